@@ -7,25 +7,12 @@ if %errorlevel% neq 0 (
     exit /b 1
 )
 
-rem Create virtual environment if it does not exist
-if not exist ".\.venv\Scripts\python.exe" (
-    echo Virtual environment not found. Creating...
-    python -m venv .venv
-)
-
-if not exist ".\.venv\Scripts\python.exe" (
-    echo Failed to create virtual environment or it is inaccessible.
-    exit /b 1
-)
-
-".\.venv\Scripts\python" -m pip install --upgrade -r requirements.txt
-if %errorlevel% neq 0 (
-    echo Failed to install dependencies.
-    exit /b %errorlevel%
-)
-
-".\.venv\Scripts\python" app\main.py
-if %errorlevel% neq 0 (
-    echo Application exited with code %errorlevel%.
-    exit /b %errorlevel%
+rem run.py creates the environment, installs dependencies only when
+rem requirements.txt or the environment changed, and starts the app.
+rem Started with the venv interpreter it runs the app in the same process.
+if exist ".\.venv\Scripts\python.exe" (
+    ".\.venv\Scripts\python" run.py %*
+) else (
+    python run.py %*
 )
+exit /b %errorlevel%
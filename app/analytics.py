@@ -0,0 +1,242 @@
+"""Aggregation of yearly stats for the analytics view.
+
+The functions here take the already parsed ``stats/<year>.json`` mapping
+(month number as string -> list of records) and compute every indicator of
+every month in a single pass.  They do not depend on Qt, so reports and
+tests can use them directly.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+INDICATORS = [
+    "Работ", "Завершенных", "Онгоингов", "Глав", "Знаков",
+    "Просмотров", "Профит", "РК", "Чистыми", "Лайков", "Спасибо",
+    "Камса", "Потрачено на софт",
+]
+# Entered by hand in the dialog rather than computed from stats records.
+MANUAL_INDICATORS = ("Камса", "Потрачено на софт")
+COMPUTED_INDICATORS = [k for k in INDICATORS if k not in MANUAL_INDICATORS]
+
+_INT_FIELDS = (("Глав", "chapters"), ("Знаков", "chars"), ("Просмотров", "views"),
+               ("Лайков", "likes"), ("Спасибо", "thanks"))
+_FLOAT_FIELDS = (("Профит", "profit"), ("РК", "ads"))
+
+Matrix = List[Dict[str, float]]
+
+
+def _empty_row() -> Dict[str, float]:
+    return {k: 0 for k in COMPUTED_INDICATORS}
+
+
+def _add_record(row: Dict[str, float], rec: Mapping[str, Any]) -> None:
+    row["Работ"] += 1
+    status = (rec.get("status", "") or "").lower()
+    if "заверш" in status:
+        row["Завершенных"] += 1
+    elif "онго" in status:
+        row["Онгоингов"] += 1
+    for indicator, key in _INT_FIELDS:
+        row[indicator] += int(rec.get(key, 0) or 0)
+    for indicator, key in _FLOAT_FIELDS:
+        row[indicator] += float(rec.get(key, 0) or 0)
+
+
+def month_indicators(
+    records: Iterable[Mapping[str, Any]], software: float = 0.0
+) -> Dict[str, float]:
+    """Return the computed indicators of a single month."""
+
+    row = _empty_row()
+    for rec in records:
+        _add_record(row, rec)
+    row["Чистыми"] = round(row["Профит"] - row["РК"] - software, 2)
+    return row
+
+
+def year_matrix(
+    stats: Mapping[str, Iterable[Mapping[str, Any]]],
+    software: Mapping[str, float] | None = None,
+) -> Matrix:
+    """Return a 12×indicator matrix; row ``m - 1`` holds month ``m``.
+
+    ``software`` maps month strings to the spending subtracted from
+    ``Чистыми``.
+    """
+
+    software = software or {}
+    matrix: Matrix = [_empty_row() for _ in range(12)]
+    for key, records in stats.items():
+        try:
+            month = int(key)
+        except (TypeError, ValueError):
+            continue
+        if not 1 <= month <= 12:
+            continue
+        row = matrix[month - 1]
+        for rec in records or []:
+            _add_record(row, rec)
+    for month, row in enumerate(matrix, start=1):
+        row["Чистыми"] = round(
+            row["Профит"] - row["РК"] - float(software.get(str(month), 0.0) or 0.0), 2
+        )
+    return matrix
+
+
+# --- top rankings ----------------------------------------------------------
+
+TOP_SUM_FIELDS = (
+    ("planned", int), ("chapters", int), ("chars", int), ("views", int),
+    ("profit", float), ("ads", float), ("likes", int), ("thanks", int),
+)
+
+
+def _empty_total() -> Dict[str, Any]:
+    return {
+        "status": "",
+        "total_chapters": 0,
+        "planned": 0,
+        "chapters": 0,
+        "progress": 0.0,
+        "release": "",
+        "chars": 0,
+        "views": 0,
+        "profit": 0.0,
+        "ads": 0.0,
+        "likes": 0,
+        "thanks": 0,
+        "done": 0,
+    }
+
+
+class _WorkRollup:
+    """Monthly rollup of one work with prefix sums over the months."""
+
+    __slots__ = ("count", "sums", "max_total", "last")
+
+    def __init__(self) -> None:
+        # index 0 is the empty prefix, index m covers months 1..m
+        self.count = [0] * 13
+        self.sums: Dict[str, List[float]] = {k: [0] * 13 for k, _ in TOP_SUM_FIELDS}
+        self.sums["done"] = [0] * 13
+        self.max_total = [0] * 13  # per month, not cumulative
+        # field -> per month (month where the value was last set up to m, value)
+        self.last: Dict[str, List[Any]] = {}
+
+
+class TopRollups:
+    """Per-work rollups of a stats year answering any month range.
+
+    Additive columns are kept as prefix sums, so a range costs two lookups
+    per work; ``status``/``progress``/``release`` keep the latest value set
+    up to each month, and ``total_chapters`` is the maximum over at most
+    twelve monthly maxima.  Results match the record-by-record aggregation
+    of :class:`TopDialog` in month order.
+    """
+
+    _LAST_FIELDS = ("status", "progress", "release")
+
+    def __init__(self, stats: Mapping[str, Iterable[Mapping[str, Any]]]) -> None:
+        monthly: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        for month in range(1, 13):
+            for rec in stats.get(str(month), []) or []:
+                work = rec.get("work", "")
+                m = monthly.setdefault(work, {}).setdefault(
+                    month, {"count": 0, "max_total": 0, "done": 0, **{k: 0 for k, _ in TOP_SUM_FIELDS}}
+                )
+                m["count"] += 1
+                for key, conv in TOP_SUM_FIELDS:
+                    m[key] += conv(rec.get(key, 0) or 0)
+                m["max_total"] = max(m["max_total"], int(rec.get("total_chapters", 0) or 0))
+                if "заверш" in (rec.get("status", "") or "").lower():
+                    m["done"] += 1
+                if "status" in rec:
+                    m["status"] = rec.get("status")
+                if rec.get("progress") is not None:
+                    m["progress"] = rec.get("progress")
+                if rec.get("release"):
+                    m["release"] = rec.get("release")
+
+        self._works: Dict[str, _WorkRollup] = {}
+        for work, months in monthly.items():
+            roll = _WorkRollup()
+            last: Dict[str, List[Any]] = {f: [(0, None)] * 13 for f in self._LAST_FIELDS}
+            for month in range(1, 13):
+                m = months.get(month)
+                roll.count[month] = roll.count[month - 1] + (m["count"] if m else 0)
+                for key in roll.sums:
+                    roll.sums[key][month] = roll.sums[key][month - 1] + (m[key] if m else 0)
+                roll.max_total[month] = m["max_total"] if m else 0
+                for f in self._LAST_FIELDS:
+                    last[f][month] = (month, m[f]) if m and f in m else last[f][month - 1]
+            roll.last = last
+            self._works[work] = roll
+
+    def works(self) -> List[str]:
+        return sorted(self._works)
+
+    def totals(self, first: int, last: int) -> Dict[str, Dict[str, Any]]:
+        """Aggregate months ``first``..``last`` (inclusive) per work."""
+
+        first = max(1, first)
+        last = min(12, last)
+        result: Dict[str, Dict[str, Any]] = {}
+        for work, roll in self._works.items():
+            if roll.count[last] - roll.count[first - 1] <= 0:
+                continue
+            t = _empty_total()
+            for key, values in roll.sums.items():
+                t[key] = values[last] - values[first - 1]
+            t["total_chapters"] = max(roll.max_total[first : last + 1])
+            for f in self._LAST_FIELDS:
+                month, value = roll.last[f][last]
+                if month >= first:
+                    t[f] = value
+            result[work] = t
+        return result
+
+
+# Period keys of ``top/<year>.json`` as produced by ``TopDialog._period_key``.
+PERIOD_KEYS = (
+    [f"M{m:02d}" for m in range(1, 13)]
+    + [f"Q{q}" for q in range(1, 5)]
+    + ["H1", "H2", "Y"]
+)
+TOP_RESULT_FIELDS = (
+    "status", "total_chapters", "planned", "chapters", "progress", "release",
+    "chars", "views", "profit", "ads", "likes", "thanks",
+)
+
+
+def period_months(key: str) -> Tuple[int, int]:
+    """Return the inclusive month range of a period key (``M01`` … ``Y``)."""
+
+    if key.startswith("M"):
+        month = int(key[1:])
+        return month, month
+    if key.startswith("Q"):
+        start = (int(key[1:]) - 1) * 3 + 1
+        return start, start + 2
+    if key.startswith("H"):
+        start = (int(key[1:]) - 1) * 6 + 1
+        return start, start + 5
+    return 1, 12
+
+
+def top_results(totals: Mapping[str, Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Turn :meth:`TopRollups.totals` into the ``top/<year>.json`` rows."""
+
+    return [
+        {"work": work, **{key: totals[work][key] for key in TOP_RESULT_FIELDS}}
+        for work in sorted(totals)
+    ]
+
+
+def top_rankings(rollups: TopRollups) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """Return the results of every period key, shaped like ``top/<year>.json``."""
+
+    return {
+        key: {"results": top_results(rollups.totals(*period_months(key)))}
+        for key in PERIOD_KEYS
+    }
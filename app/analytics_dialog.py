@@ -0,0 +1,437 @@
+"""Yearly analytics dialog: months × indicators."""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import List, Tuple
+
+from PySide6 import QtWidgets, QtGui, QtCore
+import shiboken6
+
+import analytics
+import theme_registry
+from widgets import NeonTableWidget, StyledPushButton
+from resources import icon
+from effects import (
+    apply_neon_effect,
+    register_neon,
+    update_neon_filters,
+)
+import appdata
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyticsDialog(QtWidgets.QDialog):
+    """Годовая статистика: месяцы × показатели с колонкой "Итого за год"."""
+
+    INDICATORS = analytics.INDICATORS
+
+    def __init__(self, year, parent=None):
+        super().__init__(parent)
+        self.year = year
+        self.setWindowTitle("Аналитика")
+        self.resize(900, 400)
+
+        self._input_controls: List[Tuple[QtWidgets.QWidget, str]] = []
+
+        lay = QtWidgets.QVBoxLayout(self)
+        top = QtWidgets.QHBoxLayout()
+        top.addWidget(QtWidgets.QLabel("Год:"))
+        self.spin_year = QtWidgets.QSpinBox(self)
+        self.spin_year.setRange(2000, 2100)
+        self.spin_year.setValue(year)
+        self.spin_year.setFixedWidth(self.spin_year.sizeHint().width())
+        self.spin_year.setButtonSymbols(QtWidgets.QAbstractSpinBox.UpDownArrows)
+        self.spin_year.valueChanged.connect(self._year_changed)
+        top.addWidget(self.spin_year)
+        self._register_input_control(self.spin_year, "QSpinBox")
+
+        top.addSpacing(12)
+        top.addWidget(QtWidgets.QLabel("Режим:"))
+        self.combo_mode = QtWidgets.QComboBox(self)
+        self.combo_mode.addItem("Месяц", "month")
+        self.combo_mode.addItem("Квартал", "quarter")
+        self.combo_mode.addItem("Полугодие", "half")
+        self.combo_mode.addItem("Год", "year")
+        self.combo_mode.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
+        self.combo_mode.currentIndexChanged.connect(self._update_period_options)
+        top.addWidget(self.combo_mode)
+        self._register_input_control(self.combo_mode, "QComboBox")
+
+        top.addSpacing(12)
+        top.addWidget(QtWidgets.QLabel("Период:"))
+        self.combo_period = QtWidgets.QComboBox(self)
+        self.combo_period.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
+        top.addWidget(self.combo_period)
+        self._register_input_control(self.combo_period, "QComboBox")
+
+        self._update_period_options()
+        top.addStretch(1)
+        lay.addLayout(top)
+
+        cols = len(appdata.RU_MONTHS) + 1
+        self.table = NeonTableWidget(len(self.INDICATORS), cols, self)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectItems)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.table.setAttribute(QtCore.Qt.WA_Hover, True)
+        register_neon(self.table, appdata.CONFIG)
+        self.table.setHorizontalHeaderLabels(appdata.RU_MONTHS + ["Итого за год"])
+        self.table.setVerticalHeaderLabels(self.INDICATORS)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(
+            QtWidgets.QHeaderView.Interactive
+        )
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        lay.addWidget(self.table, 1)
+
+        box = QtWidgets.QDialogButtonBox(self)
+        btn_save = StyledPushButton("Сохранить", self, **appdata.button_config())
+        btn_save.setIcon(icon("save"))
+        btn_save.setIconSize(QtCore.QSize(20, 20))
+        btn_close = StyledPushButton("Закрыть", self, **appdata.button_config())
+        btn_close.setIcon(icon("x"))
+        btn_close.setIconSize(QtCore.QSize(20, 20))
+        for btn in (btn_save, btn_close):
+            btn.setFixedSize(btn.sizeHint())
+            btn.setStyleSheet(btn.styleSheet() + "border:1px solid transparent;")
+        box.addButton(btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
+        box.addButton(btn_close, QtWidgets.QDialogButtonBox.RejectRole)
+        box.accepted.connect(self.save)
+        box.rejected.connect(self.reject)
+        lay.addWidget(box)
+
+        # prepare items
+        for r, name in enumerate(self.INDICATORS):
+            for c in range(cols):
+                it = QtWidgets.QTableWidgetItem("0")
+                it.setTextAlignment(QtCore.Qt.AlignCenter)
+                if name not in ("Камса", "Потрачено на софт") or c == cols - 1:
+                    it.setFlags(QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled)
+                self.table.setItem(r, c, it)
+
+        self.table.itemChanged.connect(self._item_changed)
+
+        self._loading = False
+        self._commissions = {str(m): 0.0 for m in range(1, 13)}
+        self._software = {str(m): 0.0 for m in range(1, 13)}
+        self._net = {str(m): 0.0 for m in range(1, 13)}
+        self._settings = QtCore.QSettings("rabota2", "rabota2")
+        geom = self._settings.value("AnalyticsDialog/geometry", type=QtCore.QByteArray)
+        if geom is not None:
+            self.restoreGeometry(geom)
+
+        raw_sizes = self._settings.value("AnalyticsDialog/columns", type=list)
+        self._saved_column_sizes = []
+        for value in raw_sizes or []:
+            try:
+                self._saved_column_sizes.append(int(value))
+            except (TypeError, ValueError):
+                continue
+
+        self.load(year)
+        self.refresh_theme()
+
+    def resizeEvent(self, event):
+        self.table.horizontalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.Interactive
+        )
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        super().resizeEvent(event)
+
+    # --- styling helpers -----------------------------------------------
+    def _register_input_control(self, widget: QtWidgets.QWidget, selector: str) -> None:
+        if widget is None:
+            return
+
+        widget.setAttribute(QtCore.Qt.WA_Hover, True)
+        register_neon(widget, appdata.CONFIG)
+
+        if isinstance(widget, QtWidgets.QComboBox):
+            view = widget.view()
+            if view is not None and shiboken6.isValid(view):
+                widget._popup_view = view
+                register_neon(view, appdata.CONFIG, owner=widget)
+
+        self._input_controls.append((widget, selector))
+
+    def _input_theme_parameters(self) -> Tuple[QtGui.QColor, QtGui.QColor, int]:
+        workspace_color = QtGui.QColor(
+            appdata.CONFIG.get("workspace_color", "#1e1e21")
+        )
+        accent_color = QtGui.QColor(appdata.CONFIG.get("accent_color", "#39ff14"))
+        try:
+            thickness = int(appdata.CONFIG.get("neon_thickness", 1))
+        except (TypeError, ValueError):
+            thickness = 1
+        return workspace_color, accent_color, thickness
+
+    def _apply_input_control_style(
+        self,
+        widget: QtWidgets.QWidget,
+        selector: str,
+        workspace_color: QtGui.QColor,
+        accent_color: QtGui.QColor,
+        thickness: int,
+    ) -> None:
+        if widget is None or not shiboken6.isValid(widget):
+            return
+
+        workspace = workspace_color.name()
+        accent = accent_color.name()
+        style = theme_registry.build_input_neon_style(
+            selector,
+            background=workspace,
+            accent=accent,
+            thickness=thickness,
+        )
+        if selector == "QComboBox":
+            style += (
+                f"{selector} QAbstractItemView{{"
+                f"background-color:{workspace};"
+                "border:0;"
+                "color:#f0f0f0;"
+                "selection-background-color:rgba(255,255,255,30);"
+                "selection-color:#000000;"
+                "}}"
+            )
+        widget.setStyleSheet(style)
+
+        palette = widget.palette()
+        text_color = QtGui.QColor("#f0f0f0")
+        for role in (
+            QtGui.QPalette.Base,
+            QtGui.QPalette.Button,
+            QtGui.QPalette.Window,
+            QtGui.QPalette.AlternateBase,
+        ):
+            palette.setColor(role, workspace_color)
+        palette.setColor(QtGui.QPalette.Text, text_color)
+        palette.setColor(QtGui.QPalette.ButtonText, text_color)
+        palette.setColor(QtGui.QPalette.Highlight, accent_color)
+        palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#000000"))
+        widget.setPalette(palette)
+
+        if isinstance(widget, QtWidgets.QComboBox):
+            view = getattr(widget, "_popup_view", None)
+            if view is None and hasattr(widget, "view"):
+                view = widget.view()
+            if view is not None and shiboken6.isValid(view):
+                view.setAttribute(QtCore.Qt.WA_Hover, True)
+                view.setPalette(palette)
+                view.setStyleSheet(
+                    f"QListView{{background-color:{workspace}; color:#f0f0f0;}}"
+                )
+                update_neon_filters(view, appdata.CONFIG)
+
+        update_neon_filters(widget, appdata.CONFIG)
+
+    def _update_period_options(self) -> None:
+        """Populate period choices according to the current mode."""
+
+        if not hasattr(self, "combo_mode") or not hasattr(self, "combo_period"):
+            return
+
+        mode = self.combo_mode.currentData()
+        self.combo_period.clear()
+
+        if mode == "month":
+            for index, name in enumerate(appdata.RU_MONTHS, 1):
+                self.combo_period.addItem(name, index)
+            self.combo_period.setEnabled(True)
+        elif mode == "quarter":
+            for index in range(1, 5):
+                self.combo_period.addItem(f"Квартал {index}", index)
+            self.combo_period.setEnabled(True)
+        elif mode == "half":
+            for index in range(1, 3):
+                self.combo_period.addItem(f"Полугодие {index}", index)
+            self.combo_period.setEnabled(True)
+        else:
+            self.combo_period.addItem("Год", 1)
+            self.combo_period.setEnabled(False)
+
+    def refresh_theme(self) -> None:
+        """Обновить стиль таблицы в соответствии с текущей темой."""
+
+        (
+            workspace_color,
+            accent_color,
+            thickness,
+        ) = self._input_theme_parameters()
+        workspace = workspace_color.name()
+        accent = accent_color.name()
+
+        for widget, selector in list(self._input_controls):
+            self._apply_input_control_style(
+                widget, selector, workspace_color, accent_color, thickness
+            )
+
+        header = self.table.horizontalHeader()
+
+        if getattr(self.table, "_neon_effect", None):
+            apply_neon_effect(self.table, False, config=appdata.CONFIG)
+        if getattr(header, "_neon_effect", None):
+            apply_neon_effect(header, False, config=appdata.CONFIG)
+
+        highlight = QtGui.QColor(accent)
+        palette = self.table.palette()
+        palette.setColor(QtGui.QPalette.Highlight, highlight)
+        self.table.setPalette(palette)
+
+        header_palette = header.palette()
+        header_palette.setColor(QtGui.QPalette.Highlight, highlight)
+        header.setPalette(header_palette)
+
+        compiled = theme_registry.theme(accent=accent, workspace=workspace)
+        table_style = compiled.get("dialog_table")
+        header_style = compiled.get("dialog_header", 6)
+
+        theme_registry.apply_style(self.table, table_style)
+        theme_registry.apply_style(header, header_style)
+
+        apply_neon_effect(self.table, True, config=appdata.CONFIG)
+        apply_neon_effect(header, True, shadow=False, border=False, config=appdata.CONFIG)
+        update_neon_filters(self.table, appdata.CONFIG)
+
+    def _apply_saved_column_sizes(self) -> None:
+        sizes = getattr(self, "_saved_column_sizes", None) or []
+        for i, width in enumerate(sizes):
+            if i < self.table.columnCount():
+                self.table.setColumnWidth(i, width)
+        self._saved_column_sizes = [
+            int(self.table.columnWidth(i)) for i in range(self.table.columnCount())
+        ]
+
+    def _year_changed(self, val):
+        self.load(val)
+
+    def _data_stamp(self, year: int) -> tuple:
+        values = os.path.join(appdata.year_dir(year), f"{year}.json")
+        return (appdata.stats_signature(year), appdata.data_signature(values))
+
+    def reopen(self, year: int) -> bool:
+        """Show ``year`` again, re-reading it only if its data changed since."""
+
+        if year != self.year or self._data_stamp(year) != self._stamp:
+            self.load(year)
+        return True
+
+    # --- data handling -------------------------------------------------
+    def load(self, year):
+        self._loading = True
+        self.year = year
+        self._stamp = self._data_stamp(year)
+        self.spin_year.setValue(year)
+
+        # load manual values
+        self._commissions = {str(m): 0.0 for m in range(1, 13)}
+        self._software = {str(m): 0.0 for m in range(1, 13)}
+        self._net = {str(m): 0.0 for m in range(1, 13)}
+        data = appdata.load_year_values(year)
+        if data:
+            self._commissions.update({str(k): float(v) for k, v in data.get("commission", {}).items()})
+            self._software.update({str(k): float(v) for k, v in data.get("software", {}).items()})
+            self._net.update({str(k): float(v) for k, v in data.get("net", {}).items()})
+
+        # fill table with monthly values, parsing the year's stats once
+        matrix = analytics.year_matrix(appdata.load_stats_data(year), self._software)
+        rows = {ind: r for r, ind in enumerate(self.INDICATORS)}
+        for m in range(1, 13):
+            stats = matrix[m - 1]
+            for ind, val in stats.items():
+                self.table.item(rows[ind], m - 1).setText(str(val))
+            self.table.item(self.INDICATORS.index("Камса"), m - 1).setText(str(self._commissions[str(m)]))
+            self.table.item(self.INDICATORS.index("Потрачено на софт"), m - 1).setText(str(self._software[str(m)]))
+            self.table.item(self.INDICATORS.index("Чистыми"), m - 1).setText(
+                str(self._net.get(str(m), stats.get("Чистыми", 0)))
+            )
+
+        self._recalculate()
+        self.table.resizeColumnsToContents()
+        self.table.horizontalHeader().setMinimumSectionSize(50)
+        self.table.resizeRowsToContents()
+        self.table.horizontalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.Interactive
+        )
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self._apply_saved_column_sizes()
+        self._loading = False
+
+    def save(self, accept=True):
+        data = {
+            "commission": self._commissions,
+            "software": self._software,
+            "net": self._net,
+        }
+        appdata.save_year_values(self.year, data)
+        self._stamp = self._data_stamp(self.year)
+        if accept:
+            self.accept()
+
+    def closeEvent(self, event):
+        self.save(accept=False)
+        self._settings.setValue("AnalyticsDialog/geometry", self.saveGeometry())
+        cols = [int(self.table.columnWidth(i)) for i in range(self.table.columnCount())]
+        self._settings.setValue("AnalyticsDialog/columns", cols)
+        self._settings.sync()
+        super().closeEvent(event)
+
+    # --- helpers -------------------------------------------------------
+    def _item_changed(self, item):
+        if self._loading:
+            return
+        row = item.row()
+        col = item.column()
+        ind = self.INDICATORS[row]
+        if ind == "Камса":
+            try:
+                self._commissions[str(col + 1)] = float(item.text())
+            except ValueError:
+                self._commissions[str(col + 1)] = 0.0
+        elif ind == "Потрачено на софт":
+            try:
+                self._software[str(col + 1)] = float(item.text())
+            except ValueError:
+                self._software[str(col + 1)] = 0.0
+        self._recalculate()
+        self.save(accept=False)
+
+    def _recalculate(self):
+        cols = len(appdata.RU_MONTHS)
+        r_profit = self.INDICATORS.index("Профит")
+        r_rk = self.INDICATORS.index("РК")
+        r_soft = self.INDICATORS.index("Потрачено на софт")
+        r_net = self.INDICATORS.index("Чистыми")
+        # recompute net values
+        for c in range(cols):
+            try:
+                profit = float(self.table.item(r_profit, c).text())
+            except ValueError:
+                profit = 0.0
+            try:
+                rk = float(self.table.item(r_rk, c).text())
+            except ValueError:
+                rk = 0.0
+            try:
+                soft = float(self.table.item(r_soft, c).text())
+            except ValueError:
+                soft = 0.0
+            net = round(profit - rk - soft, 2)
+            self.table.item(r_net, c).setText(str(net))
+            self._net[str(c + 1)] = net
+
+        # totals
+        for r in range(len(self.INDICATORS)):
+            total = 0.0
+            for c in range(cols):
+                try:
+                    total += float(self.table.item(r, c).text())
+                except ValueError:
+                    pass
+            item = self.table.item(r, cols)
+            item.setText(str(round(total, 2)))
+            font = item.font()
+            font.setBold(True)
+            item.setFont(font)
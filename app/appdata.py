@@ -0,0 +1,530 @@
+"""Configuration, paths and data stores shared by the main window and dialogs.
+
+The dialog modules import this module instead of the entry script, so
+state such as :data:`CONFIG` and :data:`BASE_SAVE_PATH` exists once however
+``main.py`` was started.  Assign ``appdata.BASE_SAVE_PATH`` (never a copy of
+it) when the save path changes.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import logging
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import startup_profiler
+import config
+import storage
+import analytics
+import autosave
+import changelog
+import sqlite_store
+from resources import GLYPH_CACHE_FILE
+
+logger = logging.getLogger(__name__)
+
+ASSETS = os.path.join(os.path.dirname(__file__), "..", "assets")
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+CONFIG_PATH = os.path.join(DATA_DIR, "config.json")
+
+DAY_ROWS_DEFAULT = 4
+_OLD_DAY_ROWS_DEFAULT = 6
+
+
+def load_config():
+    default = {
+        "neon": True,
+        "neon_size": 10,
+        "neon_thickness": 1,
+        "neon_intensity": 255,
+        "accent_color": "#39ff14",
+        "gradient_colors": ["#39ff14", "#2d7cdb"],
+        "gradient_angle": 0,
+        "font_family": "Exo 2",
+        "header_font": "Exo 2",
+        "text_font": "Exo 2",
+        "sidebar_font": "Exo 2",
+        "save_path": DATA_DIR,
+        "day_rows": DAY_ROWS_DEFAULT,
+        "workspace_color": "#1e1e21",
+        "sidebar_color": "#1f1f23",
+        "sidebar_icon": os.path.join(ASSETS, "gpt_icon.png"),
+        "app_icon": os.path.join(ASSETS, "gpt_icon.png"),
+        "sidebar_collapsed": False,
+        "calendar_mode": "widgets",
+        "storage_backend": "json",
+        "autosave_delay_ms": autosave.AUTOSAVE_DELAY_MS,
+        "neon_renderer": "overlay",
+    }
+    storage.recover_file(CONFIG_PATH)
+    if os.path.exists(CONFIG_PATH):
+        try:
+            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            save_path = data.get("save_path")
+            if save_path:
+                if not os.path.isabs(save_path):
+                    save_path = os.path.abspath(
+                        os.path.join(os.path.dirname(CONFIG_PATH), save_path)
+                    )
+                data["save_path"] = save_path
+            migrated = False
+            day_rows = data.get("day_rows")
+            if day_rows is None or day_rows == _OLD_DAY_ROWS_DEFAULT:
+                data["day_rows"] = DAY_ROWS_DEFAULT
+                migrated = True
+
+            neon_enabled = data.get("neon")
+            if not neon_enabled:
+                data["neon"] = True
+                migrated = True
+            default.update({k: v for k, v in data.items() if v is not None})
+            for key in ("monochrome", "mono_saturation", "theme"):
+                default.pop(key, None)
+            default["neon"] = True
+            if migrated:
+                try:
+                    storage.write_json(CONFIG_PATH, data)
+                except Exception:
+                    pass
+        except Exception:
+            pass
+    else:
+        try:
+            os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
+            default["neon"] = True
+            storage.write_json(CONFIG_PATH, default)
+        except Exception:
+            pass
+    return default
+
+
+with startup_profiler.phase("load_config"):
+    CONFIG = load_config()
+config.CONFIG = CONFIG
+BASE_SAVE_PATH = os.path.abspath(CONFIG.get("save_path", DATA_DIR))
+
+
+def reload_config() -> Dict:
+    """Re-read ``config.json`` into :data:`CONFIG` in place and return it.
+
+    Every module holding the dict sees the new values.
+    """
+
+    CONFIG.clear()
+    CONFIG.update(load_config())
+    return CONFIG
+
+
+MONTH_DATA_SUBDIR = "months"
+
+
+def ensure_month_storage() -> str:
+    base = os.path.abspath(BASE_SAVE_PATH)
+    month_dir = os.path.join(base, MONTH_DATA_SUBDIR)
+    os.makedirs(month_dir, exist_ok=True)
+    return month_dir
+
+
+_SQLITE_STORES: Dict[str, sqlite_store.SqliteStore] = {}
+_SQLITE_LOCK = threading.Lock()
+
+
+def active_sqlite_store() -> sqlite_store.SqliteStore | None:
+    """Return the SQLite store of ``save_path`` if ``storage_backend`` selects it.
+
+    A database created for the first time is filled from the JSON folders.
+    """
+
+    if CONFIG.get("storage_backend", "json") != "sqlite":
+        return None
+    base = os.path.abspath(BASE_SAVE_PATH)
+    with _SQLITE_LOCK:
+        store = _SQLITE_STORES.get(base)
+        if store is None:
+            path = os.path.join(base, sqlite_store.DB_FILENAME)
+            fresh = not os.path.exists(path)
+            store = sqlite_store.SqliteStore(path)
+            if fresh:
+                store.import_json(base)
+            _SQLITE_STORES[base] = store
+    return store
+
+
+def detach_sqlite_store(base: str) -> sqlite_store.SqliteStore | None:
+    """Stop serving ``base`` from SQLite and return its store.
+
+    A database that was not open yet is opened so it can still be exported.
+    """
+
+    with _SQLITE_LOCK:
+        store = _SQLITE_STORES.pop(base, None)
+    db_path = os.path.join(base, sqlite_store.DB_FILENAME)
+    if store is None and os.path.exists(db_path):
+        store = sqlite_store.SqliteStore(db_path)
+    return store
+
+
+def button_config():
+    return {
+        "gradient_colors": CONFIG.get("gradient_colors", ["#39ff14", "#2d7cdb"]),
+        "gradient_angle": CONFIG.get("gradient_angle", 0),
+        "neon_thickness": CONFIG.get("neon_thickness", 1),
+    }
+
+
+def ensure_year_dirs(year):
+    base = os.path.join(BASE_SAVE_PATH, str(year))
+    for sub in ("stats", "release", "top", "year"):
+        os.makedirs(os.path.join(base, sub), exist_ok=True)
+    return base
+
+
+# Files each per-year folder writes through :mod:`storage`.
+_YEAR_STORE_FILES = (
+    ("stats", r"{year}\.json"),
+    ("release", r"\d{{2}}\.json"),
+    ("year", r"{year}\.json"),
+    ("top", r"{year}\.json"),
+)
+
+
+def store_locations() -> List[Tuple[str, str]]:
+    """Return the directories written through :mod:`storage`.
+
+    Each comes with the pattern of the file names written there, as
+    expected by :func:`storage.recover`.
+    """
+
+    base = os.path.abspath(BASE_SAVE_PATH)
+    locations = [
+        (DATA_DIR, r"config\.json|" + re.escape(GLYPH_CACHE_FILE)),
+        (os.path.join(base, MONTH_DATA_SUBDIR), r"\d{4}-\d{2}\.json"),
+    ]
+    try:
+        years = [name for name in os.listdir(base) if name.isdigit()]
+    except OSError:
+        years = []
+    for year in sorted(years):
+        for sub, pattern in _YEAR_STORE_FILES:
+            locations.append((os.path.join(base, year, sub), pattern.format(year=year)))
+    return locations
+
+
+def stats_dir(year):
+    return os.path.join(ensure_year_dirs(year), "stats")
+
+def release_dir(year):
+    return os.path.join(ensure_year_dirs(year), "release")
+
+def top_dir(year):
+    return os.path.join(ensure_year_dirs(year), "top")
+
+def year_dir(year):
+    return os.path.join(ensure_year_dirs(year), "year")
+
+
+def load_release_data(year: int, month: int) -> Dict:
+    store = active_sqlite_store()
+    if store is not None:
+        return store.load_release(year, month)
+    path = os.path.join(release_dir(year), f"{month:02d}.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_release_data(year: int, month: int, data: Dict) -> None:
+    store = active_sqlite_store()
+    if store is not None:
+        store.save_release(year, month, data)
+        return
+    storage.write_json(os.path.join(release_dir(year), f"{month:02d}.json"), data)
+
+
+def load_year_values(year: int) -> Dict:
+    store = active_sqlite_store()
+    if store is not None:
+        return store.load_year_values(year)
+    path = os.path.join(year_dir(year), f"{year}.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_year_values(year: int, data: Dict) -> None:
+    store = active_sqlite_store()
+    if store is not None:
+        store.save_year_values(year, data)
+        return
+    storage.write_json(os.path.join(year_dir(year), f"{year}.json"), data)
+
+
+def load_top_data(year: int) -> Dict:
+    store = active_sqlite_store()
+    if store is not None:
+        return store.load_top(year)
+    path = os.path.join(top_dir(year), f"{year}.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_top_data(year: int, data: Dict) -> None:
+    store = active_sqlite_store()
+    if store is not None:
+        store.save_top(year, data)
+        return
+    storage.write_json(os.path.join(top_dir(year), f"{year}.json"), data)
+
+
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def data_signature(*paths: str) -> tuple:
+    """Cheap change marker of the JSON data files ``paths``.
+
+    With the SQLite backend the database and its WAL are stamped instead.
+    """
+
+    base = os.path.abspath(BASE_SAVE_PATH)
+    backend = CONFIG.get("storage_backend", "json")
+    if backend == "sqlite":
+        db_path = os.path.join(base, sqlite_store.DB_FILENAME)
+        paths = (db_path, db_path + "-wal")
+    return (base, backend, tuple(_file_stamp(path) for path in paths))
+
+
+_STATS_LOG_LOCK = threading.RLock()
+
+
+def _stats_log(year: int) -> changelog.YearLog:
+    return changelog.YearLog(changelog.log_path(stats_dir(year), year))
+
+
+def load_stats_data(year: int) -> Dict[str, List[Dict]]:
+    """Return ``stats/<year>.json`` with the pending change log applied.
+
+    Raises :class:`json.JSONDecodeError` if the snapshot is damaged.
+    """
+
+    return _read_stats(stats_dir(year), year, active_sqlite_store())
+
+
+def _read_stats(folder: str, year: int, store) -> Dict[str, List[Dict]]:
+    if store is not None:
+        return store.load_stats(year)
+    path = os.path.join(folder, f"{year}.json")
+    data: Dict[str, List[Dict]] = {}
+    with _STATS_LOG_LOCK:
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        entries = changelog.YearLog(changelog.log_path(folder, year)).entries()
+    return changelog.apply_record_entries(data, entries)
+
+
+def save_stats_record(year: int, month: int, index: int, record: Dict) -> None:
+    """Store one stats record as a change log entry.
+
+    The top rankings of ``year`` are then rebuilt in the background.
+    """
+
+    _bump_stats_version(year)
+    store = active_sqlite_store()
+    if store is not None:
+        store.set_stats_record(year, month, index, record)
+    else:
+        path = os.path.join(stats_dir(year), f"{year}.json")
+        with _STATS_LOG_LOCK:
+            log = _stats_log(year)
+            log.append([{"op": "set", "month": month, "item": index, "value": record}])
+            if not os.path.exists(path) or log.needs_compaction():
+                storage.write_json(path, load_stats_data(year))
+                log.clear()
+    schedule_top_rankings(year)
+
+
+_STATS_VERSIONS: Dict[Tuple[str, int], int] = {}
+_ROLLUPS: Dict[Tuple[str, str, int], Tuple[tuple, analytics.TopRollups]] = {}
+_ROLLUPS_LOCK = threading.Lock()
+
+
+def _bump_stats_version(year: int) -> None:
+    key = (os.path.abspath(BASE_SAVE_PATH), year)
+    with _ROLLUPS_LOCK:
+        _STATS_VERSIONS[key] = _STATS_VERSIONS.get(key, 0) + 1
+
+
+def stats_signature(year: int) -> tuple:
+    """Cheap change marker of a stats year: own writes plus file stamps."""
+
+    base = os.path.abspath(BASE_SAVE_PATH)
+    stamps = []
+    if CONFIG.get("storage_backend", "json") != "sqlite":
+        folder = os.path.join(base, str(year), "stats")
+        for name in (f"{year}.json", f"{year}{changelog.LOG_SUFFIX}"):
+            try:
+                st = os.stat(os.path.join(folder, name))
+            except OSError:
+                stamps.append(None)
+            else:
+                stamps.append((st.st_mtime_ns, st.st_size))
+    with _ROLLUPS_LOCK:
+        version = _STATS_VERSIONS.get((base, year), 0)
+    return (version, tuple(stamps))
+
+
+def stats_rollups(year: int) -> analytics.TopRollups:
+    """Return the per-work rollups of ``year``, rebuilt only after changes."""
+
+    key = (
+        os.path.abspath(BASE_SAVE_PATH),
+        CONFIG.get("storage_backend", "json"),
+        year,
+    )
+    signature = stats_signature(year)
+    with _ROLLUPS_LOCK:
+        cached = _ROLLUPS.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    rollups = analytics.TopRollups(load_stats_data(year))
+    with _ROLLUPS_LOCK:
+        _ROLLUPS[key] = (signature, rollups)
+    return rollups
+
+
+# Materialized ``top/<year>.json`` contents, keyed like ``_ROLLUPS``.
+_TOP_RANKINGS: Dict[Tuple[str, str, int], Tuple[tuple, Dict]] = {}
+# Latest refresh request per year; a queued job always picks up the newest.
+_TOP_REQUESTS: Dict[Tuple[str, str, int], tuple] = {}
+_TOP_PENDING: Dict[Tuple[str, str, int], Future] = {}
+_TOP_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _top_key(year: int) -> Tuple[str, str, int]:
+    return (
+        os.path.abspath(BASE_SAVE_PATH),
+        CONFIG.get("storage_backend", "json"),
+        year,
+    )
+
+
+def top_rankings(year: int) -> Dict:
+    """Return the rankings of every period of ``year``.
+
+    Served from the copy materialized after the last stats save; computed
+    on the spot (and written to ``top/<year>.json``) only if it is stale.
+    """
+
+    key = _top_key(year)
+    with _ROLLUPS_LOCK:
+        pending = _TOP_PENDING.get(key)
+    if pending is not None:
+        try:
+            pending.result()
+        except Exception:
+            pass
+    signature = stats_signature(year)
+    with _ROLLUPS_LOCK:
+        cached = _TOP_RANKINGS.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    data = analytics.top_rankings(stats_rollups(year))
+    with _ROLLUPS_LOCK:
+        _TOP_RANKINGS[key] = (signature, data)
+    save_top_data(year, data)
+    return data
+
+
+def schedule_top_rankings(year: int) -> Future:
+    """Rebuild and store the rankings of ``year`` on the background worker.
+
+    Paths are resolved here, on the caller's thread, so a later change of
+    ``save_path`` or backend cannot redirect the write.  Requests for a year
+    whose job has not started yet are merged into that job.
+    """
+
+    global _TOP_EXECUTOR
+    key = _top_key(year)
+    request = (
+        stats_signature(year),
+        stats_dir(year),
+        os.path.join(top_dir(year), f"{year}.json"),
+        active_sqlite_store(),
+    )
+    with _ROLLUPS_LOCK:
+        _TOP_REQUESTS[key] = request
+        pending = _TOP_PENDING.get(key)
+        if pending is not None and not pending.running() and not pending.done():
+            return pending
+        if _TOP_EXECUTOR is None:
+            _TOP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="top-rankings")
+        future = _TOP_EXECUTOR.submit(_materialize_top_rankings, key)
+        _TOP_PENDING[key] = future
+    return future
+
+
+def _materialize_top_rankings(key: Tuple[str, str, int]) -> None:
+    with _ROLLUPS_LOCK:
+        request = _TOP_REQUESTS.pop(key, None)
+    if request is None:
+        return
+    signature, folder, top_path, store = request
+    year = key[2]
+    try:
+        rollups = analytics.TopRollups(_read_stats(folder, year, store))
+        data = analytics.top_rankings(rollups)
+        if store is not None:
+            store.save_top(year, data)
+        else:
+            storage.write_json(top_path, data)
+        with _ROLLUPS_LOCK:
+            for cache, value in ((_ROLLUPS, rollups), (_TOP_RANKINGS, data)):
+                cached = cache.get(key)
+                if cached is None or cached[0] != signature:
+                    cache[key] = (signature, value)
+    except Exception:
+        logger.exception("Failed to rebuild top rankings for %s", year)
+    finally:
+        with _ROLLUPS_LOCK:
+            # A newer request keeps its own queued job registered.
+            if key not in _TOP_REQUESTS:
+                _TOP_PENDING.pop(key, None)
+
+
+def wait_top_rankings() -> None:
+    """Block until the scheduled ranking rebuilds have finished."""
+
+    while True:
+        with _ROLLUPS_LOCK:
+            pending = list(_TOP_PENDING.values())
+        if not pending:
+            return
+        for future in pending:
+            try:
+                future.result()
+            except Exception:
+                pass
+
+
+ICON_TOGGLE = os.path.join(ASSETS, "gpt_icon.png")
+ICON_TM   = os.path.join(ASSETS, "ic_tm.png")
+ICON_TQ   = os.path.join(ASSETS, "ic_tq.png")
+ICON_TP   = os.path.join(ASSETS, "ic_tp.png")
+ICON_TG   = os.path.join(ASSETS, "ic_tg.png")
+ICON_VYK  = os.path.join(ASSETS, "ic_vykl.png")
+
+RU_MONTHS = ["Январь","Февраль","Март","Апрель","Май","Июнь","Июль","Август","Сентябрь","Октябрь","Ноябрь","Декабрь"]
@@ -0,0 +1,107 @@
+"""Debounced background saving of calendar edits.
+
+Every committed edit used to rebuild and rewrite the whole month file on the
+GUI thread.  :class:`SaveScheduler` only marks the month dirty; bursts of
+edits inside the debounce window collapse into one snapshot which is taken on
+the GUI thread and written by a single background worker, so writes keep
+their order.  Pending changes are flushed on navigation, on close and when
+the application loses focus.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List
+
+from PySide6 import QtCore, QtGui
+
+logger = logging.getLogger(__name__)
+
+AUTOSAVE_DELAY_MS = 800
+# Continuous typing still hits the disk at least this often.
+AUTOSAVE_MAX_DELAY_FACTOR = 5
+
+
+class SaveScheduler(QtCore.QObject):
+    """Coalesce dirty notifications into background writes.
+
+    ``snapshot()`` is called on the GUI thread and must return a
+    self-contained object; ``write(snapshot)`` runs on the worker thread.
+    """
+
+    def __init__(
+        self,
+        snapshot: Callable[[], Any],
+        write: Callable[[Any], None],
+        delay_ms: int = AUTOSAVE_DELAY_MS,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._snapshot = snapshot
+        self._write = write
+        self._dirty_since: float | None = None
+        self._futures: List[Future] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self.set_delay(delay_ms)
+        app = QtGui.QGuiApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_application_state)
+
+    def set_delay(self, delay_ms: int) -> None:
+        """Change the debounce window in milliseconds."""
+
+        self._delay_ms = max(0, int(delay_ms))
+
+    def is_dirty(self) -> bool:
+        return self._dirty_since is not None
+
+    def mark_dirty(self) -> None:
+        """Note an edit; the write happens once the edits settle."""
+
+        now = time.monotonic()
+        if self._dirty_since is None:
+            self._dirty_since = now
+        waited_ms = (now - self._dirty_since) * 1000
+        if waited_ms >= self._delay_ms * AUTOSAVE_MAX_DELAY_FACTOR:
+            self.flush()
+            return
+        self._timer.start(self._delay_ms)
+
+    def discard(self) -> None:
+        """Forget pending changes without writing them."""
+
+        self._timer.stop()
+        self._dirty_since = None
+
+    def flush(self, wait: bool = False) -> None:
+        """Write pending changes now; block until written if ``wait``."""
+
+        self._timer.stop()
+        if self._dirty_since is not None:
+            self._dirty_since = None
+            data = self._snapshot()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="autosave"
+                )
+            self._futures.append(self._executor.submit(self._run, data))
+        self._futures = [f for f in self._futures if not f.done()]
+        if wait:
+            for future in self._futures:
+                future.result()
+            self._futures.clear()
+
+    def _run(self, data: Any) -> None:
+        try:
+            self._write(data)
+        except Exception:
+            logger.exception("Autosave failed")
+
+    def _on_application_state(self, state: QtCore.Qt.ApplicationState) -> None:
+        if state != QtCore.Qt.ApplicationActive:
+            self.flush()
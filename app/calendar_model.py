@@ -0,0 +1,455 @@
+"""Model/view implementation of the month calendar.
+
+The classic :class:`ExcelCalendarTable` builds a widget tree per day.  The
+classes here back the whole month with a single table model and paint the
+day number plus the ``Работа``/``План``/``Готово`` sub-rows from a delegate, so
+switching months only swaps the data held by the model.
+
+A day may hold more entries than its ``day_rows`` visible sub-rows.  Only a
+window of them starting at the day's scroll offset is painted; the others
+are counted by a "+N" marker.
+"""
+
+from __future__ import annotations
+
+import calendar
+from datetime import date
+from typing import Dict, List, Sequence
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+FIELDS = ("work", "plan", "done")
+FIELD_TITLES = ("Работа", "План", "Готово")
+WEEKDAY_TITLES = ("ПН", "ВТ", "СР", "ЧТ", "ПТ", "СБ", "ВС")
+
+DateRole = QtCore.Qt.UserRole + 1
+EntriesRole = QtCore.Qt.UserRole + 2
+InMonthRole = QtCore.Qt.UserRole + 3
+
+
+def scroll_limit(count: int, visible: int) -> int:
+    """Highest scroll offset for ``count`` entries shown ``visible`` at a time.
+
+    Once the visible rows are full, scrolling to the end shows one empty row
+    to type the next entry into.
+    """
+
+    visible = max(1, visible)
+    if count < visible:
+        return 0
+    return count + 1 - visible
+
+
+def hidden_entries(count: int, offset: int, visible: int) -> int:
+    """Number of the ``count`` entries outside the visible window."""
+
+    return count - max(0, min(count - offset, visible))
+
+
+def _normalize_row(row) -> Dict[str, str]:
+    if isinstance(row, dict):
+        return {key: str(row.get(key, "") or "") for key in FIELDS}
+    return {key: "" for key in FIELDS}
+
+
+class MonthCalendarModel(QtCore.QAbstractTableModel):
+    """Weeks × weekdays model over the entries of one month."""
+
+    entriesChanged = QtCore.Signal(int)
+
+    def __init__(self, day_rows: int = 4, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self.year = 0
+        self.month = 0
+        self._weeks: List[List[date]] = []
+        self._days: Dict[int, List[Dict[str, str]]] = {}
+        self._offsets: Dict[int, int] = {}
+        self._day_rows = max(1, int(day_rows))
+
+    # --- Qt model API ---------------------------------------------------
+    def rowCount(self, parent=QtCore.QModelIndex()):  # noqa: N802 - Qt API
+        if parent.isValid():
+            return 0
+        return len(self._weeks)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):  # noqa: N802 - Qt API
+        if parent.isValid():
+            return 0
+        return 7
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        day = self.date_at(index)
+        if day is None:
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return str(day.day)
+        if role == DateRole:
+            return day
+        if role == InMonthRole:
+            return day.month == self.month
+        if role == EntriesRole:
+            if day.month != self.month:
+                return []
+            return [dict(row) for row in self._days.get(day.day, [])]
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):  # noqa: N802
+        if (
+            orientation == QtCore.Qt.Horizontal
+            and role == QtCore.Qt.DisplayRole
+            and 0 <= section < len(WEEKDAY_TITLES)
+        ):
+            return WEEKDAY_TITLES[section]
+        return super().headerData(section, orientation, role)
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):  # noqa: N802 - Qt API
+        if role != EntriesRole:
+            return False
+        day = self.date_at(index)
+        if day is None or day.month != self.month:
+            return False
+        rows = [_normalize_row(row) for row in (value or [])]
+        if rows:
+            self._days[day.day] = rows
+        else:
+            self._days.pop(day.day, None)
+        self.dataChanged.emit(index, index, [EntriesRole])
+        self.entriesChanged.emit(day.day)
+        return True
+
+    def flags(self, index):
+        day = self.date_at(index)
+        if day is None:
+            return QtCore.Qt.NoItemFlags
+        if day.month != self.month:
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable
+
+    # --- month data -----------------------------------------------------
+    def set_month(
+        self, year: int, month: int, days: Dict[int, List[Dict[str, str]]]
+    ) -> None:
+        """Replace the displayed month without touching any view widgets."""
+
+        weeks = calendar.Calendar().monthdatescalendar(year, month)
+        normalized = {
+            int(day): [_normalize_row(row) for row in rows]
+            for day, rows in (days or {}).items()
+        }
+        self._offsets.clear()
+        if len(weeks) != len(self._weeks):
+            self.beginResetModel()
+            self.year, self.month = year, month
+            self._weeks = weeks
+            self._days = normalized
+            self.endResetModel()
+            return
+        self.year, self.month = year, month
+        self._weeks = weeks
+        self._days = normalized
+        if self._weeks:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._weeks) - 1, 6)
+            )
+
+    def month_days(self) -> Dict[int, List[Dict[str, str]]]:
+        """Return non-empty entries of the current month keyed by day."""
+
+        result: Dict[int, List[Dict[str, str]]] = {}
+        for day, rows in self._days.items():
+            kept = [dict(row) for row in rows if any(row.get(k) for k in FIELDS)]
+            if kept:
+                result[day] = kept
+        return result
+
+    def date_at(self, index: QtCore.QModelIndex) -> date | None:
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if not (0 <= row < len(self._weeks) and 0 <= col < 7):
+            return None
+        return self._weeks[row][col]
+
+    def date_map(self) -> Dict[tuple[int, int], date]:
+        return {
+            (r, c): day
+            for r, week in enumerate(self._weeks)
+            for c, day in enumerate(week)
+        }
+
+    def day_rows(self) -> int:
+        return self._day_rows
+
+    def set_day_rows(self, rows: int) -> None:
+        rows = max(1, int(rows))
+        if rows == self._day_rows:
+            return
+        self._day_rows = rows
+        if self._weeks:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._weeks) - 1, 6)
+            )
+
+    def row_offset(self, index: QtCore.QModelIndex) -> int:
+        """Index of the first entry shown in the day at ``index``."""
+
+        day = self.date_at(index)
+        if day is None or day.month != self.month:
+            return 0
+        limit = scroll_limit(len(self._days.get(day.day, [])), self._day_rows)
+        return min(self._offsets.get(day.day, 0), limit)
+
+    def hidden_count(self, index: QtCore.QModelIndex) -> int:
+        day = self.date_at(index)
+        if day is None or day.month != self.month:
+            return 0
+        count = len(self._days.get(day.day, []))
+        return hidden_entries(count, self.row_offset(index), self._day_rows)
+
+    def scroll_day(self, index: QtCore.QModelIndex, steps: int) -> bool:
+        """Move the visible window of the day by ``steps`` entries."""
+
+        day = self.date_at(index)
+        if day is None or day.month != self.month:
+            return False
+        limit = scroll_limit(len(self._days.get(day.day, [])), self._day_rows)
+        current = self.row_offset(index)
+        offset = max(0, min(limit, current + steps))
+        if offset == current:
+            return False
+        self._offsets[day.day] = offset
+        self.dataChanged.emit(index, index, [EntriesRole])
+        return True
+
+    def entry(self, index: QtCore.QModelIndex, sub_row: int, column: int) -> str:
+        day = self.date_at(index)
+        if day is None or not (0 <= column < len(FIELDS)):
+            return ""
+        rows = self._days.get(day.day, [])
+        if day.month != self.month or not (0 <= sub_row < len(rows)):
+            return ""
+        return rows[sub_row].get(FIELDS[column], "")
+
+    def set_entry(
+        self, index: QtCore.QModelIndex, sub_row: int, column: int, text: str
+    ) -> bool:
+        """Store ``text`` for the sub-row/column of the day at ``index``."""
+
+        day = self.date_at(index)
+        if day is None or day.month != self.month:
+            return False
+        if not (0 <= column < len(FIELDS)) or sub_row < 0:
+            return False
+        rows = [dict(row) for row in self._days.get(day.day, [])]
+        while len(rows) <= sub_row:
+            rows.append({key: "" for key in FIELDS})
+        text = (text or "").strip()
+        if rows[sub_row].get(FIELDS[column], "") == text:
+            return False
+        rows[sub_row][FIELDS[column]] = text
+        while rows and not any(rows[-1].get(k) for k in FIELDS):
+            rows.pop()
+        return self.setData(index, rows, EntriesRole)
+
+
+class DayCellDelegate(QtWidgets.QStyledItemDelegate):
+    """Paint a calendar day and edit its sub-cells in place."""
+
+    def __init__(self, parent: QtWidgets.QAbstractItemView | None = None):
+        super().__init__(parent)
+        self.workspace = QtGui.QColor("#1e1e21")
+        self.accent = QtGui.QColor("#39ff14")
+        self.text_color = QtGui.QColor("#f0f0f0")
+        self.header_font = QtGui.QFont()
+        self.text_font = QtGui.QFont()
+        self.radius = 8
+        self._weights: List[float] = [1.0, 1.0, 1.0]
+        self._edit_target: tuple[int, int] = (0, 0)
+
+    # --- configuration --------------------------------------------------
+    def set_colors(
+        self,
+        workspace: QtGui.QColor,
+        accent: QtGui.QColor,
+        text_color: QtGui.QColor,
+    ) -> None:
+        self.workspace = QtGui.QColor(workspace)
+        self.accent = QtGui.QColor(accent)
+        self.text_color = QtGui.QColor(text_color)
+
+    def set_fonts(self, header_font: QtGui.QFont, text_font: QtGui.QFont) -> None:
+        self.header_font = QtGui.QFont(header_font)
+        self.text_font = QtGui.QFont(text_font)
+
+    def set_column_weights(self, widths: Sequence[int]) -> None:
+        weights = [max(1.0, float(w)) for w in list(widths)[: len(FIELDS)]]
+        while len(weights) < len(FIELDS):
+            weights.append(weights[-1] if weights else 1.0)
+        self._weights = weights
+
+    def column_weights(self) -> List[float]:
+        return list(self._weights)
+
+    def set_edit_target(self, sub_row: int, column: int) -> None:
+        self._edit_target = (max(0, sub_row), max(0, min(len(FIELDS) - 1, column)))
+
+    # --- geometry -------------------------------------------------------
+    def _layout(self, rect: QtCore.QRect, day_rows: int):
+        inner = rect.adjusted(3, 2, -3, -3)
+        label_h = QtGui.QFontMetrics(self.header_font).height() + 2
+        header_h = QtGui.QFontMetrics(self.header_font).height() + 2
+        day_rect = QtCore.QRect(inner.left(), inner.top(), inner.width(), label_h)
+        header_rect = QtCore.QRect(
+            inner.left(), day_rect.bottom() + 1, inner.width(), header_h
+        )
+        body_top = header_rect.bottom() + 1
+        body_h = max(0, inner.bottom() - body_top + 1)
+        row_h = body_h / max(1, day_rows)
+        total = sum(self._weights) or 1.0
+        xs = [inner.left()]
+        for weight in self._weights:
+            xs.append(xs[-1] + inner.width() * weight / total)
+        xs[-1] = inner.right() + 1
+        return day_rect, header_rect, body_top, row_h, xs
+
+    def sub_cell_rect(
+        self, rect: QtCore.QRect, day_rows: int, sub_row: int, column: int
+    ) -> QtCore.QRect:
+        _day, _header, body_top, row_h, xs = self._layout(rect, day_rows)
+        top = int(body_top + sub_row * row_h)
+        bottom = int(body_top + (sub_row + 1) * row_h)
+        return QtCore.QRect(
+            int(xs[column]), top, int(xs[column + 1] - xs[column]), max(1, bottom - top)
+        )
+
+    def more_rect(self, rect: QtCore.QRect) -> QtCore.QRect:
+        """Area of the "+N" marker in the top right corner of a day."""
+
+        day_rect = self._layout(rect, 1)[0]
+        width = QtGui.QFontMetrics(self.text_font).horizontalAdvance("+99") + 6
+        return QtCore.QRect(day_rect.right() - width + 1, day_rect.top(), width, day_rect.height())
+
+    def hit_test(
+        self, rect: QtCore.QRect, day_rows: int, pos: QtCore.QPoint
+    ) -> tuple[int, int] | None:
+        """Return ``(sub_row, column)`` under ``pos`` or ``None``."""
+
+        _day, _header, body_top, row_h, xs = self._layout(rect, day_rows)
+        if pos.y() < body_top or row_h <= 0:
+            return None
+        sub_row = int((pos.y() - body_top) // row_h)
+        if not (0 <= sub_row < day_rows):
+            return None
+        for column in range(len(FIELDS)):
+            if xs[column] <= pos.x() < xs[column + 1]:
+                return sub_row, column
+        return None
+
+    # --- painting -------------------------------------------------------
+    def paint(self, painter, option, index):
+        model = index.model()
+        day_rows = model.day_rows() if hasattr(model, "day_rows") else 1
+        in_month = bool(index.data(InMonthRole))
+        hovered = bool(option.state & QtWidgets.QStyle.State_MouseOver) and in_month
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        cell = QtCore.QRectF(option.rect).adjusted(1.5, 1.5, -1.5, -1.5)
+        background = self.workspace if in_month else QtGui.QColor("#2a2a2a")
+        border = QtGui.QColor(self.accent)
+        if not hovered:
+            border.setAlpha(90 if in_month else 0)
+        painter.setBrush(background)
+        painter.setPen(QtGui.QPen(border, 2 if hovered else 1))
+        painter.drawRoundedRect(cell, self.radius, self.radius)
+
+        day_rect, header_rect, body_top, row_h, xs = self._layout(
+            option.rect, day_rows
+        )
+        painter.setFont(self.header_font)
+        painter.setPen(self.text_color if in_month else QtGui.QColor("#777"))
+        painter.drawText(day_rect, QtCore.Qt.AlignCenter, str(index.data()))
+
+        if in_month:
+            grid = QtGui.QColor(255, 255, 255, 40)
+            painter.setPen(self.accent)
+            for column, title in enumerate(FIELD_TITLES):
+                section = QtCore.QRectF(
+                    xs[column], header_rect.top(), xs[column + 1] - xs[column],
+                    header_rect.height(),
+                )
+                painter.drawText(section, QtCore.Qt.AlignCenter, title)
+            painter.drawLine(
+                QtCore.QPointF(xs[0], header_rect.bottom() + 0.5),
+                QtCore.QPointF(xs[-1], header_rect.bottom() + 0.5),
+            )
+            painter.setPen(grid)
+            for column in range(1, len(FIELDS)):
+                painter.drawLine(
+                    QtCore.QPointF(xs[column], body_top),
+                    QtCore.QPointF(xs[column], option.rect.bottom() - 3),
+                )
+            for sub_row in range(1, day_rows):
+                y = body_top + sub_row * row_h
+                painter.drawLine(QtCore.QPointF(xs[0], y), QtCore.QPointF(xs[-1], y))
+
+            painter.setFont(self.text_font)
+            painter.setPen(self.text_color)
+            metrics = QtGui.QFontMetrics(self.text_font)
+            entries = index.data(EntriesRole) or []
+            offset = model.row_offset(index) if hasattr(model, "row_offset") else 0
+            for sub_row, row in enumerate(entries[offset : offset + day_rows]):
+                for column, key in enumerate(FIELDS):
+                    text = row.get(key, "")
+                    if not text:
+                        continue
+                    target = self.sub_cell_rect(option.rect, day_rows, sub_row, column)
+                    target = target.adjusted(3, 0, -3, 0)
+                    elided = metrics.elidedText(
+                        text, QtCore.Qt.ElideRight, target.width()
+                    )
+                    painter.drawText(
+                        target, QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft, elided
+                    )
+            hidden = hidden_entries(len(entries), offset, day_rows)
+            if hidden:
+                painter.setPen(self.accent)
+                painter.drawText(
+                    self.more_rect(option.rect),
+                    QtCore.Qt.AlignVCenter | QtCore.Qt.AlignRight,
+                    f"+{hidden}",
+                )
+        painter.restore()
+
+    # --- editing --------------------------------------------------------
+    def createEditor(self, parent, option, index):  # noqa: N802 - Qt API
+        editor = QtWidgets.QLineEdit(parent)
+        editor.setFrame(False)
+        editor.setFont(self.text_font)
+        editor.setStyleSheet(
+            "QLineEdit{"
+            f"background-color:{self.workspace.name()};"
+            f"color:{self.text_color.name()};"
+            f"border:1px solid {self.accent.name()};"
+            "border-radius:4px;"
+            "}"
+        )
+        return editor
+
+    def setEditorData(self, editor, index):  # noqa: N802 - Qt API
+        model = index.model()
+        sub_row, column = self._edit_target
+        sub_row += model.row_offset(index)
+        editor.setText(model.entry(index, sub_row, column))
+        editor.selectAll()
+
+    def setModelData(self, editor, model, index):  # noqa: N802 - Qt API
+        sub_row, column = self._edit_target
+        sub_row += model.row_offset(index)
+        model.set_entry(index, sub_row, column, editor.text())
+
+    def updateEditorGeometry(self, editor, option, index):  # noqa: N802 - Qt API
+        model = index.model()
+        day_rows = model.day_rows() if hasattr(model, "day_rows") else 1
+        sub_row, column = self._edit_target
+        editor.setGeometry(self.sub_cell_rect(option.rect, day_rows, sub_row, column))
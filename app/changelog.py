@@ -0,0 +1,168 @@
+"""Append-only per-year change logs for the month and stats stores.
+
+Instead of rewriting a whole month (or a whole year of stats) for every edit,
+callers append small ``set``/``del`` entries to ``<year>.log`` next to the
+JSON snapshots.  Loaders apply the log on top of the snapshot; once the log
+grows past :data:`COMPACT_THRESHOLD` entries it is folded back into the
+snapshots in their usual format and removed.  ``set`` entries and day
+``del`` entries carry absolute values, so replaying them over an already
+compacted snapshot (after a crash between writing the snapshot and removing
+the log) is harmless.  A record ``del`` removes by index and shifts the later
+records, so it is not safe to replay; the stats store only logs ``set``.
+
+Entry format, one JSON object per line::
+
+    {"op": "set", "month": 3, "item": 14, "value": [...]}
+    {"op": "del", "month": 3, "item": 14}
+
+For months ``item`` is the day and ``value`` the day's rows; for stats it is
+the index of the record within the month and ``value`` the record.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+COMPACT_THRESHOLD = 200
+LOG_SUFFIX = ".log"
+
+# Callers create a YearLog per operation, so the locks live per log file.
+_LOCKS: Dict[str, threading.Lock] = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def _lock_for(path: str) -> threading.Lock:
+    key = os.path.normcase(os.path.abspath(path))
+    with _LOCKS_GUARD:
+        lock = _LOCKS.get(key)
+        if lock is None:
+            lock = _LOCKS[key] = threading.Lock()
+        return lock
+
+
+class YearLog:
+    """JSON-lines change log of one year of a store."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = _lock_for(path)
+
+    def append(self, entries: Iterable[Dict[str, Any]]) -> None:
+        lines = "".join(json.dumps(e, ensure_ascii=False) + "\n" for e in entries)
+        if not lines:
+            return
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            if self._ends_torn():
+                # Keep a half-written entry from swallowing the new ones.
+                lines = "\n" + lines
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _ends_torn(self) -> bool:
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except FileNotFoundError:
+            return False
+
+    def entries(self, month: int | None = None) -> List[Dict[str, Any]]:
+        """Return the logged entries, optionally only those of ``month``.
+
+        A torn last line left by a crash during append is skipped.
+        """
+
+        if not os.path.exists(self.path):
+            return []
+        result: List[Dict[str, Any]] = []
+        with self._lock, open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning("Skipping damaged entry in %s", self.path)
+                    continue
+                if month is None or entry.get("month") == month:
+                    result.append(entry)
+        return result
+
+    def __len__(self) -> int:
+        if not os.path.exists(self.path):
+            return 0
+        with self._lock, open(self.path, "r", encoding="utf-8") as f:
+            return sum(1 for _ in f)
+
+    def needs_compaction(self) -> bool:
+        return len(self) >= COMPACT_THRESHOLD
+
+    def clear(self) -> None:
+        with self._lock:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def log_path(directory: str, year: int) -> str:
+    return os.path.join(directory, f"{year}{LOG_SUFFIX}")
+
+
+def diff_days(
+    old: Dict[int, List[Dict[str, str]]],
+    new: Dict[int, List[Dict[str, str]]],
+    month: int,
+) -> List[Dict[str, Any]]:
+    """Return the day-level entries turning ``old`` into ``new``."""
+
+    entries: List[Dict[str, Any]] = []
+    for day in sorted(set(old) | set(new)):
+        rows = new.get(day)
+        if not rows:
+            if old.get(day):
+                entries.append({"op": "del", "month": month, "item": day})
+        elif rows != old.get(day):
+            entries.append({"op": "set", "month": month, "item": day, "value": rows})
+    return entries
+
+
+def apply_day_entries(
+    days: Dict[int, List[Dict[str, str]]], entries: Iterable[Dict[str, Any]]
+) -> Dict[int, List[Dict[str, str]]]:
+    """Apply month entries to ``days`` (keyed by day number) in place."""
+
+    for entry in entries:
+        day = int(entry.get("item", 0))
+        if entry.get("op") == "set":
+            days[day] = list(entry.get("value") or [])
+        else:
+            days.pop(day, None)
+    return days
+
+
+def apply_record_entries(
+    data: Dict[str, List[Dict[str, Any]]], entries: Iterable[Dict[str, Any]]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Apply stats entries to ``data`` (keyed by month string) in place."""
+
+    for entry in entries:
+        records = data.setdefault(str(entry.get("month")), [])
+        index = int(entry.get("item", 0))
+        if entry.get("op") == "set":
+            while len(records) <= index:
+                records.append({})
+            records[index] = entry.get("value") or {}
+        elif 0 <= index < len(records):
+            records.pop(index)
+    return data
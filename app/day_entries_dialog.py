@@ -0,0 +1,109 @@
+"""Editor of all entries of one calendar day (opened from the "+N" marker)."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Dict, List, Sequence
+
+from PySide6 import QtWidgets, QtGui, QtCore
+
+import theme_registry
+from calendar_model import FIELDS, FIELD_TITLES
+from widgets import StyledPushButton
+from resources import icon
+from effects import register_neon
+import appdata
+
+
+class DayEntriesDialog(QtWidgets.QDialog):
+    """Диалог со всеми записями дня.
+
+    Ячейка календаря показывает только ``day_rows`` строк; здесь видны и
+    редактируются все записи, в том числе не поместившиеся в ячейку."""
+
+    def __init__(
+        self,
+        day: date,
+        entries: Sequence[Dict[str, str]],
+        parent: QtWidgets.QWidget | None = None,
+    ):
+        super().__init__(parent)
+        self.day = day
+        self.setWindowTitle(f"Записи на {day.strftime('%d.%m.%Y')}")
+        self.resize(480, 360)
+
+        lay = QtWidgets.QVBoxLayout(self)
+        self.table = QtWidgets.QTableWidget(0, len(FIELDS), self)
+        self.table.setHorizontalHeaderLabels(list(FIELD_TITLES))
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setAttribute(QtCore.Qt.WA_Hover, True)
+        register_neon(self.table, appdata.CONFIG)
+        lay.addWidget(self.table)
+
+        controls = QtWidgets.QHBoxLayout()
+        controls.addStretch()
+        btn_add = StyledPushButton("Добавить запись", self, **appdata.button_config())
+        btn_add.setIcon(icon("plus"))
+        btn_add.setIconSize(QtCore.QSize(16, 16))
+        btn_remove = StyledPushButton("Удалить запись", self, **appdata.button_config())
+        btn_remove.setIcon(icon("minus"))
+        btn_remove.setIconSize(QtCore.QSize(16, 16))
+        controls.addWidget(btn_add)
+        controls.addWidget(btn_remove)
+        lay.addLayout(controls)
+
+        box = QtWidgets.QDialogButtonBox(self)
+        btn_ok = StyledPushButton("Сохранить", self, **appdata.button_config())
+        btn_ok.setIcon(icon("save"))
+        btn_ok.setIconSize(QtCore.QSize(20, 20))
+        btn_cancel = StyledPushButton("Отмена", self, **appdata.button_config())
+        btn_cancel.setIcon(icon("x"))
+        btn_cancel.setIconSize(QtCore.QSize(20, 20))
+        box.addButton(btn_ok, QtWidgets.QDialogButtonBox.AcceptRole)
+        box.addButton(btn_cancel, QtWidgets.QDialogButtonBox.RejectRole)
+        box.accepted.connect(self.accept)
+        box.rejected.connect(self.reject)
+        lay.addWidget(box)
+
+        btn_add.clicked.connect(lambda: self.add_row())
+        btn_remove.clicked.connect(self.remove_selected_rows)
+
+        for entry in entries:
+            self.add_row(entry)
+        self.add_row()
+        self._apply_style()
+
+    def _apply_style(self) -> None:
+        workspace = QtGui.QColor(appdata.CONFIG.get("workspace_color", "#1e1e21")).name()
+        accent = QtGui.QColor(appdata.CONFIG.get("accent_color", "#39ff14")).name()
+        compiled = theme_registry.theme(accent=accent, workspace=workspace)
+        theme_registry.apply_style(self.table, compiled.get("dialog_table"))
+        theme_registry.apply_style(
+            self.table.horizontalHeader(), compiled.get("dialog_header", 6)
+        )
+
+    def add_row(self, entry: Dict[str, str] | None = None) -> None:
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        for column, key in enumerate(FIELDS):
+            text = str(entry.get(key, "") or "") if entry else ""
+            self.table.setItem(row, column, QtWidgets.QTableWidgetItem(text))
+
+    def remove_selected_rows(self) -> None:
+        for row in sorted({i.row() for i in self.table.selectedIndexes()}, reverse=True):
+            self.table.removeRow(row)
+
+    def entries(self) -> List[Dict[str, str]]:
+        """Return the non-empty rows in table order."""
+
+        result: List[Dict[str, str]] = []
+        for row in range(self.table.rowCount()):
+            values = {}
+            for column, key in enumerate(FIELDS):
+                item = self.table.item(row, column)
+                values[key] = item.text().strip() if item else ""
+            if any(values.values()):
+                result.append(values)
+        return result
@@ -4,6 +4,10 @@ from PySide6 import QtWidgets, QtGui, QtCore
 import shiboken6
 import weakref
 
+import config as app_config
+import glow
+import theme_registry
+
 
 class FixedDropShadowEffect(QtWidgets.QGraphicsDropShadowEffect):
     """Drop shadow effect that preserves the original bounding rectangle."""
@@ -64,6 +68,54 @@ def set_neon(
     return eff
 
 
+def _uses_overlay(widget: QtWidgets.QWidget, config: dict | None) -> bool:
+    # Callers holding an older config dict still follow the live setting.
+    renderer = (config or {}).get("neon_renderer") or app_config.CONFIG.get(
+        "neon_renderer", "overlay"
+    )
+    if renderer != "overlay":
+        return False
+    if isinstance(widget, (QtWidgets.QDialog, QtWidgets.QMainWindow)):
+        return False
+    # A widget shown as its own window has no overlay above it; one without
+    # a parent yet is tracked until it is placed into a window.
+    return not (widget.isWindow() and widget.isVisible())
+
+
+def _glow_params(config: dict | None, intensity_scale: float) -> tuple[int, int]:
+    """Return the configured blur radius and scaled glow intensity."""
+
+    blur_radius = 20
+    intensity = 255
+    if config:
+        try:
+            blur_radius = int(config.get("neon_size", blur_radius))
+        except (TypeError, ValueError):
+            blur_radius = 20
+        try:
+            intensity = int(config.get("neon_intensity", intensity))
+        except (TypeError, ValueError):
+            intensity = 255
+    blur_radius = max(0, blur_radius)
+    intensity = max(0, min(255, intensity))
+    intensity = max(0, min(255, int(round(intensity * intensity_scale))))
+    return blur_radius, intensity
+
+
+def _neon_sheet(widget: QtWidgets.QWidget, base: str, declarations: str) -> str:
+    """Return ``base`` extended by the neon ``declarations`` of ``widget``.
+
+    Bare declarations only parse in a sheet without selectors; when ``base``
+    holds rules they are wrapped in one selecting ``widget`` itself.
+    """
+
+    if "{" not in base:
+        return base + declarations
+    name = widget.objectName()
+    selector = f"#{name}" if name else widget.metaObject().className()
+    return f"{base}{selector}{{{declarations.strip()}}}"
+
+
 def apply_neon_effect(
     widget: QtWidgets.QWidget,
     on: bool = True,
@@ -98,6 +150,11 @@ def apply_neon_effect(
     thickness_scale: float
         Multiplier for the configured border thickness when ``border`` is
         enabled. Allows keeping a thinner outline for idle states.
+
+    With ``neon_renderer`` set to ``"overlay"`` (the default) the shadow is
+    painted by the window's :class:`glow.GlowOverlay` from cached pixmaps;
+    ``"effect"`` keeps the per-widget drop shadow.  Windows themselves always
+    use the drop shadow since no overlay lies above them.
     """
 
     if widget is None or not shiboken6.isValid(widget):
@@ -133,34 +190,30 @@ def apply_neon_effect(
             widget._neon_prev_style = widget.styleSheet()
         prev_style = widget._neon_prev_style or ""
         border_radius_style = ""
+        corner_radius = 0
         if prev_style:
             matches = re.findall(r"border-radius\s*:\s*[^;]+", prev_style, re.IGNORECASE)
             if matches:
                 border_radius_value = matches[-1].strip()
                 border_radius_style = f" {border_radius_value.rstrip(';')};"
+                radius_match = re.search(r"(\d+)\s*px", border_radius_value)
+                if radius_match:
+                    corner_radius = int(radius_match.group(1))
         color = widget.palette().color(QtGui.QPalette.Highlight)
         eff = None
-        blur_radius = 20
-        intensity = 255
-        if config:
-            try:
-                blur_radius = int(config.get("neon_size", blur_radius))
-            except (TypeError, ValueError):
-                blur_radius = 20
-            try:
-                intensity = int(config.get("neon_intensity", intensity))
-            except (TypeError, ValueError):
-                intensity = 255
-        blur_radius = max(0, blur_radius)
-        intensity = max(0, min(255, intensity))
-        scaled_intensity = int(round(intensity * intensity_scale))
-        intensity = max(0, min(255, scaled_intensity))
+        blur_radius, intensity = _glow_params(config, intensity_scale)
         scaled_thickness = int(round(thickness * thickness_scale))
         if thickness > 0 and thickness_scale > 0 and scaled_thickness == 0:
             scaled_thickness = 1
         thickness = max(0, scaled_thickness)
 
-        if shadow:
+        if shadow and _uses_overlay(widget, config):
+            widget.setGraphicsEffect(None)
+            effect_color = QtGui.QColor(color)
+            effect_color.setAlpha(intensity)
+            eff = glow.register_glow(widget, effect_color, blur_radius, corner_radius)
+        elif shadow:
+            glow.unregister_glow(widget)
             eff = FixedDropShadowEffect(widget)
             eff.setOffset(0, 0)
             eff.setBlurRadius(blur_radius)
@@ -172,6 +225,7 @@ def apply_neon_effect(
             except RuntimeError:
                 return
         else:
+            glow.unregister_glow(widget)
             widget.setGraphicsEffect(None)
         if getattr(widget, "_neon_prev_palette", None) is None:
             widget._neon_prev_palette = QtGui.QPalette(widget.palette())
@@ -187,9 +241,13 @@ def apply_neon_effect(
         else:
             border_style = ""
         text_style = f" color:{color.name()};"
-        widget.setStyleSheet(prev_style + text_style + border_style + border_radius_style)
+        theme_registry.apply_style(
+            widget,
+            _neon_sheet(widget, prev_style, text_style + border_style + border_radius_style),
+        )
         widget._neon_effect = eff
     else:
+        glow.unregister_glow(widget)
         prev = getattr(widget, "_neon_prev_effect", None)
         widget._neon_prev_effect = None
         prev_palette = getattr(widget, "_neon_prev_palette", None)
@@ -212,103 +270,222 @@ def apply_neon_effect(
                 pass
         prev_style = getattr(widget, "_neon_prev_style", None)
         if prev_style:
-            widget.setStyleSheet(prev_style)
+            theme_registry.apply_style(widget, prev_style)
         elif isinstance(widget, QtWidgets.QLabel):
-            widget.setStyleSheet("")
+            theme_registry.apply_style(widget, "")
         else:
-            widget.setStyleSheet("border:0px solid transparent;")
+            theme_registry.apply_style(widget, "border:0px solid transparent;")
         widget._neon_prev_style = None
         widget._neon_effect = None
 
 
-class NeonEventFilter(QtCore.QObject):
-    """Event filter toggling neon effect on hover and focus events."""
+def update_neon_glow(
+    widget: QtWidgets.QWidget,
+    intensity_scale: float = 1.0,
+    *,
+    config: dict | None = None,
+) -> bool:
+    """Retint the active neon of ``widget`` without restyling it.
+
+    Only the glow strength and the text color follow the current highlight;
+    the stylesheet and the effect object are kept.  Returns ``False`` when
+    ``widget`` has no neon to update, :func:`apply_neon_effect` is needed then.
+    """
+
+    if widget is None or not shiboken6.isValid(widget):
+        return False
+    eff = getattr(widget, "_neon_effect", None)
+    if eff is None or isinstance(eff, glow.GlowSpec) != _uses_overlay(widget, config):
+        return False
+    try:
+        intensity_scale = max(0.0, float(intensity_scale))
+    except (TypeError, ValueError):
+        intensity_scale = 1.0
+    blur_radius, intensity = _glow_params(config, intensity_scale)
+    palette = widget.palette()
+    highlight = palette.color(QtGui.QPalette.Highlight)
+    color = QtGui.QColor(highlight)
+    color.setAlpha(intensity)
+    if isinstance(eff, glow.GlowSpec):
+        widget._neon_effect = glow.register_glow(widget, color, blur_radius, eff.radius)
+    elif (
+        isinstance(eff, QtWidgets.QGraphicsDropShadowEffect)
+        and shiboken6.isValid(eff)
+        and widget.graphicsEffect() is eff
+    ):
+        eff.setColor(color)
+        eff.setBlurRadius(blur_radius)
+    else:
+        return False
+    if palette.color(QtGui.QPalette.ButtonText) != highlight:
+        palette.setColor(QtGui.QPalette.ButtonText, highlight)
+        widget.setPalette(palette)
+    return True
+
+
+def _cpp_key(obj: QtCore.QObject) -> int:
+    return shiboken6.getCppPointer(obj)[0]
+
 
-    def __init__(self, widget: QtWidgets.QWidget, config: dict):
-        super().__init__(widget)
-        self._widget = weakref.ref(widget)
-        self._config = config
-        widget.destroyed.connect(self._on_widget_destroyed)
+class NeonDispatcher(QtCore.QObject):
+    """Single router of neon focus changes.
 
-    def _on_widget_destroyed(self, obj=None) -> None:
-        widget = self._widget()
-        if widget is not None and shiboken6.isValid(widget):
-            widget.removeEventFilter(self)
+    Widgets are kept in a registry keyed by their C++ object together with
+    the config styling them; nothing is installed on the widgets, so their
+    events never reach Python.  Focus is followed through
+    ``QApplication.focusChanged``: the neon moves to the registered widget
+    owning the new focus widget (the widget itself or an ancestor).  Hover
+    needs no Python either, widgets with ``WA_Hover`` get the ``:hover`` rules
+    of their stylesheet.
+    """
 
-    def update_config(self, config: dict) -> None:
-        self._config = config
+    def __init__(self, app: QtCore.QCoreApplication) -> None:
+        super().__init__(app)
+        # key -> (owner, config); helpers such as combo popups map to their owner
+        self._targets: dict[int, tuple[weakref.ref, dict]] = {}
+        if isinstance(app, QtWidgets.QApplication):
+            app.focusChanged.connect(self._on_focus_changed)
+
+    def register(
+        self,
+        widget: QtWidgets.QWidget,
+        config: dict,
+        owner: QtWidgets.QWidget | None = None,
+    ) -> None:
+        key = _cpp_key(widget)
+        entry = self._targets.get(key)
+        if entry is None:
+            widget.destroyed.connect(lambda _obj=None, key=key: self._targets.pop(key, None))
+        if owner is not None:
+            ref = weakref.ref(owner)
+        else:
+            ref = entry[0] if entry is not None else weakref.ref(widget)
+        self._targets[key] = (ref, config)
 
-    def _start(self) -> None:
-        widget = self._widget()
-        if getattr(widget, "_neon_effect", None):
-            return
-        apply_neon_effect(widget, True, config=self._config)
+    def unregister(self, widget: QtWidgets.QWidget) -> None:
+        self._targets.pop(_cpp_key(widget), None)
 
-    def _stop(self) -> None:
-        widget = self._widget()
-        if widget is None or not shiboken6.isValid(widget):
-            return
-        apply_neon_effect(widget, False, config=self._config)
+    def target_for(
+        self, widget: QtWidgets.QWidget | None
+    ) -> tuple[QtWidgets.QWidget, dict] | None:
+        """Return the owner and config ``widget`` is registered with."""
 
-    def eventFilter(self, obj, event):  # noqa: D401 - Qt event filter signature
-        widget = self._widget()
         if widget is None or not shiboken6.isValid(widget):
-            return False
-
-        etype = event.type()
-
-        if etype in (
-            QtCore.QEvent.FocusIn,
-            QtCore.QEvent.MouseButtonDblClick,
-        ):
-            self._start()
-            if etype == QtCore.QEvent.FocusIn:
-                focus = QtWidgets.QApplication.focusWidget()
-                if (
-                    focus is not None
-                    and focus is not widget
-                    and widget.isAncestorOf(focus)
-                ):
-                    focus.installEventFilter(self)
-
-        elif etype == QtCore.QEvent.FocusOut:
-            focus = QtWidgets.QApplication.focusWidget()
-            if obj is widget and focus is not None and widget.isAncestorOf(focus):
-                focus.installEventFilter(self)
-            else:
-                self._stop()
+            return None
+        entry = self._targets.get(_cpp_key(widget))
+        if entry is None:
+            return None
+        owner = entry[0]()
+        if owner is None or not shiboken6.isValid(owner):
+            return None
+        return owner, entry[1]
+
+    def _owner(
+        self, widget: QtWidgets.QWidget | None
+    ) -> tuple[QtWidgets.QWidget, dict] | None:
+        """Return the target of ``widget`` or of its nearest registered ancestor."""
+
+        while widget is not None:
+            target = self.target_for(widget)
+            if target is not None:
+                return target
+            if widget.isWindow():
+                return None
+            widget = widget.parentWidget()
+        return None
+
+    def _on_focus_changed(self, old, new) -> None:
+        previous = self._owner(old)
+        current = self._owner(new)
+        if previous is not None and (current is None or previous[0] is not current[0]):
+            widget = previous[0]
+            if new is None or not (new is widget or widget.isAncestorOf(new)):
+                apply_neon_effect(widget, False, config=previous[1])
+        if current is not None:
+            widget, config = current
+            if not getattr(widget, "_neon_effect", None):
+                apply_neon_effect(widget, True, config=config)
+
+
+_dispatcher: NeonDispatcher | None = None
+
+
+def neon_dispatcher() -> NeonDispatcher | None:
+    """Return the dispatcher of the running application, creating it once."""
+
+    global _dispatcher
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        return None
+    if (
+        _dispatcher is None
+        or not shiboken6.isValid(_dispatcher)
+        or _dispatcher.parent() is not app
+    ):
+        _dispatcher = NeonDispatcher(app)
+    return _dispatcher
+
+
+def register_neon(
+    widget: QtWidgets.QWidget,
+    config: dict,
+    owner: QtWidgets.QWidget | None = None,
+) -> None:
+    """Light the neon of ``widget`` (or ``owner``) while it holds the focus.
 
-        elif etype in (
-            QtCore.QEvent.HoverLeave,
-            QtCore.QEvent.Leave,
-        ):
-            if not widget.hasFocus():
-                self._stop()
+    Registering again replaces the config and keeps an earlier ``owner``.
+    ``owner`` routes a helper outside the widget's children, e.g. a combo box
+    popup, to its control.
+    """
 
-        return False
+    dispatcher = neon_dispatcher()
+    if dispatcher is not None and widget is not None and shiboken6.isValid(widget):
+        dispatcher.register(widget, config, owner)
+
+
+def unregister_neon(widget: QtWidgets.QWidget) -> None:
+    """Stop following the focus of ``widget``."""
+
+    dispatcher = neon_dispatcher()
+    if dispatcher is not None and widget is not None and shiboken6.isValid(widget):
+        dispatcher.unregister(widget)
+
+
+def neon_registered(widget: QtWidgets.QWidget) -> bool:
+    dispatcher = neon_dispatcher()
+    return dispatcher is not None and dispatcher.target_for(widget) is not None
 
 
 def update_neon_filters(root: QtWidgets.QWidget, config: dict) -> None:
-    """Recursively update neon event filters according to configuration."""
+    """Register every hover-enabled widget under ``root`` for neon."""
+
+    if root is None or not shiboken6.isValid(root):
+        return
+    dispatcher = neon_dispatcher()
+    if dispatcher is None:
+        return
+    for widget in [root] + root.findChildren(QtWidgets.QWidget):
+        if shiboken6.isValid(widget) and widget.testAttribute(QtCore.Qt.WA_Hover):
+            dispatcher.register(widget, config)
+
+
+def apply_neon_to_inputs(root: QtWidgets.QWidget) -> None:
+    """Register the editable input widgets under ``root`` for neon."""
 
     if root is None or not shiboken6.isValid(root):
         return
 
-    def _process(widget: QtWidgets.QWidget) -> None:
-        if widget is None or not shiboken6.isValid(widget):
-            return
-        if not widget.testAttribute(QtCore.Qt.WA_Hover):
-            return
-        filt = getattr(widget, "_neon_filter", None)
-        if filt is None:
-            filt = NeonEventFilter(widget, config)
-            widget.installEventFilter(filt)
-            if hasattr(widget, "viewport"):
-                widget.viewport().installEventFilter(filt)
-            widget._neon_filter = filt
-        elif filt is not None:
-            filt._config = config
-
-    widgets = [root] + root.findChildren(QtWidgets.QWidget)
-    for w in widgets:
-        _process(w)
+    targets = (
+        QtWidgets.QLineEdit,
+        QtWidgets.QPlainTextEdit,
+        QtWidgets.QTextEdit,
+        QtWidgets.QAbstractSpinBox,
+        QtWidgets.QComboBox,
+        QtWidgets.QCheckBox,
+        QtWidgets.QSlider,
+    )
+
+    for w in [root] + root.findChildren(QtWidgets.QWidget):
+        if isinstance(w, targets):
+            w.setAttribute(QtCore.Qt.WA_Hover, True)
+            register_neon(w, app_config.CONFIG)
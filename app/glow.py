@@ -0,0 +1,429 @@
+"""Neon glow painted by one overlay per window.
+
+A ``QGraphicsDropShadowEffect`` makes Qt render its widget offscreen and blur
+it again on every repaint.  Here a highlighted widget only registers its glow
+(:func:`register_glow`): a transparent :class:`GlowOverlay` on top of the
+widget's window paints a pre-blurred rounded-rect pixmap around it.  Widgets
+stacked above the glowing one are cut out of the glow, so it shows only where
+a drop shadow would.  The pixmaps come from :class:`GlowPixmapCache`, keyed by size, corner radius,
+blur, color and intensity, so hovering the same kind of widget twice blurs
+nothing.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Set, Tuple
+
+import shiboken6
+from PySide6 import QtCore, QtGui, QtWidgets
+
+CACHE_CAPACITY = 128
+
+_TRACKED_EVENTS = (
+    QtCore.QEvent.Move,
+    QtCore.QEvent.Resize,
+    QtCore.QEvent.Show,
+    QtCore.QEvent.Hide,
+    QtCore.QEvent.ParentChange,
+)
+
+
+@dataclass(frozen=True)
+class GlowSpec:
+    """Appearance of one glow; ``rgba`` already carries the intensity."""
+
+    rgba: int
+    blur: int
+    radius: int = 0
+
+
+def _key(widget: QtWidgets.QWidget) -> int:
+    # Wrappers of C++-owned widgets (headers, viewports) may be recreated,
+    # so registrations are keyed by the C++ object instead of ``id()``.
+    return shiboken6.getCppPointer(widget)[0]
+
+
+def _blur_image(image: QtGui.QImage, radius: int) -> QtGui.QImage:
+    """Blur ``image`` with the same kernel Qt uses for drop shadows."""
+
+    scene = QtWidgets.QGraphicsScene()
+    item = QtWidgets.QGraphicsPixmapItem(QtGui.QPixmap.fromImage(image))
+    effect = QtWidgets.QGraphicsBlurEffect()
+    effect.setBlurRadius(radius)
+    effect.setBlurHints(QtWidgets.QGraphicsBlurEffect.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+    result = QtGui.QImage(image.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    result.fill(QtCore.Qt.transparent)
+    painter = QtGui.QPainter(result)
+    rect = QtCore.QRectF(0, 0, image.width(), image.height())
+    scene.render(painter, rect, rect)
+    painter.end()
+    return result
+
+
+def render_glow(size: QtCore.QSize, spec: GlowSpec) -> QtGui.QPixmap:
+    """Return the glow of a ``size`` widget, padded by ``spec.blur``.
+
+    The widget's own rounded rect is left transparent, so the glow never
+    tints its content.
+    """
+
+    pad = spec.blur
+    image = QtGui.QImage(
+        size.width() + 2 * pad,
+        size.height() + 2 * pad,
+        QtGui.QImage.Format_ARGB32_Premultiplied,
+    )
+    image.fill(QtCore.Qt.transparent)
+    shape = QtGui.QPainterPath()
+    shape.addRoundedRect(
+        QtCore.QRectF(pad, pad, size.width(), size.height()), spec.radius, spec.radius
+    )
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.fillPath(shape, QtGui.QColor.fromRgba(spec.rgba))
+    painter.end()
+    if pad > 0:
+        image = _blur_image(image, pad)
+    painter = QtGui.QPainter(image)
+    painter.setRenderHint(QtGui.QPainter.Antialiasing)
+    painter.setCompositionMode(QtGui.QPainter.CompositionMode_Clear)
+    painter.fillPath(shape, QtCore.Qt.transparent)
+    painter.end()
+    return QtGui.QPixmap.fromImage(image)
+
+
+class GlowPixmapCache:
+    """LRU cache of rendered glow pixmaps."""
+
+    def __init__(self, capacity: int = CACHE_CAPACITY) -> None:
+        self._capacity = max(1, capacity)
+        self._pixmaps: "OrderedDict[Tuple[int, int, GlowSpec], QtGui.QPixmap]" = OrderedDict()
+        self.misses = 0
+
+    def get(self, size: QtCore.QSize, spec: GlowSpec) -> QtGui.QPixmap:
+        key = (size.width(), size.height(), spec)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            return pixmap
+        self.misses += 1
+        pixmap = render_glow(size, spec)
+        self._pixmaps[key] = pixmap
+        while len(self._pixmaps) > self._capacity:
+            self._pixmaps.popitem(last=False)
+        return pixmap
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+
+
+GLOW_CACHE = GlowPixmapCache()
+
+
+class GlowOverlay(QtWidgets.QWidget):
+    """Transparent layer over a window painting the registered glows.
+
+    The overlay stays on top of the window's children; each glow is clipped
+    so that widgets stacked above its widget still cover it.
+    """
+
+    def __init__(self, window: QtWidgets.QWidget) -> None:
+        super().__init__(window)
+        self.setObjectName("GlowOverlay")
+        self.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
+        self.setAttribute(QtCore.Qt.WA_NoSystemBackground, True)
+        self.setFocusPolicy(QtCore.Qt.NoFocus)
+        self.setAutoFillBackground(False)
+        self._glows: Dict[int, Tuple[QtWidgets.QWidget, GlowSpec]] = {}
+        self._painted: Dict[int, QtCore.QRect] = {}
+        self._raise_pending = False
+        self.setGeometry(window.rect())
+        window.installEventFilter(self)
+        self.show()
+
+    @classmethod
+    def for_window(cls, window: QtWidgets.QWidget) -> "GlowOverlay":
+        overlay = getattr(window, "_glow_overlay", None)
+        if overlay is None or not shiboken6.isValid(overlay):
+            overlay = cls(window)
+            window._glow_overlay = overlay
+        return overlay
+
+    def glows(self) -> Dict[int, GlowSpec]:
+        return {key: spec for key, (_widget, spec) in self._glows.items()}
+
+    def add(self, widget: QtWidgets.QWidget, spec: GlowSpec) -> None:
+        self._glows[_key(widget)] = (widget, spec)
+        self.raise_()
+        self.refresh(widget)
+
+    def remove(self, widget: QtWidgets.QWidget) -> None:
+        key = _key(widget)
+        if self._glows.pop(key, None) is not None:
+            old = self._painted.pop(key, None)
+            if old is not None:
+                self.update(old)
+
+    def _glow_rect(self, widget: QtWidgets.QWidget, spec: GlowSpec) -> QtCore.QRect | None:
+        if not widget.isVisible() or widget.window() is not self.parentWidget():
+            return None
+        pad = spec.blur
+        top_left = widget.mapTo(self.parentWidget(), QtCore.QPoint(0, 0))
+        return QtCore.QRect(top_left, widget.size()).adjusted(-pad, -pad, pad, pad)
+
+    def _glow_clip(self, widget: QtWidgets.QWidget, spec: GlowSpec) -> QtGui.QRegion:
+        """Return the overlay area where the glow of ``widget`` may show.
+
+        The glow surrounds the visible part of the widget and, like a drop
+        shadow, stays inside the ancestors clipping it (scroll areas, the
+        collapsing sidebar) and under the siblings stacked above the widget
+        or one of those ancestors.
+        """
+
+        visible = widget.visibleRegion()
+        if visible.isEmpty():
+            return QtGui.QRegion()
+        window = self.parentWidget()
+        pad = spec.blur
+        origin = widget.mapTo(window, QtCore.QPoint(0, 0))
+        clip = visible.boundingRect().translated(origin).adjusted(-pad, -pad, pad, pad)
+        parent = widget.parentWidget()
+        while parent is not None and parent is not window:
+            top_left = parent.mapTo(window, QtCore.QPoint(0, 0))
+            clip = clip.intersected(QtCore.QRect(top_left, parent.size()))
+            parent = parent.parentWidget()
+        region = QtGui.QRegion(clip)
+        child = widget
+        while child is not window:
+            parent = child.parentWidget()
+            if parent is None:
+                break
+            siblings = parent.children()
+            # children() follows the stacking order, later ones paint above
+            for sibling in siblings[siblings.index(child) + 1:]:
+                if (
+                    sibling is self
+                    or not isinstance(sibling, QtWidgets.QWidget)
+                    or sibling.isWindow()
+                    or not sibling.isVisible()
+                ):
+                    continue
+                top_left = sibling.mapTo(window, QtCore.QPoint(0, 0))
+                region = region.subtracted(QtGui.QRegion(QtCore.QRect(top_left, sibling.size())))
+            child = parent
+        return region
+
+    def refresh(self, widget: QtWidgets.QWidget) -> None:
+        """Repaint the glow of ``widget`` after it moved, resized or toggled."""
+
+        key = _key(widget)
+        entry = self._glows.get(key)
+        old = self._painted.pop(key, None)
+        rect = self._glow_rect(widget, entry[1]) if entry is not None else None
+        if rect is not None:
+            self._painted[key] = rect
+        dirty = QtGui.QRegion()
+        for r in (old, rect):
+            if r is not None:
+                dirty = dirty.united(r)
+        if not dirty.isEmpty():
+            self.update(dirty)
+
+    def eventFilter(self, obj, event):  # noqa: D401 - Qt event filter signature
+        if obj is self.parentWidget() and event.type() == QtCore.QEvent.Resize:
+            self.setGeometry(obj.rect())
+            for widget, _spec in list(self._glows.values()):
+                if shiboken6.isValid(widget):
+                    self.refresh(widget)
+        elif (
+            obj is self.parentWidget()
+            and event.type() == QtCore.QEvent.ChildAdded
+            and not self._raise_pending
+        ):
+            # Keep painting above widgets added after the overlay.
+            self._raise_pending = True
+            QtCore.QTimer.singleShot(0, self._raise_if_valid)
+        return False
+
+    def _raise_if_valid(self) -> None:
+        if shiboken6.isValid(self):
+            self._raise_pending = False
+            self.raise_()
+
+    def paintEvent(self, event):  # noqa: D401 - Qt override
+        painter = None
+        region = event.region()
+        for key, (widget, spec) in list(self._glows.items()):
+            if not shiboken6.isValid(widget):
+                del self._glows[key]
+                self._painted.pop(key, None)
+                continue
+            rect = self._glow_rect(widget, spec)
+            if rect is None or not region.intersects(rect):
+                continue
+            clip = self._glow_clip(widget, spec).intersected(region)
+            if clip.isEmpty():
+                continue
+            if painter is None:
+                painter = QtGui.QPainter(self)
+            painter.setClipRegion(clip)
+            painter.drawPixmap(rect.topLeft(), GLOW_CACHE.get(widget.size(), spec))
+        if painter is not None:
+            painter.end()
+
+
+class _GlowTracker(QtCore.QObject):
+    """Follows glowing widgets so their overlay repaints the right area.
+
+    Ancestors below the window are filtered as well: moving or resizing a
+    container (e.g. the animated sidebar) moves the glow with it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._specs: Dict[int, Tuple[QtWidgets.QWidget, GlowSpec, GlowOverlay | None]] = {}
+        # ancestor key -> (ancestor, keys of the glowing widgets inside it)
+        self._ancestors: Dict[int, Tuple[QtWidgets.QWidget, Set[int]]] = {}
+
+    def spec(self, widget: QtWidgets.QWidget) -> GlowSpec | None:
+        entry = self._specs.get(_key(widget))
+        return entry[1] if entry is not None else None
+
+    def track(self, widget: QtWidgets.QWidget, spec: GlowSpec) -> None:
+        key = _key(widget)
+        overlay = None
+        if key in self._specs:
+            overlay = self._specs[key][2]
+        else:
+            widget.installEventFilter(self)
+            widget.destroyed.connect(lambda _obj=None, key=key: self._forget(key))
+        self._specs[key] = (widget, spec, overlay)
+        self._attach(widget)
+
+    def untrack(self, widget: QtWidgets.QWidget) -> None:
+        key = _key(widget)
+        entry = self._specs.pop(key, None)
+        if entry is None:
+            return
+        self._unwatch_ancestors(key)
+        overlay = entry[2]
+        if overlay is not None and shiboken6.isValid(overlay):
+            overlay.remove(widget)
+        if shiboken6.isValid(widget) and key not in self._ancestors:
+            widget.removeEventFilter(self)
+
+    def _forget(self, key: int) -> None:
+        if self._specs.pop(key, None) is not None:
+            self._unwatch_ancestors(key)
+
+    def _watch_ancestors(self, widget: QtWidgets.QWidget) -> None:
+        key = _key(widget)
+        self._unwatch_ancestors(key)
+        window = widget.window()
+        parent = widget.parentWidget()
+        # The window itself is followed by its overlay.
+        while parent is not None and parent is not window:
+            parent_key = _key(parent)
+            entry = self._ancestors.get(parent_key)
+            if entry is None:
+                parent.installEventFilter(self)
+                entry = self._ancestors[parent_key] = (parent, set())
+            entry[1].add(key)
+            parent = parent.parentWidget()
+
+    def _unwatch_ancestors(self, key: int) -> None:
+        for parent_key, (parent, keys) in list(self._ancestors.items()):
+            keys.discard(key)
+            if keys:
+                continue
+            del self._ancestors[parent_key]
+            if parent_key not in self._specs and shiboken6.isValid(parent):
+                parent.removeEventFilter(self)
+
+    def _attach(self, widget: QtWidgets.QWidget) -> None:
+        key = _key(widget)
+        _widget, spec, previous = self._specs[key]
+        window = widget.window()
+        overlay = None
+        if window is not widget:
+            overlay = GlowOverlay.for_window(window)
+        if previous is not None and previous is not overlay and shiboken6.isValid(previous):
+            previous.remove(widget)
+        if overlay is not None:
+            overlay.add(widget, spec)
+        self._specs[key] = (widget, spec, overlay)
+        self._watch_ancestors(widget)
+
+    def _refresh(self, widget: QtWidgets.QWidget) -> None:
+        overlay = self._specs[_key(widget)][2]
+        if overlay is not None and shiboken6.isValid(overlay):
+            overlay.refresh(widget)
+
+    def eventFilter(self, obj, event):  # noqa: D401 - Qt event filter signature
+        etype = event.type()
+        if etype not in _TRACKED_EVENTS:
+            return False
+        key = _key(obj)
+        if key in self._specs:
+            if etype in (QtCore.QEvent.ParentChange, QtCore.QEvent.Show):
+                self._attach(obj)
+            else:
+                self._refresh(obj)
+        entry = self._ancestors.get(key)
+        if entry is not None:
+            for child_key in list(entry[1]):
+                child = self._specs.get(child_key)
+                if child is None or not shiboken6.isValid(child[0]):
+                    continue
+                if etype == QtCore.QEvent.ParentChange:
+                    self._attach(child[0])
+                else:
+                    self._refresh(child[0])
+        return False
+
+
+_tracker: _GlowTracker | None = None
+
+
+def _get_tracker() -> _GlowTracker:
+    global _tracker
+    if _tracker is None:
+        _tracker = _GlowTracker()
+    return _tracker
+
+
+def register_glow(
+    widget: QtWidgets.QWidget,
+    color: QtGui.QColor,
+    blur: int,
+    radius: int = 0,
+) -> GlowSpec:
+    """Show a glow of ``color`` (alpha = intensity) around ``widget``.
+
+    Widgets without a parent yet are tracked and start glowing once they
+    are placed into a window.
+    """
+
+    spec = GlowSpec(QtGui.QColor(color).rgba(), max(0, int(blur)), max(0, int(radius)))
+    _get_tracker().track(widget, spec)
+    return spec
+
+
+def unregister_glow(widget: QtWidgets.QWidget) -> None:
+    """Remove the glow of ``widget`` if it has one."""
+
+    if _tracker is not None:
+        _tracker.untrack(widget)
+
+
+def glow_spec(widget: QtWidgets.QWidget) -> GlowSpec | None:
+    """Return the active glow of ``widget`` or ``None``."""
+
+    return _tracker.spec(widget) if _tracker is not None else None
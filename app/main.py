@@ -5,255 +5,88 @@ import json
 import calendar
 import weakref
 import logging
-import argparse
+import importlib
+import sqlite3
+import threading
 from datetime import datetime, date
-from typing import Dict, List, Union, Iterable, Optional, Tuple
+from typing import Dict, List, Union, Iterable, Iterator, Optional, Tuple
 
+import startup_profiler  # first app module: marks the start of the import phase
 from PySide6 import QtWidgets, QtGui, QtCore
 import shiboken6
 from dataclasses import dataclass, field
-import config
+import storage
+import autosave
+import calendar_model
+import changelog
+import month_cache
+import theme_registry
+import theme_transaction
+import appdata
+from appdata import (
+    CONFIG,
+    DATA_DIR,
+    DAY_ROWS_DEFAULT,
+    ICON_TOGGLE,
+    ICON_TM,
+    ICON_TQ,
+    ICON_TP,
+    ICON_TG,
+    RU_MONTHS,
+    active_sqlite_store,
+    button_config,
+    ensure_month_storage,
+    reload_config,
+    store_locations,
+)
 
-from widgets import StyledPushButton, StyledToolButton
+from widgets import NeonTableWidget, StyledPushButton, StyledToolButton
 from resources import (
     register_fonts,
+    register_deferred_fonts,
     load_icons,
     icon,
     ensure_supported_family,
-    filter_supported_families,
-    family_support_details,
+    configure_glyph_cache,
+    warm_glyph_cache,
 )
 import theme_manager
 from effects import (
     FixedDropShadowEffect,
-    NeonEventFilter,
     apply_neon_effect,
+    neon_registered,
+    register_neon,
     update_neon_filters,
 )
 
 logger = logging.getLogger(__name__)
 
-ASSETS = os.path.join(os.path.dirname(__file__), "..", "assets")
-DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
-CONFIG_PATH = os.path.join(DATA_DIR, "config.json")
-
-DAY_ROWS_DEFAULT = 4
-_OLD_DAY_ROWS_DEFAULT = 6
-
-
-def load_config():
-    default = {
-        "neon": True,
-        "neon_size": 10,
-        "neon_thickness": 1,
-        "neon_intensity": 255,
-        "accent_color": "#39ff14",
-        "gradient_colors": ["#39ff14", "#2d7cdb"],
-        "gradient_angle": 0,
-        "font_family": "Exo 2",
-        "header_font": "Exo 2",
-        "text_font": "Exo 2",
-        "sidebar_font": "Exo 2",
-        "save_path": DATA_DIR,
-        "day_rows": DAY_ROWS_DEFAULT,
-        "workspace_color": "#1e1e21",
-        "sidebar_color": "#1f1f23",
-        "sidebar_icon": os.path.join(ASSETS, "gpt_icon.png"),
-        "app_icon": os.path.join(ASSETS, "gpt_icon.png"),
-        "sidebar_collapsed": False,
-    }
-    if os.path.exists(CONFIG_PATH):
-        try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            save_path = data.get("save_path")
-            if save_path:
-                if not os.path.isabs(save_path):
-                    save_path = os.path.abspath(
-                        os.path.join(os.path.dirname(CONFIG_PATH), save_path)
-                    )
-                data["save_path"] = save_path
-            migrated = False
-            day_rows = data.get("day_rows")
-            if day_rows is None or day_rows == _OLD_DAY_ROWS_DEFAULT:
-                data["day_rows"] = DAY_ROWS_DEFAULT
-                migrated = True
-
-            neon_enabled = data.get("neon")
-            if not neon_enabled:
-                data["neon"] = True
-                migrated = True
-            default.update({k: v for k, v in data.items() if v is not None})
-            for key in ("monochrome", "mono_saturation", "theme"):
-                default.pop(key, None)
-            default["neon"] = True
-            if migrated:
-                try:
-                    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2)
-                except Exception:
-                    pass
-        except Exception:
-            pass
-    else:
-        try:
-            os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-            default["neon"] = True
-            with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-                json.dump(default, f, ensure_ascii=False, indent=2)
-        except Exception:
-            pass
-    return default
-
-
-CONFIG = load_config()
-config.CONFIG = CONFIG
-BASE_SAVE_PATH = os.path.abspath(CONFIG.get("save_path", DATA_DIR))
-MONTH_DATA_SUBDIR = "months"
 
+def migrate_storage_backend(previous: str, previous_base: str) -> None:
+    """Carry the data over after ``storage_backend`` has been switched.
 
-def _ensure_month_storage() -> str:
-    base = os.path.abspath(BASE_SAVE_PATH)
-    month_dir = os.path.join(base, MONTH_DATA_SUBDIR)
-    os.makedirs(month_dir, exist_ok=True)
-    return month_dir
-
-
-def button_config():
-    return {
-        "gradient_colors": CONFIG.get("gradient_colors", ["#39ff14", "#2d7cdb"]),
-        "gradient_angle": CONFIG.get("gradient_angle", 0),
-        "neon_thickness": CONFIG.get("neon_thickness", 1),
-    }
-
-
-def build_input_neon_style(
-    selector: str,
-    *,
-    background: str,
-    accent: str,
-    thickness: int,
-    radius: int = 8,
-) -> str:
-    """Return a stylesheet block for neon-ready input widgets.
-
-    Parameters
-    ----------
-    selector:
-        CSS selector for the widget (e.g. ``"QSpinBox"``).
-    background:
-        Base background color for the control.
-    accent:
-        Accent color used for hover/focus states.
-    thickness:
-        Thickness of the border in pixels.  Values below ``0`` are clamped to
-        ``0`` to mirror slider input; hover/focus states still highlight the
-        control with at least a 1px outline.
-    radius:
-        Corner radius in pixels.
+    Switching to SQLite imports the JSON folders into the database; switching
+    back exports the database so the folders are current again.
     """
 
-    try:
-        border = max(0, int(thickness))
-    except (TypeError, ValueError):
-        border = 0
-    highlight_border = max(border, 1)
-
-    accent_color = QtGui.QColor(accent)
-    subtle_border = QtGui.QColor(accent_color)
-    subtle_border.setAlpha(90)
-    subtle_name = subtle_border.name(QtGui.QColor.HexArgb)
-
-    base_border = f"border:{border}px solid {accent};" if border else "border:0px solid transparent;"
-    if border:
-        # use a subtle alpha in the resting state for softer appearance
-        base_border = f"border:{border}px solid {subtle_name};"
-
-    return (
-        f"{selector}{{"
-        f"background-color:{background};"
-        f"border-radius:{radius}px;"
-        "padding:4px 8px;"
-        f"{base_border}"
-        "color:#f0f0f0;"
-        "selection-background-color:rgba(255,255,255,30);"
-        "selection-color:#000;"
-        "}"
-        f"{selector}:hover, {selector}:focus{{"
-        f"border:{highlight_border}px solid {accent};"
-        f"color:{accent};"
-        "}"
-    )
-
-def ensure_year_dirs(year):
-    base = os.path.join(BASE_SAVE_PATH, str(year))
-    for sub in ("stats", "release", "top", "year"):
-        os.makedirs(os.path.join(base, sub), exist_ok=True)
-    return base
-
-
-def _read_sort_settings(
-    settings: QtCore.QSettings, prefix: str
-) -> tuple[int, QtCore.Qt.SortOrder] | None:
-    section = settings.value(f"{prefix}/sortSection")
-    order = settings.value(f"{prefix}/sortOrder")
-    try:
-        section_int = int(section)
-        order_enum = QtCore.Qt.SortOrder(int(order))
-    except (TypeError, ValueError):
-        return None
-    return section_int, order_enum
-
-
-def apply_neon_to_inputs(root: QtWidgets.QWidget) -> None:
-    """Install neon event filters on editable input widgets under ``root``."""
-
-    if root is None or not shiboken6.isValid(root):
+    current = CONFIG.get("storage_backend", "json")
+    if current == previous:
         return
+    with _MONTH_LOG_LOCK:
+        _PERSISTED_MONTHS.clear()
+    if previous == "sqlite":
+        store = appdata.detach_sqlite_store(previous_base)
+        if store is not None:
+            store.export_json(previous_base)
+            store.close()
+    elif current == "sqlite":
+        store = active_sqlite_store()
+        if store is not None:
+            store.import_json(os.path.abspath(appdata.BASE_SAVE_PATH))
 
-    targets = (
-        QtWidgets.QLineEdit,
-        QtWidgets.QPlainTextEdit,
-        QtWidgets.QTextEdit,
-        QtWidgets.QAbstractSpinBox,
-        QtWidgets.QComboBox,
-        QtWidgets.QCheckBox,
-        QtWidgets.QSlider,
-    )
 
-    widgets = [root] + root.findChildren(QtWidgets.QWidget)
-    for w in widgets:
-        if not isinstance(w, targets):
-            continue
-        if getattr(w, "_neon_filter", None) is not None:
-            continue
-        w.setAttribute(QtCore.Qt.WA_Hover, True)
-        filt = NeonEventFilter(w, CONFIG)
-        w.installEventFilter(filt)
-        w._neon_filter = filt
-
-def stats_dir(year):
-    return os.path.join(ensure_year_dirs(year), "stats")
-
-def release_dir(year):
-    return os.path.join(ensure_year_dirs(year), "release")
-
-def top_dir(year):
-    return os.path.join(ensure_year_dirs(year), "top")
-
-def year_dir(year):
-    return os.path.join(ensure_year_dirs(year), "year")
-ICON_TOGGLE = os.path.join(ASSETS, "gpt_icon.png")
-ICON_TM   = os.path.join(ASSETS, "ic_tm.png")
-ICON_TQ   = os.path.join(ASSETS, "ic_tq.png")
-ICON_TP   = os.path.join(ASSETS, "ic_tp.png")
-ICON_TG   = os.path.join(ASSETS, "ic_tg.png")
-ICON_VYK  = os.path.join(ASSETS, "ic_vykl.png")
 VERSION_FILE = os.path.join(os.path.dirname(__file__), "..", "VERSION")
 
-RU_MONTHS = ["Январь","Февраль","Март","Апрель","Май","Июнь","Июль","Август","Сентябрь","Октябрь","Ноябрь","Декабрь"]
-
-
 def ensure_font_registered(
     family: str, parent: QtWidgets.QWidget | None = None
 ) -> str:
@@ -331,9 +164,8 @@ def resolve_font_config(parent: QtWidgets.QWidget | None = None) -> tuple[str, s
         changed = True
 
     if changed:
-        os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(CONFIG, f, ensure_ascii=False, indent=2)
+        os.makedirs(os.path.dirname(appdata.CONFIG_PATH), exist_ok=True)
+        storage.write_json(appdata.CONFIG_PATH, CONFIG)
 
     return header, text
 
@@ -346,11 +178,15 @@ class MonthData:
 
     @property
     def path(self) -> str:
-        storage = _ensure_month_storage()
+        storage = ensure_month_storage()
         return os.path.join(storage, f"{self.year:04d}-{self.month:02d}.json")
 
     def save(self) -> None:
-        days: Dict[str, List[Dict[str, str]]] = {}
+        self.write()
+        MONTH_CACHE.put(self.year, self.month, self)
+
+    def _normalized_days(self) -> Dict[int, List[Dict[str, str]]]:
+        days: Dict[int, List[Dict[str, str]]] = {}
         for day, rows in self.days.items():
             row_list: List[Dict[str, str]] = []
             for r in rows:
@@ -360,1804 +196,227 @@ class MonthData:
                     "done": r.get("done", ""),
                 })
             if row_list:
-                days[str(day)] = row_list
+                days[int(day)] = row_list
+        return days
+
+    def write(self) -> None:
+        """Record the changed days in the year's change log.
+
+        Does not touch :data:`MONTH_CACHE`.  The first write of a month and
+        every :data:`changelog.COMPACT_THRESHOLD` entries fold the log back
+        into the ``YYYY-MM.json`` snapshots.
+        """
+
+        days = self._normalized_days()
         path = self.path
+        with _MONTH_LOG_LOCK:
+            old = _PERSISTED_MONTHS.get(path)
+            if old is None:
+                old = MonthData.load(self.year, self.month).days
+            entries = changelog.diff_days(old, days, self.month)
+            _PERSISTED_MONTHS[path] = days
+            store = active_sqlite_store()
+            if store is not None:
+                store.apply_month_entries(self.year, entries)
+                return
+            log = _month_log(self.year)
+            log.append(entries)
+            if not os.path.exists(path) or log.needs_compaction():
+                _compact_month_log(self.year, ensure=(self.month,))
+
+    def write_snapshot(self) -> None:
+        """Write the whole month as ``YYYY-MM.json``."""
+
+        days = {str(day): rows for day, rows in self._normalized_days().items()}
         data = {"year": self.year, "month": self.month, "days": days}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        storage.write_json(self.path, data)
 
     @classmethod
     def load(cls, year: int, month: int) -> "MonthData":
-        storage = _ensure_month_storage()
+        store = active_sqlite_store()
+        if store is not None:
+            return cls(year=year, month=month, days=store.load_month(year, month))
+        months_dir = ensure_month_storage()
         filename = f"{year:04d}-{month:02d}.json"
-        path = os.path.join(storage, filename)
-        if not os.path.exists(path):
-            legacy_path = os.path.join(DATA_DIR, filename)
-            if os.path.exists(legacy_path):
-                path = legacy_path
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+        # Compaction rewrites the snapshot and clears the log under this lock;
+        # reading between the two would drop the logged edits.
+        with _MONTH_LOG_LOCK:
+            path = os.path.join(months_dir, filename)
+            if not os.path.exists(path):
+                legacy_path = os.path.join(DATA_DIR, filename)
+                if os.path.exists(legacy_path):
+                    path = legacy_path
             days: Dict[int, List[Dict[str, str]]] = {}
-            for k, v in data.get("days", {}).items():
-                row_list: List[Dict[str, str]] = []
-                for row in v:
-                    if isinstance(row, dict):
-                        row_list.append({
-                            "work": row.get("work", ""),
-                            "plan": row.get("plan", ""),
-                            "done": row.get("done", ""),
-                        })
-                    elif isinstance(row, list):
-                        row_list.append({
-                            "work": row[0] if len(row) > 0 else "",
-                            "plan": row[1] if len(row) > 1 else "",
-                            "done": row[2] if len(row) > 2 else "",
-                        })
-                days[int(k)] = row_list
-            return cls(year=data.get("year", year), month=data.get("month", month), days=days)
-        return cls(year=year, month=month)
-
-
-class ReleaseDialog(QtWidgets.QDialog):
-    """Диалог для управления выкладкой.
-
-    Структура представлена таблицей из четырёх колонок:
-    день, работа, количество глав и время. Допускается несколько
-    записей на один день."""
-
-    class _DayColumnDelegate(QtWidgets.QStyledItemDelegate):
-        """Delegate limiting the day column to valid values."""
-
-        def __init__(self, max_day: int, parent: QtWidgets.QWidget | None = None):
-            super().__init__(parent)
-            self._max_day = max_day
-
-        def set_max_day(self, max_day: int) -> None:
-            self._max_day = max_day
-
-        def createEditor(self, parent, option, index):  # type: ignore[override]
-            editor = QtWidgets.QLineEdit(parent)
-            validator = QtGui.QIntValidator(1, self._max_day, editor)
-            editor.setValidator(validator)
-            editor.setAlignment(QtCore.Qt.AlignCenter)
-            return editor
-
-    def __init__(self, year, month, works, parent=None):
-        super().__init__(parent)
-        self.year = year
-        self.month = month
-        self.works = list(works)
-        self.setWindowTitle("Выкладка")
-        self.resize(600, 400)
-
-        lay = QtWidgets.QVBoxLayout(self)
-        self.days_in_month = calendar.monthrange(year, month)[1]
-
-        self.table = QtWidgets.QTableWidget(0, 4, self)
-        self.table.setHorizontalHeaderLabels(["День", "Работа", "Глав", "Время"])
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
-        self.table.verticalHeader().setVisible(False)
-        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self._day_delegate = self._DayColumnDelegate(self.days_in_month, self.table)
-        self.table.setItemDelegateForColumn(0, self._day_delegate)
-
-        self._loading = False
-
-        app = QtWidgets.QApplication.instance()
-        self.setFont(app.font())
-        self.table.setFont(app.font())
-        header_font = QtGui.QFont(CONFIG.get("header_font"))
-        self.table.horizontalHeader().setFont(header_font)
-
-        self.table.setAttribute(QtCore.Qt.WA_Hover, True)
-        self.table.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
-        header.setAttribute(QtCore.Qt.WA_Hover, True)
-        self._tbl_filter = NeonEventFilter(self.table, CONFIG)
-        self.table.installEventFilter(self._tbl_filter)
-        self.table.viewport().installEventFilter(self._tbl_filter)
-        self.table._neon_filter = self._tbl_filter
-        self._header_filter = NeonEventFilter(header, CONFIG)
-        header.installEventFilter(self._header_filter)
-        header._neon_filter = self._header_filter
-
-        lay.addWidget(self.table)
-
-        controls = QtWidgets.QHBoxLayout()
-        controls.addStretch()
-        btn_add_row = StyledPushButton("Добавить запись", self, **button_config())
-        btn_add_row.setIcon(icon("plus"))
-        btn_add_row.setIconSize(QtCore.QSize(16, 16))
-        btn_delete_row = StyledPushButton("Удалить запись", self, **button_config())
-        btn_delete_row.setIcon(icon("minus"))
-        btn_delete_row.setIconSize(QtCore.QSize(16, 16))
-        controls.addWidget(btn_add_row)
-        controls.addWidget(btn_delete_row)
-        lay.addLayout(controls)
-
-        box = QtWidgets.QDialogButtonBox(self)
-        btn_save = StyledPushButton("Сохранить", self, **button_config())
-        btn_save.setIcon(icon("save"))
-        btn_save.setIconSize(QtCore.QSize(20, 20))
-        btn_close = StyledPushButton("Закрыть", self, **button_config())
-        btn_close.setIcon(icon("x"))
-        btn_close.setIconSize(QtCore.QSize(20, 20))
-        box.addButton(btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
-        box.addButton(btn_close, QtWidgets.QDialogButtonBox.RejectRole)
-        box.accepted.connect(self.accept)
-        box.rejected.connect(self.reject)
-        lay.addWidget(box)
-
-        for b in (btn_save, btn_close):
-            b.setFixedSize(b.sizeHint())
-
-        self._settings = QtCore.QSettings("rabota2", "rabota2")
-        geom = self._settings.value("ReleaseDialog/geometry", type=QtCore.QByteArray)
-        if geom is not None:
-            self.restoreGeometry(geom)
-        sizes = self._settings.value("ReleaseDialog/columns", type=list)
-        for i, w in enumerate(sizes or []):
-            try:
-                self.table.setColumnWidth(i, int(w))
-            except (TypeError, ValueError):
-                pass  # пропустить некорректное значение
-
-        btn_add_row.clicked.connect(self.add_row)
-        btn_delete_row.clicked.connect(self.remove_selected_rows)
-
-        self.table.itemChanged.connect(self._on_item_changed)
-        self.load()
-        self.refresh_theme()
-
-    def refresh_theme(self) -> None:
-        """Rebuild palette-dependent style and neon highlighting."""
-
-        workspace = QtGui.QColor(CONFIG.get("workspace_color", "#1e1e21")).name()
-        accent = QtGui.QColor(CONFIG.get("accent_color", "#39ff14")).name()
-
-        header = self.table.horizontalHeader()
-
-        if getattr(self.table, "_neon_effect", None):
-            apply_neon_effect(self.table, False, config=CONFIG)
-        if getattr(header, "_neon_effect", None):
-            apply_neon_effect(header, False, config=CONFIG)
-
-        table_style = (
-            "QTableWidget{"
-            f"background-color:{workspace};"
-            f"border:1px solid {accent};"
-            "border-radius:8px;"
-            "selection-background-color:rgba(0,0,0,0);"
-            f"selection-color:{accent};"
-            "gridline-color:rgba(255,255,255,40);"
-            "}"
-        )
-        header_style = (
-            "QHeaderView::section{"
-            f"background-color:{workspace};"
-            f"color:{accent};"
-            "padding:0 6px;"
-            "border:0;"
-            f"border-bottom:1px solid {accent};"
-            "}"
-        )
-
-        self.table.setStyleSheet(table_style)
-        header.setStyleSheet(header_style)
-
-        apply_neon_effect(self.table, True, config=CONFIG)
-        apply_neon_effect(header, True, shadow=False, border=False, config=CONFIG)
-        update_neon_filters(self.table, CONFIG)
-
-    def _ensure_minimum_rows(self) -> None:
-        """Guarantee that the table contains rows for each day of the month."""
-
-        previous_loading = self._loading
-        self._loading = True
-        try:
-            while self.table.rowCount() < self.days_in_month:
-                self.add_row()
-        finally:
-            self._loading = previous_loading
-
-    def closeEvent(self, event):
-        self.save()
-        self._settings.setValue("ReleaseDialog/geometry", self.saveGeometry())
-        cols = [int(self.table.columnWidth(i)) for i in range(self.table.columnCount())]
-        self._settings.setValue("ReleaseDialog/columns", cols)
-        self._settings.sync()
-        super().closeEvent(event)
-
-    def file_path(self):
-        return os.path.join(release_dir(self.year), f"{self.month:02d}.json")
-
-    def add_row(self, day: int | None = None, entry: Dict[str, Union[str, int]] | None = None):
-        previous_loading = self._loading
-        self._loading = True
-        try:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            day_item = QtWidgets.QTableWidgetItem(str(day) if day else "")
-            day_item.setFlags(
-                QtCore.Qt.ItemIsSelectable
-                | QtCore.Qt.ItemIsEditable
-                | QtCore.Qt.ItemIsEnabled
-            )
-            day_item.setTextAlignment(QtCore.Qt.AlignCenter)
-            self.table.setItem(row, 0, day_item)
-
-            work = entry.get("work", "") if entry else ""
-            chapters = entry.get("chapters", "") if entry else ""
-            time_value = entry.get("time", "") if entry else ""
-
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(str(work)))
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(str(chapters)))
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(str(time_value)))
-            self.table.setCurrentCell(row, 0)
-        finally:
-            self._loading = previous_loading
-
-    def remove_selected_rows(self):
-        selected = sorted({idx.row() for idx in self.table.selectedIndexes()}, reverse=True)
-        if not selected:
-            return
-        previous_loading = self._loading
-        self._loading = True
-        try:
-            for row in selected:
-                self.table.removeRow(row)
-        finally:
-            self._loading = previous_loading
-        if self.table.rowCount() < self.days_in_month:
-            self._ensure_minimum_rows()
-        self.save()
-
-    def load(self):
-        self._loading = True
-        blocker = QtCore.QSignalBlocker(self.table)
-        try:
-            path = self.file_path()
-            data = {}
             if os.path.exists(path):
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                except json.JSONDecodeError as exc:
-                    logger.error("Failed to parse release data from '%s': %s", path, exc)
-                    QtWidgets.QMessageBox.warning(
-                        self,
-                        "Ошибка",
-                        "Данные повреждены или нечитаемы.",
-                    )
-                    data = {}
-
-            self.table.setRowCount(0)
-
-            day_entries = data.get("days", {})
-            for day_str in sorted(day_entries.keys(), key=lambda x: int(x)):
-                entries = day_entries.get(day_str, [])
-                try:
-                    day = int(day_str)
-                except (TypeError, ValueError):
-                    continue
-                if 1 <= day <= self.days_in_month:
-                    for entry in entries or []:
-                        self.add_row(day=day, entry=entry)
-        finally:
-            del blocker
-            self._loading = False
-
-        self._day_delegate.set_max_day(self.days_in_month)
-        if self.table.rowCount() < self.days_in_month:
-            self._ensure_minimum_rows()
-
-    def _on_item_changed(self, item: QtWidgets.QTableWidgetItem | None):
-        if self._loading or item is None:
-            return
-        self.save()
-
-    def save(self):
-        days: Dict[str, List[Dict[str, str | int]]] = {}
-        for row in range(self.table.rowCount()):
-            day_item = self.table.item(row, 0)
-            work_item = self.table.item(row, 1)
-            chapters_item = self.table.item(row, 2)
-            time_item = self.table.item(row, 3)
-
-            day_text = day_item.text().strip() if day_item else ""
-            try:
-                day = int(day_text)
-            except (TypeError, ValueError):
-                continue
-            if not (1 <= day <= self.days_in_month):
-                continue
-
-            work_name = work_item.text().strip() if work_item else ""
-            if not work_name:
-                continue
-            chapters_text = chapters_item.text().strip() if chapters_item else ""
-            try:
-                chapters = int(chapters_text) if chapters_text else 0
-            except (TypeError, ValueError):
-                chapters = 0
-            time_text = time_item.text().strip() if time_item else ""
-            entry = {
-                "work": work_name,
-                "chapters": chapters,
-                "time": time_text,
-            }
-            days.setdefault(str(day), []).append(entry)
-
-        works = sorted({e["work"] for entries in days.values() for e in entries})
-        data = {"works": works, "days": days}
-
-        try:
-            os.makedirs(os.path.dirname(self.file_path()), exist_ok=True)
-            with open(self.file_path(), "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except OSError as exc:
-            logger.warning("Failed to save release data: %s", exc)
-
-
-class StatsEntryForm(QtWidgets.QWidget):
-    """Форма для ввода/редактирования статистики месяца."""
-
-    # ключ, заголовок, класс виджета
-    INPUT_FIELDS = [
-        ("work", "Работа", QtWidgets.QLineEdit),
-        ("status", "Статус", QtWidgets.QLineEdit),
-        ("adult", "18+", QtWidgets.QCheckBox),
-        ("total_chapters", "Всего глав", QtWidgets.QSpinBox),
-        ("chars_per_chapter", "Знаков глава", QtWidgets.QSpinBox),
-        ("planned", "Запланировано", QtWidgets.QSpinBox),
-        ("chapters", "Сделано глав", QtWidgets.QSpinBox),
-        ("progress", "Прогресс перевода", QtWidgets.QDoubleSpinBox),
-        ("release", "Выпуск", QtWidgets.QLineEdit),
-        ("profit", "Профит", QtWidgets.QDoubleSpinBox),
-        ("ads", "Затраты на рекламу", QtWidgets.QDoubleSpinBox),
-        ("views", "Просмотры", QtWidgets.QSpinBox),
-        ("likes", "Лайки", QtWidgets.QSpinBox),
-        ("thanks", "Спасибо", QtWidgets.QSpinBox),
-    ]
-
-    # колонки таблицы: все поля + вычисляемое "chars"
-    TABLE_COLUMNS = [(key, label) for key, label, _ in INPUT_FIELDS] + [
-        ("chars", "Знаков"),
-    ]
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setSizePolicy(
-            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding
-        )
-        form = QtWidgets.QFormLayout(self)
-        form.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
-        self._styled_inputs: list[tuple[QtWidgets.QWidget, str]] = []
-        self._input_filters: dict[QtWidgets.QWidget, NeonEventFilter] = {}
-        self.widgets = {}
-        for key, label, cls in self.INPUT_FIELDS:
-            w = cls(self)
-            if isinstance(w, QtWidgets.QSpinBox):
-                w.setRange(0, 1_000_000_000)
-                w.setFixedWidth(w.sizeHint().width() + 20)
-            else:
-                w.setMinimumWidth(w.sizeHint().width())
-            if isinstance(w, QtWidgets.QDoubleSpinBox):
-                w.setRange(0, 1_000_000_000)
-                w.setDecimals(2)
-            if key == "progress" and isinstance(w, QtWidgets.QDoubleSpinBox):
-                w.setRange(0, 100)
-                w.setSuffix("%")
-            if isinstance(w, QtWidgets.QComboBox):
-                w.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
-            form.addRow(label, w)
-            self.widgets[key] = w
-            w.setAttribute(QtCore.Qt.WA_Hover, True)
-            selector: str | None = None
-            if isinstance(w, QtWidgets.QDoubleSpinBox):
-                selector = "QDoubleSpinBox"
-            elif isinstance(w, QtWidgets.QSpinBox):
-                selector = "QSpinBox"
-            elif isinstance(w, QtWidgets.QLineEdit):
-                selector = "QLineEdit"
-            if selector is not None:
-                self._styled_inputs.append((w, selector))
-            if key != "adult":  # avoid framing the entire row for checkbox
-                filt = NeonEventFilter(w, CONFIG)
-                w.installEventFilter(filt)
-                w._neon_filter = filt
-                self._input_filters[w] = filt
-
-        self.refresh_theme()
-
-    def get_record(self) -> Dict[str, int | float | str | bool]:
-        record: Dict[str, int | float | str | bool] = {}
-        for key, _, _ in self.INPUT_FIELDS:
-            w = self.widgets[key]
-            if isinstance(w, QtWidgets.QLineEdit):
-                record[key] = w.text().strip()
-            elif isinstance(w, QtWidgets.QCheckBox):
-                record[key] = w.isChecked()
-            else:  # spinboxes
-                record[key] = w.value()
-        record["chars"] = record["chapters"] * record["chars_per_chapter"]
-        return record
-
-    def set_record(self, record: Dict[str, int | float | str | bool]):
-        for key, _, _ in self.INPUT_FIELDS:
-            w = self.widgets[key]
-            val = record.get(key)
-            if isinstance(w, QtWidgets.QLineEdit):
-                w.setText(str(val) if val is not None else "")
-            elif isinstance(w, QtWidgets.QCheckBox):
-                w.setChecked(bool(val))
-            else:
-                w.setValue(val if isinstance(val, (int, float)) else 0)
-
-    def clear(self):
-        for key, _, _ in self.INPUT_FIELDS:
-            w = self.widgets[key]
-            if isinstance(w, QtWidgets.QLineEdit):
-                w.clear()
-            elif isinstance(w, QtWidgets.QCheckBox):
-                w.setChecked(False)
-            else:
-                w.setValue(0)
-
-    def refresh_theme(self) -> None:
-        """Rebuild input styles based on the current configuration."""
-
-        workspace = QtGui.QColor(CONFIG.get("workspace_color", "#1e1e21")).name()
-        accent = QtGui.QColor(CONFIG.get("accent_color", "#39ff14")).name()
-        try:
-            thickness = int(CONFIG.get("neon_thickness", 1))
-        except (TypeError, ValueError):
-            thickness = 1
-        thickness = max(0, thickness)
-
-        for widget, selector in self._styled_inputs:
-            if widget is None or not shiboken6.isValid(widget):
-                continue
-            style = build_input_neon_style(
-                selector,
-                background=workspace,
-                accent=accent,
-                thickness=thickness,
-            )
-            widget.setStyleSheet(style)
-
-        for widget, filt in self._input_filters.items():
-            if widget is None or not shiboken6.isValid(widget):
-                continue
-            filt._config = CONFIG
-
-        update_neon_filters(self, CONFIG)
-
-
-class StatsDialog(QtWidgets.QDialog):
-    """Диалог для просмотра и редактирования статистики месяца."""
-
-    def __init__(self, year: int, month: int, parent=None):
-        super().__init__(parent)
-        self.setObjectName("StatsDialog")
-        self.setWindowTitle("Вводные данные")
-        self.resize(800, 500)
-
-        lay = QtWidgets.QVBoxLayout(self)
-        self.table_stats = NeonTableWidget(0, len(StatsEntryForm.TABLE_COLUMNS), self)
-        self.table_stats.setSelectionBehavior(QtWidgets.QTableView.SelectRows)
-        self.table_stats.setSelectionMode(QtWidgets.QTableView.SingleSelection)
-        header = self.table_stats.horizontalHeader()
-        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
-        header.setTextElideMode(QtCore.Qt.ElideNone)
-        self.table_stats.setHorizontalHeaderLabels(
-            [h for _, h in StatsEntryForm.TABLE_COLUMNS]
-        )
-        self.table_stats.setSortingEnabled(True)
-        self.table_stats.verticalHeader().setVisible(False)
-        self.table_stats.verticalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.Stretch
-        )
-        self.table_stats.itemSelectionChanged.connect(self.on_table_selection)
-        lay.addWidget(self.table_stats)
-
-        self._table_filter: NeonEventFilter | None = None
-        self._header_filter: NeonEventFilter | None = None
-        self._button_filters: list[NeonEventFilter] = []
-        self._apply_table_style()
-
-        self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
-        self.setAutoFillBackground(True)
-        self._apply_dialog_style()
-
-        self.form_stats = StatsEntryForm(self)
-        lay.addWidget(self.form_stats)
-
-        self.btn_box = QtWidgets.QDialogButtonBox(self)
-        self.btn_save = StyledPushButton("Сохранить", self, **button_config())
-        self.btn_save.setIcon(icon("save"))
-        self.btn_save.setIconSize(QtCore.QSize(20, 20))
-        self.btn_close = StyledPushButton("Закрыть", self, **button_config())
-        self.btn_close.setIcon(icon("x"))
-        self.btn_close.setIconSize(QtCore.QSize(20, 20))
-        for btn in (self.btn_save, self.btn_close):
-            btn.setFixedSize(btn.sizeHint())
-            btn.setStyleSheet(btn.styleSheet() + "border:1px solid transparent;")
-            btn.setAttribute(QtCore.Qt.WA_Hover, True)
-            filt = NeonEventFilter(btn, CONFIG)
-            btn.installEventFilter(filt)
-            btn._neon_filter = filt
-            self._button_filters.append(filt)
-        self.btn_box.addButton(self.btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
-        self.btn_box.addButton(self.btn_close, QtWidgets.QDialogButtonBox.RejectRole)
-        self.btn_box.accepted.connect(self.save_record)
-        self.btn_box.rejected.connect(self.reject)
-        lay.addWidget(self.btn_box)
-        lay.setStretch(0, 2)
-        lay.setStretch(1, 1)
-
-        self.records: List[Dict[str, int | float | str | bool]] = []
-        self.current_index = None
-        self.year = year
-        self.month = month
-        self._settings = QtCore.QSettings("rabota2", "rabota2")
-        self._saved_sort: tuple[int, QtCore.Qt.SortOrder] | None = _read_sort_settings(
-            self._settings, "StatsDialog"
-        )
-        header.sortIndicatorChanged.connect(self._on_sort_changed)
-        geom = self._settings.value("StatsDialog/geometry", type=QtCore.QByteArray)
-        if geom is not None:
-            self.restoreGeometry(geom)
-        self.load_stats(year, month)
-        sizes = self._settings.value("StatsDialog/columns", type=list)
-        for i, w in enumerate(sizes or []):
-            try:
-                self.table_stats.setColumnWidth(i, int(w))
-            except (TypeError, ValueError):
-                pass  # пропустить некорректное значение
-        self._apply_saved_sort()
-
-    def _apply_table_style(self) -> None:
-        """Собрать стили для таблицы и заголовка с учётом конфигурации."""
-
-        workspace = QtGui.QColor(CONFIG.get("workspace_color", "#1e1e21")).name()
-        accent = QtGui.QColor(CONFIG.get("accent_color", "#39ff14")).name()
-
-        table_style = (
-            "QTableWidget{"  # базовая область и вьюпорт
-            f"background-color:{workspace};"
-            f"border:1px solid {accent};"
-            "border-radius:8px;"
-            "selection-background-color:rgba(0,0,0,0);"
-            f"selection-color:{accent};"
-            "gridline-color:rgba(255,255,255,40);"
-            "}"
-            "QTableWidget::item{border:0;}"
-        )
-
-        header_style = (
-            "QHeaderView::section{"  # горизонтальные заголовки
-            f"background-color:{workspace};"
-            f"color:{accent};"
-            "padding:0 8px;"
-            "border:0;"
-            f"border-bottom:1px solid {accent};"
-            "}"
-        )
-
-        self.table_stats.setStyleSheet(table_style)
-        header = self.table_stats.horizontalHeader()
-        header.setStyleSheet(header_style)
-
-        highlight = QtGui.QColor(accent)
-        table_palette = self.table_stats.palette()
-        table_palette.setColor(QtGui.QPalette.Highlight, highlight)
-        self.table_stats.setPalette(table_palette)
-
-        header_palette = header.palette()
-        header_palette.setColor(QtGui.QPalette.Highlight, highlight)
-        header.setPalette(header_palette)
-
-        self.table_stats.setAttribute(QtCore.Qt.WA_Hover, True)
-        self.table_stats.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
-        header.setAttribute(QtCore.Qt.WA_Hover, True)
-
-        if self._table_filter is None:
-            self._table_filter = NeonEventFilter(self.table_stats, CONFIG)
-            self.table_stats.installEventFilter(self._table_filter)
-            self.table_stats.viewport().installEventFilter(self._table_filter)
-            self.table_stats._neon_filter = self._table_filter
-        else:
-            self._table_filter._config = CONFIG
-
-        if self._header_filter is None:
-            header_filter = NeonEventFilter(header, CONFIG)
-            header.installEventFilter(header_filter)
-            header._neon_filter = header_filter
-            self._header_filter = header_filter
-        else:
-            self._header_filter._config = CONFIG
-
-        apply_neon_effect(self.table_stats, True, config=CONFIG)
-        apply_neon_effect(header, True, shadow=False, border=False, config=CONFIG)
-
-    def _apply_dialog_style(self) -> None:
-        """Обновить палитру и обёртку диалога под текущую тему."""
-
-        workspace_color = QtGui.QColor(CONFIG.get("workspace_color", "#1e1e21"))
-        accent_color = QtGui.QColor(CONFIG.get("accent_color", "#39ff14"))
-        workspace = workspace_color.name()
-        accent = accent_color.name()
-
-        if getattr(self, "_neon_effect", None):
-            apply_neon_effect(self, False, config=CONFIG)
-
-        palette = QtGui.QPalette(self.palette())
-        for role in (
-            QtGui.QPalette.Window,
-            QtGui.QPalette.Base,
-            QtGui.QPalette.Button,
-            QtGui.QPalette.AlternateBase,
-        ):
-            palette.setColor(role, workspace_color)
-        text_color = QtGui.QColor("#f0f0f0")
-        palette.setColor(QtGui.QPalette.WindowText, text_color)
-        palette.setColor(QtGui.QPalette.Text, text_color)
-        palette.setColor(QtGui.QPalette.ButtonText, text_color)
-        palette.setColor(QtGui.QPalette.Highlight, accent_color)
-        palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#000000"))
-        self.setPalette(palette)
-
-        base_style = (
-            "#StatsDialog{"  # контейнер диалога
-            f"background-color:{workspace};"
-            "color:#f0f0f0;"
-            "border-radius:16px;"
-            f"border:1px solid {accent};"
-            "}"
-        )
-        self.setStyleSheet(base_style)
-
-        apply_neon_effect(
-            self,
-            True,
-            shadow=True,
-            border=False,
-            intensity_scale=0.45,
-            thickness_scale=0.0,
-            config=CONFIG,
-        )
-        # Вернуть базовый стиль без переопределения цвета для дочерних элементов.
-        self.setStyleSheet(base_style)
-
-    def refresh_theme(self) -> None:
-        """Обновить стили таблицы и формы ввода."""
-
-        self._apply_dialog_style()
-        self._apply_table_style()
-        if hasattr(self, "form_stats"):
-            self.form_stats.refresh_theme()
-        for filt in self._button_filters:
-            filt._config = CONFIG
-        update_neon_filters(self.btn_box, CONFIG)
-
-    def resizeEvent(self, event):
-        self.table_stats.horizontalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.Interactive
-        )
-        super().resizeEvent(event)
-
-    def on_table_selection(self):
-        selection_model = self.table_stats.selectionModel()
-        if selection_model is None:
-            return
-
-        indexes = selection_model.selectedRows()
-        if indexes:
-            row = indexes[0].row()
-            first_item = self.table_stats.item(row, 0)
-            record_index = (
-                first_item.data(QtCore.Qt.UserRole)
-                if first_item is not None
-                else None
-            )
-            if record_index is None:
-                record_index = row
-            self.current_index = int(record_index)
-            if 0 <= self.current_index < len(self.records):
-                self.form_stats.set_record(self.records[self.current_index])
-                return
-        # Nothing selected or out of range
-        self.current_index = None
-        self.form_stats.clear()
-
-    def load_stats(self, year: int, month: int):
-        self.year = year
-        self.month = month
-        path = os.path.join(stats_dir(year), f"{year}.json")
-        data = {}
-        if os.path.exists(path):
-            try:
                 with open(path, "r", encoding="utf-8") as f:
                     data = json.load(f)
-            except json.JSONDecodeError as exc:
-                logger.error("Failed to parse stats data from '%s': %s", path, exc)
-                QtWidgets.QMessageBox.warning(
-                    self,
-                    "Ошибка",
-                    "Данные повреждены или нечитаемы.",
-                )
-                data = {}
-        self.records = data.get(str(month), [])
-        self.table_stats.setRowCount(len(self.records))
-        for r, rec in enumerate(self.records):
-            for c, (key, _) in enumerate(StatsEntryForm.TABLE_COLUMNS):
-                val = rec.get(key, "")
-                if isinstance(val, bool):
-                    text = "✓" if val else ""
-                    item = QtWidgets.QTableWidgetItem(text)
-                    item.setData(QtCore.Qt.EditRole, int(val))
-                elif isinstance(val, (int, float)):
-                    item = QtWidgets.QTableWidgetItem()
-                    item.setData(QtCore.Qt.EditRole, val)
-                    item.setTextAlignment(QtCore.Qt.AlignCenter)
-                else:
-                    item = QtWidgets.QTableWidgetItem(str(val))
-                if c == 0:
-                    item.setData(QtCore.Qt.UserRole, r)
-                self.table_stats.setItem(r, c, item)
-        self.table_stats.resizeColumnsToContents()
-        header = self.table_stats.horizontalHeader()
-        header.setMinimumSectionSize(50)
-        header.setTextElideMode(QtCore.Qt.ElideNone)
-        self.table_stats.resizeRowsToContents()
-        header.setStretchLastSection(True)
-        total_width = sum(header.sectionSize(i) for i in range(header.count()))
-        if total_width <= self.table_stats.viewport().width():
-            self.table_stats.setHorizontalScrollBarPolicy(
-                QtCore.Qt.ScrollBarAlwaysOff
-            )
-        else:
-            self.table_stats.setHorizontalScrollBarPolicy(
-                QtCore.Qt.ScrollBarAsNeeded
-            )
-        self.current_index = None
-        self.form_stats.clear()
-        self._apply_saved_sort()
-
-    def save_record(self):
-        record = self.form_stats.get_record()
-        if self.current_index is None:
-            self.records.append(record)
-        else:
-            self.records[self.current_index] = record
-        path = os.path.join(stats_dir(self.year), f"{self.year}.json")
-        data = {}
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        data[str(self.month)] = self.records
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        self.load_stats(self.year, self.month)
-
-    def closeEvent(self, event):
-        if self.current_index is not None or any(
-            self.form_stats.get_record().values()
-        ):
-            self.save_record()
-        self._settings.setValue("StatsDialog/geometry", self.saveGeometry())
-        cols = [
-            int(self.table_stats.columnWidth(i))
-            for i in range(self.table_stats.columnCount())
-        ]
-        self._settings.setValue("StatsDialog/columns", cols)
-        header = self.table_stats.horizontalHeader()
-        self._settings.setValue("StatsDialog/sortSection", int(header.sortIndicatorSection()))
-        self._settings.setValue(
-            "StatsDialog/sortOrder", int(header.sortIndicatorOrder().value)
-        )
-        self._settings.sync()
-        super().closeEvent(event)
-
-    def _on_sort_changed(self, section: int, order: QtCore.Qt.SortOrder) -> None:
-        self._saved_sort = (int(section), QtCore.Qt.SortOrder(order))
-
-    def _apply_saved_sort(self) -> None:
-        if not self.table_stats.isSortingEnabled():
-            return
-        section_order = self._saved_sort
-        if section_order is None:
-            header = self.table_stats.horizontalHeader()
-            section_order = (
-                int(header.sortIndicatorSection()),
-                QtCore.Qt.SortOrder(header.sortIndicatorOrder()),
-            )
-        section, order = section_order
-        if 0 <= section < self.table_stats.columnCount():
-            self.table_stats.sortByColumn(section, order)
-            self._saved_sort = (section, order)
-
-
-class AnalyticsDialog(QtWidgets.QDialog):
-    """Годовая статистика: месяцы × показатели с колонкой "Итого за год"."""
-
-    INDICATORS = [
-        "Работ", "Завершенных", "Онгоингов", "Глав", "Знаков",
-        "Просмотров", "Профит", "РК", "Чистыми", "Лайков", "Спасибо",
-        "Камса", "Потрачено на софт",
-    ]
-
-    def __init__(self, year, parent=None):
-        super().__init__(parent)
-        self.year = year
-        self.setWindowTitle("Аналитика")
-        self.resize(900, 400)
-
-        self._input_controls: List[Tuple[QtWidgets.QWidget, str]] = []
-
-        lay = QtWidgets.QVBoxLayout(self)
-        top = QtWidgets.QHBoxLayout()
-        top.addWidget(QtWidgets.QLabel("Год:"))
-        self.spin_year = QtWidgets.QSpinBox(self)
-        self.spin_year.setRange(2000, 2100)
-        self.spin_year.setValue(year)
-        self.spin_year.setFixedWidth(self.spin_year.sizeHint().width())
-        self.spin_year.setButtonSymbols(QtWidgets.QAbstractSpinBox.UpDownArrows)
-        self.spin_year.valueChanged.connect(self._year_changed)
-        top.addWidget(self.spin_year)
-        self._register_input_control(self.spin_year, "QSpinBox")
-
-        top.addSpacing(12)
-        top.addWidget(QtWidgets.QLabel("Режим:"))
-        self.combo_mode = QtWidgets.QComboBox(self)
-        self.combo_mode.addItem("Месяц", "month")
-        self.combo_mode.addItem("Квартал", "quarter")
-        self.combo_mode.addItem("Полугодие", "half")
-        self.combo_mode.addItem("Год", "year")
-        self.combo_mode.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
-        self.combo_mode.currentIndexChanged.connect(self._update_period_options)
-        top.addWidget(self.combo_mode)
-        self._register_input_control(self.combo_mode, "QComboBox")
-
-        top.addSpacing(12)
-        top.addWidget(QtWidgets.QLabel("Период:"))
-        self.combo_period = QtWidgets.QComboBox(self)
-        self.combo_period.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
-        top.addWidget(self.combo_period)
-        self._register_input_control(self.combo_period, "QComboBox")
-
-        self._update_period_options()
-        top.addStretch(1)
-        lay.addLayout(top)
-
-        cols = len(RU_MONTHS) + 1
-        self.table = NeonTableWidget(len(self.INDICATORS), cols, self)
-        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectItems)
-        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self.table.setAttribute(QtCore.Qt.WA_Hover, True)
-        filt = NeonEventFilter(self.table, CONFIG)
-        self.table.installEventFilter(filt)
-        self.table._neon_filter = filt
-        self.table.setHorizontalHeaderLabels(RU_MONTHS + ["Итого за год"])
-        self.table.setVerticalHeaderLabels(self.INDICATORS)
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(
-            QtWidgets.QHeaderView.Interactive
-        )
-        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        lay.addWidget(self.table, 1)
-
-        box = QtWidgets.QDialogButtonBox(self)
-        btn_save = StyledPushButton("Сохранить", self, **button_config())
-        btn_save.setIcon(icon("save"))
-        btn_save.setIconSize(QtCore.QSize(20, 20))
-        btn_close = StyledPushButton("Закрыть", self, **button_config())
-        btn_close.setIcon(icon("x"))
-        btn_close.setIconSize(QtCore.QSize(20, 20))
-        for btn in (btn_save, btn_close):
-            btn.setFixedSize(btn.sizeHint())
-            btn.setStyleSheet(btn.styleSheet() + "border:1px solid transparent;")
-        box.addButton(btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
-        box.addButton(btn_close, QtWidgets.QDialogButtonBox.RejectRole)
-        box.accepted.connect(self.save)
-        box.rejected.connect(self.reject)
-        lay.addWidget(box)
-
-        # prepare items
-        for r, name in enumerate(self.INDICATORS):
-            for c in range(cols):
-                it = QtWidgets.QTableWidgetItem("0")
-                it.setTextAlignment(QtCore.Qt.AlignCenter)
-                if name not in ("Камса", "Потрачено на софт") or c == cols - 1:
-                    it.setFlags(QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled)
-                self.table.setItem(r, c, it)
-
-        self.table.itemChanged.connect(self._item_changed)
-
-        self._loading = False
-        self._commissions = {str(m): 0.0 for m in range(1, 13)}
-        self._software = {str(m): 0.0 for m in range(1, 13)}
-        self._net = {str(m): 0.0 for m in range(1, 13)}
-        self._settings = QtCore.QSettings("rabota2", "rabota2")
-        geom = self._settings.value("AnalyticsDialog/geometry", type=QtCore.QByteArray)
-        if geom is not None:
-            self.restoreGeometry(geom)
-
-        raw_sizes = self._settings.value("AnalyticsDialog/columns", type=list)
-        self._saved_column_sizes = []
-        for value in raw_sizes or []:
-            try:
-                self._saved_column_sizes.append(int(value))
-            except (TypeError, ValueError):
-                continue
-
-        self.load(year)
-        self.refresh_theme()
-
-    def resizeEvent(self, event):
-        self.table.horizontalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.Interactive
-        )
-        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        super().resizeEvent(event)
-
-    # --- styling helpers -----------------------------------------------
-    def _register_input_control(self, widget: QtWidgets.QWidget, selector: str) -> None:
-        if widget is None:
-            return
-
-        widget.setAttribute(QtCore.Qt.WA_Hover, True)
-        filt = NeonEventFilter(widget, CONFIG)
-        widget.installEventFilter(filt)
-        if hasattr(widget, "viewport"):
-            widget.viewport().installEventFilter(filt)
-        widget._neon_filter = filt
-
-        if isinstance(widget, QtWidgets.QComboBox):
-            view = widget.view()
-            if view is not None and shiboken6.isValid(view):
-                widget._popup_view = view
-
-        self._input_controls.append((widget, selector))
-
-    def _input_theme_parameters(self) -> Tuple[QtGui.QColor, QtGui.QColor, int]:
-        workspace_color = QtGui.QColor(
-            CONFIG.get("workspace_color", "#1e1e21")
-        )
-        accent_color = QtGui.QColor(CONFIG.get("accent_color", "#39ff14"))
-        try:
-            thickness = int(CONFIG.get("neon_thickness", 1))
-        except (TypeError, ValueError):
-            thickness = 1
-        return workspace_color, accent_color, thickness
-
-    def _apply_input_control_style(
-        self,
-        widget: QtWidgets.QWidget,
-        selector: str,
-        workspace_color: QtGui.QColor,
-        accent_color: QtGui.QColor,
-        thickness: int,
-    ) -> None:
-        if widget is None or not shiboken6.isValid(widget):
-            return
-
-        workspace = workspace_color.name()
-        accent = accent_color.name()
-        style = build_input_neon_style(
-            selector,
-            background=workspace,
-            accent=accent,
-            thickness=thickness,
-        )
-        if selector == "QComboBox":
-            style += (
-                f"{selector} QAbstractItemView{{"
-                f"background-color:{workspace};"
-                "border:0;"
-                "color:#f0f0f0;"
-                "selection-background-color:rgba(255,255,255,30);"
-                "selection-color:#000000;"
-                "}}"
-            )
-        widget.setStyleSheet(style)
-
-        palette = widget.palette()
-        text_color = QtGui.QColor("#f0f0f0")
-        for role in (
-            QtGui.QPalette.Base,
-            QtGui.QPalette.Button,
-            QtGui.QPalette.Window,
-            QtGui.QPalette.AlternateBase,
-        ):
-            palette.setColor(role, workspace_color)
-        palette.setColor(QtGui.QPalette.Text, text_color)
-        palette.setColor(QtGui.QPalette.ButtonText, text_color)
-        palette.setColor(QtGui.QPalette.Highlight, accent_color)
-        palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#000000"))
-        widget.setPalette(palette)
-
-        if isinstance(widget, QtWidgets.QComboBox):
-            view = getattr(widget, "_popup_view", None)
-            if view is None and hasattr(widget, "view"):
-                view = widget.view()
-            if view is not None and shiboken6.isValid(view):
-                view.setAttribute(QtCore.Qt.WA_Hover, True)
-                view.setPalette(palette)
-                view.setStyleSheet(
-                    f"QListView{{background-color:{workspace}; color:#f0f0f0;}}"
-                )
-                update_neon_filters(view, CONFIG)
-
-        update_neon_filters(widget, CONFIG)
-
-    def _update_period_options(self) -> None:
-        """Populate period choices according to the current mode."""
-
-        if not hasattr(self, "combo_mode") or not hasattr(self, "combo_period"):
-            return
-
-        mode = self.combo_mode.currentData()
-        self.combo_period.clear()
-
-        if mode == "month":
-            for index, name in enumerate(RU_MONTHS, 1):
-                self.combo_period.addItem(name, index)
-            self.combo_period.setEnabled(True)
-        elif mode == "quarter":
-            for index in range(1, 5):
-                self.combo_period.addItem(f"Квартал {index}", index)
-            self.combo_period.setEnabled(True)
-        elif mode == "half":
-            for index in range(1, 3):
-                self.combo_period.addItem(f"Полугодие {index}", index)
-            self.combo_period.setEnabled(True)
-        else:
-            self.combo_period.addItem("Год", 1)
-            self.combo_period.setEnabled(False)
-
-    def refresh_theme(self) -> None:
-        """Обновить стиль таблицы в соответствии с текущей темой."""
-
-        (
-            workspace_color,
-            accent_color,
-            thickness,
-        ) = self._input_theme_parameters()
-        workspace = workspace_color.name()
-        accent = accent_color.name()
-
-        for widget, selector in list(self._input_controls):
-            self._apply_input_control_style(
-                widget, selector, workspace_color, accent_color, thickness
-            )
-
-        header = self.table.horizontalHeader()
-
-        if getattr(self.table, "_neon_effect", None):
-            apply_neon_effect(self.table, False, config=CONFIG)
-        if getattr(header, "_neon_effect", None):
-            apply_neon_effect(header, False, config=CONFIG)
-
-        highlight = QtGui.QColor(accent)
-        palette = self.table.palette()
-        palette.setColor(QtGui.QPalette.Highlight, highlight)
-        self.table.setPalette(palette)
-
-        header_palette = header.palette()
-        header_palette.setColor(QtGui.QPalette.Highlight, highlight)
-        header.setPalette(header_palette)
-
-        table_style = (
-            "QTableWidget{"
-            f"background-color:{workspace};"
-            f"border:1px solid {accent};"
-            "border-radius:8px;"
-            "selection-background-color:rgba(0,0,0,0);"
-            f"selection-color:{accent};"
-            "gridline-color:rgba(255,255,255,40);"
-            "}"
-            "QTableWidget::item{border:0;}"
-        )
-        header_style = (
-            "QHeaderView::section{"
-            f"background-color:{workspace};"
-            f"color:{accent};"
-            "padding:0 6px;"
-            "border:0;"
-            f"border-bottom:1px solid {accent};"
-            "}"
-        )
-
-        self.table.setStyleSheet(table_style)
-        header.setStyleSheet(header_style)
-
-        apply_neon_effect(self.table, True, config=CONFIG)
-        apply_neon_effect(header, True, shadow=False, border=False, config=CONFIG)
-        update_neon_filters(self.table, CONFIG)
-
-    def _apply_saved_column_sizes(self) -> None:
-        sizes = getattr(self, "_saved_column_sizes", None) or []
-        for i, width in enumerate(sizes):
-            if i < self.table.columnCount():
-                self.table.setColumnWidth(i, width)
-        self._saved_column_sizes = [
-            int(self.table.columnWidth(i)) for i in range(self.table.columnCount())
-        ]
-
-    def _year_changed(self, val):
-        self.load(val)
-
-    # --- data handling -------------------------------------------------
-    def load(self, year):
-        self._loading = True
-        self.year = year
-        self.spin_year.setValue(year)
-
-        # load manual values
-        self._commissions = {str(m): 0.0 for m in range(1, 13)}
-        self._software = {str(m): 0.0 for m in range(1, 13)}
-        self._net = {str(m): 0.0 for m in range(1, 13)}
-        path = os.path.join(year_dir(year), f"{year}.json")
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self._commissions.update({str(k): float(v) for k, v in data.get("commission", {}).items()})
-            self._software.update({str(k): float(v) for k, v in data.get("software", {}).items()})
-            self._net.update({str(k): float(v) for k, v in data.get("net", {}).items()})
-
-        # fill table with monthly values
-        for m in range(1, 13):
-            stats = self._calc_month_stats(year, m)
-            for ind, val in stats.items():
-                row = self.INDICATORS.index(ind)
-                self.table.item(row, m - 1).setText(str(val))
-            self.table.item(self.INDICATORS.index("Камса"), m - 1).setText(str(self._commissions[str(m)]))
-            self.table.item(self.INDICATORS.index("Потрачено на софт"), m - 1).setText(str(self._software[str(m)]))
-            self.table.item(self.INDICATORS.index("Чистыми"), m - 1).setText(
-                str(self._net.get(str(m), stats.get("Чистыми", 0)))
-            )
-
-        self._recalculate()
-        self.table.resizeColumnsToContents()
-        self.table.horizontalHeader().setMinimumSectionSize(50)
-        self.table.resizeRowsToContents()
-        self.table.horizontalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.Interactive
-        )
-        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
-        self._apply_saved_column_sizes()
-        self._loading = False
-
-    def save(self, accept=True):
-        path = os.path.join(year_dir(self.year), f"{self.year}.json")
-        data = {
-            "commission": self._commissions,
-            "software": self._software,
-            "net": self._net,
-        }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        if accept:
-            self.accept()
+                for k, v in data.get("days", {}).items():
+                    row_list: List[Dict[str, str]] = []
+                    for row in v:
+                        if isinstance(row, dict):
+                            row_list.append({
+                                "work": row.get("work", ""),
+                                "plan": row.get("plan", ""),
+                                "done": row.get("done", ""),
+                            })
+                        elif isinstance(row, list):
+                            row_list.append({
+                                "work": row[0] if len(row) > 0 else "",
+                                "plan": row[1] if len(row) > 1 else "",
+                                "done": row[2] if len(row) > 2 else "",
+                            })
+                    days[int(k)] = row_list
+                year = data.get("year", year)
+                month = data.get("month", month)
+            changelog.apply_day_entries(days, _month_log(year).entries(month))
+        return cls(year=year, month=month, days=days)
+
+
+_MONTH_LOG_LOCK = threading.RLock()
+# Last written state of each month file, used to diff the next write.
+_PERSISTED_MONTHS: Dict[str, Dict[int, List[Dict[str, str]]]] = {}
+
+
+def _month_log(year: int) -> changelog.YearLog:
+    return changelog.YearLog(changelog.log_path(ensure_month_storage(), year))
+
+
+def _compact_month_log(year: int, ensure: Iterable[int] = ()) -> None:
+    """Fold the month change log of ``year`` into the JSON snapshots."""
+
+    with _MONTH_LOG_LOCK:
+        log = _month_log(year)
+        months = {int(e.get("month", 0)) for e in log.entries()} | set(ensure)
+        for month in sorted(m for m in months if 1 <= m <= 12):
+            md = MonthData.load(year, month)
+            md.write_snapshot()
+            _PERSISTED_MONTHS[md.path] = md._normalized_days()
+        log.clear()
+
+
+# Months around the visible one are read ahead on a worker thread; the
+# scope keeps entries of different ``save_path`` locations apart.
+MONTH_CACHE = month_cache.MonthPrefetcher(
+    MonthData.load, scope=lambda: os.path.abspath(appdata.BASE_SAVE_PATH)
+)
 
-    def closeEvent(self, event):
-        self.save(accept=False)
-        self._settings.setValue("AnalyticsDialog/geometry", self.saveGeometry())
-        cols = [int(self.table.columnWidth(i)) for i in range(self.table.columnCount())]
-        self._settings.setValue("AnalyticsDialog/columns", cols)
-        self._settings.sync()
-        super().closeEvent(event)
 
-    # --- helpers -------------------------------------------------------
-    def _calc_month_stats(self, year, month):
-        res = {k: 0 for k in self.INDICATORS if k not in ("Камса", "Потрачено на софт")}
-        path = os.path.join(stats_dir(year), f"{year}.json")
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            month_data = data.get(str(month), [])
-            res["Работ"] = len(month_data)
-            for rec in month_data:
-                status = (rec.get("status", "") or "").lower()
-                if "заверш" in status:
-                    res["Завершенных"] += 1
-                elif "онго" in status:
-                    res["Онгоингов"] += 1
-                res["Глав"] += int(rec.get("chapters", 0) or 0)
-                res["Знаков"] += int(rec.get("chars", 0) or 0)
-                res["Просмотров"] += int(rec.get("views", 0) or 0)
-                res["Профит"] += float(rec.get("profit", 0) or 0)
-                res["РК"] += float(rec.get("ads", 0) or 0)
-                res["Лайков"] += int(rec.get("likes", 0) or 0)
-                res["Спасибо"] += int(rec.get("thanks", 0) or 0)
-        res["Чистыми"] = round(
-            res["Профит"] - res["РК"] - self._software.get(str(month), 0.0), 2
-        )
-        return res
+def _month_save_scheduler(view) -> autosave.SaveScheduler:
+    """Create the debounced autosave used by both calendar views.
 
-    def _item_changed(self, item):
-        if self._loading:
-            return
-        row = item.row()
-        col = item.column()
-        ind = self.INDICATORS[row]
-        if ind == "Камса":
-            try:
-                self._commissions[str(col + 1)] = float(item.text())
-            except ValueError:
-                self._commissions[str(col + 1)] = 0.0
-        elif ind == "Потрачено на софт":
-            try:
-                self._software[str(col + 1)] = float(item.text())
-            except ValueError:
-                self._software[str(col + 1)] = 0.0
-        self._recalculate()
-        self.save(accept=False)
-
-    def _recalculate(self):
-        cols = len(RU_MONTHS)
-        r_profit = self.INDICATORS.index("Профит")
-        r_rk = self.INDICATORS.index("РК")
-        r_soft = self.INDICATORS.index("Потрачено на софт")
-        r_net = self.INDICATORS.index("Чистыми")
-        # recompute net values
-        for c in range(cols):
-            try:
-                profit = float(self.table.item(r_profit, c).text())
-            except ValueError:
-                profit = 0.0
-            try:
-                rk = float(self.table.item(r_rk, c).text())
-            except ValueError:
-                rk = 0.0
-            try:
-                soft = float(self.table.item(r_soft, c).text())
-            except ValueError:
-                soft = 0.0
-            net = round(profit - rk - soft, 2)
-            self.table.item(r_net, c).setText(str(net))
-            self._net[str(c + 1)] = net
-
-        # totals
-        for r in range(len(self.INDICATORS)):
-            total = 0.0
-            for c in range(cols):
-                try:
-                    total += float(self.table.item(r, c).text())
-                except ValueError:
-                    pass
-            item = self.table.item(r, cols)
-            item.setText(str(round(total, 2)))
-            font = item.font()
-            font.setBold(True)
-            item.setFont(font)
-
-class TopDialog(QtWidgets.QDialog):
-    """Агрегирование и сохранение топов за период."""
-
-    def __init__(self, year, parent=None):
-        super().__init__(parent)
-        self.year = year
-        self.results = []
-        self.setWindowTitle("Топы")
-        self.resize(700, 400)
+    The snapshot goes into :data:`MONTH_CACHE` right away so that returning
+    to the month before the worker has written it shows the latest edits.
+    """
 
-        lay = QtWidgets.QVBoxLayout(self)
-        top = QtWidgets.QFormLayout()
+    def snapshot() -> MonthData:
+        md = view._snapshot_month()
+        MONTH_CACHE.put(md.year, md.month, md)
+        return md
 
-        self.spin_year = QtWidgets.QSpinBox(self)
-        self.spin_year.setRange(2000, 2100)
-        self.spin_year.setValue(year)
-
-        self.combo_mode = QtWidgets.QComboBox(self)
-        self.combo_mode.addItem("Месяц", "month")
-        self.combo_mode.addItem("Квартал", "quarter")
-        self.combo_mode.addItem("Полугодие", "half")
-        self.combo_mode.addItem("Год", "year")
-        self.combo_mode.currentIndexChanged.connect(self._mode_changed)
-        self.combo_period = QtWidgets.QComboBox(self)
-
-        self._input_selectors: dict[QtWidgets.QWidget, str] = {
-            self.spin_year: "QSpinBox",
-            self.combo_mode: "QComboBox",
-            self.combo_period: "QComboBox",
-        }
-        self._input_filters: dict[QtWidgets.QWidget, NeonEventFilter] = {}
-        self._input_views: dict[QtWidgets.QWidget, QtWidgets.QWidget] = {}
-        for widget in self._input_selectors:
-            widget.setAttribute(QtCore.Qt.WA_Hover, True)
-            filt = NeonEventFilter(widget, CONFIG)
-            widget.installEventFilter(filt)
-            widget._neon_filter = filt
-            self._input_filters[widget] = filt
-            view_getter = getattr(widget, "view", None)
-            view = view_getter() if callable(view_getter) else None
-            if view is not None and shiboken6.isValid(view):
-                view.setAttribute(QtCore.Qt.WA_Hover, True)
-                try:
-                    view.installEventFilter(filt)
-                except RuntimeError:
-                    pass
-                viewport_getter = getattr(view, "viewport", None)
-                viewport = viewport_getter() if callable(viewport_getter) else None
-                if viewport is not None and shiboken6.isValid(viewport):
-                    viewport.setAttribute(QtCore.Qt.WA_Hover, True)
-                    try:
-                        viewport.installEventFilter(filt)
-                    except RuntimeError:
-                        pass
-                self._input_views[widget] = view
-
-        self._mode_changed()  # fill periods
-
-        self.btn_calc = StyledPushButton("Сформировать", self, **button_config())
-        self.btn_calc.clicked.connect(self.calculate)
-        self.btn_calc.apply_base_style()
-        self.btn_calc._apply_neon_profile("idle")
-
-        row = QtWidgets.QHBoxLayout()
-        row.setContentsMargins(0, 0, 0, 0)
-        row.addWidget(self.spin_year)
-        row.addWidget(self.combo_mode)
-        row.addWidget(self.combo_period)
-        row.addWidget(self.btn_calc)
-
-        top.addRow(QtWidgets.QLabel("Год:"), row)
-        lay.addLayout(top)
+    return autosave.SaveScheduler(
+        snapshot,
+        MonthData.write,
+        delay_ms=CONFIG.get("autosave_delay_ms", autosave.AUTOSAVE_DELAY_MS),
+        parent=view,
+    )
 
-        headers = [
-            "№",
-            "Работа",
-            "Статус",
-            "Всего глав",
-            "Запланировано",
-            "Сделано глав",
-            "Прогресс перевода",
-            "Выпуск",
-            "Знаков",
-            "Просмотров",
-            "Профит",
-            "РК",
-            "Лайков",
-            "Спасибо",
-        ]
-        self.table = NeonTableWidget(0, len(headers), self)
-        self.table.setHorizontalHeaderLabels(headers)
-        self.table.setStyleSheet(
-            "QTableWidget{border:1px solid #555; border-radius:8px;} "
-            "QTableWidget::item{border:0;} "
-            "QHeaderView::section{padding:0 8px;}"
-        )
-        self.table.horizontalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.Interactive
-        )
-        self.table.verticalHeader().setVisible(False)
-        self.table.verticalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.Stretch
-        )
-        self.table.setSortingEnabled(True)
 
-        app = QtWidgets.QApplication.instance()
-        self.setFont(app.font())
-        self.table.setFont(app.font())
-        header_font = QtGui.QFont(CONFIG.get("header_font"))
-        table_header = self.table.horizontalHeader()
-        table_header.setFont(header_font)
-        table_header.sortIndicatorChanged.connect(self._on_sort_changed)
-
-        lay.addWidget(self.table, 1)
-
-        box = QtWidgets.QDialogButtonBox(self)
-        btn_save = StyledPushButton("Сохранить", self, **button_config())
-        btn_save.setIcon(icon("save"))
-        btn_save.setIconSize(QtCore.QSize(20, 20))
-        btn_close = StyledPushButton("Закрыть", self, **button_config())
-        btn_close.setIcon(icon("x"))
-        btn_close.setIconSize(QtCore.QSize(20, 20))
-        box.addButton(btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
-        box.addButton(btn_close, QtWidgets.QDialogButtonBox.RejectRole)
-        box.accepted.connect(self._save_and_accept)
-        box.rejected.connect(self.reject)
-        lay.addWidget(box)
-        for b in (btn_save, btn_close):
-            b.setFixedSize(b.sizeHint())
+# Dialogs opened from the sidebar live in their own modules and are imported
+# on first use: the first paint only needs the calendar, sidebar and top bar.
+_DIALOG_MODULES = {
+    "ReleaseDialog": "release_dialog",
+    "StatsEntryForm": "stats_dialog",
+    "StatsDialog": "stats_dialog",
+    "AnalyticsDialog": "analytics_dialog",
+    "TopDialog": "top_dialog",
+    "SettingsDialog": "settings_dialog",
+    "DayEntriesDialog": "day_entries_dialog",
+}
 
-        self._settings = QtCore.QSettings("rabota2", "rabota2")
-        self._saved_sort: tuple[int, QtCore.Qt.SortOrder] | None = _read_sort_settings(
-            self._settings, "TopDialog"
-        )
-        geom = self._settings.value("TopDialog/geometry", type=QtCore.QByteArray)
-        if geom is not None:
-            self.restoreGeometry(geom)
-        self.calculate()
-        self.refresh_theme()
-        sizes = self._settings.value("TopDialog/columns", type=list)
-        for i, w in enumerate(sizes or []):
-            try:
-                self.table.setColumnWidth(i, int(w))
-            except (TypeError, ValueError):
-                pass  # пропустить некорректное значение
 
-    def refresh_theme(self) -> None:
-        """Пересобрать стили таблицы и заголовков с учётом темы."""
+def __getattr__(name: str):
+    module = _DIALOG_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    cls = getattr(importlib.import_module(module), name)
+    globals()[name] = cls
+    return cls
 
-        workspace = QtGui.QColor(CONFIG.get("workspace_color", "#1e1e21")).name()
-        accent = QtGui.QColor(CONFIG.get("accent_color", "#39ff14")).name()
-        try:
-            thickness = int(CONFIG.get("neon_thickness", 1))
-        except (TypeError, ValueError):
-            thickness = 1
-        thickness = max(0, thickness)
 
-        header = self.table.horizontalHeader()
+def dialog_class(name: str) -> type:
+    """Return dialog class ``name``, importing its module on first use."""
 
-        self.table.setAttribute(QtCore.Qt.WA_Hover, True)
-        self.table.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
-        header.setAttribute(QtCore.Qt.WA_Hover, True)
+    cls = globals().get(name)
+    return cls if cls is not None else __getattr__(name)
 
-        for widget, selector in self._input_selectors.items():
-            if widget is None or not shiboken6.isValid(widget):
-                continue
-            style = build_input_neon_style(
-                selector,
-                background=workspace,
-                accent=accent,
-                thickness=thickness,
-            )
-            widget.setStyleSheet(style)
-            filt = self._input_filters.get(widget)
-            if filt is not None:
-                filt._config = CONFIG
-            update_neon_filters(widget, CONFIG)
-            view = self._input_views.get(widget)
-            if view is not None and shiboken6.isValid(view):
-                update_neon_filters(view, CONFIG)
-
-        self.btn_calc.update_gradient(**button_config())
-        self.btn_calc.apply_base_style()
-        self.btn_calc._apply_neon_profile("idle")
-
-        if getattr(self.table, "_neon_effect", None):
-            apply_neon_effect(self.table, False, config=CONFIG)
-        if getattr(header, "_neon_effect", None):
-            apply_neon_effect(header, False, config=CONFIG)
 
-        highlight = QtGui.QColor(accent)
-        table_palette = self.table.palette()
-        table_palette.setColor(QtGui.QPalette.Highlight, highlight)
-        self.table.setPalette(table_palette)
-
-        header_palette = header.palette()
-        header_palette.setColor(QtGui.QPalette.Highlight, highlight)
-        header.setPalette(header_palette)
-
-        table_style = (
-            "QTableWidget{"  # базовая область и вьюпорт
-            f"background-color:{workspace};"
-            f"border:1px solid {accent};"
-            "border-radius:8px;"
-            "selection-background-color:rgba(0,0,0,0);"
-            f"selection-color:{accent};"
-            "gridline-color:rgba(255,255,255,40);"
-            "}"
-            "QTableWidget::item{border:0;}"
-        )
-        header_style = (
-            "QHeaderView::section{"  # горизонтальные заголовки
-            f"background-color:{workspace};"
-            f"color:{accent};"
-            "padding:0 8px;"
-            "border:0;"
-            f"border-bottom:1px solid {accent};"
-            "}"
-        )
+def loaded_dialog_classes(*names: str) -> Tuple[type, ...]:
+    """Return the classes among ``names`` whose modules are imported already."""
 
-        self.table.setStyleSheet(table_style)
-        header.setStyleSheet(header_style)
+    return tuple(globals()[name] for name in names if name in globals())
 
-        apply_neon_effect(self.table, True, config=CONFIG)
-        apply_neon_effect(header, True, shadow=False, border=False, config=CONFIG)
-        update_neon_filters(self.table, CONFIG)
-        update_neon_filters(header, CONFIG)
 
-    def resizeEvent(self, event):
-        self.table.horizontalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.Interactive
-        )
-        super().resizeEvent(event)
+def edit_day_entries(
+    parent: QtWidgets.QWidget, day: date, entries: List[Dict[str, str]]
+) -> List[Dict[str, str]] | None:
+    """Edit all ``entries`` of ``day`` in a popup; ``None`` if cancelled."""
 
-    def _mode_changed(self):
-        mode = self.combo_mode.currentData()
-        self.combo_period.clear()
-        if mode == "month":
-            for i, m in enumerate(RU_MONTHS, 1):
-                self.combo_period.addItem(m, i)
-            self.combo_period.setEnabled(True)
-        elif mode == "quarter":
-            for i in range(1, 5):
-                self.combo_period.addItem(str(i), i)
-            self.combo_period.setEnabled(True)
-        elif mode == "half":
-            for i in range(1, 3):
-                self.combo_period.addItem(str(i), i)
-            self.combo_period.setEnabled(True)
-        else:
-            self.combo_period.setEnabled(False)
-
-    # --- helpers -------------------------------------------------------
-    def _months_for_period(self):
-        mode = self.combo_mode.currentData()
-        if mode == "month" and self.combo_period.isEnabled():
-            return [self.combo_period.currentData()]
-        if mode == "quarter" and self.combo_period.isEnabled():
-            q = self.combo_period.currentData()
-            start = (q - 1) * 3 + 1
-            return list(range(start, start + 3))
-        if mode == "half" and self.combo_period.isEnabled():
-            h = self.combo_period.currentData()
-            start = (h - 1) * 6 + 1
-            return list(range(start, start + 6))
-        return list(range(1, 13))
-
-    def calculate(self):
-        year = self.spin_year.value()
-        months = self._months_for_period()
-        path = os.path.join(stats_dir(year), f"{year}.json")
-        totals = {}
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            for m in months:
-                for rec in data.get(str(m), []):
-                    work = rec.get("work", "")
-                    t = totals.setdefault(
-                        work,
-                        {
-                            "status": "",
-                            "total_chapters": 0,
-                            "planned": 0,
-                            "chapters": 0,
-                            "progress": 0.0,
-                            "release": "",
-                            "chars": 0,
-                            "views": 0,
-                            "profit": 0.0,
-                            "ads": 0.0,
-                            "likes": 0,
-                            "thanks": 0,
-                            "done": 0,
-                        },
-                    )
-                    t["status"] = rec.get("status", t["status"])
-                    t["total_chapters"] = max(
-                        t["total_chapters"], int(rec.get("total_chapters", 0) or 0)
-                    )
-                    t["planned"] += int(rec.get("planned", 0) or 0)
-                    t["chapters"] += int(rec.get("chapters", 0) or 0)
-                    prog = rec.get("progress")
-                    if prog is not None:
-                        t["progress"] = prog
-                    rel = rec.get("release")
-                    if rel:
-                        t["release"] = rel
-                    t["chars"] += int(rec.get("chars", 0) or 0)
-                    t["views"] += int(rec.get("views", 0) or 0)
-                    t["profit"] += float(rec.get("profit", 0) or 0)
-                    t["ads"] += float(rec.get("ads", 0) or 0)
-                    t["likes"] += int(rec.get("likes", 0) or 0)
-                    t["thanks"] += int(rec.get("thanks", 0) or 0)
-                    status = (rec.get("status", "") or "").lower()
-                    if "заверш" in status:
-                        t["done"] += 1
-        results = sorted(totals.items(), key=lambda kv: kv[0])
-        self.results = results
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(0)
-        sums = {
-            "total_chapters": 0,
-            "planned": 0,
-            "chapters": 0,
-            "chars": 0,
-            "views": 0,
-            "profit": 0.0,
-            "ads": 0.0,
-            "likes": 0,
-            "thanks": 0,
-        }
-        for idx, (work, vals) in enumerate(results, 1):
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(idx)))
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(work))
-            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(vals.get("status", "")))
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(str(vals["total_chapters"])))
-            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(vals["planned"])))
-            self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(str(vals["chapters"])))
-            self.table.setItem(
-                row, 6, QtWidgets.QTableWidgetItem(f"{round(vals['progress'], 2)}%")
-            )
-            self.table.setItem(row, 7, QtWidgets.QTableWidgetItem(vals.get("release", "")))
-            self.table.setItem(row, 8, QtWidgets.QTableWidgetItem(str(vals["chars"])))
-            self.table.setItem(row, 9, QtWidgets.QTableWidgetItem(str(vals["views"])))
-            self.table.setItem(row, 10, QtWidgets.QTableWidgetItem(str(round(vals["profit"], 2))))
-            self.table.setItem(row, 11, QtWidgets.QTableWidgetItem(str(round(vals["ads"], 2))))
-            self.table.setItem(row, 12, QtWidgets.QTableWidgetItem(str(vals["likes"])))
-            self.table.setItem(row, 13, QtWidgets.QTableWidgetItem(str(vals["thanks"])))
-
-            # accumulate sums
-            sums["total_chapters"] += vals["total_chapters"]
-            sums["planned"] += vals["planned"]
-            sums["chapters"] += vals["chapters"]
-            sums["chars"] += vals["chars"]
-            sums["views"] += vals["views"]
-            sums["profit"] += vals["profit"]
-            sums["ads"] += vals["ads"]
-            sums["likes"] += vals["likes"]
-            sums["thanks"] += vals["thanks"]
-
-        if results:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem("Итого"))
-            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(str(sums["total_chapters"])))
-            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(sums["planned"])))
-            self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(str(sums["chapters"])))
-            self.table.setItem(row, 8, QtWidgets.QTableWidgetItem(str(sums["chars"])))
-            self.table.setItem(row, 9, QtWidgets.QTableWidgetItem(str(sums["views"])))
-            self.table.setItem(row, 10, QtWidgets.QTableWidgetItem(str(round(sums["profit"], 2))))
-            self.table.setItem(row, 11, QtWidgets.QTableWidgetItem(str(round(sums["ads"], 2))))
-            self.table.setItem(row, 12, QtWidgets.QTableWidgetItem(str(sums["likes"])))
-            self.table.setItem(row, 13, QtWidgets.QTableWidgetItem(str(sums["thanks"])))
-        self.table.setSortingEnabled(True)
-        self.table.resizeColumnsToContents()
-        header = self.table.horizontalHeader()
-        header.setMinimumSectionSize(50)
-        header.setTextElideMode(QtCore.Qt.ElideNone)
-        self._apply_saved_sort()
-
-    def _period_key(self):
-        mode = self.combo_mode.currentData()
-        if mode == "month" and self.combo_period.isEnabled():
-            return f"M{self.combo_period.currentData():02d}"
-        if mode == "quarter" and self.combo_period.isEnabled():
-            return f"Q{self.combo_period.currentData()}"
-        if mode == "half" and self.combo_period.isEnabled():
-            return f"H{self.combo_period.currentData()}"
-        return "Y"
-
-    def save(self):
-        if not self.results:
-            self.calculate()
-        year = self.spin_year.value()
-        path = os.path.join(top_dir(year), f"{year}.json")
-        data = {}
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        key = self._period_key()
-        results = []
-        for w, vals in self.results:
-            results.append(
-                {
-                    "work": w,
-                    "status": vals.get("status", ""),
-                    "total_chapters": vals.get("total_chapters", 0),
-                    "planned": vals.get("planned", 0),
-                    "chapters": vals.get("chapters", 0),
-                    "progress": vals.get("progress", 0.0),
-                    "release": vals.get("release", ""),
-                    "chars": vals.get("chars", 0),
-                    "views": vals.get("views", 0),
-                    "profit": vals.get("profit", 0.0),
-                    "ads": vals.get("ads", 0.0),
-                    "likes": vals.get("likes", 0),
-                    "thanks": vals.get("thanks", 0),
-                }
-            )
-        data[key] = {"results": results}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    dlg = dialog_class("DayEntriesDialog")(day, entries, parent)
+    try:
+        if dlg.exec() != QtWidgets.QDialog.Accepted:
+            return None
+        return dlg.entries()
+    finally:
+        dlg.deleteLater()
 
-    def _save_and_accept(self):
-        self.save()
-        self.accept()
 
-    def closeEvent(self, event):
-        self.save()
-        self._settings.setValue("TopDialog/geometry", self.saveGeometry())
-        cols = [int(self.table.columnWidth(i)) for i in range(self.table.columnCount())]
-        self._settings.setValue("TopDialog/columns", cols)
-        header = self.table.horizontalHeader()
-        self._settings.setValue("TopDialog/sortSection", int(header.sortIndicatorSection()))
-        self._settings.setValue("TopDialog/sortOrder", int(header.sortIndicatorOrder().value))
-        self._settings.sync()
-        super().closeEvent(event)
+def _font_values() -> Dict[str, object]:
+    return {key: CONFIG.get(key) for key in theme_transaction.ASPECT_KEYS["fonts"]}
 
-    def _on_sort_changed(self, section: int, order: QtCore.Qt.SortOrder) -> None:
-        self._saved_sort = (int(section), QtCore.Qt.SortOrder(order))
 
-    def _apply_saved_sort(self) -> None:
-        if not self.table.isSortingEnabled():
-            return
-        section_order = self._saved_sort
-        if section_order is None:
-            header = self.table.horizontalHeader()
-            section_order = (
-                int(header.sortIndicatorSection()),
-                QtCore.Qt.SortOrder(header.sortIndicatorOrder()),
-            )
-        section, order = section_order
-        if 0 <= section < self.table.columnCount():
-            self.table.sortByColumn(section, order)
-            self._saved_sort = (section, order)
-
-class NeonTableWidget(QtWidgets.QTableWidget):
-    """Вложенная таблица с neonовым подсвечиванием при наведении и фокусе."""
-
-    def __init__(self, rows, cols, parent=None, use_neon=True):
-        super().__init__(rows, cols, parent)
-        self.setFocusPolicy(QtCore.Qt.StrongFocus)
-        self._active_editor: QtWidgets.QLineEdit | None = None
-        self._neon_enabled = use_neon
-        self.setStyleSheet(
-            "QTableWidget, QTableWidget::viewport{border:1px solid transparent;}\n"
-            "QTableWidget::item:selected{background:transparent;}"
-        )
+class DialogManager:
+    """Keeps one instance of each sidebar dialog of ``parent`` alive.
 
-    def focusOutEvent(self, e):
-        super().focusOutEvent(e)
-        self.clearSelection()
+    Closing a dialog only hides it.  Opening it again calls its
+    ``reopen(*args)``, which refreshes what changed on disk since and
+    returns ``False`` when the instance cannot be reused; the dialog is
+    then built anew, as it is after a font change.
+    """
 
-    def itemSelectionChanged(self):
-        super().itemSelectionChanged()
-        self.clearSelection()
+    def __init__(self, parent: QtWidgets.QWidget) -> None:
+        self._parent = parent
+        self._dialogs: Dict[str, Tuple[object, Dict[str, object]]] = {}
+
+    def get(self, name: str, *args):
+        """Return dialog ``name`` for ``args``, reusing the hidden instance."""
+
+        cls = dialog_class(name)
+        entry = self._dialogs.pop(name, None)
+        if entry is not None:
+            dlg, fonts = entry
+            if self._reusable(dlg, cls, fonts) and dlg.reopen(*args):
+                self._dialogs[name] = entry
+                return dlg
+            if isinstance(dlg, QtCore.QObject) and shiboken6.isValid(dlg):
+                dlg.deleteLater()
+        dlg = cls(*args, self._parent)
+        self._dialogs[name] = (dlg, _font_values())
+        return dlg
+
+    @staticmethod
+    def _reusable(dlg, cls: type, fonts: Dict[str, object]) -> bool:
+        if type(dlg) is not cls or not hasattr(dlg, "reopen"):
+            return False
+        if isinstance(dlg, QtCore.QObject) and not shiboken6.isValid(dlg):
+            return False
+        return fonts == _font_values()
 
-    def edit(self, index, trigger, event):
-        res = super().edit(index, trigger, event)
-        if res and self._neon_enabled:
-            editor = self.findChild(QtWidgets.QLineEdit)
-            if editor is not None:
-                if self._active_editor is not None and self._active_editor is not editor:
-                    old_filter = getattr(self._active_editor, "_neon_filter", None)
-                    if old_filter is not None:
-                        self._active_editor.removeEventFilter(old_filter)
-                        self._active_editor._neon_filter = None
-                    self._active_editor.removeEventFilter(self)
-                    apply_neon_effect(self._active_editor, False, config=CONFIG)
-                if getattr(editor, "_neon_filter", None) is None:
-                    editor.setAttribute(QtCore.Qt.WA_Hover, True)
-                    editor.setStyleSheet(
-                        editor.styleSheet() + "border:1px solid transparent;"
-                    )
-                    filt = NeonEventFilter(editor, CONFIG)
-                    editor.installEventFilter(filt)
-                    editor._neon_filter = filt
-                apply_neon_effect(editor, True, shadow=False, config=CONFIG)
-                if self._active_editor is not editor:
-                    editor.installEventFilter(self)
-                self._active_editor = editor
-        return res
-
-    def eventFilter(self, obj, event):  # noqa: D401 - Qt event filter signature
-        if obj is self._active_editor and event.type() == QtCore.QEvent.FocusOut:
-            apply_neon_effect(obj, False, config=CONFIG)
-            filt = getattr(obj, "_neon_filter", None)
-            if filt is not None:
-                obj.removeEventFilter(filt)
-                obj._neon_filter = None
-            obj.removeEventFilter(self)
-            self._active_editor = None
-        return super().eventFilter(obj, event)
 
 class ExcelCalendarTable(QtWidgets.QTableWidget):
     """Таблица календаря месяца с вложенными таблицами по дням."""
 
+    _DAY_BASE_STYLE = "border:1px solid transparent; border-radius:8px;"
+
     class _DayContainerEventFilter(QtCore.QObject):
         """Проксирует события контейнера дня в ``ExcelCalendarTable``."""
 
@@ -2185,9 +444,12 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
                 QtCore.QEvent.HoverLeave,
             ):
                 table._clear_active_day(self._coords, transient=True)
+            elif etype == QtCore.QEvent.Wheel and event.angleDelta().y():
+                steps = -1 if event.angleDelta().y() > 0 else 1
+                return table.scroll_day(self._coords, steps)
             return False
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, *, load: bool = True):
         super().__init__(parent)
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         self.verticalHeader().setVisible(False)
@@ -2200,6 +462,8 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         header.setAttribute(QtCore.Qt.WA_Hover, True)
         workspace_color, accent_color = self._resolve_palette_colors()
         self._update_header_theme(header, workspace_color, accent_color, ensure_filter=True)
+        text_color = QtWidgets.QApplication.palette().color(QtGui.QPalette.WindowText).name()
+        self._apply_day_sheet(self._compiled_theme(workspace_color, accent_color, text_color))
         header.setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
         self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
         self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
@@ -2212,7 +476,6 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         self.cell_tables: Dict[tuple[int, int], QtWidgets.QTableWidget] = {}
         self.day_labels: Dict[tuple[int, int], QtWidgets.QLabel] = {}
         self.cell_containers: Dict[tuple[int, int], QtWidgets.QWidget] = {}
-        self.cell_filters: Dict[tuple[int, int], NeonEventFilter | None] = {}
         self._cell_event_filters: Dict[tuple[int, int], QtCore.QObject] = {}
         self._active_day: tuple[int, int] | None = None
         self._hover_day: tuple[int, int] | None = None
@@ -2220,6 +483,13 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         self._col_widths: List[int] | None = None
 
         self._loading_cells = False
+        # All entries of the month; the day tables show ``day_rows`` of them
+        # starting at the day's offset in ``_day_offsets``.
+        self._month_days: Dict[int, List[Dict[str, str]]] = {}
+        self._day_offsets: Dict[int, int] = {}
+        self._day_headers: Dict[tuple[int, int], QtWidgets.QHBoxLayout] = {}
+        self._more_buttons: Dict[tuple[int, int], QtWidgets.QToolButton] = {}
+        self._visible_weeks = 0
 
         self._updating_rows = False
 
@@ -2229,7 +499,14 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         self._row_timer.timeout.connect(self._update_row_heights)
         self.destroyed.connect(lambda: self._row_timer.stop())
 
-        self.load_month_data(self.year, self.month)
+        self._autosave = _month_save_scheduler(self)
+
+        if load:
+            with startup_profiler.phase("load_month_data"):
+                self.load_month_data(self.year, self.month)
+        else:
+            # Empty grid of the current month; see prepare_month_cells().
+            self.setRowCount(len(calendar.Calendar().monthdatescalendar(self.year, self.month)))
 
     # --- theme helpers -------------------------------------------------
     @staticmethod
@@ -2246,14 +523,16 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         return workspace, accent
 
     @staticmethod
-    def _blend_for_hover(base: QtGui.QColor, accent: QtGui.QColor, ratio: float = 0.18) -> QtGui.QColor:
-        ratio = max(0.0, min(1.0, ratio))
-        mixed = QtGui.QColor(
-            int(base.red() * (1 - ratio) + accent.red() * ratio),
-            int(base.green() * (1 - ratio) + accent.green() * ratio),
-            int(base.blue() * (1 - ratio) + accent.blue() * ratio),
+    def _compiled_theme(
+        workspace: QtGui.QColor, accent: QtGui.QColor, text_color: str
+    ) -> theme_registry.CompiledTheme:
+        return theme_registry.theme(
+            accent=accent.name(), workspace=workspace.name(), text=text_color
         )
-        return mixed
+
+    def _apply_day_sheet(self, compiled: theme_registry.CompiledTheme) -> None:
+        # One sheet on the viewport styles every pooled day cell.
+        theme_registry.apply_style(self.viewport(), compiled.get("calendar_days"))
 
     @classmethod
     def _header_section_style(
@@ -2261,19 +540,9 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         workspace: QtGui.QColor,
         accent: QtGui.QColor,
     ) -> str:
-        ws = workspace.name()
-        accent_name = accent.name()
-        hover = cls._blend_for_hover(workspace, accent).name()
-        return (
-            "QHeaderView::section{"
-            f"background:{ws};"
-            f"color:{accent_name};"
-            "padding:0 6px;"
-            "border:0;"
-            f"border-bottom:1px solid {accent_name};"
-            "}"
-            f"QHeaderView::section:hover{{background:{hover};}}"
-        )
+        return theme_registry.theme(
+            accent=accent.name(), workspace=workspace.name()
+        ).get("header_section")
 
     @staticmethod
     def _safe_int(value, default: int) -> int:
@@ -2319,18 +588,13 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         if header is None or not shiboken6.isValid(header):
             return
         style = self._header_section_style(workspace, accent)
-        header.setStyleSheet(style)
+        theme_registry.apply_style(header, style)
         header._neon_prev_style = style  # type: ignore[attr-defined]
         palette = header.palette()
         palette.setColor(QtGui.QPalette.Highlight, accent)
         header.setPalette(palette)
-        filt = getattr(header, "_neon_filter", None)
-        if ensure_filter and filt is None:
-            filt = NeonEventFilter(header, CONFIG)
-            header.installEventFilter(filt)
-            header._neon_filter = filt  # type: ignore[attr-defined]
-        if filt:
-            filt.update_config(CONFIG)
+        if ensure_filter or neon_registered(header):
+            register_neon(header, CONFIG)
         self._sync_header_effect(header, accent, shadow=shadow)
 
     def _apply_inner_table_theme(
@@ -2355,32 +619,16 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
             )
         thickness = max(1, self._safe_int(CONFIG.get("neon_thickness", 1), 1))
         radius = max(0, self._safe_int(CONFIG.get("inner_table_radius", 12), 12))
-        selection_rgba = (
-            f"rgba({accent.red()},{accent.green()},{accent.blue()},120)"
-        )
-        ws_name = workspace.name()
-        accent_name = accent.name()
-        viewport_radius = max(0, radius - 1)
-        style = (
-            "QTableWidget{"\
-            f"background-color:{ws_name};"\
-            f"color:{text_color};"\
-            f"selection-background-color:{selection_rgba};"\
-            f"selection-color:{text_color};"\
-            f"border:{thickness}px solid {accent_name};"\
-            f"border-radius:{radius}px;"\
-            "gridline-color:rgba(255,255,255,40);"\
-            "}"\
-            "QTableWidget::viewport{"\
-            f"background-color:{ws_name};"\
-            "border:0;"\
-            f"border-radius:{viewport_radius}px;"\
-            "}"\
-            "QTableWidget::item{border:0;}"
-        )
+        style = theme_registry.theme(
+            accent=accent.name(),
+            workspace=workspace.name(),
+            text=text_color,
+            thickness=thickness,
+            radius=radius,
+        ).get("inner_table")
         if getattr(table, "_neon_effect", None):
             apply_neon_effect(table, False, config=CONFIG)
-        table.setStyleSheet(style)
+        theme_registry.apply_style(table, style)
         table._neon_prev_style = style  # type: ignore[attr-defined]
         palette = table.palette()
         palette.setColor(QtGui.QPalette.Highlight, accent)
@@ -2388,13 +636,7 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         palette.setColor(QtGui.QPalette.Window, workspace)
         palette.setColor(QtGui.QPalette.Text, QtGui.QColor(text_color))
         table.setPalette(palette)
-        filt = getattr(table, "_neon_filter", None)
-        if filt is None:
-            filt = NeonEventFilter(table, CONFIG)
-            table.installEventFilter(filt)
-            table._neon_filter = filt  # type: ignore[attr-defined]
-        else:
-            filt.update_config(CONFIG)
+        register_neon(table, CONFIG)
         apply_neon_effect(table, True, config=CONFIG)
         header = table.horizontalHeader()
         if header is not None and shiboken6.isValid(header):
@@ -2454,8 +696,12 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
 
     def update_day_rows(self):
         rows = CONFIG.get("day_rows", DAY_ROWS_DEFAULT)
-        for tbl in self.cell_tables.values():
+        for coords, tbl in self.cell_tables.items():
+            if tbl.rowCount() == rows:
+                continue
             tbl.setRowCount(rows)
+            # Entries are kept in ``_month_days``; the window may shift.
+            self._fill_inner_table(coords)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -2470,7 +716,7 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
             return
         self._updating_rows = True
         try:
-            rows = self.rowCount()
+            rows = self._visible_weeks or self.rowCount()
             if rows:
                 height = self.viewport().height() // rows
                 for r in range(rows):
@@ -2487,155 +733,287 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         day = self.date_map.get(coords)
         if day is None or day.month != self.month:
             return
-        self.save_current_month()
+        index = self._day_offset(day.day) + item.row()
+        rows = self._month_days.setdefault(day.day, [])
+        while len(rows) <= index:
+            rows.append({"work": "", "plan": "", "done": ""})
+        rows[index] = dict(rows[index])
+        rows[index][calendar_model.FIELDS[item.column()]] = item.text().strip()
+        while rows and not any(rows[-1].get(key) for key in calendar_model.FIELDS):
+            rows.pop()
+        if not rows:
+            del self._month_days[day.day]
+        self._update_more_button(coords)
+        self._autosave.mark_dirty()
+
+    def flush_pending_save(self, wait: bool = False) -> None:
+        self._autosave.flush(wait)
 
     def save_current_month(self):
+        if not self.date_map:
+            # Not loaded yet: an empty snapshot would wipe the stored month.
+            return
+        # Pending background writes must land before this one.
+        self._autosave.discard()
+        self._autosave.flush(wait=True)
+        self._snapshot_month().save()
+
+    def _snapshot_month(self) -> MonthData:
         md = MonthData(year=self.year, month=self.month)
-        for (r, c), day in self.date_map.items():
-            if day.month != self.month:
-                continue
-            inner = self.cell_tables.get((r, c))
-            if not inner:
-                continue
-            rows = []
-            for rr in range(inner.rowCount()):
-                vals = []
-                for cc in range(inner.columnCount()):
-                    it = inner.item(rr, cc)
-                    vals.append(it.text().strip() if it else "")
-                if any(vals):
-                    rows.append({"work": vals[0], "plan": vals[1], "done": vals[2]})
+        for day, entries in self._month_days.items():
+            rows = [
+                dict(row) for row in entries if any(row.get(k) for k in calendar_model.FIELDS)
+            ]
             if rows:
-                md.days[day.day] = rows
-        md.save()
-
-    def load_month_data(self, year: int, month: int):
-        self.year = year
-        self.month = month
-        md = MonthData.load(year, month)
-        cal = calendar.Calendar()
-        weeks = cal.monthdatescalendar(year, month)
+                md.days[day] = rows
+        return md
+
+    def prepare_month_cells(self, year: int, month: int) -> Iterator[None]:
+        """Create the pooled day cells ``month`` needs, yielding after each week.
+
+        Lets the caller build the grid across event loop turns before
+        :meth:`load_month_data`, which then only fills the cells.
+        """
+
+        weeks = calendar.Calendar().monthdatescalendar(year, month)
+        if self.rowCount() < len(weeks):
+            self.setRowCount(len(weeks))
+        created = False
+        for r, week in enumerate(weeks):
+            for c in range(len(week)):
+                if (r, c) not in self.cell_containers:
+                    self._create_day_cell((r, c))
+                    created = True
+            yield
+        if created:
+            self.apply_fonts()
+
+    def _create_day_cell(self, coords: tuple[int, int]) -> None:
+        """Build the pooled container, label and inner table for ``coords``."""
+
+        r, c = coords
+        container = QtWidgets.QWidget()
+        container.setObjectName("CalendarDay")
+        container.setAttribute(QtCore.Qt.WA_Hover, True)
+        container.setMouseTracking(True)
+        container.setFocusPolicy(QtCore.Qt.NoFocus)
+        lay = QtWidgets.QVBoxLayout(container)
+        lay.setContentsMargins(0, 0, 0, 0)
+        lay.setSpacing(2)
+        container.setStyleSheet(self._DAY_BASE_STYLE)
+        container.setProperty("calendar_base_style", self._DAY_BASE_STYLE)
+        lbl = QtWidgets.QLabel("", container)
+        lbl.setObjectName("CalendarDayLabel")
+        lbl.setAttribute(QtCore.Qt.WA_Hover, True)
+        lbl.setFont(
+            QtGui.QFont(CONFIG.get("header_font", CONFIG.get("font_family", "Exo 2")))
+        )
+        lbl.setAlignment(QtCore.Qt.AlignCenter)
+        # keep reference for later font updates
+        self.day_labels[coords] = lbl
+        top = QtWidgets.QHBoxLayout()
+        top.setContentsMargins(0, 0, 4, 0)
+        top.addStretch(1)
+        top.addWidget(lbl)
+        top.addStretch(1)
+        lay.addLayout(top)
+        self._day_headers[coords] = top
+        inner = self._create_inner_table()
+        inner.setAttribute(QtCore.Qt.WA_Hover, True)
+        inner.setMouseTracking(True)
+        inner.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
+        inner.viewport().setMouseTracking(True)
+        lay.addWidget(inner)
         workspace_color, accent_color = self._resolve_palette_colors()
         text_color = (
             QtWidgets.QApplication.palette()
             .color(QtGui.QPalette.WindowText)
             .name()
         )
-        old_tables = dict(self.cell_tables)
-        old_labels = dict(self.day_labels)
-        self.date_map.clear()
-        self.cell_tables.clear()
-        self.day_labels.clear()
-        for coords, container in list(self.cell_containers.items()):
-            apply_neon_effect(container, False, config=CONFIG)
-            event_filter = self._cell_event_filters.pop(coords, None)
-            if event_filter:
-                if shiboken6.isValid(container):
-                    container.removeEventFilter(event_filter)
-                label = old_labels.get(coords)
-                if label and shiboken6.isValid(label):
-                    label.removeEventFilter(event_filter)
-                inner_table = old_tables.get(coords)
-                if inner_table and shiboken6.isValid(inner_table):
-                    inner_table.removeEventFilter(event_filter)
-                    viewport = inner_table.viewport()
-                    if viewport and shiboken6.isValid(viewport):
-                        viewport.removeEventFilter(event_filter)
+        self._apply_inner_table_theme(
+            inner,
+            workspace_color,
+            accent_color,
+            text_color=text_color,
+        )
+        self.setCellWidget(r, c, container)
+        self.cell_tables[coords] = inner
+        self.cell_containers[coords] = container
+        register_neon(container, CONFIG)
+        day_filter = self._DayContainerEventFilter(self, coords)
+        container.installEventFilter(day_filter)
+        lbl.installEventFilter(day_filter)
+        inner.installEventFilter(day_filter)
+        inner.viewport().installEventFilter(day_filter)
+        self._cell_event_filters[coords] = day_filter
+        handler = lambda changed_item, coord=coords: self._on_inner_item_changed(
+            coord, changed_item
+        )
+        inner.itemChanged.connect(handler)
+        inner._autosave_handler = handler  # type: ignore[attr-defined]
+
+    def _set_day_state(self, coords: tuple[int, int], in_month: bool) -> None:
+        """Switch a pooled day between the current-month and adjacent look."""
+
+        container = self.cell_containers[coords]
+        if container.property("calendar_in_month") is in_month:
+            return
+        container.setEnabled(in_month)
+        # The look comes from the "calendar_days" sheet on the viewport.
+        theme_registry.set_style_state(self.day_labels[coords], "calendar_in_month", in_month)
+        theme_registry.set_style_state(container, "calendar_in_month", in_month)
+
+    def _day_offset(self, day: int) -> int:
+        """Index of the first entry of ``day`` shown in its table."""
+
+        limit = calendar_model.scroll_limit(
+            len(self._month_days.get(day, [])), CONFIG.get("day_rows", DAY_ROWS_DEFAULT)
+        )
+        return min(self._day_offsets.get(day, 0), limit)
+
+    def scroll_day(self, coords: tuple[int, int], steps: int) -> bool:
+        """Move the entries shown by the day at ``coords`` by ``steps`` rows."""
+
+        day = self.date_map.get(coords)
+        if day is None or day.month != self.month:
+            return False
+        limit = calendar_model.scroll_limit(
+            len(self._month_days.get(day.day, [])), CONFIG.get("day_rows", DAY_ROWS_DEFAULT)
+        )
+        current = self._day_offset(day.day)
+        offset = max(0, min(limit, current + steps))
+        if offset == current:
+            return False
+        self._day_offsets[day.day] = offset
+        self._fill_inner_table(coords)
+        return True
+
+    def open_day_editor(self, coords: tuple[int, int]) -> bool:
+        """Edit every entry of the day at ``coords`` in a popup."""
+
+        day = self.date_map.get(coords)
+        if day is None or day.month != self.month:
+            return False
+        rows = edit_day_entries(self, day, self._month_days.get(day.day, []))
+        if rows is None:
+            return False
+        if rows:
+            self._month_days[day.day] = rows
+        else:
+            self._month_days.pop(day.day, None)
+        self._fill_inner_table(coords)
+        self._autosave.mark_dirty()
+        return True
+
+    def _update_more_button(self, coords: tuple[int, int]) -> None:
+        """Show how many entries of the day are outside its table."""
+
+        day = self.date_map.get(coords)
+        inner = self.cell_tables.get(coords)
+        hidden = 0
+        if day is not None and day.month == self.month and inner is not None:
+            hidden = calendar_model.hidden_entries(
+                len(self._month_days.get(day.day, [])),
+                self._day_offset(day.day),
+                inner.rowCount(),
+            )
+        button = self._more_buttons.get(coords)
+        if button is None:
+            if not hidden:
+                return
+            # Created on first overflow only; most days never need one.
+            button = QtWidgets.QToolButton(self.cell_containers[coords])
+            button.setObjectName("CalendarDayMore")
+            button.setAutoRaise(True)
+            button.setCursor(QtCore.Qt.PointingHandCursor)
+            button.setToolTip("Все записи дня")
+            button.clicked.connect(lambda _=False, c=coords: self.open_day_editor(c))
+            self._day_headers[coords].addWidget(button)
+            self._more_buttons[coords] = button
+        text = f"+{hidden}"
+        if button.text() != text:
+            button.setText(text)
+        button.setVisible(bool(hidden))
+
+    def _fill_inner_table(self, coords: tuple[int, int], start_row: int = 0) -> None:
+        """Write the stored entries of the day at ``coords`` into its table.
+
+        Existing items are reused and only their text is reset, so navigating
+        between months does not allocate new ``QTableWidgetItem`` objects.
+        The table shows the entries from the day's scroll offset on.
+        """
+
+        inner = self.cell_tables.get(coords)
+        day = self.date_map.get(coords)
+        if inner is None:
+            return
+        in_month = day is not None and day.month == self.month
+        rows = self._month_days.get(day.day, []) if in_month else []
+        offset = self._day_offset(day.day) if in_month else 0
+        blocker = QtCore.QSignalBlocker(inner)
+        try:
+            for rr in range(start_row, inner.rowCount()):
+                row = rows[offset + rr] if offset + rr < len(rows) else None
+                for cc, key in enumerate(("work", "plan", "done")):
+                    text = str(row.get(key, "")) if row else ""
+                    item = inner.item(rr, cc)
+                    if item is None:
+                        if not text:
+                            continue
+                        inner.setItem(rr, cc, QtWidgets.QTableWidgetItem(text))
+                    elif item.text() != text:
+                        item.setText(text)
+        finally:
+            del blocker
+        self._update_more_button(coords)
+
+    def load_month_data(self, year: int, month: int):
+        self.year = year
+        self.month = month
+        md = MONTH_CACHE.get(year, month)
+        MONTH_CACHE.prefetch_around(year, month)
+        # A copy: edits must not reach the cached month before a save.
+        self._month_days = {
+            int(day): [dict(row) for row in rows] for day, rows in md.days.items()
+        }
+        self._day_offsets.clear()
+        weeks = calendar.Calendar().monthdatescalendar(year, month)
+        for container in self.cell_containers.values():
+            if getattr(container, "_neon_effect", None):
+                apply_neon_effect(container, False, config=CONFIG)
         self._hover_day = None
         self._active_day = None
-        self.cell_containers.clear()
-        self.cell_filters.clear()
-        self.setRowCount(len(weeks))
-        base_style = "border:1px solid transparent; border-radius:8px;"
+        self.date_map.clear()
+        # Rows are only ever added: a 6th week row is hidden rather than
+        # removed so its pooled widgets survive months with five weeks.
+        if self.rowCount() < len(weeks):
+            self.setRowCount(len(weeks))
+        for r in range(self.rowCount()):
+            self.setRowHidden(r, r >= len(weeks))
+        self._visible_weeks = len(weeks)
+        created = False
         self._loading_cells = True
         try:
             for r, week in enumerate(weeks):
                 for c, day in enumerate(week):
-                    container = QtWidgets.QWidget()
-                    container.setAttribute(QtCore.Qt.WA_Hover, True)
-                    container.setMouseTracking(True)
-                    container.setFocusPolicy(QtCore.Qt.NoFocus)
-                    lay = QtWidgets.QVBoxLayout(container)
-                    lay.setContentsMargins(0, 0, 0, 0)
-                    lay.setSpacing(2)
-                    container.setStyleSheet(base_style)
-                    lbl = QtWidgets.QLabel(str(day.day), container)
-                    lbl.setAttribute(QtCore.Qt.WA_Hover, True)
-                    lbl.setFont(
-                        QtGui.QFont(
-                            CONFIG.get(
-                                "header_font", CONFIG.get("font_family", "Exo 2")
-                            )
-                        )
-                    )
-                    lbl.setAlignment(QtCore.Qt.AlignCenter)
-                    # keep reference for later font updates
-                    self.day_labels[(r, c)] = lbl
-                    lay.addWidget(lbl, alignment=QtCore.Qt.AlignHCenter)
-                    inner = self._create_inner_table()
-                    inner.setAttribute(QtCore.Qt.WA_Hover, True)
-                    inner.setMouseTracking(True)
-                    inner.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
-                    inner.viewport().setMouseTracking(True)
-                    lay.addWidget(inner)
-                    self.setCellWidget(r, c, container)
-                    self.date_map[(r, c)] = day
-                    self.cell_tables[(r, c)] = inner
-                    self.cell_containers[(r, c)] = container
-                    filt = NeonEventFilter(container, CONFIG)
-                    container.installEventFilter(filt)
-                    container._neon_filter = filt
-                    self.cell_filters[(r, c)] = filt
-                    day_filter = self._DayContainerEventFilter(self, (r, c))
-                    container.installEventFilter(day_filter)
-                    lbl.installEventFilter(day_filter)
-                    inner.installEventFilter(day_filter)
-                    inner.viewport().installEventFilter(day_filter)
-                    self._cell_event_filters[(r, c)] = day_filter
-                    if day.month != month:
-                        container.setEnabled(False)
-                        container.setStyleSheet(
-                            base_style + "background-color:#2a2a2a; color:#777;"
-                        )
-                        lbl.setStyleSheet("color:#777;")
-                        container.setProperty(
-                            "calendar_base_style",
-                            container.styleSheet(),
-                        )
-                    else:
-                        container.setEnabled(True)
-                        container.setStyleSheet(base_style)
-                        lbl.setStyleSheet("")
-                        container.setProperty("calendar_base_style", base_style)
-                    blocker = QtCore.QSignalBlocker(inner)
-                    try:
-                        rows = md.days.get(day.day, [])
-                        for rr, row in enumerate(rows):
-                            if rr >= inner.rowCount():
-                                break
-                            for cc, key in enumerate(["work", "plan", "done"]):
-                                item = QtWidgets.QTableWidgetItem(
-                                    str(row.get(key, ""))
-                                )
-                                inner.setItem(rr, cc, item)
-                    finally:
-                        del blocker
-                    self._apply_inner_table_theme(
-                        inner,
-                        workspace_color,
-                        accent_color,
-                        text_color=text_color,
-                    )
-                    handler = lambda changed_item, coord=(r, c): self._on_inner_item_changed(
-                        coord, changed_item
-                    )
-                    inner.itemChanged.connect(handler)
-                    inner._autosave_handler = handler  # type: ignore[attr-defined]
-            update_neon_filters(self, CONFIG)
+                    coords = (r, c)
+                    if coords not in self.cell_containers:
+                        self._create_day_cell(coords)
+                        created = True
+                    self.date_map[coords] = day
+                    lbl = self.day_labels[coords]
+                    text = str(day.day)
+                    if lbl.text() != text:
+                        lbl.setText(text)
+                    self._set_day_state(coords, day.month == month)
+                    self._fill_inner_table(coords)
+            if created:
+                update_neon_filters(self, CONFIG)
         finally:
             self._loading_cells = False
         self._update_row_heights()
-        self.apply_fonts()
+        if created:
+            self.apply_fonts()
         return True
 
     # ---------- Day highlighting ----------
@@ -2682,92 +1060,280 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
                 return
             self._active_day = None
 
-        apply_neon_effect(container, False, config=CONFIG)
-        base_style = container.property("calendar_base_style")
-        if base_style:
-            container.setStyleSheet(base_style)
+        apply_neon_effect(container, False, config=CONFIG)
+        base_style = container.property("calendar_base_style")
+        if base_style:
+            container.setStyleSheet(base_style)
+
+    def apply_fonts(self):
+        """Apply current header font to calendar elements."""
+        header_font = QtGui.QFont(
+            CONFIG.get("header_font", CONFIG.get("font_family", "Exo 2"))
+        )
+        self.horizontalHeader().setFont(header_font)
+        # Ensure weekday header items on the main calendar adopt the font
+        for i in range(self.columnCount()):
+            item = self.horizontalHeaderItem(i)
+            if item:
+                item.setFont(header_font)
+        for tbl in self.cell_tables.values():
+            tbl.horizontalHeader().setFont(header_font)
+            # Ensure individual header items also adopt the selected font
+            for i in range(tbl.columnCount()):
+                item = tbl.horizontalHeaderItem(i)
+                if item:
+                    item.setFont(header_font)
+        for lbl in self.day_labels.values():
+            lbl.setFont(header_font)
+
+    def apply_theme(self) -> None:
+        """Apply palette-based colors to calendar widgets."""
+        workspace_color, accent_color = self._resolve_palette_colors()
+        text_color = QtWidgets.QApplication.palette().color(QtGui.QPalette.WindowText).name()
+        ws = workspace_color.name()
+
+        # Reset previously applied neon so the refreshed CSS becomes the base style.
+        apply_neon_effect(self, False, config=CONFIG)
+        header = self.horizontalHeader()
+        if header is not None and shiboken6.isValid(header):
+            apply_neon_effect(header, False, config=CONFIG)
+
+        compiled = self._compiled_theme(workspace_color, accent_color, text_color)
+        theme_registry.apply_style(self, compiled.get("calendar_table"))
+        self._apply_day_sheet(compiled)
+        table_palette = self.palette()
+        table_palette.setColor(QtGui.QPalette.Highlight, accent_color)
+        self.setPalette(table_palette)
+        self._update_header_theme(
+            header,
+            workspace_color,
+            accent_color,
+            ensure_filter=True,
+        )
+        apply_neon_effect(self, True, config=CONFIG)
+        if header is not None and shiboken6.isValid(header):
+            apply_neon_effect(header, True, border=False, config=CONFIG)
+        for tbl in self.cell_tables.values():
+            self._apply_inner_table_theme(
+                tbl,
+                workspace_color,
+                accent_color,
+                text_color=text_color,
+            )
+
+    # ---------- Navigation ----------
+    def go_prev_month(self):
+        self.flush_pending_save()
+        if self.month == 1:
+            self.month = 12
+            self.year -= 1
+        else:
+            self.month -= 1
+        self.load_month_data(self.year, self.month)
+
+    def go_next_month(self):
+        self.flush_pending_save()
+        if self.month == 12:
+            self.month = 1
+            self.year += 1
+        else:
+            self.month += 1
+        self.load_month_data(self.year, self.month)
+
+    def work_names(self) -> List[str]:
+        """Return sorted work titles entered for the current month."""
+
+        names = {
+            str(row.get("work", "")).strip()
+            for rows in self._month_days.values()
+            for row in rows
+        }
+        names.discard("")
+        return sorted(names)
+
+
+class ModelCalendarView(QtWidgets.QTableView):
+    """Календарь месяца на одной модели вместо вложенных таблиц.
+
+    Дни рисуются делегатом :class:`calendar_model.DayCellDelegate`, поэтому
+    переключение месяца заменяет только данные модели.  Публичный интерфейс
+    совпадает с :class:`ExcelCalendarTable`.
+    """
+
+    def __init__(self, parent=None, *, load: bool = True):
+        super().__init__(parent)
+        self.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        self.verticalHeader().setVisible(False)
+        self.setShowGrid(True)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
+        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+
+        self._model = calendar_model.MonthCalendarModel(
+            CONFIG.get("day_rows", DAY_ROWS_DEFAULT), self
+        )
+        self._delegate = calendar_model.DayCellDelegate(self)
+        self.setModel(self._model)
+        self.setItemDelegate(self._delegate)
+        self._model.entriesChanged.connect(self._on_entries_changed)
+        self._autosave = _month_save_scheduler(self)
+
+        header = self.horizontalHeader()
+        header.setAttribute(QtCore.Qt.WA_Hover, True)
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+
+        now = datetime.now()
+        self.year = now.year
+        self.month = now.month
+        self.date_map: Dict[tuple[int, int], date] = {}
+        # Совместимость с кодом, обращающимся к виджетам ExcelCalendarTable.
+        self.cell_tables: Dict[tuple[int, int], QtWidgets.QTableWidget] = {}
+        self.day_labels: Dict[tuple[int, int], QtWidgets.QLabel] = {}
+        self._col_widths: List[int] | None = None
+        self._loading_cells = False
+
+        self.apply_theme()
+        self.apply_fonts()
+        if load:
+            with startup_profiler.phase("load_month_data"):
+                self.load_month_data(self.year, self.month)
+        else:
+            # Day numbers without entries; ``date_map`` stays empty until loaded.
+            self._loading_cells = True
+            try:
+                self._model.set_month(self.year, self.month, {})
+            finally:
+                self._loading_cells = False
+
+    # ---------- Data ----------
+    def load_month_data(self, year: int, month: int):
+        self.year = year
+        self.month = month
+        md = MONTH_CACHE.get(year, month)
+        MONTH_CACHE.prefetch_around(year, month)
+        self._loading_cells = True
+        try:
+            self._model.set_month(year, month, md.days)
+        finally:
+            self._loading_cells = False
+        self.date_map = self._model.date_map()
+        return True
+
+    def flush_pending_save(self, wait: bool = False) -> None:
+        self._autosave.flush(wait)
+
+    def prepare_month_cells(self, year: int, month: int) -> Iterator[None]:
+        """Nothing to build ahead: the model paints every day from one delegate."""
+
+        return iter(())
+
+    def save_current_month(self):
+        if not self.date_map:
+            return
+        self._autosave.discard()
+        self._autosave.flush(wait=True)
+        self._snapshot_month().save()
+
+    def _snapshot_month(self) -> MonthData:
+        return MonthData(year=self.year, month=self.month, days=self._model.month_days())
+
+    def _on_entries_changed(self, _day: int) -> None:
+        if self._loading_cells:
+            return
+        self._autosave.mark_dirty()
+
+    def work_names(self) -> List[str]:
+        names = {
+            row.get("work", "").strip()
+            for rows in self._model.month_days().values()
+            for row in rows
+        }
+        names.discard("")
+        return sorted(names)
+
+    # ---------- Editing ----------
+    def open_day_editor(self, coords: tuple[int, int]) -> bool:
+        """Edit every entry of the day at ``coords`` in a popup."""
+
+        index = self._model.index(*coords)
+        day = self._model.date_at(index)
+        if day is None or day.month != self.month:
+            return False
+        rows = edit_day_entries(self, day, index.data(calendar_model.EntriesRole) or [])
+        if rows is None:
+            return False
+        return self._model.setData(index, rows, calendar_model.EntriesRole)
+
+    def mousePressEvent(self, event):  # noqa: N802 - Qt override
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        if (
+            index.isValid()
+            and event.button() == QtCore.Qt.LeftButton
+            and self._model.hidden_count(index)
+            and self._delegate.more_rect(self.visualRect(index)).contains(pos)
+        ):
+            self.open_day_editor((index.row(), index.column()))
+            return
+        super().mousePressEvent(event)
+
+    def wheelEvent(self, event):  # noqa: N802 - Qt override
+        index = self.indexAt(event.position().toPoint())
+        steps = -1 if event.angleDelta().y() > 0 else 1
+        if index.isValid() and event.angleDelta().y() and self._model.scroll_day(index, steps):
+            event.accept()
+            return
+        super().wheelEvent(event)
+
+    def mouseDoubleClickEvent(self, event):  # noqa: N802 - Qt override
+        index = self.indexAt(event.position().toPoint())
+        if not index.isValid() or not (index.flags() & QtCore.Qt.ItemIsEditable):
+            return
+        target = self._delegate.hit_test(
+            self.visualRect(index), self._model.day_rows(), event.position().toPoint()
+        )
+        if target is None:
+            return
+        self._delegate.set_edit_target(*target)
+        self.edit(index)
+
+    # ---------- Layout ----------
+    def set_day_column_widths(self, widths: Iterable[int]):
+        self._col_widths = [int(w) for w in widths]
+        self._delegate.set_column_weights(self._col_widths)
+        self.viewport().update()
+
+    def get_day_column_widths(self) -> List[int]:
+        return list(self._col_widths or [])
+
+    def update_day_rows(self):
+        self._model.set_day_rows(CONFIG.get("day_rows", DAY_ROWS_DEFAULT))
 
+    # ---------- Theme ----------
     def apply_fonts(self):
-        """Apply current header font to calendar elements."""
         header_font = QtGui.QFont(
             CONFIG.get("header_font", CONFIG.get("font_family", "Exo 2"))
         )
         self.horizontalHeader().setFont(header_font)
-        # Ensure weekday header items on the main calendar adopt the font
-        for i in range(self.columnCount()):
-            item = self.horizontalHeaderItem(i)
-            if item:
-                item.setFont(header_font)
-        for tbl in self.cell_tables.values():
-            tbl.horizontalHeader().setFont(header_font)
-            # Ensure individual header items also adopt the selected font
-            for i in range(tbl.columnCount()):
-                item = tbl.horizontalHeaderItem(i)
-                if item:
-                    item.setFont(header_font)
-        for lbl in self.day_labels.values():
-            lbl.setFont(header_font)
+        self._delegate.set_fonts(header_font, self.font())
+        self.viewport().update()
 
     def apply_theme(self) -> None:
-        """Apply palette-based colors to calendar widgets."""
-        workspace_color, accent_color = self._resolve_palette_colors()
-        text_color = QtWidgets.QApplication.palette().color(QtGui.QPalette.WindowText).name()
-        ws = workspace_color.name()
-
-        # Reset previously applied neon so the refreshed CSS becomes the base style.
-        apply_neon_effect(self, False, config=CONFIG)
-        header = self.horizontalHeader()
-        if header is not None and shiboken6.isValid(header):
-            apply_neon_effect(header, False, config=CONFIG)
-
-        subtle_border = QtGui.QColor(accent_color)
-        subtle_border.setAlpha(90)
-        r, g, b, a = subtle_border.getRgb()
-        border_rgba = f"rgba({r},{g},{b},{a})"
-        selection_rgba = f"rgba({accent_color.red()},{accent_color.green()},{accent_color.blue()},120)"
-
-        style = (
-            "QTableWidget{"
-            f"background-color:{ws};"
-            f"color:{text_color};"
-            f"selection-background-color:{selection_rgba};"
-            f"selection-color:{text_color};"
-            f"border:1px solid {border_rgba};"
-            "border-radius:16px;"
-            "gridline-color:rgba(255,255,255,40);"
-            "}"
-            "QTableWidget::viewport{"
-            f"background-color:{ws};"
-            "border:0;"
-            "}"
-            "QTableWidget::item{border:0;}"
-        )
-        self.setStyleSheet(style)
-        table_palette = self.palette()
-        table_palette.setColor(QtGui.QPalette.Highlight, accent_color)
-        self.setPalette(table_palette)
-        self._update_header_theme(
-            header,
-            workspace_color,
-            accent_color,
-            ensure_filter=True,
-        )
-        apply_neon_effect(self, True, config=CONFIG)
-        if header is not None and shiboken6.isValid(header):
-            apply_neon_effect(header, True, border=False, config=CONFIG)
-        for tbl in self.cell_tables.values():
-            self._apply_inner_table_theme(
-                tbl,
-                workspace_color,
-                accent_color,
-                text_color=text_color,
-            )
-        for container in self.cell_containers.values():
-            container.setStyleSheet(f"background-color:{ws};color:{text_color};")
+        workspace, accent = ExcelCalendarTable._resolve_palette_colors()
+        text_color = QtWidgets.QApplication.palette().color(QtGui.QPalette.WindowText)
+        self._delegate.set_colors(workspace, accent, text_color)
+        compiled = ExcelCalendarTable._compiled_theme(workspace, accent, text_color.name())
+        theme_registry.apply_style(self, compiled.get("calendar_view"))
+        theme_registry.apply_style(self.horizontalHeader(), compiled.get("header_section"))
+        self.viewport().update()
 
     # ---------- Navigation ----------
     def go_prev_month(self):
-        self.save_current_month()
+        self.flush_pending_save()
         if self.month == 1:
             self.month = 12
             self.year -= 1
@@ -2776,7 +1342,7 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
         self.load_month_data(self.year, self.month)
 
     def go_next_month(self):
-        self.save_current_month()
+        self.flush_pending_save()
         if self.month == 12:
             self.month = 1
             self.year += 1
@@ -2784,6 +1350,19 @@ class ExcelCalendarTable(QtWidgets.QTableWidget):
             self.month += 1
         self.load_month_data(self.year, self.month)
 
+
+def create_calendar(parent=None, *, load: bool = True) -> QtWidgets.QTableView:
+    """Create the calendar widget selected by ``CONFIG["calendar_mode"]``.
+
+    With ``load=False`` the current month is shown as an empty grid until
+    :meth:`load_month_data` is called.
+    """
+
+    if CONFIG.get("calendar_mode") == "model":
+        return ModelCalendarView(parent, load=load)
+    return ExcelCalendarTable(parent, load=load)
+
+
 class CollapsibleSidebar(QtWidgets.QFrame):
     toggled = QtCore.Signal(bool)
     settings_clicked = QtCore.Signal()
@@ -2793,10 +1372,7 @@ class CollapsibleSidebar(QtWidgets.QFrame):
         self.setObjectName("Sidebar")
         self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
         self.setStyleSheet(
-            """
-            #Sidebar { background-color: #1f1f23; }
-            QLabel { color: #c7c7c7; }
-            """
+            theme_registry.theme(accent="#c7c7c7").get("sidebar", "#1f1f23")
         )
         self.expanded_width=260; self.collapsed_width=64
         lay=QtWidgets.QVBoxLayout(self); lay.setContentsMargins(8,8,8,8); lay.setSpacing(6)
@@ -2899,8 +1475,7 @@ class CollapsibleSidebar(QtWidgets.QFrame):
         self._update_button_layouts()
         CONFIG["sidebar_collapsed"] = collapsed
         try:
-            with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-                json.dump(CONFIG, f, ensure_ascii=False, indent=2)
+            storage.write_json(appdata.CONFIG_PATH, CONFIG)
         except Exception:
             pass
         self.toggled.emit(not collapsed)
@@ -2933,19 +1508,10 @@ class CollapsibleSidebar(QtWidgets.QFrame):
             sidebar_color = CONFIG.get("sidebar_color", "#1f1f23")
         if isinstance(sidebar_color, QtGui.QColor):
             sidebar_color = sidebar_color.name()
-        label_color = accent.name()
-        accent_name = accent.name()
-        style = (
-            "#Sidebar {"
-            f" background-color: {sidebar_color};"
-            f" border: 1px solid {accent_name};"
-            " border-radius: 20px;"
-            "}"
-            "\n"
-            f"#Sidebar QLabel {{ color: {label_color}; }}\n"
+        # apply_neon_effect below sets the sheet, built on this base.
+        self._neon_prev_style = theme_registry.theme(accent=accent.name()).get(
+            "sidebar", sidebar_color
         )
-        self.setStyleSheet(style)
-        self._neon_prev_style = style
         palette = self.palette()
         palette.setColor(QtGui.QPalette.Window, QtGui.QColor(sidebar_color))
         palette.setColor(QtGui.QPalette.Highlight, accent)
@@ -2992,711 +1558,6 @@ class CollapsibleSidebar(QtWidgets.QFrame):
             w.setFont(font)
 
 
-class SettingsDialog(QtWidgets.QDialog):
-    """Окно настроек приложения."""
-
-    settings_changed = QtCore.Signal()
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # keep a reference to the main window
-        self.main_window = parent if isinstance(parent, QtWidgets.QWidget) else None
-        self.setWindowTitle("Настройки")
-        self.resize(500, 400)
-        main_lay = QtWidgets.QVBoxLayout(self)
-        tabs = QtWidgets.QTabWidget(self)
-        main_lay.addWidget(tabs)
-
-        # --- Интерфейс ---
-        tab_interface = QtWidgets.QWidget()
-        form_interface = QtWidgets.QFormLayout(tab_interface)
-        tabs.addTab(tab_interface, "Интерфейс")
-
-        self._accent_color = QtGui.QColor(CONFIG.get("accent_color", "#39ff14"))
-        self._preset_colors = [
-            ("Зелёный", QtGui.QColor("#39ff14")),
-            ("Красный", QtGui.QColor("#ff5555")),
-            ("Синий", QtGui.QColor("#2d7cdb")),
-            ("Жёлтый", QtGui.QColor("#ffd700")),
-            ("Фиолетовый", QtGui.QColor("#8a2be2")),
-        ]
-        self.combo_accent = QtWidgets.QComboBox(self)
-        for name, color in self._preset_colors:
-            pix = QtGui.QPixmap(16, 16)
-            pix.fill(color)
-            self.combo_accent.addItem(QtGui.QIcon(pix), name)
-        self.combo_accent.addItem("Другой…")
-        other_index = self.combo_accent.count() - 1
-        current = self._accent_color.name().lower()
-        idx = next(
-            (i for i, (_, c) in enumerate(self._preset_colors) if c.name().lower() == current),
-            other_index,
-        )
-        self.combo_accent.blockSignals(True)
-        self.combo_accent.setCurrentIndex(idx)
-        self.combo_accent.blockSignals(False)
-        if idx == other_index:
-            pix = QtGui.QPixmap(16, 16)
-            pix.fill(self._accent_color)
-            self.combo_accent.setItemIcon(other_index, QtGui.QIcon(pix))
-        self._accent_index = idx
-        # connect after setting initial index to avoid unwanted color dialog
-        # use activated so selecting "Другой" again reopens the color picker
-        self.combo_accent.activated.connect(self._on_accent_changed)
-        form_interface.addRow("Цвет подсветки", self.combo_accent)
-
-        self._color_preview_links: dict[QtWidgets.QAbstractButton, str] = {}
-
-        self._workspace_color = QtGui.QColor(CONFIG.get("workspace_color", "#1e1e21"))
-        self.btn_workspace = QtWidgets.QPushButton(self)
-        self._register_color_preview(self.btn_workspace, "_workspace_color")
-        self.btn_workspace.clicked.connect(self.choose_workspace_color)
-        form_interface.addRow("Цвет рабочей области", self.btn_workspace)
-
-        self._sidebar_color = QtGui.QColor(CONFIG.get("sidebar_color", "#1f1f23"))
-        self.btn_sidebar = QtWidgets.QPushButton(self)
-        self._register_color_preview(self.btn_sidebar, "_sidebar_color")
-        self.btn_sidebar.clicked.connect(self.choose_sidebar_color)
-        form_interface.addRow("Цвет боковой панели", self.btn_sidebar)
-
-        # gradient controls
-        grad = CONFIG.get("gradient_colors", ["#39ff14", "#2d7cdb"])
-        self._grad_color1 = QtGui.QColor(grad[0])
-        self._grad_color2 = QtGui.QColor(grad[1])
-        self.btn_grad1 = QtWidgets.QPushButton(self)
-        self._register_color_preview(self.btn_grad1, "_grad_color1")
-        self.btn_grad2 = QtWidgets.QPushButton(self)
-        self._register_color_preview(self.btn_grad2, "_grad_color2")
-        self.btn_grad1.clicked.connect(lambda: self.choose_grad_color(1))
-        self.btn_grad2.clicked.connect(lambda: self.choose_grad_color(2))
-        lay_grad = QtWidgets.QHBoxLayout(); lay_grad.addWidget(self.btn_grad1); lay_grad.addWidget(self.btn_grad2)
-        form_interface.addRow("Градиент", lay_grad)
-        self.sld_grad_angle = QtWidgets.QSlider(QtCore.Qt.Horizontal, self)
-        self.sld_grad_angle.setRange(0, 360)
-        self.sld_grad_angle.setValue(int(CONFIG.get("gradient_angle", 0)))
-        self.lbl_grad_angle = QtWidgets.QLabel(str(self.sld_grad_angle.value()))
-        self.sld_grad_angle.valueChanged.connect(lambda v: (self.lbl_grad_angle.setText(str(v)), self._save_config()))
-        lay_angle = QtWidgets.QHBoxLayout(); lay_angle.addWidget(self.sld_grad_angle,1); lay_angle.addWidget(self.lbl_grad_angle)
-        form_interface.addRow("Угол градиента", lay_angle)
-        # neon controls
-        grp_neon = QtWidgets.QGroupBox("Неон", self)
-        lay_neon = QtWidgets.QFormLayout(grp_neon)
-        info_neon = QtWidgets.QLabel("Подсветка всегда включена", self)
-        info_neon.setWordWrap(True)
-        lay_neon.addRow(info_neon)
-        self._neon_presets: list[tuple[str, tuple[int, int, int]]] = [
-            ("Мягкий", (6, 1, 180)),
-            ("Стандарт", (10, 1, 255)),
-            ("Яркий", (14, 2, 255)),
-        ]
-        self.combo_neon_preset = QtWidgets.QComboBox(self)
-        for name, values in self._neon_presets:
-            self.combo_neon_preset.addItem(name, values)
-        self._neon_custom_index = self.combo_neon_preset.count()
-        self.combo_neon_preset.addItem("Пользовательский", None)
-        lay_neon.addRow("Профиль", self.combo_neon_preset)
-
-        self.sld_neon_size = QtWidgets.QSlider(QtCore.Qt.Horizontal, self)
-        self.sld_neon_size.setRange(0, 200)
-        self.sld_neon_size.setValue(int(CONFIG.get("neon_size", 10)))
-        self.lbl_neon_size = QtWidgets.QLabel(str(self.sld_neon_size.value()), self)
-        lay_neon_size = QtWidgets.QHBoxLayout()
-        lay_neon_size.addWidget(self.sld_neon_size, 1)
-        lay_neon_size.addWidget(self.lbl_neon_size)
-        lay_neon.addRow("Размер", lay_neon_size)
-
-        self.sld_neon_thickness = QtWidgets.QSlider(QtCore.Qt.Horizontal, self)
-        self.sld_neon_thickness.setRange(0, 10)
-        self.sld_neon_thickness.setValue(int(CONFIG.get("neon_thickness", 1)))
-        self.lbl_neon_thickness = QtWidgets.QLabel(
-            str(self.sld_neon_thickness.value()), self
-        )
-        lay_neon_thickness = QtWidgets.QHBoxLayout()
-        lay_neon_thickness.addWidget(self.sld_neon_thickness, 1)
-        lay_neon_thickness.addWidget(self.lbl_neon_thickness)
-        lay_neon.addRow("Толщина", lay_neon_thickness)
-
-        self.sld_neon_intensity = QtWidgets.QSlider(QtCore.Qt.Horizontal, self)
-        self.sld_neon_intensity.setRange(0, 255)
-        self.sld_neon_intensity.setValue(int(CONFIG.get("neon_intensity", 255)))
-        self.lbl_neon_intensity = QtWidgets.QLabel(
-            str(self.sld_neon_intensity.value()), self
-        )
-        lay_neon_intensity = QtWidgets.QHBoxLayout()
-        lay_neon_intensity.addWidget(self.sld_neon_intensity, 1)
-        lay_neon_intensity.addWidget(self.lbl_neon_intensity)
-        lay_neon.addRow("Интенсивность", lay_neon_intensity)
-        form_interface.addRow(grp_neon)
-        self._neon_controls = (
-            self.sld_neon_size,
-            self.sld_neon_thickness,
-            self.sld_neon_intensity,
-            self.combo_neon_preset,
-        )
-
-        self._block_neon_preset_sync = False
-        self.combo_neon_preset.currentIndexChanged.connect(self._apply_neon_preset)
-        self.sld_neon_size.valueChanged.connect(self._handle_neon_value_change)
-        self.sld_neon_thickness.valueChanged.connect(self._handle_neon_value_change)
-        self.sld_neon_intensity.valueChanged.connect(self._handle_neon_value_change)
-        self._update_neon_labels()
-        self._sync_neon_preset_to_values()
-
-
-        supported = filter_supported_families(
-            QtGui.QFontDatabase.families(),
-            "Qt font database",
-            emit_warnings=False,
-        )
-        fallback_family, _ = ensure_supported_family(
-            "Exo 2", source="ui/fallback", fallback="Exo 2"
-        )
-        if fallback_family not in supported:
-            supported.add(fallback_family)
-        self._supported_font_families = supported
-        self._fallback_font_family = fallback_family
-
-        self.font_header = QtWidgets.QFontComboBox(self)
-        self._prepare_font_combo(self.font_header)
-        header_initial, _ = ensure_supported_family(
-            CONFIG.get("header_font", CONFIG.get("font_family", fallback_family)),
-            source="ui/header",
-            fallback=fallback_family,
-        )
-        self._set_combo_font(self.font_header, header_initial)
-        self.font_header.currentFontChanged.connect(
-            lambda font: self._handle_font_combo_changed(
-                "header_font", self.font_header, font, apply_header=True
-            )
-        )
-        form_interface.addRow("Шрифт заголовков", self.font_header)
-
-        self.font_text = QtWidgets.QFontComboBox(self)
-        self._prepare_font_combo(self.font_text)
-        text_initial, _ = ensure_supported_family(
-            CONFIG.get("text_font", CONFIG.get("font_family", fallback_family)),
-            source="ui/text",
-            fallback=fallback_family,
-        )
-        self._set_combo_font(self.font_text, text_initial)
-        self.font_text.currentFontChanged.connect(
-            lambda font: self._handle_font_combo_changed(
-                "text_font", self.font_text, font
-            )
-        )
-        form_interface.addRow("Шрифт текста", self.font_text)
-
-        self.font_sidebar = QtWidgets.QFontComboBox(self)
-        self._prepare_font_combo(self.font_sidebar)
-        sidebar_initial, _ = ensure_supported_family(
-            CONFIG.get("sidebar_font", header_initial),
-            source="ui/sidebar",
-            fallback=header_initial,
-        )
-        self._set_combo_font(self.font_sidebar, sidebar_initial)
-        self.font_sidebar.currentFontChanged.connect(
-            lambda font: self._handle_font_combo_changed(
-                "sidebar_font", self.font_sidebar, font, refresh_sidebar=True
-            )
-        )
-        form_interface.addRow("Шрифт боковой панели", self.font_sidebar)
-
-        path_lay = QtWidgets.QHBoxLayout()
-        self.edit_path = QtWidgets.QLineEdit(CONFIG.get("save_path", DATA_DIR), self)
-        self.edit_path.editingFinished.connect(self._save_config)
-        btn_browse = StyledPushButton("...", self, **button_config())
-        btn_browse.clicked.connect(self.browse_path)
-        path_lay.addWidget(self.edit_path, 1)
-        path_lay.addWidget(btn_browse)
-        form_interface.addRow("Путь сохранения", path_lay)
-
-        # --- Иконки ---
-        tab_icons = QtWidgets.QWidget()
-        form_icons = QtWidgets.QFormLayout(tab_icons)
-        icon_files = [
-            f for f in os.listdir(ASSETS) if f.lower().endswith((".png", ".ico"))
-        ]
-
-        # sidebar icon
-        self.combo_sidebar_icon = QtWidgets.QComboBox(self)
-        for f in icon_files:
-            path = os.path.join(ASSETS, f)
-            self.combo_sidebar_icon.addItem(QtGui.QIcon(path), f, path)
-        current_sidebar = CONFIG.get("sidebar_icon", ICON_TOGGLE)
-        idx = self.combo_sidebar_icon.findData(current_sidebar)
-        if idx < 0 and os.path.isfile(current_sidebar):
-            self.combo_sidebar_icon.addItem(
-                QtGui.QIcon(current_sidebar), os.path.basename(current_sidebar), current_sidebar
-            )
-            idx = self.combo_sidebar_icon.count() - 1
-        if idx >= 0:
-            self.combo_sidebar_icon.setCurrentIndex(idx)
-        self.combo_sidebar_icon.currentIndexChanged.connect(lambda _: self._save_config())
-        btn_sidebar_browse = StyledPushButton("Обзор…", self, **button_config())
-        btn_sidebar_browse.clicked.connect(
-            lambda: self.browse_icon(self.combo_sidebar_icon)
-        )
-        lay_sidebar = QtWidgets.QHBoxLayout()
-        lay_sidebar.addWidget(self.combo_sidebar_icon, 1)
-        lay_sidebar.addWidget(btn_sidebar_browse)
-        form_icons.addRow("Иконка боковой панели", lay_sidebar)
-
-        # application icon
-        self.combo_app_icon = QtWidgets.QComboBox(self)
-        for f in icon_files:
-            path = os.path.join(ASSETS, f)
-            self.combo_app_icon.addItem(QtGui.QIcon(path), f, path)
-        current_app = CONFIG.get("app_icon", ICON_TOGGLE)
-        idx = self.combo_app_icon.findData(current_app)
-        if idx < 0 and os.path.isfile(current_app):
-            self.combo_app_icon.addItem(
-                QtGui.QIcon(current_app), os.path.basename(current_app), current_app
-            )
-            idx = self.combo_app_icon.count() - 1
-        if idx >= 0:
-            self.combo_app_icon.setCurrentIndex(idx)
-        self.combo_app_icon.currentIndexChanged.connect(lambda _: self._save_config())
-        btn_app_browse = StyledPushButton("Обзор…", self, **button_config())
-        btn_app_browse.clicked.connect(
-            lambda: self.browse_icon(self.combo_app_icon)
-        )
-        lay_app = QtWidgets.QHBoxLayout()
-        lay_app.addWidget(self.combo_app_icon, 1)
-        lay_app.addWidget(btn_app_browse)
-        form_icons.addRow("Иконка приложения", lay_app)
-
-        hint = QtWidgets.QLabel("Размер иконок: 20×20 px", self)
-        hint.setAlignment(QtCore.Qt.AlignCenter)
-        form_icons.addRow(hint)
-        tabs.addTab(tab_icons, "Иконки")
-
-        # General options below tabs
-        form_gen = QtWidgets.QFormLayout()
-        main_lay.addLayout(form_gen)
-        self.spin_day_rows = QtWidgets.QSpinBox(self)
-        self.spin_day_rows.setRange(1, 20)
-        day_rows = CONFIG.get("day_rows")
-        if not isinstance(day_rows, int) or day_rows < 1:
-            day_rows = DAY_ROWS_DEFAULT
-        self.spin_day_rows.setValue(day_rows)
-        self.spin_day_rows.setAttribute(QtCore.Qt.WA_Hover, True)
-        self.spin_day_rows.setFixedWidth(self.spin_day_rows.sizeHint().width() + 20)
-        self.spin_day_rows.setButtonSymbols(QtWidgets.QAbstractSpinBox.NoButtons)
-        self._apply_spin_day_rows_style()
-        self.spin_day_rows.valueChanged.connect(lambda _: self._save_config())
-        form_gen.addRow("Строк на день", self.spin_day_rows)
-
-        box = QtWidgets.QDialogButtonBox(self)
-        btn_save = StyledPushButton("Сохранить", self, **button_config())
-        btn_save.setIcon(icon("save"))
-        btn_save.setIconSize(QtCore.QSize(20, 20))
-        btn_save.setFixedSize(btn_save.sizeHint())
-        btn_cancel = StyledPushButton("Отмена", self, **button_config())
-        btn_cancel.setIcon(icon("x"))
-        btn_cancel.setIconSize(QtCore.QSize(20, 20))
-        btn_cancel.setFixedSize(btn_cancel.sizeHint())
-        box.addButton(btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
-        box.addButton(btn_cancel, QtWidgets.QDialogButtonBox.RejectRole)
-        box.accepted.connect(self.accept)
-        box.rejected.connect(self.reject)
-        main_lay.addWidget(box)
-
-        self._settings = QtCore.QSettings("rabota2", "rabota2")
-        geom = self._settings.value("SettingsDialog/geometry", type=QtCore.QByteArray)
-        if geom is not None:
-            self.restoreGeometry(geom)
-
-        apply_neon_to_inputs(self)
-        self._update_neon_controls_effects()
-
-    def closeEvent(self, event):
-        self._settings.setValue("SettingsDialog/geometry", self.saveGeometry())
-        self._settings.sync()
-        super().closeEvent(event)
-
-    def browse_path(self):
-        path = QtWidgets.QFileDialog.getExistingDirectory(
-            self, "Выбрать папку", self.edit_path.text()
-        )
-        if path:
-            self.edit_path.setText(path)
-            self._save_config()
-
-    def browse_icon(self, combo: QtWidgets.QComboBox):
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self,
-            "Выберите иконку",
-            "",
-            "Image Files (*.png *.ico)",
-        )
-        if path:
-            idx = combo.findData(path)
-            if idx < 0:
-                combo.addItem(QtGui.QIcon(path), os.path.basename(path), path)
-                idx = combo.count() - 1
-            combo.setCurrentIndex(idx)
-            self._save_config()
-
-    def _build_spin_day_rows_style(self) -> str:
-        background = self._workspace_color.name()
-        accent = self._accent_color.name()
-        thickness = self.sld_neon_thickness.value() if hasattr(self, 'sld_neon_thickness') else CONFIG.get("neon_thickness", 1)
-        return build_input_neon_style("QSpinBox", background=background, accent=accent, thickness=thickness)
-
-    def _apply_spin_day_rows_style(self) -> None:
-        if not hasattr(self, 'spin_day_rows'):
-            return
-        style = self._build_spin_day_rows_style()
-        self.spin_day_rows.setStyleSheet(style)
-        self.spin_day_rows.setAttribute(QtCore.Qt.WA_Hover, True)
-        filt = getattr(self.spin_day_rows, '_neon_filter', None)
-        if filt is not None:
-            filt._config = CONFIG
-
-    def _collect_config(self):
-        return {
-            "neon": True,
-            "neon_size": self.sld_neon_size.value(),
-            "neon_thickness": self.sld_neon_thickness.value(),
-            "neon_intensity": self.sld_neon_intensity.value(),
-            "accent_color": self._accent_color.name(),
-            "gradient_colors": [self._grad_color1.name(), self._grad_color2.name()],
-            "gradient_angle": self.sld_grad_angle.value(),
-            "workspace_color": self._workspace_color.name(),
-            "sidebar_color": self._sidebar_color.name(),
-            "font_family": self.font_text.currentFont().family(),
-            "header_font": self.font_header.currentFont().family(),
-            "text_font": self.font_text.currentFont().family(),
-            "sidebar_font": self.font_sidebar.currentFont().family(),
-            "sidebar_icon": self.combo_sidebar_icon.currentData(),
-            "app_icon": self.combo_app_icon.currentData(),
-            "day_rows": self.spin_day_rows.value(),
-            "save_path": self.edit_path.text().strip() or DATA_DIR,
-        }
-
-    def _on_sidebar_font_changed(self):
-        self._handle_font_combo_changed(
-            "sidebar_font",
-            self.font_sidebar,
-            self.font_sidebar.currentFont(),
-            refresh_sidebar=True,
-        )
-
-    def _prepare_font_combo(self, combo: QtWidgets.QFontComboBox) -> None:
-        """Restrict *combo* to supported font families."""
-
-        model = combo.model()
-        row = 0
-        while row < model.rowCount():
-            index = model.index(row, combo.modelColumn())
-            family = index.data(QtCore.Qt.DisplayRole)
-            if family not in self._supported_font_families:
-                model.removeRow(row)
-            else:
-                row += 1
-
-    def _set_combo_font(self, combo: QtWidgets.QFontComboBox, family: str) -> None:
-        """Assign *family* to *combo* without emitting signals."""
-
-        blocker = QtCore.QSignalBlocker(combo)
-        combo.setCurrentFont(QtGui.QFont(family))
-        del blocker
-
-    def _apply_header_font_update(self, family: str) -> None:
-        """Apply header font changes to the main window immediately."""
-
-        theme_manager.set_header_font(family)
-        parent = self.parent()
-        if parent and hasattr(parent, "table"):
-            parent.table.apply_fonts()
-            if hasattr(parent, "topbar"):
-                parent.topbar.update_labels()
-
-    def _handle_font_combo_changed(
-        self,
-        key: str,
-        combo: QtWidgets.QFontComboBox,
-        font: QtGui.QFont,
-        *,
-        apply_header: bool = False,
-        refresh_sidebar: bool = False,
-    ) -> None:
-        """Validate the chosen font and update configuration."""
-
-        family = font.family()
-        supported, missing = family_support_details(family)
-        if not supported:
-            missing_label = missing or "необходимый"
-            message = (
-                f"Шрифт «{family}» не поддерживается: отсутствует {missing_label} набор символов. "
-                f"Будет использован «{self._fallback_font_family}»."
-            )
-            QtWidgets.QMessageBox.warning(self, "Недоступный шрифт", message)
-            blocker = QtCore.QSignalBlocker(combo)
-            combo.setCurrentFont(QtGui.QFont(self._fallback_font_family))
-            del blocker
-            family = self._fallback_font_family
-
-        valid_family, _ = ensure_supported_family(
-            family,
-            source=f"ui/{key}",
-            fallback=self._fallback_font_family,
-        )
-        if key == "text_font":
-            CONFIG["font_family"] = valid_family
-        CONFIG[key] = valid_family
-        self._save_config()
-
-        if apply_header:
-            self._apply_header_font_update(valid_family)
-        if refresh_sidebar:
-            self._refresh_color_previews()
-            if self.main_window and hasattr(self.main_window, "sidebar"):
-                self.main_window.sidebar.apply_fonts()
-
-    def _on_neon_changed(self):
-        self._save_config()
-        parent = self.parent()
-        if parent is not None and hasattr(parent, "apply_style"):
-            parent.apply_style()
-            update_neon_filters(parent, CONFIG)
-
-    def _current_neon_values(self) -> tuple[int, int, int]:
-        return (
-            self.sld_neon_size.value(),
-            self.sld_neon_thickness.value(),
-            self.sld_neon_intensity.value(),
-        )
-
-    def _update_neon_labels(self) -> None:
-        self.lbl_neon_size.setText(str(self.sld_neon_size.value()))
-        self.lbl_neon_thickness.setText(str(self.sld_neon_thickness.value()))
-        self.lbl_neon_intensity.setText(str(self.sld_neon_intensity.value()))
-
-    def _sync_neon_preset_to_values(self) -> None:
-        values = self._current_neon_values()
-        idx = next(
-            (
-                i
-                for i, (_, preset) in enumerate(self._neon_presets)
-                if preset == values
-            ),
-            self._neon_custom_index,
-        )
-        self.combo_neon_preset.blockSignals(True)
-        self.combo_neon_preset.setCurrentIndex(idx)
-        self.combo_neon_preset.blockSignals(False)
-
-    def _handle_neon_value_change(self, *_):
-        self._update_neon_labels()
-        if self._block_neon_preset_sync:
-            return
-        self._sync_neon_preset_to_values()
-        self._on_neon_changed()
-
-    def _apply_neon_preset(self, index: int) -> None:
-        values = self.combo_neon_preset.itemData(index)
-        if not isinstance(values, tuple):
-            self._sync_neon_preset_to_values()
-            self._on_neon_changed()
-            return
-        self._block_neon_preset_sync = True
-        try:
-            self.sld_neon_size.setValue(values[0])
-            self.sld_neon_thickness.setValue(values[1])
-            self.sld_neon_intensity.setValue(values[2])
-        finally:
-            self._block_neon_preset_sync = False
-        self._update_neon_labels()
-        self._sync_neon_preset_to_values()
-        self._on_neon_changed()
-
-    def _update_neon_controls_effects(self) -> None:
-        for widget in getattr(self, "_neon_controls", ()):
-            if widget is None or not shiboken6.isValid(widget):
-                continue
-            apply_neon_effect(widget, True, border=True, config=CONFIG)
-
-    def _save_config(self):
-        config = self._collect_config()
-        CONFIG.update(config)
-        self._apply_spin_day_rows_style()
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(CONFIG, f, ensure_ascii=False, indent=2)
-        update_neon_filters(self, CONFIG)
-        self._update_neon_controls_effects()
-        self._refresh_color_previews()
-        self.settings_changed.emit()
-
-    def save(self) -> None:
-        """Public method to persist configuration changes."""
-        self._save_config()
-
-    def apply_fonts(self):
-        """Save and apply new header font immediately."""
-
-        self._handle_font_combo_changed(
-            "header_font",
-            self.font_header,
-            self.font_header.currentFont(),
-            apply_header=True,
-        )
-
-    def accept(self):
-        self._save_config()
-        theme_manager.set_text_font(self.font_text.currentFont().family())
-        theme_manager.set_header_font(self.font_header.currentFont().family())
-        parent = self.parent()
-        if parent and hasattr(parent, "table"):
-            parent.table.apply_fonts()
-            if hasattr(parent, "topbar"):
-                parent.topbar.update_labels()
-        super().accept()
-
-    def _on_accent_changed(self, idx):
-        other_index = self.combo_accent.count() - 1
-        if idx == other_index:
-            color = QtWidgets.QColorDialog.getColor(
-                self._accent_color, self, "Цвет"
-            )
-            if color.isValid():
-                self._accent_color = color
-                pix = QtGui.QPixmap(16, 16)
-                pix.fill(color)
-                self.combo_accent.setItemIcon(idx, QtGui.QIcon(pix))
-                self._accent_index = idx
-            else:
-                self.combo_accent.blockSignals(True)
-                self.combo_accent.setCurrentIndex(self._accent_index)
-                self.combo_accent.blockSignals(False)
-        else:
-            self._accent_color = self._preset_colors[idx][1]
-            self._accent_index = idx
-        self._save_config()
-        self._refresh_color_previews()
-
-    def _register_color_preview(
-        self, button: QtWidgets.QAbstractButton, attr_name: str
-    ) -> None:
-        """Attach *button* to an attribute storing ``QColor`` value."""
-
-        self._color_preview_links[button] = attr_name
-        button.setCursor(QtCore.Qt.PointingHandCursor)
-        self._refresh_color_previews(button)
-
-    def _style_color_preview(
-        self, button: QtWidgets.QAbstractButton, color: QtGui.QColor
-    ) -> None:
-        """Apply themed style and neon handling to a preview button."""
-
-        accent = QtGui.QColor(CONFIG.get("accent_color", "#39ff14")).name()
-        workspace = QtGui.QColor(CONFIG.get("workspace_color", "#1e1e21")).name()
-        fill = color.name()
-        shared_rules = (
-            f"background:{fill};"
-            f"border:2px solid {accent};"
-            "border-radius:12px;"
-            "padding:6px 12px;"
-            f"color:{workspace};"
-            "min-height:28px;"
-        )
-        style = (
-            f"QPushButton{{{shared_rules}}}"
-            f"QPushButton:hover{{{shared_rules}}}"
-            f"QPushButton:focus{{{shared_rules}}}"
-        )
-        button.setStyleSheet(style)
-        button.setAttribute(QtCore.Qt.WA_Hover, True)
-        palette = button.palette()
-        palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor(accent))
-        button.setPalette(palette)
-
-        filt = getattr(button, "_neon_filter", None)
-        if filt is None or not shiboken6.isValid(filt):
-            filt = NeonEventFilter(button, CONFIG)
-            button.installEventFilter(filt)
-            button._neon_filter = filt
-        else:
-            filt._config = CONFIG
-
-        effect = getattr(button, "_neon_effect", None)
-        if effect is not None and shiboken6.isValid(effect):
-            button._neon_prev_style = None
-            apply_neon_effect(button, True, config=CONFIG)
-        else:
-            button._neon_prev_style = style
-
-    def _refresh_color_previews(
-        self, *buttons: QtWidgets.QAbstractButton,
-    ) -> None:
-        """Rebuild style for registered color preview buttons."""
-
-        targets = buttons or tuple(self._color_preview_links)
-        for button in targets:
-            attr_name = self._color_preview_links.get(button)
-            if attr_name is None:
-                continue
-            color = getattr(self, attr_name, None)
-            if isinstance(color, QtGui.QColor) and color.isValid():
-                self._style_color_preview(button, color)
-
-    def _update_workspace_button(self):
-        self._refresh_color_previews(self.btn_workspace)
-
-    def choose_workspace_color(self):
-        color = QtWidgets.QColorDialog.getColor(
-            self._workspace_color, self, "Цвет"
-        )
-        if color.isValid():
-            self._workspace_color = color
-            self._save_config()
-            self._refresh_color_previews(self.btn_workspace)
-            parent = self.parent()
-            if parent is not None:
-                if hasattr(parent, "table"):
-                    parent.table.apply_theme()
-                if hasattr(parent, "topbar"):
-                    parent.topbar.apply_background(self._workspace_color)
-                if hasattr(parent, "statusBar"):
-                    parent.statusBar().setStyleSheet(
-                        f"background-color:{self._workspace_color.name()};"
-                    )
-
-    def _update_sidebar_button(self):
-        self._refresh_color_previews(self.btn_sidebar)
-
-    def choose_sidebar_color(self):
-        color = QtWidgets.QColorDialog.getColor(
-            self._sidebar_color, self, "Цвет"
-        )
-        if color.isValid():
-            self._sidebar_color = color
-            self._save_config()
-            self._refresh_color_previews(self.btn_sidebar)
-
-    def _update_grad_buttons(self):
-        self._refresh_color_previews(self.btn_grad1, self.btn_grad2)
-
-    def choose_grad_color(self, idx):
-        color = QtWidgets.QColorDialog.getColor(
-            self._grad_color1 if idx == 1 else self._grad_color2,
-            self,
-            "Цвет",
-        )
-        if color.isValid():
-            if idx == 1:
-                self._grad_color1 = color
-            else:
-                self._grad_color2 = color
-            self._save_config()
-            self._refresh_color_previews(
-                self.btn_grad1 if idx == 1 else self.btn_grad2
-            )
-            parent = self.parent()
-            if parent is not None and hasattr(parent, "apply_settings"):
-                parent.apply_settings()
-
-
 class TopBar(QtWidgets.QWidget):
     prev_clicked = QtCore.Signal()
     next_clicked = QtCore.Signal()
@@ -3845,7 +1706,7 @@ class TopBar(QtWidgets.QWidget):
                 f"background-color:{background};"
                 f" border-radius:{radius}px;"
                 f" padding:{padding};"
-                "}}"
+                "}"
             )
         else:
             bg_block = (
@@ -4092,46 +1953,53 @@ class TopBar(QtWidgets.QWidget):
         update_neon_filters(self, CONFIG)
 
     def _update_spin_year_neon(self) -> None:
-        """Ensure the year spin box has a neon event filter installed."""
+        """Route the year spin box and its editor to one neon."""
 
-        filt = getattr(self.spin_year, "_neon_filter", None)
+        register_neon(self.spin_year, CONFIG)
         editor = self.spin_year.lineEdit()
         editor_valid = editor is not None and shiboken6.isValid(editor)
-
-        if filt is None:
-            filt = NeonEventFilter(self.spin_year, CONFIG)
-            self.spin_year.installEventFilter(filt)
-            if editor_valid:
-                editor.installEventFilter(filt)
-            self.spin_year._neon_filter = filt
-        else:
-            if hasattr(filt, "update_config"):
-                filt.update_config(CONFIG)
-            else:
-                filt._config = CONFIG
-            if editor_valid:
-                existing = getattr(editor, "_neon_filter", None)
-                if existing is not filt:
-                    editor.installEventFilter(filt)
-                    editor._neon_filter = filt
-                else:
-                    if hasattr(existing, "update_config"):
-                        existing.update_config(CONFIG)
-                    else:
-                        existing._config = CONFIG
-            for target in (self.spin_year, editor if editor_valid else None):
-                if target is None or not shiboken6.isValid(target):
-                    continue
-                effect = getattr(target, "_neon_effect", None)
-                if effect is not None and shiboken6.isValid(effect):
-                    apply_neon_effect(target, True, config=CONFIG)
+        if editor_valid:
+            register_neon(editor, CONFIG, owner=self.spin_year)
+        for target in (self.spin_year, editor if editor_valid else None):
+            if target is None or not shiboken6.isValid(target):
+                continue
+            effect = getattr(target, "_neon_effect", None)
+            if effect is not None and shiboken6.isValid(effect):
+                apply_neon_effect(target, True, config=CONFIG)
 
 
 class MainWindow(QtWidgets.QMainWindow):
-    def __init__(self):
+    # Emitted when the steps of start_deferred_startup() have all run.
+    startup_finished = QtCore.Signal()
+
+    # Theme aspects applied before the first paint of a deferred startup.
+    SKELETON_ASPECTS = ("fonts", "day_rows", "palette")
+    # Start the deferred steps anyway if no paint arrives, e.g. when minimized.
+    FIRST_PAINT_TIMEOUT_MS = 1000
+
+    class _FirstPaintFilter(QtCore.QObject):
+        """Вызывает ``callback`` при первой отрисовке окна."""
+
+        def __init__(self, window: QtWidgets.QWidget, callback):
+            super().__init__(window)
+            self._callback = callback
+            window.installEventFilter(self)
+
+        def eventFilter(self, obj, event):  # noqa: D401 - Qt override signature
+            if event.type() == QtCore.QEvent.Paint:
+                obj.removeEventFilter(self)
+                self.deleteLater()
+                self._callback()
+            return False
+
+    def __init__(self, *, deferred: bool = False):
+        """Build the window; ``deferred`` leaves the month data and the neon
+        and gradient theme pass to :meth:`start_deferred_startup`."""
+
         super().__init__()
         self.setWindowTitle("План-график")
         self.setWindowIcon(QtGui.QIcon(CONFIG.get("app_icon", ICON_TOGGLE)))
+        self._storage_backend = CONFIG.get("storage_backend", "json")
         central = QtWidgets.QWidget(self)
         h = QtWidgets.QHBoxLayout(central); h.setContentsMargins(0,0,0,0); h.setSpacing(0)
 
@@ -4142,12 +2010,13 @@ class MainWindow(QtWidgets.QMainWindow):
         # right: vbox with topbar + table
         right = QtWidgets.QWidget(self); v = QtWidgets.QVBoxLayout(right); v.setContentsMargins(0,0,0,0); v.setSpacing(0)
         self.topbar = TopBar(self); v.addWidget(self.topbar)
-        self.table = ExcelCalendarTable(self); v.addWidget(self.table, 1)
+        self.table = create_calendar(self, load=not deferred); v.addWidget(self.table, 1)
         h.addWidget(right, 1)
 
         self.setCentralWidget(central)
 
         self._settings = QtCore.QSettings("rabota2", "rabota2")
+        self._dialogs = DialogManager(self)
         cols = self._settings.value("MainWindow/columns", type=list)
         if cols:
             self.table.set_day_column_widths([int(w) for w in cols])
@@ -4189,6 +2058,69 @@ class MainWindow(QtWidgets.QMainWindow):
         self._update_timer()
         self._update_version()
 
+        # Theme values applied last; ``None`` makes the next pass complete.
+        self._applied_theme: Optional[Dict[str, object]] = None
+        self._startup_steps: Optional[Iterator[None]] = None
+        self._first_paint_seen = False
+        with startup_profiler.phase("apply_settings"):
+            self.apply_settings(self.SKELETON_ASPECTS if deferred else None)
+
+    def start_deferred_startup(self, *tasks) -> None:
+        """Stream in the rest of the window once it has been painted.
+
+        The month data (one week of day cells per event loop turn), the
+        remaining theme aspects and then ``tasks`` run from the event loop,
+        after which :attr:`startup_finished` is emitted.  The time to the
+        first paint is recorded as the ``first_paint`` startup metric.
+        """
+
+        self._startup_steps = self._deferred_startup(tasks)
+        self._FirstPaintFilter(self, self._on_first_paint)
+        QtCore.QTimer.singleShot(self.FIRST_PAINT_TIMEOUT_MS, self, self._on_first_paint)
+
+    def _on_first_paint(self) -> None:
+        if self._startup_steps is None or self._first_paint_seen:
+            return
+        self._first_paint_seen = True
+        elapsed = startup_profiler.PROFILER.mark("first_paint")
+        logger.info("First paint after %.0f ms", elapsed * 1000)
+        QtCore.QTimer.singleShot(0, self, self._run_startup_step)
+
+    def _deferred_startup(self, tasks) -> Iterator[None]:
+        table = self.table
+        year, month = table.year, table.month
+        for _ in table.prepare_month_cells(year, month):
+            yield
+            if table is not self.table:
+                break
+        # Navigating or switching the calendar meanwhile already loaded data.
+        if table is self.table and not table.date_map:
+            with startup_profiler.phase("load_month_data"):
+                table.load_month_data(year, month)
+            self._update_month_label()
+        yield
+        with startup_profiler.phase("apply_settings"):
+            self.apply_settings()
+        for task in tasks:
+            yield
+            try:
+                task()
+            except Exception:
+                logger.exception("Deferred startup task %r failed", task)
+
+    def _run_startup_step(self) -> None:
+        steps = self._startup_steps
+        if steps is None:
+            return
+        with startup_profiler.phase("deferred_startup"):
+            try:
+                next(steps)
+            except StopIteration:
+                self._startup_steps = None
+                self.startup_finished.emit()
+                return
+        QtCore.QTimer.singleShot(0, self, self._run_startup_step)
+
     def _update_month_label(self):
         self.topbar.lbl_month.setText(RU_MONTHS[self.table.month-1])
         self.topbar.spin_year.blockSignals(True)
@@ -4220,80 +2152,104 @@ class MainWindow(QtWidgets.QMainWindow):
         self.table.go_next_month(); self._update_month_label()
 
     def change_year(self, year):
-        self.table.save_current_month()
+        self.table.flush_pending_save()
         self.table.year = year
         self.table.load_month_data(year, self.table.month)
         self._update_month_label()
 
     def open_input_dialog(self):
         previous_button = self.sidebar.last_active_button
-        dlg = StatsDialog(self.table.year, self.table.month, self)
+        dlg = self._dialogs.get("StatsDialog", self.table.year, self.table.month)
         dlg.exec()
         self.sidebar.activate_button(previous_button)
 
     def open_analytics_dialog(self):
         previous_button = self.sidebar.last_active_button
-        dlg = AnalyticsDialog(self.table.year, self)
+        dlg = self._dialogs.get("AnalyticsDialog", self.table.year)
         dlg.exec()
         self.sidebar.activate_button(previous_button)
 
     def _collect_work_names(self) -> List[str]:
-        names = set()
-        for (r, c), day in self.table.date_map.items():
-            if day.month != self.table.month:
-                continue
-            inner = self.table.cell_tables.get((r, c))
-            if not inner:
-                continue
-            for row in range(inner.rowCount()):
-                it = inner.item(row, 0)
-                if it:
-                    name = it.text().strip()
-                    if name:
-                        names.add(name)
-        return sorted(names)
+        return self.table.work_names()
 
     def open_release_dialog(self):
         previous_button = self.sidebar.last_active_button
         works = self._collect_work_names()
-        dlg = ReleaseDialog(self.table.year, self.table.month, works, self)
+        dlg = self._dialogs.get("ReleaseDialog", self.table.year, self.table.month, works)
         dlg.exec()
         self.sidebar.activate_button(previous_button)
 
     def open_top_dialog(self):
         previous_button = self.sidebar.last_active_button
-        dlg = TopDialog(self.table.year, self)
+        dlg = self._dialogs.get("TopDialog", self.table.year)
         dlg.exec()
         self.sidebar.activate_button(previous_button)
 
     def open_settings_dialog(self):
         previous_button = self.sidebar.last_active_button
-        dlg = SettingsDialog(self)
-        dlg.settings_changed.connect(self._on_settings_changed)
+        # Settings may switch the storage; land pending edits first.
+        self.table.flush_pending_save(wait=True)
+        dlg = self._dialogs.get("SettingsDialog")
+        dlg.settings_changed.connect(self._on_settings_changed, QtCore.Qt.UniqueConnection)
         dlg.exec()
         self.sidebar.activate_button(previous_button)
 
     def _on_settings_changed(self):
-        global BASE_SAVE_PATH
-        CONFIG.clear()
-        CONFIG.update(load_config())
-        config.CONFIG = CONFIG
+        # SettingsDialog has already merged its values into CONFIG.
+        previous_backend = self._storage_backend
+        previous_base = os.path.abspath(appdata.BASE_SAVE_PATH)
+        reload_config()
         if not isinstance(CONFIG.get("gradient_colors"), list):
             CONFIG["gradient_colors"] = ["#39ff14", "#2d7cdb"]
-        BASE_SAVE_PATH = os.path.abspath(CONFIG.get("save_path", DATA_DIR))
+        appdata.BASE_SAVE_PATH = os.path.abspath(CONFIG.get("save_path", DATA_DIR))
+        try:
+            migrate_storage_backend(previous_backend, previous_base)
+        except (OSError, ValueError, sqlite3.Error):
+            logger.exception("Failed to move data to the '%s' storage", CONFIG.get("storage_backend"))
+        self._storage_backend = CONFIG.get("storage_backend", "json")
+        MONTH_CACHE.clear()
+        self._ensure_calendar_mode()
         self.apply_settings()
-        workspace = self._current_workspace_color()
-        accent = self._current_accent_color()
-        self.topbar.apply_background(workspace, accent=accent)
         app = QtWidgets.QApplication.instance()
         if app is not None:
+            # Dialogs that were never opened have nothing to refresh.
+            themed = loaded_dialog_classes(
+                "ReleaseDialog", "AnalyticsDialog", "TopDialog", "StatsDialog"
+            )
             for dlg in app.topLevelWidgets():
-                if isinstance(
-                    dlg, (ReleaseDialog, AnalyticsDialog, TopDialog, StatsDialog)
-                ):
+                if themed and isinstance(dlg, themed):
                     dlg.refresh_theme()
 
+    def _ensure_calendar_mode(self) -> None:
+        """Swap the calendar widget when ``calendar_mode`` changes."""
+
+        wanted = (
+            ModelCalendarView
+            if CONFIG.get("calendar_mode") == "model"
+            else ExcelCalendarTable
+        )
+        if type(self.table) is wanted:
+            return
+        old = self.table
+        old.save_current_month()
+        new = create_calendar(old.parentWidget())
+        if (new.year, new.month) != (old.year, old.month):
+            new.load_month_data(old.year, old.month)
+        widths = old.get_day_column_widths()
+        if widths:
+            new.set_day_column_widths(widths)
+        layout = old.parentWidget().layout()
+        layout.replaceWidget(old, new)
+        old.hide()
+        old.deleteLater()
+        self.table = new
+        self._applied_theme = None
+
     def apply_fonts(self):
+        self._apply_font_aspect()
+        self.table.update_day_rows()
+
+    def _apply_font_aspect(self) -> None:
         header_family, text_family = resolve_font_config(self)
         theme_manager.set_text_font(text_family)
         theme_manager.set_header_font(header_family)
@@ -4315,7 +2271,6 @@ class MainWindow(QtWidgets.QMainWindow):
         # Ensure weekday headers and day labels adopt the selected font
         # after direct font assignments above.
         self.table.apply_fonts()
-        self.table.update_day_rows()
         for dlg in app.topLevelWidgets():
             if isinstance(dlg, QtWidgets.QDialog):
                 for tbl in dlg.findChildren(QtWidgets.QTableWidget):
@@ -4343,80 +2298,58 @@ class MainWindow(QtWidgets.QMainWindow):
         except TypeError:
             func(self.sidebar, accent, sidebar)
 
-    def apply_palette(self):
+    def _apply_icons(self) -> None:
         load_icons(CONFIG.get("theme", "dark"))
         self.topbar.update_icons()
         self.sidebar.update_icons()
         self.setWindowIcon(QtGui.QIcon(CONFIG.get("app_icon", ICON_TOGGLE)))
-        workspace = self._current_workspace_color()
-        self.statusBar().setStyleSheet(
-            f"background-color:{workspace.name()};"
-        )
-        accent = self._current_accent_color()
-        self.topbar.apply_background(workspace, accent=accent)
-        self.table.horizontalHeader().setStyleSheet(
-            f"background-color:{workspace.name()};"
-        )
-        # ensure widgets use the latest accent color for borders and neon effects
-        app = QtWidgets.QApplication.instance()
-        pal = app.palette()
-        pal.setColor(QtGui.QPalette.Highlight, accent)
-        app.setPalette(pal)
-        sidebar_color = CONFIG.get("sidebar_color", "#1f1f23")
-        self.topbar.apply_style()
-        self._apply_sidebar_style(accent, sidebar_color)
-        self.sidebar.anim.setDuration(160)
-        update_neon_filters(self, CONFIG)
-        # Reapply background so the spin box border matches the current theme
-        self.topbar.apply_background(workspace, accent=accent)
-        self.topbar.update_labels()
-
-    def apply_settings(self):
-        self.apply_fonts()
-        self.apply_palette()
-        self.apply_theme()
-        accent = self._current_accent_color()
-        sidebar_color = CONFIG.get("sidebar_color", "#1f1f23")
-        self._apply_sidebar_style(
-            accent, sidebar_color
-        )
-        app = QtWidgets.QApplication.instance()
-        for w in app.allWidgets():
-            if isinstance(w, (StyledToolButton, StyledPushButton)):
-                w.update_gradient(**button_config())
-                w.apply_base_style()
-                state = "hover" if bool(w.property("neon_selected")) else "idle"
-                w.apply_neon_state(state)
 
+    def apply_settings(self, only: Optional[Iterable[str]] = None):
+        """Apply the theme aspects that changed since the last call.
 
+        Fonts, day rows, the palette, neon and the button gradient are each
+        applied at most once, with updates disabled, so that changing only
+        the accent color does not re-font the application.  ``only`` limits
+        the pass to some aspects and leaves the rest for the next call.
+        """
 
-    def apply_style(self) -> None:
-        accent = QtGui.QColor(CONFIG.get("accent_color", "#39ff14"))
-        workspace = QtGui.QColor(CONFIG.get("workspace_color", "#1e1e21"))
-        if CONFIG.get("monochrome", False):
-            h, s, v, _ = accent.getHsv()
-            s = int(CONFIG.get("mono_saturation", 100))
-            accent.setHsv(h, s, v)
-            workspace = theme_manager.apply_monochrome(workspace)
-        sidebar = CONFIG.get("sidebar_color", "#1f1f23")
-        style = (
-            f"background:{workspace.name()};" f"border:1px solid {accent.name()};" f"border-radius:8px;"
+        transaction = theme_transaction.ThemeTransaction(
+            self._applied_theme, CONFIG, only
         )
-        for cls in (
-            QtWidgets.QLineEdit,
-            QtWidgets.QComboBox,
-            QtWidgets.QSpinBox,
-            QtWidgets.QTimeEdit,
-        ):
-            for w in self.findChildren(cls):
-                w.setStyleSheet(style)
+        if not transaction:
+            return
         app = QtWidgets.QApplication.instance()
-        pal = app.palette()
-        pal.setColor(QtGui.QPalette.Highlight, accent)
-        app.setPalette(pal)
-        self.topbar.apply_style()
-        self._apply_sidebar_style(accent, sidebar)
-        update_neon_filters(self, CONFIG)
+        with transaction.applying(self):
+            if "fonts" in transaction:
+                self._apply_font_aspect()
+            if transaction.any("fonts", "day_rows"):
+                self.table.update_day_rows()
+            buttons = [
+                w
+                for w in app.allWidgets()
+                if isinstance(w, (StyledToolButton, StyledPushButton))
+            ]
+            if "gradient" in transaction:
+                for button in buttons:
+                    if shiboken6.isValid(button):
+                        button.update_gradient(**button_config())
+            restyled: set = set()
+            if "palette" in transaction:
+                # Also restyles the sidebar buttons and the top bar background.
+                self.apply_theme()
+                self._apply_icons()
+                restyled.update(self.sidebar._button_widgets)
+            if transaction.any("palette", "neon", "gradient"):
+                for button in buttons:
+                    # Closed windows may be collected while the theme applies.
+                    if button in restyled or not shiboken6.isValid(button):
+                        continue
+                    state = "hover" if bool(button.property("neon_selected")) else "idle"
+                    button.apply_neon_state(state)
+            if transaction.any("palette", "neon") and "neon" not in transaction.pending:
+                self.topbar._update_spin_year_neon()
+                update_neon_filters(self, CONFIG)
+        self._applied_theme = transaction.applied_values()
 
     def apply_theme(self):
         app = QtWidgets.QApplication.instance()
@@ -4491,51 +2424,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
         _, workspace_for_styles = theme_manager.apply_gradient(CONFIG)
         workspace_for_styles = QtGui.QColor(workspace_for_styles)
-        self.statusBar().setStyleSheet(
-            f"background-color:{workspace_for_styles.name()};"
-        )
         flat_cfg = CONFIG.copy()
         flat_cfg.pop("gradient_colors", None)
         flat_base, _ = theme_manager.apply_gradient(flat_cfg)
-        self.topbar.update_background(
-            workspace_for_styles,
-            accent=accent,
-        )
-        theme = CONFIG.get("theme", "dark")
-        self.setStyleSheet(
-            "QSpinBox,QDoubleSpinBox,QTimeEdit,QComboBox,QLineEdit{" + flat_base + "}"
-            f"""
-            QSpinBox::up-button,QDoubleSpinBox::up-button{{
-                subcontrol-origin:border;
-                subcontrol-position:right top;
-                margin-left:2px;
-                border:1px solid transparent;
-                border-radius:8px;
-                width:16px;height:16px;
-            }}
-            QSpinBox::down-button,QDoubleSpinBox::down-button{{
-                subcontrol-origin:border;
-                subcontrol-position:right bottom;
-                margin-left:2px;
-                border:1px solid transparent;
-                border-radius:8px;
-                width:16px;height:16px;
-            }}
-            QSpinBox::up-arrow,QSpinBox::down-arrow,QDoubleSpinBox::up-arrow,QDoubleSpinBox::down-arrow{{
-                width:10px;height:10px;
-            }}
-            QSpinBox::up-arrow,QDoubleSpinBox::up-arrow{{ image:url(assets/icons/{theme}/chevron-up.svg); }}
-            QSpinBox::down-arrow,QDoubleSpinBox::down-arrow{{ image:url(assets/icons/{theme}/chevron-down.svg); }}
-            QComboBox::down-arrow{{
-                image:url(assets/icons/{theme}/chevron-down.svg);
-                width:10px;height:10px;
-            }}
-            QComboBox::drop-down{{
-                subcontrol-origin:padding;
-                subcontrol-position:right center;
-                width:16px;
-            }}
-            """
+        theme_registry.apply_style(
+            self,
+            theme_registry.theme(workspace=workspace_for_styles.name()).get(
+                "main_window", flat_base, CONFIG.get("theme", "dark")
+            ),
         )
         self.table.apply_theme()
         sidebar_style_color = sidebar_color
@@ -4556,9 +2452,8 @@ class MainWindow(QtWidgets.QMainWindow):
         super().resizeEvent(event)
 
     def closeEvent(self, event):
-        self.table.save_current_month()
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(CONFIG, f, ensure_ascii=False, indent=2)
+        self.table.flush_pending_save(wait=True)
+        storage.write_json(appdata.CONFIG_PATH, CONFIG)
         cols = self.table.get_day_column_widths()
         self._settings.setValue("MainWindow/columns", cols)
         self._settings.sync()
@@ -4566,23 +2461,34 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
 def main():
+    # Finish or drop writes interrupted by a crash before anything is loaded.
+    with startup_profiler.phase("recover"):
+        storage.recover(store_locations())
+    configure_glyph_cache(os.path.dirname(appdata.CONFIG_PATH))
     load_icons(CONFIG.get("theme", "dark"))
 
-    # Ensure the configured base font is available before applying it globally
-    base_family = ensure_font_registered(CONFIG.get("font_family", "Exo 2"))
-    CONFIG["font_family"] = base_family
+    with startup_profiler.phase("resolve_font_config"):
+        # Ensure the configured base font is available before applying it globally
+        base_family = ensure_font_registered(CONFIG.get("font_family", "Exo 2"))
+        CONFIG["font_family"] = base_family
 
-    header_family, text_family = resolve_font_config()
-    theme_manager.set_header_font(header_family)
-    theme_manager.set_text_font(text_family)
+        header_family, text_family = resolve_font_config()
+        theme_manager.set_header_font(header_family)
+        theme_manager.set_text_font(text_family)
 
-    w = MainWindow()
-    w.apply_settings()
-    w.show()
-    w.showMaximized()
+    # The first paint shows the sidebar, top bar and an empty calendar grid.
+    with startup_profiler.phase("main_window"):
+        w = MainWindow(deferred=True)
+    with startup_profiler.phase("show"):
+        w.showMaximized()
+    # Month data and neon stream in afterwards, followed by the remaining
+    # font faces and the glyph coverage of installed fonts.
+    w.start_deferred_startup(register_deferred_fonts, warm_glyph_cache)
     return w
 
 if __name__ == "__main__":
+    import argparse
+
     QtCore.QLocale.setDefault(QtCore.QLocale("ru_RU"))
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -4590,12 +2496,33 @@ if __name__ == "__main__":
         action="store_true",
         help="Skip registering bundled fonts",
     )
+    parser.add_argument(
+        startup_profiler.FLAG,
+        action="store_true",
+        help="Write a startup phase report to logs/",
+    )
+    parser.add_argument(
+        startup_profiler.CPROFILE_FLAG,
+        action="store_true",
+        help="Also dump cProfile statistics of the startup",
+    )
     args, qt_args = parser.parse_known_args()
-    app = QtWidgets.QApplication([sys.argv[0]] + qt_args)
+    startup_profiler.PROFILER.record_import()
+    with startup_profiler.phase("qapplication"):
+        app = QtWidgets.QApplication([sys.argv[0]] + qt_args)
     try:
         if not args.skip_fonts:
-            register_fonts()
+            with startup_profiler.phase("register_fonts"):
+                register_fonts(defer=True)
         window = main()
+
+        def _finish_profile() -> None:
+            report = startup_profiler.PROFILER.finish()
+            if report:
+                logger.info("Startup profile written to %s", report)
+
+        # Written once the deferred startup steps after the first paint ran.
+        window.startup_finished.connect(_finish_profile)
         exit_code = app.exec()
         sys.exit(exit_code)
     except Exception as exc:
@@ -0,0 +1,165 @@
+"""Background prefetch of month files into a small LRU cache.
+
+Loading a month means a couple of ``os.path.exists`` checks, the legacy
+``DATA_DIR`` fallback and a JSON parse.  :class:`MonthPrefetcher` runs that
+work for the months around the visible one on a worker thread, so stepping
+to the previous or next month is served from memory even when ``save_path``
+points at a slow network share.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_CAPACITY = 12
+
+_Key = Tuple[Hashable, int, int]
+
+
+def adjacent_months(year: int, month: int, *, years: bool = True) -> Iterable[Tuple[int, int]]:
+    """Yield the months next to ``year``/``month`` in prefetch order."""
+
+    yield (year, month - 1) if month > 1 else (year - 1, 12)
+    yield (year, month + 1) if month < 12 else (year + 1, 1)
+    if years:
+        yield year - 1, month
+        yield year + 1, month
+
+
+class MonthPrefetcher:
+    """LRU cache of loaded months filled by a background worker.
+
+    ``loader(year, month)`` produces the cached object and ``scope()`` names
+    the storage it was read from (the save directory), so switching
+    ``save_path`` never serves months of the previous location.  Callers get
+    deep copies and may mutate them freely.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[int, int], Any],
+        scope: Callable[[], Hashable] = lambda: None,
+        capacity: int = CACHE_CAPACITY,
+    ) -> None:
+        self._loader = loader
+        self._scope = scope
+        self._capacity = max(1, capacity)
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[_Key, Any]" = OrderedDict()
+        self._pending: Dict[_Key, Future] = {}
+        # Bumped on invalidation so a load that raced a save is dropped.
+        self._generations: Dict[_Key, int] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _key(self, year: int, month: int) -> _Key:
+        return (self._scope(), year, month)
+
+    def _store(self, key: _Key, generation: int, value: Any) -> None:
+        if self._generations.get(key, 0) != generation:
+            return
+        self._cache[key] = value
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._capacity:
+            self._cache.popitem(last=False)
+
+    def get(self, year: int, month: int) -> Any:
+        """Return the month, from cache when possible, loading it otherwise."""
+
+        key = self._key(year, month)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return copy.deepcopy(self._cache[key])
+            pending = self._pending.get(key)
+        if pending is not None:
+            try:
+                pending.result()
+            except Exception:
+                pass
+            with self._lock:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    return copy.deepcopy(self._cache[key])
+        with self._lock:
+            generation = self._generations.get(key, 0)
+        value = self._loader(year, month)
+        with self._lock:
+            self._store(key, generation, value)
+        return copy.deepcopy(value)
+
+    def prefetch(self, year: int, month: int) -> None:
+        """Schedule a background load of ``year``/``month`` unless cached."""
+
+        key = self._key(year, month)
+        with self._lock:
+            if key in self._cache or key in self._pending:
+                return
+            generation = self._generations.get(key, 0)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="month-prefetch"
+                )
+            future = self._executor.submit(self._load, key, generation)
+            self._pending[key] = future
+
+    def prefetch_around(self, year: int, month: int, *, years: bool = True) -> None:
+        """Prefetch the neighbours of the visible month."""
+
+        for y, m in adjacent_months(year, month, years=years):
+            self.prefetch(y, m)
+
+    def wait(self) -> None:
+        """Block until the scheduled prefetches have finished."""
+
+        with self._lock:
+            pending = list(self._pending.values())
+        for future in pending:
+            try:
+                future.result()
+            except Exception:
+                pass
+
+    def _load(self, key: _Key, generation: int) -> None:
+        _scope, year, month = key
+        try:
+            value = self._loader(year, month)
+        except Exception:
+            logger.exception("Failed to prefetch month %04d-%02d", year, month)
+            with self._lock:
+                self._pending.pop(key, None)
+            return
+        with self._lock:
+            self._pending.pop(key, None)
+            self._store(key, generation, value)
+
+    def put(self, year: int, month: int, value: Any) -> None:
+        """Cache ``value`` as the newest state of a month about to be written."""
+
+        key = self._key(year, month)
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            self._store(key, generation, copy.deepcopy(value))
+
+    def invalidate(self, year: int, month: int) -> None:
+        """Forget the cached copy of a month that has just been written."""
+
+        key = self._key(year, month)
+        with self._lock:
+            self._cache.pop(key, None)
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def clear(self) -> None:
+        """Drop every cached month, e.g. after ``save_path`` changes."""
+
+        with self._lock:
+            for key in list(self._cache) + list(self._pending):
+                self._generations[key] = self._generations.get(key, 0) + 1
+            self._cache.clear()
@@ -0,0 +1,279 @@
+"""Release planning dialog (opened from the sidebar)."""
+
+from __future__ import annotations
+
+import calendar
+import json
+import logging
+import os
+import sqlite3
+from typing import Dict, List, Union
+
+from PySide6 import QtWidgets, QtGui, QtCore
+
+import theme_registry
+from release_model import ReleaseRowsModel
+from widgets import StyledPushButton
+from resources import icon
+from effects import (
+    apply_neon_effect,
+    register_neon,
+    update_neon_filters,
+)
+import appdata
+
+logger = logging.getLogger(__name__)
+
+# Edits are written once the table has been left alone for this long.
+SAVE_DELAY_MS = 500
+
+
+class ReleaseDialog(QtWidgets.QDialog):
+    """Диалог для управления выкладкой.
+
+    Структура представлена таблицей из четырёх колонок:
+    день, работа, количество глав и время. Допускается несколько
+    записей на один день."""
+
+    class _DayColumnDelegate(QtWidgets.QStyledItemDelegate):
+        """Delegate limiting the day column to valid values."""
+
+        def __init__(self, max_day: int, parent: QtWidgets.QWidget | None = None):
+            super().__init__(parent)
+            self._max_day = max_day
+
+        def set_max_day(self, max_day: int) -> None:
+            self._max_day = max_day
+
+        def createEditor(self, parent, option, index):  # type: ignore[override]
+            editor = QtWidgets.QLineEdit(parent)
+            validator = QtGui.QIntValidator(1, self._max_day, editor)
+            editor.setValidator(validator)
+            editor.setAlignment(QtCore.Qt.AlignCenter)
+            return editor
+
+    def __init__(self, year, month, works, parent=None):
+        super().__init__(parent)
+        self.year = year
+        self.month = month
+        self.works = list(works)
+        self.setWindowTitle("Выкладка")
+        self.resize(600, 400)
+
+        lay = QtWidgets.QVBoxLayout(self)
+        self.days_in_month = calendar.monthrange(year, month)[1]
+
+        self.rows_model = ReleaseRowsModel(self)
+        self.table = QtWidgets.QTableView(self)
+        self.table.setModel(self.rows_model)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self._day_delegate = self._DayColumnDelegate(self.days_in_month, self.table)
+        self.table.setItemDelegateForColumn(0, self._day_delegate)
+
+        self._dirty = False
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.flush)
+
+        app = QtWidgets.QApplication.instance()
+        self.setFont(app.font())
+        self.table.setFont(app.font())
+        header_font = QtGui.QFont(appdata.CONFIG.get("header_font"))
+        self.table.horizontalHeader().setFont(header_font)
+
+        self.table.setAttribute(QtCore.Qt.WA_Hover, True)
+        self.table.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
+        header.setAttribute(QtCore.Qt.WA_Hover, True)
+        register_neon(self.table, appdata.CONFIG)
+        register_neon(header, appdata.CONFIG)
+
+        lay.addWidget(self.table)
+
+        controls = QtWidgets.QHBoxLayout()
+        controls.addStretch()
+        btn_add_row = StyledPushButton("Добавить запись", self, **appdata.button_config())
+        btn_add_row.setIcon(icon("plus"))
+        btn_add_row.setIconSize(QtCore.QSize(16, 16))
+        btn_delete_row = StyledPushButton("Удалить запись", self, **appdata.button_config())
+        btn_delete_row.setIcon(icon("minus"))
+        btn_delete_row.setIconSize(QtCore.QSize(16, 16))
+        controls.addWidget(btn_add_row)
+        controls.addWidget(btn_delete_row)
+        lay.addLayout(controls)
+
+        box = QtWidgets.QDialogButtonBox(self)
+        btn_save = StyledPushButton("Сохранить", self, **appdata.button_config())
+        btn_save.setIcon(icon("save"))
+        btn_save.setIconSize(QtCore.QSize(20, 20))
+        btn_close = StyledPushButton("Закрыть", self, **appdata.button_config())
+        btn_close.setIcon(icon("x"))
+        btn_close.setIconSize(QtCore.QSize(20, 20))
+        box.addButton(btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
+        box.addButton(btn_close, QtWidgets.QDialogButtonBox.RejectRole)
+        box.accepted.connect(self.accept)
+        box.rejected.connect(self.reject)
+        lay.addWidget(box)
+
+        for b in (btn_save, btn_close):
+            b.setFixedSize(b.sizeHint())
+
+        self._settings = QtCore.QSettings("rabota2", "rabota2")
+        geom = self._settings.value("ReleaseDialog/geometry", type=QtCore.QByteArray)
+        if geom is not None:
+            self.restoreGeometry(geom)
+        sizes = self._settings.value("ReleaseDialog/columns", type=list)
+        for i, w in enumerate(sizes or []):
+            try:
+                self.table.setColumnWidth(i, int(w))
+            except (TypeError, ValueError):
+                pass  # пропустить некорректное значение
+
+        btn_add_row.clicked.connect(self.add_row)
+        btn_delete_row.clicked.connect(self.remove_selected_rows)
+
+        self.rows_model.edited.connect(self._mark_dirty)
+        self.load()
+        self.refresh_theme()
+
+    def refresh_theme(self) -> None:
+        """Rebuild palette-dependent style and neon highlighting."""
+
+        workspace = QtGui.QColor(appdata.CONFIG.get("workspace_color", "#1e1e21")).name()
+        accent = QtGui.QColor(appdata.CONFIG.get("accent_color", "#39ff14")).name()
+
+        header = self.table.horizontalHeader()
+
+        if getattr(self.table, "_neon_effect", None):
+            apply_neon_effect(self.table, False, config=appdata.CONFIG)
+        if getattr(header, "_neon_effect", None):
+            apply_neon_effect(header, False, config=appdata.CONFIG)
+
+        compiled = theme_registry.theme(accent=accent, workspace=workspace)
+        table_style = compiled.get("dialog_table", False, "QTableView")
+        header_style = compiled.get("dialog_header", 6)
+
+        theme_registry.apply_style(self.table, table_style)
+        theme_registry.apply_style(header, header_style)
+
+        apply_neon_effect(self.table, True, config=appdata.CONFIG)
+        apply_neon_effect(header, True, shadow=False, border=False, config=appdata.CONFIG)
+        update_neon_filters(self.table, appdata.CONFIG)
+
+    def hideEvent(self, event):
+        self.flush()
+        super().hideEvent(event)
+
+    def closeEvent(self, event):
+        self.flush()
+        self._settings.setValue("ReleaseDialog/geometry", self.saveGeometry())
+        cols = [
+            int(self.table.columnWidth(i))
+            for i in range(self.rows_model.columnCount())
+        ]
+        self._settings.setValue("ReleaseDialog/columns", cols)
+        self._settings.sync()
+        super().closeEvent(event)
+
+    def file_path(self):
+        return os.path.join(appdata.release_dir(self.year), f"{self.month:02d}.json")
+
+    def add_row(self, day: int | None = None, entry: Dict[str, Union[str, int]] | None = None):
+        # ``clicked`` passes its checked state as the first argument.
+        if isinstance(day, bool):
+            day = None
+        row = self.rows_model.add_row(day, entry)
+        self.table.setCurrentIndex(self.rows_model.index(row, 0))
+        if entry:
+            self._mark_dirty()
+
+    def remove_selected_rows(self):
+        selected = {idx.row() for idx in self.table.selectedIndexes()}
+        if not selected:
+            return
+        self.rows_model.remove_rows(selected)
+        self.rows_model.pad(self.days_in_month)
+        self._mark_dirty()
+
+    def reopen(self, year, month, works) -> bool:
+        """Show ``month`` again, re-reading it only if it changed since."""
+
+        self.works = list(works)
+        if (year, month) != (self.year, self.month):
+            self.flush()
+            self.year = year
+            self.month = month
+            self.days_in_month = calendar.monthrange(year, month)[1]
+            self.load()
+        elif appdata.data_signature(self.file_path()) != self._stamp:
+            self.load()
+        return True
+
+    def load(self):
+        self._stamp = appdata.data_signature(self.file_path())
+        self._save_timer.stop()
+        self._dirty = False
+        try:
+            data = appdata.load_release_data(self.year, self.month)
+        except json.JSONDecodeError as exc:
+            path = self.file_path()
+            logger.error("Failed to parse release data from '%s': %s", path, exc)
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Ошибка",
+                "Данные повреждены или нечитаемы.",
+            )
+            data = {}
+
+        self._day_delegate.set_max_day(self.days_in_month)
+        self.rows_model.set_month(data.get("days", {}), self.days_in_month)
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending edits now instead of after :data:`SAVE_DELAY_MS`."""
+
+        if self._dirty:
+            self.save()
+
+    def save(self):
+        self._save_timer.stop()
+        self._dirty = False
+        days: Dict[str, List[Dict[str, str | int]]] = {}
+        for row in self.rows_model.rows():
+            day = row["day"]
+            if day is None or not (1 <= day <= self.days_in_month):
+                continue
+
+            work_name = row["work"].strip()
+            if not work_name:
+                continue
+            chapters_text = row["chapters"].strip()
+            try:
+                chapters = int(chapters_text) if chapters_text else 0
+            except (TypeError, ValueError):
+                chapters = 0
+            time_text = row["time"].strip()
+            entry = {
+                "work": work_name,
+                "chapters": chapters,
+                "time": time_text,
+            }
+            days.setdefault(str(day), []).append(entry)
+
+        works = sorted({e["work"] for entries in days.values() for e in entries})
+        data = {"works": works, "days": days}
+
+        try:
+            appdata.save_release_data(self.year, self.month, data)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("Failed to save release data: %s", exc)
+        else:
+            self._stamp = appdata.data_signature(self.file_path())
@@ -0,0 +1,182 @@
+"""Model of the release plan rows shown by :class:`ReleaseDialog`.
+
+The dialog used to insert a row of four ``QTableWidgetItem`` per entry and
+per padding row, relaying out the table each time.  :class:`ReleaseRowsModel`
+receives the whole month in one reset and keeps its rows ordered by day, so
+entries sharing a day stay together in the order they were added.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+from PySide6 import QtCore
+
+COLUMNS = ("day", "work", "chapters", "time")
+TITLES = ("День", "Работа", "Глав", "Время")
+
+# Rows without a day are kept after all dated ones.
+_NO_DAY = 1 << 30
+
+Row = Dict[str, object]
+
+
+def _blank_row() -> Row:
+    return {"day": None, "work": "", "chapters": "", "time": ""}
+
+
+def _make_row(day: int | None, entry: Mapping | None) -> Row:
+    entry = entry or {}
+    return {
+        "day": day or None,
+        "work": str(entry.get("work", "")),
+        "chapters": str(entry.get("chapters", "")),
+        "time": str(entry.get("time", "")),
+    }
+
+
+def _day_key(row: Row) -> int:
+    return row["day"] or _NO_DAY
+
+
+def _parse_day(text: str) -> int | None:
+    try:
+        day = int(text)
+    except (TypeError, ValueError):
+        return None
+    return day if day > 0 else None
+
+
+class ReleaseRowsModel(QtCore.QAbstractTableModel):
+    """Release entries of one month, sorted by day."""
+
+    # Emitted after the user changed a cell.
+    edited = QtCore.Signal()
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._rows: List[Row] = []
+
+    # --- Qt model API ---------------------------------------------------
+    def rowCount(self, parent=QtCore.QModelIndex()):  # noqa: N802 - Qt API
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):  # noqa: N802 - Qt API
+        if parent.isValid():
+            return 0
+        return len(COLUMNS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        row = self._rows[index.row()]
+        key = COLUMNS[index.column()]
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            if key == "day":
+                return str(row["day"]) if row["day"] else ""
+            return row[key]
+        if role == QtCore.Qt.TextAlignmentRole and key == "day":
+            return int(QtCore.Qt.AlignCenter)
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):  # noqa: N802
+        if (
+            orientation == QtCore.Qt.Horizontal
+            and role == QtCore.Qt.DisplayRole
+            and 0 <= section < len(TITLES)
+        ):
+            return TITLES[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return (
+            QtCore.Qt.ItemIsSelectable
+            | QtCore.Qt.ItemIsEditable
+            | QtCore.Qt.ItemIsEnabled
+        )
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):  # noqa: N802 - Qt API
+        if role != QtCore.Qt.EditRole or not index.isValid():
+            return False
+        row = index.row()
+        if not (0 <= row < len(self._rows)):
+            return False
+        key = COLUMNS[index.column()]
+        text = "" if value is None else str(value)
+        new = _parse_day(text.strip()) if key == "day" else text
+        if self._rows[row][key] == new:
+            return False
+        self._rows[row][key] = new
+        self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+        if key == "day":
+            self._move_to_sorted_place(row)
+        self.edited.emit()
+        return True
+
+    # --- rows -----------------------------------------------------------
+    def set_month(self, days: Mapping[str, Iterable[Mapping]], max_day: int) -> None:
+        """Show the entries of ``days`` and pad to ``max_day`` rows, in one reset.
+
+        Entries of days outside ``1..max_day`` are left out.
+        """
+
+        rows: List[Row] = []
+        for day_str, entries in days.items():
+            day = _parse_day(day_str)
+            if day is None or day > max_day:
+                continue
+            rows.extend(_make_row(day, entry) for entry in entries or [])
+        rows.sort(key=_day_key)  # stable: entries of a day keep their order
+        rows.extend(_blank_row() for _ in range(max_day - len(rows)))
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def add_row(self, day: int | None = None, entry: Mapping | None = None) -> int:
+        """Insert an entry after the others of its day and return its row."""
+
+        row = _make_row(day, entry)
+        position = bisect.bisect_right([_day_key(r) for r in self._rows], _day_key(row))
+        self.beginInsertRows(QtCore.QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        self.endInsertRows()
+        return position
+
+    def remove_rows(self, rows: Iterable[int]) -> None:
+        for row in sorted(set(rows), reverse=True):
+            if 0 <= row < len(self._rows):
+                self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+
+    def pad(self, count: int) -> None:
+        """Append blank rows until there are at least ``count``."""
+
+        missing = count - len(self._rows)
+        if missing <= 0:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + missing - 1)
+        self._rows.extend(_blank_row() for _ in range(missing))
+        self.endInsertRows()
+
+    def rows(self) -> Sequence[Row]:
+        return tuple(dict(row) for row in self._rows)
+
+    def _move_to_sorted_place(self, row: int) -> None:
+        moved = self._rows[row]
+        others = [_day_key(r) for i, r in enumerate(self._rows) if i != row]
+        target = bisect.bisect_right(others, _day_key(moved))
+        if target == row:
+            return
+        # beginMoveRows takes the destination before the removal of ``row``.
+        destination = target + 1 if target > row else target
+        self.beginMoveRows(QtCore.QModelIndex(), row, row, QtCore.QModelIndex(), destination)
+        del self._rows[row]
+        self._rows.insert(target, moved)
+        self.endMoveRows()
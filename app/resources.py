@@ -3,28 +3,17 @@
 from __future__ import annotations
 
 import os
+import json
 import logging
-import ctypes
+import threading
 from typing import Dict, Iterable
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import storage
 
 logger = logging.getLogger(__name__)
 
-try:  # pragma: no cover - optional dependency
-    import tkinter as tk
-    from tkinter import font as tkfont
-except Exception as exc:  # pragma: no cover - extremely defensive
-    tk = None  # type: ignore[assignment]
-    tkfont = None  # type: ignore[assignment]
-    logger.warning("Failed to import tkinter: %s", exc)
-
-try:  # pragma: no cover - optional dependency
-    import customtkinter as ctk
-except Exception as exc:  # pragma: no cover - extremely defensive
-    ctk = None  # type: ignore[assignment]
-    logger.warning("Failed to import customtkinter: %s", exc)
-
-from PySide6 import QtGui, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtGui import QIcon, QFont, QGuiApplication
 
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), "..", "assets")
@@ -33,6 +22,14 @@ ICONS_DIR = os.path.join(ASSETS_DIR, "icons")
 
 ICONS: Dict[str, QIcon] = {}
 
+FONT_EXTENSIONS = {".ttf", ".otf", ".ttc"}
+CATTEDRALE_FILE = "Cattedrale[RUSbypenka220]-Regular.ttf"
+EXO2_DIR = "Exo2"
+# Faces needed for the first paint; the other Exo 2 files may be deferred.
+ESSENTIAL_EXO2_FACES = ("Exo2-Regular.ttf", "Exo2-Bold.ttf")
+
+_DEFERRED_FONT_FILES: list[str] = []
+
 LATIN_RANGE = tuple(range(ord("A"), ord("Z") + 1)) + tuple(
     range(ord("a"), ord("z") + 1)
 )
@@ -47,16 +44,201 @@ REQUIRED_RANGES = {
 }
 
 
-def _font_has_required_glyphs(family: str) -> tuple[bool, str | None]:
-    """Return whether *family* provides required glyph ranges."""
+GLYPH_CACHE_FILE = "glyph_coverage.json"
+GLYPH_CACHE_VERSION = 1
+
+# Files of the application fonts registered in this process, by family.
+_FONT_FILES: Dict[str, str] = {}
 
-    font = QFont(family)
+
+def _scan_required_glyphs(family: str) -> tuple[bool, str | None]:
+    """Check every required code point of *family* in its font file."""
+
+    raw = QtGui.QRawFont.fromFont(QFont(family))
     for label, codes in REQUIRED_RANGES.items():
-        if not all(QtGui.QFontDatabase.supportsCharacter(font, code) for code in codes):
+        if not raw.isValid() or not all(raw.supportsCharacter(code) for code in codes):
             return False, label
     return True, None
 
 
+def _file_signature(path: str) -> str:
+    try:
+        return f"{os.path.normpath(path)}:{os.stat(path).st_mtime_ns}"
+    except OSError:
+        return os.path.normpath(path)
+
+
+def _system_font_signature() -> str:
+    """Fingerprint of the system font directories.
+
+    Qt does not expose the file behind a system family, so the modification
+    times of the font directories stand in for it: installing or removing a
+    font invalidates the cached coverage of system families.
+    """
+
+    directories = list(
+        QtCore.QStandardPaths.standardLocations(QtCore.QStandardPaths.FontsLocation)
+    )
+    if os.name == "nt":
+        directories.append(os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"))
+    else:
+        directories.extend(("/usr/share/fonts", "/usr/local/share/fonts", "/Library/Fonts"))
+    stamps = []
+    for directory in sorted(set(directories)):
+        try:
+            stamps.append(str(os.stat(directory).st_mtime_ns))
+        except OSError:
+            continue
+    return "system:" + ",".join(stamps)
+
+
+class GlyphCoverageCache:
+    """Glyph coverage of font families, optionally persisted as JSON.
+
+    Entries are keyed by family and the signature of its font file
+    (path and mtime for bundled fonts, the font directories for system
+    ones), so results survive restarts until the font itself changes.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[str, tuple[bool, str | None]] = {}
+        self._dirty = False
+        self._system_signature: str | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self.path: str | None = None
+        self.misses = 0
+        if path:
+            self.set_path(path)
+
+    def set_path(self, path: str | None) -> None:
+        """Persist to *path*, merging the entries already stored there."""
+
+        self.path = path
+        if not path:
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            logger.warning("Failed to read glyph coverage cache '%s'", path)
+            return
+        if not isinstance(data, dict) or data.get("version") != GLYPH_CACHE_VERSION:
+            return
+        entries = data.get("entries", {})
+        with self._lock:
+            for key, value in entries.items():
+                if isinstance(value, dict) and key not in self._entries:
+                    self._entries[key] = (bool(value.get("ok")), value.get("missing"))
+
+    def _key(self, family: str) -> str:
+        path = _FONT_FILES.get(family)
+        if path is not None:
+            signature = _file_signature(path)
+        else:
+            if self._system_signature is None:
+                self._system_signature = _system_font_signature()
+            signature = self._system_signature
+        return f"{family}\n{signature}"
+
+    def lookup(self, family: str) -> tuple[bool, str | None] | None:
+        with self._lock:
+            return self._entries.get(self._key(family))
+
+    def check(self, family: str) -> tuple[bool, str | None]:
+        """Return the coverage of *family*, scanning it on a cache miss."""
+
+        key = self._key(family)
+        with self._lock:
+            result = self._entries.get(key)
+        if result is not None:
+            return result
+        result = _scan_required_glyphs(family)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = result
+            self._dirty = True
+        return result
+
+    def save(self) -> None:
+        """Write the entries to :attr:`path` if anything new was scanned."""
+
+        with self._lock:
+            if not self.path or not self._dirty:
+                return
+            entries = {
+                key: {"ok": ok, "missing": missing}
+                for key, (ok, missing) in self._entries.items()
+            }
+            self._dirty = False
+        try:
+            storage.write_json(
+                self.path, {"version": GLYPH_CACHE_VERSION, "entries": entries}
+            )
+        except OSError:
+            logger.warning("Failed to write glyph coverage cache '%s'", self.path)
+
+    def warm(self, families: Iterable[str]) -> Future:
+        """Scan *families* on a background thread and save the results."""
+
+        pending = [family for family in families if self.lookup(family) is None]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="glyph-coverage"
+            )
+        return self._executor.submit(self._warm, pending)
+
+    def _warm(self, families: list[str]) -> int:
+        scanned = 0
+        try:
+            for family in families:
+                self.check(family)
+                scanned += 1
+        except Exception:
+            logger.exception("Glyph coverage scan stopped")
+        self.save()
+        return scanned
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._dirty = False
+            self._system_signature = None
+
+
+GLYPH_CACHE = GlyphCoverageCache()
+
+
+def configure_glyph_cache(directory: str) -> GlyphCoverageCache:
+    """Persist :data:`GLYPH_CACHE` in *directory* (next to ``config.json``)."""
+
+    GLYPH_CACHE.set_path(os.path.join(directory, GLYPH_CACHE_FILE))
+    return GLYPH_CACHE
+
+
+def warm_glyph_cache() -> Future:
+    """Fill the coverage of every installed family in the background."""
+
+    return GLYPH_CACHE.warm(QtGui.QFontDatabase.families())
+
+
+def _remember_font_file(font_id: int, path: str) -> list[str]:
+    """Return the families of an application font and note their file."""
+
+    families = list(QtGui.QFontDatabase.applicationFontFamilies(font_id))
+    for family in families:
+        _FONT_FILES[family] = path
+    return families
+
+
+def _font_has_required_glyphs(family: str) -> tuple[bool, str | None]:
+    """Return whether *family* provides required glyph ranges."""
+
+    return GLYPH_CACHE.check(family)
+
+
 def filter_supported_families(
     families: Iterable[str],
     source: str,
@@ -77,6 +259,7 @@ def filter_supported_families(
                 source,
                 missing,
             )
+    GLYPH_CACHE.save()
     return valid
 
 
@@ -137,65 +320,60 @@ def _show_error_dialog(message: str) -> None:
             break
 
 
+def add_font_file(path: str) -> list[str]:
+    """Register *path* with Qt and return the families it provides."""
+
+    font_id = QtGui.QFontDatabase.addApplicationFont(path)
+    if font_id == -1:
+        logger.error("Failed to load font '%s'", path)
+        return []
+    return _remember_font_file(font_id, path)
+
+
 def register_cattedrale(font_path: str) -> str:
-    """Register the Cattedrale font for Tk-based widgets.
+    """Register the Cattedrale font and return its family name.
 
-    Returns the detected family name or ``"Exo 2"`` if registration fails."""
+    The family is read from Qt's ``applicationFontFamilies``.  Returns
+    ``"Exo 2"`` if the font cannot be loaded."""
 
-    if tk is None or ctk is None or tkfont is None:
+    families = add_font_file(font_path) if os.path.isfile(font_path) else []
+    if not families:
         message = (
-            "Не удалось загрузить tkinter/customtkinter — шрифт Cattedrale не будет применён"
+            "Не удалось загрузить шрифт Cattedrale — будет использован Exo 2"
         )
         logger.warning(message)
         _show_error_dialog(message)
         return "Exo 2"
+    return families[0]
 
-    if os.name != "nt" and not os.environ.get("DISPLAY"):
-        message = (
-            "Переменная окружения DISPLAY не установлена — шрифт Cattedrale не будет применён"
-        )
-        logger.warning(message)
-        _show_error_dialog(message)
-        return "Exo 2"
 
-    def _worker() -> str:
-        root = None
-        try:
-            if os.name == "nt":
-                ctypes.windll.gdi32.AddFontResourceExW(font_path, 0x10, 0)
-                ctypes.windll.user32.SendMessageW(0xFFFF, 0x1D, 0, 0)
-
-            root = tk.Tk()
-            root.withdraw()
-
-            before = set(tkfont.families(root))
-            ctk.FontManager.load_font(font_path)
-            after = set(tkfont.families(root))
-            new_fams = after - before
-            family = next(
-                iter(new_fams), os.path.splitext(os.path.basename(font_path))[0]
-            )
-            return family
-        finally:
-            if root is not None:
-                root.destroy()
+def _exo2_font_files() -> tuple[list[str], list[str]]:
+    """Return the essential and the remaining Exo 2 font files."""
 
-    try:
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(_worker)
-            return future.result(timeout=5)
-    except (Exception, TimeoutError):
-        logger.exception("Failed to register font '%s'", font_path)
-        return "Exo 2"
+    directory = os.path.join(FONTS_DIR, EXO2_DIR)
+    essential: list[str] = []
+    rest: list[str] = []
+    if not os.path.isdir(directory):
+        return essential, rest
+    for root, _dirs, files in os.walk(directory):
+        for name in sorted(files):
+            if os.path.splitext(name)[1].lower() not in FONT_EXTENSIONS:
+                continue
+            target = essential if name in ESSENTIAL_EXO2_FACES else rest
+            target.append(os.path.join(root, name))
+    return essential, rest
 
 
-def register_fonts() -> None:
+def register_fonts(*, defer: bool = False) -> None:
     """Register bundled fonts and ensure the default family is available.
 
-    Recursively walks through :data:`FONTS_DIR` and loads every font file with a
-    supported extension.  If the default "Exo 2" family cannot be registered,
-    the application falls back to ``"Arial"`` and updates the global
-    configuration accordingly.
+    Cattedrale and the Exo 2 files from :data:`FONTS_DIR` are added through
+    Qt alone; their families come from ``applicationFontFamilies`` and are
+    validated once per batch, so the cost does not depend on the number of
+    installed fonts.  With ``defer=True`` only the faces needed for the first
+    paint are loaded and :func:`register_deferred_fonts` adds the rest.  If
+    the default "Exo 2" family cannot be registered, the application falls
+    back to it by name and updates the global configuration accordingly.
     """
 
     def _set_fallback() -> None:
@@ -204,11 +382,11 @@ def register_fonts() -> None:
         fallback_family = "Exo 2"
         QGuiApplication.setFont(QFont(fallback_family))
         try:  # deferred import to avoid circular dependency
-            from . import main as _main
+            import appdata
 
-            _main.CONFIG["font_family"] = fallback_family
-            _main.CONFIG["header_font"] = fallback_family
-            _main.CONFIG["sidebar_font"] = fallback_family
+            appdata.CONFIG["font_family"] = fallback_family
+            appdata.CONFIG["header_font"] = fallback_family
+            appdata.CONFIG["sidebar_font"] = fallback_family
         except Exception:  # pragma: no cover - extremely defensive
             pass
 
@@ -216,92 +394,34 @@ def register_fonts() -> None:
         _set_fallback()
         return
 
-    extensions = {".ttf", ".otf", ".fon", ".ttc"}
     families: set[str] = set()
 
-    font_path = os.path.join(FONTS_DIR, "Cattedrale[RUSbypenka220]-Regular.ttf")
-    if tk and ctk and tkfont and (os.name == "nt" or os.environ.get("DISPLAY")):
-        executor = ThreadPoolExecutor(max_workers=1)
-        future = executor.submit(register_cattedrale, font_path)
-        try:
-            fam = future.result(timeout=2)
-        except Exception:
-            logger.exception(
-                "Cattedrale registration failed or timed out; skipping"
-            )
-            fam = "Exo 2"
-        finally:
-            executor.shutdown(wait=False)
-    else:
-        logger.warning(
-            "Tkinter unavailable or running headless; skipping Cattedrale registration"
-        )
-        fam = "Exo 2"
+    font_path = os.path.join(FONTS_DIR, CATTEDRALE_FILE)
+    fam = register_cattedrale(font_path)
     if fam == "Exo 2":
         logger.warning("Cattedrale font not found, using fallback")
     preferred_cattedrale: str | None = None
     if fam != "Exo 2":
-        fid = QtGui.QFontDatabase.addApplicationFont(font_path)
-        if fid != -1:
-            fams = QtGui.QFontDatabase.applicationFontFamilies(fid)
-            valid = _filter_supported_families(fams, font_path)
-            if valid:
-                preferred_cattedrale = next(iter(valid))
-                families.update(valid)
-    if preferred_cattedrale is None and fam != "Exo 2":
         valid = _filter_supported_families({fam}, font_path)
         if valid:
-            preferred_cattedrale = next(iter(valid))
+            preferred_cattedrale = fam
             families.update(valid)
         else:
             fam = "Exo 2"
 
-    whitelist_dirs = {os.path.normpath(os.path.join(FONTS_DIR, "Exo2"))}
-    whitelist_files = {os.path.normpath(font_path)}
-
-    def _iter_font_files() -> Iterable[str]:
-        for entry in sorted(whitelist_files):
-            normalized = os.path.normpath(entry)
-            if normalized == os.path.normpath(font_path):
-                continue
-            if os.path.isfile(entry):
-                yield entry
-        for directory in sorted(whitelist_dirs):
-            if not os.path.isdir(directory):
-                continue
-            for root, _dirs, files in os.walk(directory):
-                for name in sorted(files):
-                    yield os.path.join(root, name)
-
-    for path in _iter_font_files():
-        ext = os.path.splitext(path)[1].lower()
-        if ext not in extensions:
-            continue
-        old_fams = set(QtGui.QFontDatabase.families())
-        new_fams: set[str] = set()
-        fid = (
-            QtGui.QFontDatabase.addApplicationFont(path)
-            if ext != ".fon"
-            else -1
-        )
-
-        if ext == ".fon" or fid == -1:
-            if os.name == "nt":
-                try:
-                    ctypes.windll.gdi32.AddFontResourceExW(path, 0x10, 0)
-                    ctypes.windll.user32.SendMessageW(0xFFFF, 0x1D, 0, 0)
-                    new_fams = set(QtGui.QFontDatabase.families()) - old_fams
-                except Exception:  # pragma: no cover - extremely defensive
-                    logger.error("Failed to load font '%s'", path)
-                    continue
-            else:
-                logger.error("Failed to load font '%s'", path)
-                continue
-        else:
-            new_fams = set(QtGui.QFontDatabase.applicationFontFamilies(fid))
-
-        valid = _filter_supported_families(new_fams, path)
-        families.update(valid)
+    essential, rest = _exo2_font_files()
+    batch = essential
+    if defer and essential:
+        _DEFERRED_FONT_FILES[:] = rest
+    else:
+        batch = essential + rest
+        _DEFERRED_FONT_FILES.clear()
+    exo_families: set[str] = set()
+    for path in batch:
+        exo_families.update(add_font_file(path))
+    families.update(
+        _filter_supported_families(exo_families, os.path.join(FONTS_DIR, EXO2_DIR))
+    )
 
     if "Exo 2" not in families:
         logger.error("Font 'Exo 2' not registered")
@@ -310,21 +430,21 @@ def register_fonts() -> None:
 
     # Success – ensure CONFIG reflects the available family and update header/sidebar
     try:  # pragma: no cover - defensive
-        from . import main as _main
-        from . import theme_manager
+        import appdata
+        import theme_manager
 
-        _main.CONFIG.setdefault("font_family", "Exo 2")
+        appdata.CONFIG.setdefault("font_family", "Exo 2")
         target_family = preferred_cattedrale if preferred_cattedrale else fam
         if target_family == "Exo 2":
-            _main.CONFIG["header_font"] = "Exo 2"
-            _main.CONFIG["sidebar_font"] = "Exo 2"
+            appdata.CONFIG["header_font"] = "Exo 2"
+            appdata.CONFIG["sidebar_font"] = "Exo 2"
         else:
             changed = False
-            if _main.CONFIG.get("header_font") != target_family:
-                _main.CONFIG["header_font"] = target_family
+            if appdata.CONFIG.get("header_font") != target_family:
+                appdata.CONFIG["header_font"] = target_family
                 changed = True
-            if _main.CONFIG.get("sidebar_font") != target_family:
-                _main.CONFIG["sidebar_font"] = target_family
+            if appdata.CONFIG.get("sidebar_font") != target_family:
+                appdata.CONFIG["sidebar_font"] = target_family
                 changed = True
             if changed:
                 app = QtWidgets.QApplication.instance()
@@ -333,12 +453,23 @@ def register_fonts() -> None:
                         if hasattr(w, "apply_fonts"):
                             w.apply_fonts()
 
-        theme_manager.set_header_font(_main.CONFIG["header_font"])
-        theme_manager.set_text_font(_main.CONFIG["font_family"])
+        theme_manager.set_header_font(appdata.CONFIG["header_font"])
+        theme_manager.set_text_font(appdata.CONFIG["font_family"])
     except Exception:
         pass
 
 
+def register_deferred_fonts() -> list[str]:
+    """Register the faces skipped by ``register_fonts(defer=True)``."""
+
+    files = list(_DEFERRED_FONT_FILES)
+    _DEFERRED_FONT_FILES.clear()
+    families: set[str] = set()
+    for path in files:
+        families.update(add_font_file(path))
+    return sorted(families)
+
+
 def load_icons(theme: str = "dark") -> None:
     """Load themed icons into the global :data:`ICONS` dictionary."""
     theme_dir = os.path.join(ICONS_DIR, theme)
@@ -0,0 +1,754 @@
+"""Application settings dialog."""
+
+from __future__ import annotations
+
+import logging
+import os
+
+from PySide6 import QtWidgets, QtGui, QtCore
+import shiboken6
+
+import config
+import storage
+import theme_manager
+import theme_registry
+from widgets import StyledPushButton
+from resources import (
+    ensure_supported_family,
+    family_support_details,
+    filter_supported_families,
+    icon,
+)
+from effects import (
+    apply_neon_effect,
+    apply_neon_to_inputs,
+    register_neon,
+    update_neon_filters,
+)
+import appdata
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsDialog(QtWidgets.QDialog):
+    """Окно настроек приложения."""
+
+    settings_changed = QtCore.Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # keep a reference to the main window
+        self.main_window = parent if isinstance(parent, QtWidgets.QWidget) else None
+        self.setWindowTitle("Настройки")
+        self.resize(500, 400)
+        main_lay = QtWidgets.QVBoxLayout(self)
+        tabs = QtWidgets.QTabWidget(self)
+        main_lay.addWidget(tabs)
+
+        # --- Интерфейс ---
+        tab_interface = QtWidgets.QWidget()
+        form_interface = QtWidgets.QFormLayout(tab_interface)
+        tabs.addTab(tab_interface, "Интерфейс")
+
+        self._accent_color = QtGui.QColor(appdata.CONFIG.get("accent_color", "#39ff14"))
+        self._preset_colors = [
+            ("Зелёный", QtGui.QColor("#39ff14")),
+            ("Красный", QtGui.QColor("#ff5555")),
+            ("Синий", QtGui.QColor("#2d7cdb")),
+            ("Жёлтый", QtGui.QColor("#ffd700")),
+            ("Фиолетовый", QtGui.QColor("#8a2be2")),
+        ]
+        self.combo_accent = QtWidgets.QComboBox(self)
+        for name, color in self._preset_colors:
+            pix = QtGui.QPixmap(16, 16)
+            pix.fill(color)
+            self.combo_accent.addItem(QtGui.QIcon(pix), name)
+        self.combo_accent.addItem("Другой…")
+        other_index = self.combo_accent.count() - 1
+        current = self._accent_color.name().lower()
+        idx = next(
+            (i for i, (_, c) in enumerate(self._preset_colors) if c.name().lower() == current),
+            other_index,
+        )
+        self.combo_accent.blockSignals(True)
+        self.combo_accent.setCurrentIndex(idx)
+        self.combo_accent.blockSignals(False)
+        if idx == other_index:
+            pix = QtGui.QPixmap(16, 16)
+            pix.fill(self._accent_color)
+            self.combo_accent.setItemIcon(other_index, QtGui.QIcon(pix))
+        self._accent_index = idx
+        # connect after setting initial index to avoid unwanted color dialog
+        # use activated so selecting "Другой" again reopens the color picker
+        self.combo_accent.activated.connect(self._on_accent_changed)
+        form_interface.addRow("Цвет подсветки", self.combo_accent)
+
+        self._color_preview_links: dict[QtWidgets.QAbstractButton, str] = {}
+
+        self._workspace_color = QtGui.QColor(appdata.CONFIG.get("workspace_color", "#1e1e21"))
+        self.btn_workspace = QtWidgets.QPushButton(self)
+        self._register_color_preview(self.btn_workspace, "_workspace_color")
+        self.btn_workspace.clicked.connect(self.choose_workspace_color)
+        form_interface.addRow("Цвет рабочей области", self.btn_workspace)
+
+        self._sidebar_color = QtGui.QColor(appdata.CONFIG.get("sidebar_color", "#1f1f23"))
+        self.btn_sidebar = QtWidgets.QPushButton(self)
+        self._register_color_preview(self.btn_sidebar, "_sidebar_color")
+        self.btn_sidebar.clicked.connect(self.choose_sidebar_color)
+        form_interface.addRow("Цвет боковой панели", self.btn_sidebar)
+
+        # gradient controls
+        grad = appdata.CONFIG.get("gradient_colors", ["#39ff14", "#2d7cdb"])
+        self._grad_color1 = QtGui.QColor(grad[0])
+        self._grad_color2 = QtGui.QColor(grad[1])
+        self.btn_grad1 = QtWidgets.QPushButton(self)
+        self._register_color_preview(self.btn_grad1, "_grad_color1")
+        self.btn_grad2 = QtWidgets.QPushButton(self)
+        self._register_color_preview(self.btn_grad2, "_grad_color2")
+        self.btn_grad1.clicked.connect(lambda: self.choose_grad_color(1))
+        self.btn_grad2.clicked.connect(lambda: self.choose_grad_color(2))
+        lay_grad = QtWidgets.QHBoxLayout(); lay_grad.addWidget(self.btn_grad1); lay_grad.addWidget(self.btn_grad2)
+        form_interface.addRow("Градиент", lay_grad)
+        self.sld_grad_angle = QtWidgets.QSlider(QtCore.Qt.Horizontal, self)
+        self.sld_grad_angle.setRange(0, 360)
+        self.sld_grad_angle.setValue(int(appdata.CONFIG.get("gradient_angle", 0)))
+        self.lbl_grad_angle = QtWidgets.QLabel(str(self.sld_grad_angle.value()))
+        self.sld_grad_angle.valueChanged.connect(lambda v: (self.lbl_grad_angle.setText(str(v)), self._save_config()))
+        lay_angle = QtWidgets.QHBoxLayout(); lay_angle.addWidget(self.sld_grad_angle,1); lay_angle.addWidget(self.lbl_grad_angle)
+        form_interface.addRow("Угол градиента", lay_angle)
+        # neon controls
+        grp_neon = QtWidgets.QGroupBox("Неон", self)
+        lay_neon = QtWidgets.QFormLayout(grp_neon)
+        info_neon = QtWidgets.QLabel("Подсветка всегда включена", self)
+        info_neon.setWordWrap(True)
+        lay_neon.addRow(info_neon)
+        self._neon_presets: list[tuple[str, tuple[int, int, int]]] = [
+            ("Мягкий", (6, 1, 180)),
+            ("Стандарт", (10, 1, 255)),
+            ("Яркий", (14, 2, 255)),
+        ]
+        self.combo_neon_preset = QtWidgets.QComboBox(self)
+        for name, values in self._neon_presets:
+            self.combo_neon_preset.addItem(name, values)
+        self._neon_custom_index = self.combo_neon_preset.count()
+        self.combo_neon_preset.addItem("Пользовательский", None)
+        lay_neon.addRow("Профиль", self.combo_neon_preset)
+
+        self.sld_neon_size = QtWidgets.QSlider(QtCore.Qt.Horizontal, self)
+        self.sld_neon_size.setRange(0, 200)
+        self.sld_neon_size.setValue(int(appdata.CONFIG.get("neon_size", 10)))
+        self.lbl_neon_size = QtWidgets.QLabel(str(self.sld_neon_size.value()), self)
+        lay_neon_size = QtWidgets.QHBoxLayout()
+        lay_neon_size.addWidget(self.sld_neon_size, 1)
+        lay_neon_size.addWidget(self.lbl_neon_size)
+        lay_neon.addRow("Размер", lay_neon_size)
+
+        self.sld_neon_thickness = QtWidgets.QSlider(QtCore.Qt.Horizontal, self)
+        self.sld_neon_thickness.setRange(0, 10)
+        self.sld_neon_thickness.setValue(int(appdata.CONFIG.get("neon_thickness", 1)))
+        self.lbl_neon_thickness = QtWidgets.QLabel(
+            str(self.sld_neon_thickness.value()), self
+        )
+        lay_neon_thickness = QtWidgets.QHBoxLayout()
+        lay_neon_thickness.addWidget(self.sld_neon_thickness, 1)
+        lay_neon_thickness.addWidget(self.lbl_neon_thickness)
+        lay_neon.addRow("Толщина", lay_neon_thickness)
+
+        self.sld_neon_intensity = QtWidgets.QSlider(QtCore.Qt.Horizontal, self)
+        self.sld_neon_intensity.setRange(0, 255)
+        self.sld_neon_intensity.setValue(int(appdata.CONFIG.get("neon_intensity", 255)))
+        self.lbl_neon_intensity = QtWidgets.QLabel(
+            str(self.sld_neon_intensity.value()), self
+        )
+        lay_neon_intensity = QtWidgets.QHBoxLayout()
+        lay_neon_intensity.addWidget(self.sld_neon_intensity, 1)
+        lay_neon_intensity.addWidget(self.lbl_neon_intensity)
+        lay_neon.addRow("Интенсивность", lay_neon_intensity)
+        form_interface.addRow(grp_neon)
+        self._neon_controls = (
+            self.sld_neon_size,
+            self.sld_neon_thickness,
+            self.sld_neon_intensity,
+            self.combo_neon_preset,
+        )
+
+        self._block_neon_preset_sync = False
+        self.combo_neon_preset.currentIndexChanged.connect(self._apply_neon_preset)
+        self.sld_neon_size.valueChanged.connect(self._handle_neon_value_change)
+        self.sld_neon_thickness.valueChanged.connect(self._handle_neon_value_change)
+        self.sld_neon_intensity.valueChanged.connect(self._handle_neon_value_change)
+        self._update_neon_labels()
+        self._sync_neon_preset_to_values()
+
+
+        supported = filter_supported_families(
+            QtGui.QFontDatabase.families(),
+            "Qt font database",
+            emit_warnings=False,
+        )
+        fallback_family, _ = ensure_supported_family(
+            "Exo 2", source="ui/fallback", fallback="Exo 2"
+        )
+        if fallback_family not in supported:
+            supported.add(fallback_family)
+        self._supported_font_families = supported
+        self._fallback_font_family = fallback_family
+
+        self.font_header = QtWidgets.QFontComboBox(self)
+        self._prepare_font_combo(self.font_header)
+        header_initial, _ = ensure_supported_family(
+            appdata.CONFIG.get("header_font", appdata.CONFIG.get("font_family", fallback_family)),
+            source="ui/header",
+            fallback=fallback_family,
+        )
+        self._set_combo_font(self.font_header, header_initial)
+        self.font_header.currentFontChanged.connect(
+            lambda font: self._handle_font_combo_changed(
+                "header_font", self.font_header, font, apply_header=True
+            )
+        )
+        form_interface.addRow("Шрифт заголовков", self.font_header)
+
+        self.font_text = QtWidgets.QFontComboBox(self)
+        self._prepare_font_combo(self.font_text)
+        text_initial, _ = ensure_supported_family(
+            appdata.CONFIG.get("text_font", appdata.CONFIG.get("font_family", fallback_family)),
+            source="ui/text",
+            fallback=fallback_family,
+        )
+        self._set_combo_font(self.font_text, text_initial)
+        self.font_text.currentFontChanged.connect(
+            lambda font: self._handle_font_combo_changed(
+                "text_font", self.font_text, font
+            )
+        )
+        form_interface.addRow("Шрифт текста", self.font_text)
+
+        self.font_sidebar = QtWidgets.QFontComboBox(self)
+        self._prepare_font_combo(self.font_sidebar)
+        sidebar_initial, _ = ensure_supported_family(
+            appdata.CONFIG.get("sidebar_font", header_initial),
+            source="ui/sidebar",
+            fallback=header_initial,
+        )
+        self._set_combo_font(self.font_sidebar, sidebar_initial)
+        self.font_sidebar.currentFontChanged.connect(
+            lambda font: self._handle_font_combo_changed(
+                "sidebar_font", self.font_sidebar, font, refresh_sidebar=True
+            )
+        )
+        form_interface.addRow("Шрифт боковой панели", self.font_sidebar)
+
+        path_lay = QtWidgets.QHBoxLayout()
+        self.edit_path = QtWidgets.QLineEdit(appdata.CONFIG.get("save_path", appdata.DATA_DIR), self)
+        self.edit_path.editingFinished.connect(self._save_config)
+        btn_browse = StyledPushButton("...", self, **appdata.button_config())
+        btn_browse.clicked.connect(self.browse_path)
+        path_lay.addWidget(self.edit_path, 1)
+        path_lay.addWidget(btn_browse)
+        form_interface.addRow("Путь сохранения", path_lay)
+
+        self.combo_storage_backend = QtWidgets.QComboBox(self)
+        self.combo_storage_backend.addItem("JSON-файлы", "json")
+        self.combo_storage_backend.addItem("SQLite", "sqlite")
+        backend_index = self.combo_storage_backend.findData(
+            appdata.CONFIG.get("storage_backend", "json")
+        )
+        self.combo_storage_backend.setCurrentIndex(max(0, backend_index))
+        self.combo_storage_backend.currentIndexChanged.connect(lambda _: self._save_config())
+        form_interface.addRow("Хранилище данных", self.combo_storage_backend)
+
+        # --- Иконки ---
+        tab_icons = QtWidgets.QWidget()
+        form_icons = QtWidgets.QFormLayout(tab_icons)
+        icon_files = [
+            f for f in os.listdir(appdata.ASSETS) if f.lower().endswith((".png", ".ico"))
+        ]
+
+        # sidebar icon
+        self.combo_sidebar_icon = QtWidgets.QComboBox(self)
+        for f in icon_files:
+            path = os.path.join(appdata.ASSETS, f)
+            self.combo_sidebar_icon.addItem(QtGui.QIcon(path), f, path)
+        current_sidebar = appdata.CONFIG.get("sidebar_icon", appdata.ICON_TOGGLE)
+        idx = self.combo_sidebar_icon.findData(current_sidebar)
+        if idx < 0 and os.path.isfile(current_sidebar):
+            self.combo_sidebar_icon.addItem(
+                QtGui.QIcon(current_sidebar), os.path.basename(current_sidebar), current_sidebar
+            )
+            idx = self.combo_sidebar_icon.count() - 1
+        if idx >= 0:
+            self.combo_sidebar_icon.setCurrentIndex(idx)
+        self.combo_sidebar_icon.currentIndexChanged.connect(lambda _: self._save_config())
+        btn_sidebar_browse = StyledPushButton("Обзор…", self, **appdata.button_config())
+        btn_sidebar_browse.clicked.connect(
+            lambda: self.browse_icon(self.combo_sidebar_icon)
+        )
+        lay_sidebar = QtWidgets.QHBoxLayout()
+        lay_sidebar.addWidget(self.combo_sidebar_icon, 1)
+        lay_sidebar.addWidget(btn_sidebar_browse)
+        form_icons.addRow("Иконка боковой панели", lay_sidebar)
+
+        # application icon
+        self.combo_app_icon = QtWidgets.QComboBox(self)
+        for f in icon_files:
+            path = os.path.join(appdata.ASSETS, f)
+            self.combo_app_icon.addItem(QtGui.QIcon(path), f, path)
+        current_app = appdata.CONFIG.get("app_icon", appdata.ICON_TOGGLE)
+        idx = self.combo_app_icon.findData(current_app)
+        if idx < 0 and os.path.isfile(current_app):
+            self.combo_app_icon.addItem(
+                QtGui.QIcon(current_app), os.path.basename(current_app), current_app
+            )
+            idx = self.combo_app_icon.count() - 1
+        if idx >= 0:
+            self.combo_app_icon.setCurrentIndex(idx)
+        self.combo_app_icon.currentIndexChanged.connect(lambda _: self._save_config())
+        btn_app_browse = StyledPushButton("Обзор…", self, **appdata.button_config())
+        btn_app_browse.clicked.connect(
+            lambda: self.browse_icon(self.combo_app_icon)
+        )
+        lay_app = QtWidgets.QHBoxLayout()
+        lay_app.addWidget(self.combo_app_icon, 1)
+        lay_app.addWidget(btn_app_browse)
+        form_icons.addRow("Иконка приложения", lay_app)
+
+        hint = QtWidgets.QLabel("Размер иконок: 20×20 px", self)
+        hint.setAlignment(QtCore.Qt.AlignCenter)
+        form_icons.addRow(hint)
+        tabs.addTab(tab_icons, "Иконки")
+
+        # General options below tabs
+        form_gen = QtWidgets.QFormLayout()
+        main_lay.addLayout(form_gen)
+        self.spin_day_rows = QtWidgets.QSpinBox(self)
+        self.spin_day_rows.setRange(1, 20)
+        day_rows = appdata.CONFIG.get("day_rows")
+        if not isinstance(day_rows, int) or day_rows < 1:
+            day_rows = appdata.DAY_ROWS_DEFAULT
+        self.spin_day_rows.setValue(day_rows)
+        self.spin_day_rows.setAttribute(QtCore.Qt.WA_Hover, True)
+        self.spin_day_rows.setFixedWidth(self.spin_day_rows.sizeHint().width() + 20)
+        self.spin_day_rows.setButtonSymbols(QtWidgets.QAbstractSpinBox.NoButtons)
+        self._apply_spin_day_rows_style()
+        self.spin_day_rows.valueChanged.connect(lambda _: self._save_config())
+        form_gen.addRow("Строк на день", self.spin_day_rows)
+        self.combo_calendar_mode = QtWidgets.QComboBox(self)
+        self.combo_calendar_mode.addItem("Вложенные таблицы", "widgets")
+        self.combo_calendar_mode.addItem("Модель (быстрый)", "model")
+        mode_index = self.combo_calendar_mode.findData(
+            appdata.CONFIG.get("calendar_mode", "widgets")
+        )
+        self.combo_calendar_mode.setCurrentIndex(max(0, mode_index))
+        self.combo_calendar_mode.currentIndexChanged.connect(lambda _: self._save_config())
+        form_gen.addRow("Режим календаря", self.combo_calendar_mode)
+
+        box = QtWidgets.QDialogButtonBox(self)
+        btn_save = StyledPushButton("Сохранить", self, **appdata.button_config())
+        btn_save.setIcon(icon("save"))
+        btn_save.setIconSize(QtCore.QSize(20, 20))
+        btn_save.setFixedSize(btn_save.sizeHint())
+        btn_cancel = StyledPushButton("Отмена", self, **appdata.button_config())
+        btn_cancel.setIcon(icon("x"))
+        btn_cancel.setIconSize(QtCore.QSize(20, 20))
+        btn_cancel.setFixedSize(btn_cancel.sizeHint())
+        box.addButton(btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
+        box.addButton(btn_cancel, QtWidgets.QDialogButtonBox.RejectRole)
+        box.accepted.connect(self.accept)
+        box.rejected.connect(self.reject)
+        main_lay.addWidget(box)
+
+        self._settings = QtCore.QSettings("rabota2", "rabota2")
+        geom = self._settings.value("SettingsDialog/geometry", type=QtCore.QByteArray)
+        if geom is not None:
+            self.restoreGeometry(geom)
+
+        apply_neon_to_inputs(self)
+        self._update_neon_controls_effects()
+        # Fields and settings as shown; see reopen().
+        self._baseline = self._shown_state()
+
+    def closeEvent(self, event):
+        self._settings.setValue("SettingsDialog/geometry", self.saveGeometry())
+        self._settings.sync()
+        super().closeEvent(event)
+
+    def browse_path(self):
+        path = QtWidgets.QFileDialog.getExistingDirectory(
+            self, "Выбрать папку", self.edit_path.text()
+        )
+        if path:
+            self.edit_path.setText(path)
+            self._save_config()
+
+    def browse_icon(self, combo: QtWidgets.QComboBox):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self,
+            "Выберите иконку",
+            "",
+            "Image Files (*.png *.ico)",
+        )
+        if path:
+            idx = combo.findData(path)
+            if idx < 0:
+                combo.addItem(QtGui.QIcon(path), os.path.basename(path), path)
+                idx = combo.count() - 1
+            combo.setCurrentIndex(idx)
+            self._save_config()
+
+    def _build_spin_day_rows_style(self) -> str:
+        background = self._workspace_color.name()
+        accent = self._accent_color.name()
+        thickness = self.sld_neon_thickness.value() if hasattr(self, 'sld_neon_thickness') else appdata.CONFIG.get("neon_thickness", 1)
+        return theme_registry.build_input_neon_style("QSpinBox", background=background, accent=accent, thickness=thickness)
+
+    def _apply_spin_day_rows_style(self) -> None:
+        if not hasattr(self, 'spin_day_rows'):
+            return
+        style = self._build_spin_day_rows_style()
+        self.spin_day_rows.setStyleSheet(style)
+        self.spin_day_rows.setAttribute(QtCore.Qt.WA_Hover, True)
+
+    def _collect_config(self):
+        return {
+            "neon": True,
+            "neon_size": self.sld_neon_size.value(),
+            "neon_thickness": self.sld_neon_thickness.value(),
+            "neon_intensity": self.sld_neon_intensity.value(),
+            "accent_color": self._accent_color.name(),
+            "gradient_colors": [self._grad_color1.name(), self._grad_color2.name()],
+            "gradient_angle": self.sld_grad_angle.value(),
+            "workspace_color": self._workspace_color.name(),
+            "sidebar_color": self._sidebar_color.name(),
+            "font_family": self.font_text.currentFont().family(),
+            "header_font": self.font_header.currentFont().family(),
+            "text_font": self.font_text.currentFont().family(),
+            "sidebar_font": self.font_sidebar.currentFont().family(),
+            "sidebar_icon": self.combo_sidebar_icon.currentData(),
+            "app_icon": self.combo_app_icon.currentData(),
+            "day_rows": self.spin_day_rows.value(),
+            "calendar_mode": self.combo_calendar_mode.currentData() or "widgets",
+            "save_path": self.edit_path.text().strip() or appdata.DATA_DIR,
+            "storage_backend": self.combo_storage_backend.currentData() or "json",
+        }
+
+    def reopen(self) -> bool:
+        """Reuse the dialog while its fields still show the stored settings.
+
+        Edits dismissed with "Отмена" or settings changed elsewhere make the
+        caller build a fresh dialog.
+        """
+
+        return self._shown_state() == self._baseline
+
+    def _shown_state(self) -> tuple:
+        fields = self._collect_config()
+        return fields, {key: appdata.CONFIG.get(key) for key in fields}
+
+    def _on_sidebar_font_changed(self):
+        self._handle_font_combo_changed(
+            "sidebar_font",
+            self.font_sidebar,
+            self.font_sidebar.currentFont(),
+            refresh_sidebar=True,
+        )
+
+    def _prepare_font_combo(self, combo: QtWidgets.QFontComboBox) -> None:
+        """Restrict *combo* to supported font families."""
+
+        model = combo.model()
+        row = 0
+        while row < model.rowCount():
+            index = model.index(row, combo.modelColumn())
+            family = index.data(QtCore.Qt.DisplayRole)
+            if family not in self._supported_font_families:
+                model.removeRow(row)
+            else:
+                row += 1
+
+    def _set_combo_font(self, combo: QtWidgets.QFontComboBox, family: str) -> None:
+        """Assign *family* to *combo* without emitting signals."""
+
+        blocker = QtCore.QSignalBlocker(combo)
+        combo.setCurrentFont(QtGui.QFont(family))
+        del blocker
+
+    def _apply_header_font_update(self, family: str) -> None:
+        """Apply header font changes to the main window immediately."""
+
+        theme_manager.set_header_font(family)
+        parent = self.parent()
+        if parent and hasattr(parent, "table"):
+            parent.table.apply_fonts()
+            if hasattr(parent, "topbar"):
+                parent.topbar.update_labels()
+
+    def _handle_font_combo_changed(
+        self,
+        key: str,
+        combo: QtWidgets.QFontComboBox,
+        font: QtGui.QFont,
+        *,
+        apply_header: bool = False,
+        refresh_sidebar: bool = False,
+    ) -> None:
+        """Validate the chosen font and update configuration."""
+
+        family = font.family()
+        supported, missing = family_support_details(family)
+        if not supported:
+            missing_label = missing or "необходимый"
+            message = (
+                f"Шрифт «{family}» не поддерживается: отсутствует {missing_label} набор символов. "
+                f"Будет использован «{self._fallback_font_family}»."
+            )
+            QtWidgets.QMessageBox.warning(self, "Недоступный шрифт", message)
+            blocker = QtCore.QSignalBlocker(combo)
+            combo.setCurrentFont(QtGui.QFont(self._fallback_font_family))
+            del blocker
+            family = self._fallback_font_family
+
+        valid_family, _ = ensure_supported_family(
+            family,
+            source=f"ui/{key}",
+            fallback=self._fallback_font_family,
+        )
+        if key == "text_font":
+            appdata.CONFIG["font_family"] = valid_family
+        appdata.CONFIG[key] = valid_family
+        self._save_config()
+
+        if apply_header:
+            self._apply_header_font_update(valid_family)
+        if refresh_sidebar:
+            self._refresh_color_previews()
+            if self.main_window and hasattr(self.main_window, "sidebar"):
+                self.main_window.sidebar.apply_fonts()
+
+    def _on_neon_changed(self):
+        self._save_config()
+        parent = self.parent()
+        if parent is not None and hasattr(parent, "apply_settings"):
+            parent.apply_settings()
+
+    def _current_neon_values(self) -> tuple[int, int, int]:
+        return (
+            self.sld_neon_size.value(),
+            self.sld_neon_thickness.value(),
+            self.sld_neon_intensity.value(),
+        )
+
+    def _update_neon_labels(self) -> None:
+        self.lbl_neon_size.setText(str(self.sld_neon_size.value()))
+        self.lbl_neon_thickness.setText(str(self.sld_neon_thickness.value()))
+        self.lbl_neon_intensity.setText(str(self.sld_neon_intensity.value()))
+
+    def _sync_neon_preset_to_values(self) -> None:
+        values = self._current_neon_values()
+        idx = next(
+            (
+                i
+                for i, (_, preset) in enumerate(self._neon_presets)
+                if preset == values
+            ),
+            self._neon_custom_index,
+        )
+        self.combo_neon_preset.blockSignals(True)
+        self.combo_neon_preset.setCurrentIndex(idx)
+        self.combo_neon_preset.blockSignals(False)
+
+    def _handle_neon_value_change(self, *_):
+        self._update_neon_labels()
+        if self._block_neon_preset_sync:
+            return
+        self._sync_neon_preset_to_values()
+        self._on_neon_changed()
+
+    def _apply_neon_preset(self, index: int) -> None:
+        values = self.combo_neon_preset.itemData(index)
+        if not isinstance(values, tuple):
+            self._sync_neon_preset_to_values()
+            self._on_neon_changed()
+            return
+        self._block_neon_preset_sync = True
+        try:
+            self.sld_neon_size.setValue(values[0])
+            self.sld_neon_thickness.setValue(values[1])
+            self.sld_neon_intensity.setValue(values[2])
+        finally:
+            self._block_neon_preset_sync = False
+        self._update_neon_labels()
+        self._sync_neon_preset_to_values()
+        self._on_neon_changed()
+
+    def _update_neon_controls_effects(self) -> None:
+        for widget in getattr(self, "_neon_controls", ()):
+            if widget is None or not shiboken6.isValid(widget):
+                continue
+            apply_neon_effect(widget, True, border=True, config=appdata.CONFIG)
+
+    def _save_config(self):
+        config = self._collect_config()
+        appdata.CONFIG.update(config)
+        self._apply_spin_day_rows_style()
+        storage.write_json(appdata.CONFIG_PATH, appdata.CONFIG)
+        update_neon_filters(self, appdata.CONFIG)
+        self._update_neon_controls_effects()
+        self._refresh_color_previews()
+        self._baseline = self._shown_state()
+        self.settings_changed.emit()
+
+    def save(self) -> None:
+        """Public method to persist configuration changes."""
+        self._save_config()
+
+    def apply_fonts(self):
+        """Save and apply new header font immediately."""
+
+        self._handle_font_combo_changed(
+            "header_font",
+            self.font_header,
+            self.font_header.currentFont(),
+            apply_header=True,
+        )
+
+    def accept(self):
+        self._save_config()
+        theme_manager.set_text_font(self.font_text.currentFont().family())
+        theme_manager.set_header_font(self.font_header.currentFont().family())
+        parent = self.parent()
+        if parent and hasattr(parent, "table"):
+            parent.table.apply_fonts()
+            if hasattr(parent, "topbar"):
+                parent.topbar.update_labels()
+        super().accept()
+
+    def _on_accent_changed(self, idx):
+        other_index = self.combo_accent.count() - 1
+        if idx == other_index:
+            color = QtWidgets.QColorDialog.getColor(
+                self._accent_color, self, "Цвет"
+            )
+            if color.isValid():
+                self._accent_color = color
+                pix = QtGui.QPixmap(16, 16)
+                pix.fill(color)
+                self.combo_accent.setItemIcon(idx, QtGui.QIcon(pix))
+                self._accent_index = idx
+            else:
+                self.combo_accent.blockSignals(True)
+                self.combo_accent.setCurrentIndex(self._accent_index)
+                self.combo_accent.blockSignals(False)
+        else:
+            self._accent_color = self._preset_colors[idx][1]
+            self._accent_index = idx
+        self._save_config()
+        self._refresh_color_previews()
+
+    def _register_color_preview(
+        self, button: QtWidgets.QAbstractButton, attr_name: str
+    ) -> None:
+        """Attach *button* to an attribute storing ``QColor`` value."""
+
+        self._color_preview_links[button] = attr_name
+        button.setCursor(QtCore.Qt.PointingHandCursor)
+        self._refresh_color_previews(button)
+
+    def _style_color_preview(
+        self, button: QtWidgets.QAbstractButton, color: QtGui.QColor
+    ) -> None:
+        """Apply themed style and neon handling to a preview button."""
+
+        accent = QtGui.QColor(appdata.CONFIG.get("accent_color", "#39ff14")).name()
+        workspace = QtGui.QColor(appdata.CONFIG.get("workspace_color", "#1e1e21")).name()
+        fill = color.name()
+        shared_rules = (
+            f"background:{fill};"
+            f"border:2px solid {accent};"
+            "border-radius:12px;"
+            "padding:6px 12px;"
+            f"color:{workspace};"
+            "min-height:28px;"
+        )
+        style = (
+            f"QPushButton{{{shared_rules}}}"
+            f"QPushButton:hover{{{shared_rules}}}"
+            f"QPushButton:focus{{{shared_rules}}}"
+        )
+        button.setStyleSheet(style)
+        button.setAttribute(QtCore.Qt.WA_Hover, True)
+        palette = button.palette()
+        palette.setColor(QtGui.QPalette.Highlight, QtGui.QColor(accent))
+        button.setPalette(palette)
+
+        register_neon(button, appdata.CONFIG)
+
+        effect = getattr(button, "_neon_effect", None)
+        if effect is not None and shiboken6.isValid(effect):
+            button._neon_prev_style = None
+            apply_neon_effect(button, True, config=appdata.CONFIG)
+        else:
+            button._neon_prev_style = style
+
+    def _refresh_color_previews(
+        self, *buttons: QtWidgets.QAbstractButton,
+    ) -> None:
+        """Rebuild style for registered color preview buttons."""
+
+        targets = buttons or tuple(self._color_preview_links)
+        for button in targets:
+            attr_name = self._color_preview_links.get(button)
+            if attr_name is None:
+                continue
+            color = getattr(self, attr_name, None)
+            if isinstance(color, QtGui.QColor) and color.isValid():
+                self._style_color_preview(button, color)
+
+    def _update_workspace_button(self):
+        self._refresh_color_previews(self.btn_workspace)
+
+    def choose_workspace_color(self):
+        color = QtWidgets.QColorDialog.getColor(
+            self._workspace_color, self, "Цвет"
+        )
+        if color.isValid():
+            self._workspace_color = color
+            self._save_config()
+            self._refresh_color_previews(self.btn_workspace)
+            parent = self.parent()
+            if parent is not None and hasattr(parent, "apply_settings"):
+                parent.apply_settings()
+
+    def _update_sidebar_button(self):
+        self._refresh_color_previews(self.btn_sidebar)
+
+    def choose_sidebar_color(self):
+        color = QtWidgets.QColorDialog.getColor(
+            self._sidebar_color, self, "Цвет"
+        )
+        if color.isValid():
+            self._sidebar_color = color
+            self._save_config()
+            self._refresh_color_previews(self.btn_sidebar)
+
+    def _update_grad_buttons(self):
+        self._refresh_color_previews(self.btn_grad1, self.btn_grad2)
+
+    def choose_grad_color(self, idx):
+        color = QtWidgets.QColorDialog.getColor(
+            self._grad_color1 if idx == 1 else self._grad_color2,
+            self,
+            "Цвет",
+        )
+        if color.isValid():
+            if idx == 1:
+                self._grad_color1 = color
+            else:
+                self._grad_color2 = color
+            self._save_config()
+            self._refresh_color_previews(
+                self.btn_grad1 if idx == 1 else self.btn_grad2
+            )
+            parent = self.parent()
+            if parent is not None and hasattr(parent, "apply_settings"):
+                parent.apply_settings()
@@ -0,0 +1,385 @@
+"""SQLite storage backend.
+
+Keeps the same logical data as the JSON folders under ``save_path`` in one
+``rabota2.sqlite3`` file:
+
+* ``month_rows`` – calendar entries of ``months/YYYY-MM.json``;
+* ``stats_records`` – records of ``<year>/stats/<year>.json``;
+* ``release_rows`` – entries of ``<year>/release/MM.json``;
+* ``year_values`` – manual analytics values of ``<year>/year/<year>.json``;
+* ``top_results`` – saved tops of ``<year>/top/<year>.json``.
+
+Primary keys start with ``(year, month, day)`` (or ``(year, month)`` for
+stats) and so double as the period indexes; ``work`` columns have their own
+indexes.  :meth:`SqliteStore.import_json` and :meth:`SqliteStore.export_json`
+convert between the database and the folder layout in both directions.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+import changelog
+import storage
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "rabota2.sqlite3"
+MONTH_FIELDS = ("work", "plan", "done")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS month_rows (
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    work TEXT NOT NULL DEFAULT '',
+    plan TEXT NOT NULL DEFAULT '',
+    done TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (year, month, day, position)
+);
+CREATE INDEX IF NOT EXISTS month_rows_work ON month_rows (work);
+
+CREATE TABLE IF NOT EXISTS stats_records (
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    work TEXT NOT NULL DEFAULT '',
+    record TEXT NOT NULL,
+    PRIMARY KEY (year, month, position)
+);
+CREATE INDEX IF NOT EXISTS stats_records_work ON stats_records (work);
+
+CREATE TABLE IF NOT EXISTS release_rows (
+    year INTEGER NOT NULL,
+    month INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    work TEXT NOT NULL DEFAULT '',
+    chapters INTEGER NOT NULL DEFAULT 0,
+    time TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (year, month, day, position)
+);
+CREATE INDEX IF NOT EXISTS release_rows_work ON release_rows (work);
+
+CREATE TABLE IF NOT EXISTS year_values (
+    year INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS top_results (
+    year INTEGER NOT NULL,
+    period TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (year, period)
+);
+"""
+
+_MONTH_FILE = re.compile(r"^(\d{4})-(\d{2})\.json$")
+_RELEASE_FILE = re.compile(r"^(\d{2})\.json$")
+
+
+def _read_json(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _month_row(row: Any) -> Dict[str, str]:
+    if isinstance(row, dict):
+        return {key: str(row.get(key, "") or "") for key in MONTH_FIELDS}
+    if isinstance(row, list):
+        return {key: str(row[i]) if i < len(row) else "" for i, key in enumerate(MONTH_FIELDS)}
+    return {key: "" for key in MONTH_FIELDS}
+
+
+class SqliteStore:
+    """Thread-safe access to the SQLite database of one ``save_path``."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Used from the GUI thread and the autosave/prefetch workers; every
+        # access is serialized through ``_lock``.
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # --- months ----------------------------------------------------------
+    def load_month(self, year: int, month: int) -> Dict[int, List[Dict[str, str]]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, work, plan, done FROM month_rows"
+                " WHERE year = ? AND month = ? ORDER BY day, position",
+                (year, month),
+            ).fetchall()
+        days: Dict[int, List[Dict[str, str]]] = {}
+        for day, work, plan, done in rows:
+            days.setdefault(day, []).append({"work": work, "plan": plan, "done": done})
+        return days
+
+    def _set_month_day(self, year: int, month: int, day: int, rows: Iterable[Any]) -> None:
+        self._conn.execute(
+            "DELETE FROM month_rows WHERE year = ? AND month = ? AND day = ?",
+            (year, month, day),
+        )
+        self._conn.executemany(
+            "INSERT INTO month_rows (year, month, day, position, work, plan, done)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (year, month, day, pos, r["work"], r["plan"], r["done"])
+                for pos, r in enumerate(_month_row(row) for row in rows)
+            ],
+        )
+
+    def apply_month_entries(self, year: int, entries: Iterable[Dict[str, Any]]) -> None:
+        """Apply :mod:`changelog` day entries of ``year`` in one transaction."""
+
+        with self._lock, self._conn:
+            for entry in entries:
+                rows = entry.get("value") if entry.get("op") == "set" else []
+                self._set_month_day(
+                    year, int(entry["month"]), int(entry["item"]), rows or []
+                )
+
+    def replace_month(self, year: int, month: int, days: Dict[int, List[Any]]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM month_rows WHERE year = ? AND month = ?", (year, month)
+            )
+            for day, rows in days.items():
+                self._set_month_day(year, month, int(day), rows)
+
+    # --- stats -----------------------------------------------------------
+    def load_stats(self, year: int) -> Dict[str, List[Dict[str, Any]]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT month, record FROM stats_records WHERE year = ?"
+                " ORDER BY month, position",
+                (year,),
+            ).fetchall()
+        data: Dict[str, List[Dict[str, Any]]] = {}
+        for month, record in rows:
+            data.setdefault(str(month), []).append(json.loads(record))
+        return data
+
+    def set_stats_record(self, year: int, month: int, index: int, record: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stats_records (year, month, position, work, record)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (year, month, index, str(record.get("work", "")), json.dumps(record, ensure_ascii=False)),
+            )
+
+    def replace_stats(self, year: int, data: Dict[str, List[Dict[str, Any]]]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM stats_records WHERE year = ?", (year,))
+            for month, records in data.items():
+                for index, record in enumerate(records or []):
+                    self.set_stats_record(year, int(month), index, record)
+
+    # --- releases --------------------------------------------------------
+    def load_release(self, year: int, month: int) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT day, work, chapters, time FROM release_rows"
+                " WHERE year = ? AND month = ? ORDER BY day, position",
+                (year, month),
+            ).fetchall()
+        if not rows:
+            return {}
+        days: Dict[str, List[Dict[str, Any]]] = {}
+        for day, work, chapters, time_text in rows:
+            days.setdefault(str(day), []).append(
+                {"work": work, "chapters": chapters, "time": time_text}
+            )
+        works = sorted({work for _day, work, _c, _t in rows})
+        return {"works": works, "days": days}
+
+    def save_release(self, year: int, month: int, data: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM release_rows WHERE year = ? AND month = ?", (year, month)
+            )
+            params = []
+            for day, entries in (data.get("days") or {}).items():
+                for pos, entry in enumerate(entries or []):
+                    try:
+                        chapters = int(entry.get("chapters", 0) or 0)
+                    except (TypeError, ValueError):
+                        chapters = 0
+                    params.append(
+                        (year, month, int(day), pos, str(entry.get("work", "")),
+                         chapters, str(entry.get("time", "")))
+                    )
+            self._conn.executemany(
+                "INSERT INTO release_rows (year, month, day, position, work, chapters, time)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                params,
+            )
+
+    # --- analytics and tops ---------------------------------------------
+    def load_year_values(self, year: int) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM year_values WHERE year = ?", (year,)
+            ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def save_year_values(self, year: int, data: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO year_values (year, data) VALUES (?, ?)",
+                (year, json.dumps(data, ensure_ascii=False)),
+            )
+
+    def load_top(self, year: int) -> Dict[str, Any]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT period, data FROM top_results WHERE year = ?", (year,)
+            ).fetchall()
+        return {period: json.loads(data) for period, data in rows}
+
+    def save_top(self, year: int, data: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM top_results WHERE year = ?", (year,))
+            self._conn.executemany(
+                "INSERT INTO top_results (year, period, data) VALUES (?, ?, ?)",
+                [(year, k, json.dumps(v, ensure_ascii=False)) for k, v in data.items()],
+            )
+
+    # --- JSON folders ----------------------------------------------------
+    def import_json(self, base: str) -> None:
+        """Replace the database content with the JSON folders under ``base``."""
+
+        with self._lock, self._conn:
+            for table in ("month_rows", "stats_records", "release_rows", "year_values", "top_results"):
+                self._conn.execute(f"DELETE FROM {table}")
+            months_dir = os.path.join(base, "months")
+            found: Dict[Tuple[int, int], Dict[int, List[Any]]] = {}
+            log_years: Set[int] = set()
+            if os.path.isdir(months_dir):
+                for name in os.listdir(months_dir):
+                    match = _MONTH_FILE.match(name)
+                    stem = name[: -len(changelog.LOG_SUFFIX)]
+                    if match:
+                        data = _read_json(os.path.join(months_dir, name))
+                        found[(int(match.group(1)), int(match.group(2)))] = {
+                            int(k): v for k, v in (data.get("days") or {}).items()
+                        }
+                    elif name.endswith(changelog.LOG_SUFFIX) and stem.isdigit():
+                        log_years.add(int(stem))
+            for year in log_years:
+                log = changelog.YearLog(changelog.log_path(months_dir, year))
+                for entry in log.entries():
+                    days = found.setdefault((year, int(entry.get("month", 0))), {})
+                    changelog.apply_day_entries(days, [entry])
+            for (year, month), days in found.items():
+                for day, rows in days.items():
+                    self._set_month_day(year, month, day, rows)
+            for year, year_path in self._year_dirs(base):
+                stats_dir = os.path.join(year_path, "stats")
+                stats_path = os.path.join(stats_dir, f"{year}.json")
+                stats = _read_json(stats_path) if os.path.exists(stats_path) else {}
+                changelog.apply_record_entries(
+                    stats, changelog.YearLog(changelog.log_path(stats_dir, year)).entries()
+                )
+                self.replace_stats(year, stats)
+                release_dir = os.path.join(year_path, "release")
+                if os.path.isdir(release_dir):
+                    for name in os.listdir(release_dir):
+                        match = _RELEASE_FILE.match(name)
+                        if match:
+                            self.save_release(
+                                year, int(match.group(1)), _read_json(os.path.join(release_dir, name))
+                            )
+                values_path = os.path.join(year_path, "year", f"{year}.json")
+                if os.path.exists(values_path):
+                    self.save_year_values(year, _read_json(values_path))
+                top_path = os.path.join(year_path, "top", f"{year}.json")
+                if os.path.exists(top_path):
+                    self.save_top(year, _read_json(top_path))
+
+    @staticmethod
+    def _year_dirs(base: str) -> List[Tuple[int, str]]:
+        if not os.path.isdir(base):
+            return []
+        return [
+            (int(name), os.path.join(base, name))
+            for name in sorted(os.listdir(base))
+            if name.isdigit() and os.path.isdir(os.path.join(base, name))
+        ]
+
+    def export_json(self, base: str) -> None:
+        """Write the database back into the JSON folders under ``base``.
+
+        Files of months, stats and releases missing from the database are
+        rewritten empty, and pending change logs are dropped, so the folders
+        match the database exactly.
+        """
+
+        with self._lock:
+            months: Set[Tuple[int, int]] = set(
+                self._conn.execute("SELECT DISTINCT year, month FROM month_rows").fetchall()
+            )
+            stats_years = {y for (y,) in self._conn.execute("SELECT DISTINCT year FROM stats_records")}
+            releases: Set[Tuple[int, int]] = set(
+                self._conn.execute("SELECT DISTINCT year, month FROM release_rows").fetchall()
+            )
+            value_years = [y for (y,) in self._conn.execute("SELECT year FROM year_values")]
+            top_years = [y for (y,) in self._conn.execute("SELECT DISTINCT year FROM top_results")]
+
+            months_dir = os.path.join(base, "months")
+            if os.path.isdir(months_dir):
+                for name in os.listdir(months_dir):
+                    match = _MONTH_FILE.match(name)
+                    if match:
+                        months.add((int(match.group(1)), int(match.group(2))))
+            for year, year_path in self._year_dirs(base):
+                if os.path.exists(os.path.join(year_path, "stats", f"{year}.json")):
+                    stats_years.add(year)
+                release_dir = os.path.join(year_path, "release")
+                if os.path.isdir(release_dir):
+                    for name in os.listdir(release_dir):
+                        match = _RELEASE_FILE.match(name)
+                        if match:
+                            releases.add((year, int(match.group(1))))
+
+            for year, month in sorted(months):
+                days = {str(d): rows for d, rows in self.load_month(year, month).items()}
+                storage.write_json(
+                    os.path.join(months_dir, f"{year:04d}-{month:02d}.json"),
+                    {"year": year, "month": month, "days": days},
+                )
+            for year in {y for y, _m in months}:
+                changelog.YearLog(changelog.log_path(months_dir, year)).clear()
+            for year in sorted(stats_years):
+                stats_dir = os.path.join(base, str(year), "stats")
+                storage.write_json(os.path.join(stats_dir, f"{year}.json"), self.load_stats(year))
+                changelog.YearLog(changelog.log_path(stats_dir, year)).clear()
+            for year, month in sorted(releases):
+                data = self.load_release(year, month) or {"works": [], "days": {}}
+                storage.write_json(
+                    os.path.join(base, str(year), "release", f"{month:02d}.json"), data
+                )
+            for year in value_years:
+                storage.write_json(
+                    os.path.join(base, str(year), "year", f"{year}.json"),
+                    self.load_year_values(year),
+                )
+            for year in top_years:
+                storage.write_json(
+                    os.path.join(base, str(year), "top", f"{year}.json"), self.load_top(year)
+                )
@@ -0,0 +1,328 @@
+"""Startup phase profiler.
+
+Launch the application with ``--profile-startup`` (or set
+``RABOTA2_PROFILE_STARTUP=1``) to time the named startup phases.  Each
+phase records wall and CPU time, the number of live widgets and QObjects
+at its end and the peak of Python allocations inside it.  The report is
+written as JSON lines to ``logs/startup-<timestamp>.jsonl``; with
+``--cprofile`` a ``.prof`` dump of the whole startup is stored beside it.
+The ``first_paint`` entry is the time from the import until the main
+window was painted for the first time.
+
+Two reports are compared with::
+
+    python app/startup_profiler.py compare OLD.jsonl NEW.jsonl
+
+which prints the per-phase difference and exits with status 1 when a phase
+got slower than the threshold.
+
+The module is imported first by ``main.py`` so that the import of the
+application itself is measured as the ``import`` phase.
+"""
+
+from __future__ import annotations
+
+import argparse
+import cProfile
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+_IMPORTED_AT = time.perf_counter()
+_IMPORTED_CPU = time.process_time()
+
+FLAG = "--profile-startup"
+CPROFILE_FLAG = "--cprofile"
+ENV_FLAG = "RABOTA2_PROFILE_STARTUP"
+# Set by run.py to the launcher's ``time.time()`` to cover its own checks.
+LAUNCH_ENV = "RABOTA2_LAUNCH_TIME"
+LOG_DIR = os.path.join(os.path.dirname(__file__), "..", "logs")
+
+DEFAULT_THRESHOLD = 10.0  # percent
+MIN_DELTA_MS = 5.0
+
+
+def _qt_counts() -> Dict[str, int]:
+    """Return the number of live widgets and QObjects."""
+
+    try:
+        from PySide6 import QtCore, QtWidgets
+    except ImportError:  # pragma: no cover - PySide6 is a hard dependency
+        return {}
+    app = QtWidgets.QApplication.instance()
+    if app is None:
+        return {"widgets": 0, "qobjects": 0}
+    widgets = QtWidgets.QApplication.allWidgets()
+    qobjects = len(app.findChildren(QtCore.QObject)) + 1
+    for window in QtWidgets.QApplication.topLevelWidgets():
+        if window.parent() is None:
+            qobjects += len(window.findChildren(QtCore.QObject)) + 1
+    return {"widgets": len(widgets), "qobjects": qobjects}
+
+
+class StartupProfiler:
+    """Collects timed startup phases while :attr:`enabled`."""
+
+    def __init__(self, enabled: bool = False, *, cprofile: bool = False) -> None:
+        self.enabled = enabled
+        self.records: List[Dict[str, Any]] = []
+        # Open phases as [name, highest allocation peak of finished children].
+        self._stack: List[list] = []
+        self._origin = _IMPORTED_AT
+        self._profile: Optional[cProfile.Profile] = None
+        self._finished = False
+        if enabled:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            if cprofile:
+                self._profile = cProfile.Profile()
+                self._profile.enable()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as phase ``name``; phases may nest."""
+
+        if not self.enabled or self._finished:
+            yield
+            return
+        parent = self._stack[-1] if self._stack else None
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # Keep the parent's peak so far before measuring this phase alone.
+            if parent is not None:
+                parent[1] = max(parent[1], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+        frame = [name, 0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            peak = None
+            if tracing and tracemalloc.is_tracing():
+                peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+                if parent is not None:
+                    parent[1] = max(parent[1], peak)
+            self.record(
+                name,
+                wall=time.perf_counter() - start,
+                cpu=time.process_time() - cpu,
+                start=start,
+                parent=parent[0] if parent is not None else None,
+                py_peak=peak,
+            )
+
+    def record(
+        self,
+        name: str,
+        *,
+        wall: float,
+        cpu: float,
+        start: Optional[float] = None,
+        parent: Optional[str] = None,
+        py_peak: Optional[int] = None,
+    ) -> None:
+        """Add a phase measured elsewhere (times in seconds, peak in bytes)."""
+
+        if not self.enabled or self._finished:
+            return
+        if start is None:
+            start = self._origin
+        entry: Dict[str, Any] = {
+            "type": "phase",
+            "phase": name,
+            "parent": parent,
+            "start_ms": round((start - self._origin) * 1000, 3),
+            "wall_ms": round(wall * 1000, 3),
+            "cpu_ms": round(cpu * 1000, 3),
+        }
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            entry["py_current_kb"] = round(current / 1024, 1)
+            entry["py_peak_kb"] = round((py_peak if py_peak is not None else peak) / 1024, 1)
+        entry.update(_qt_counts())
+        self.records.append(entry)
+
+    def mark(self, name: str) -> float:
+        """Record ``name`` as a phase from the start of the import until now.
+
+        Returns the elapsed seconds, also when profiling is disabled.
+        """
+
+        elapsed = time.perf_counter() - self._origin
+        self.record(name, wall=elapsed, cpu=time.process_time() - _IMPORTED_CPU)
+        return elapsed
+
+    def record_import(self) -> None:
+        """Record the ``launcher`` and ``import`` phases up to now."""
+
+        now = time.perf_counter()
+        launched = os.environ.get(LAUNCH_ENV)
+        if launched:
+            try:
+                # Wall time from the launcher start until this module loaded.
+                offset = time.time() - (now - _IMPORTED_AT) - float(launched)
+            except ValueError:
+                offset = None
+            if offset is not None and offset >= 0:
+                self.record("launcher", wall=offset, cpu=0.0, start=_IMPORTED_AT - offset)
+        self.record(
+            "import", wall=now - _IMPORTED_AT, cpu=time.process_time() - _IMPORTED_CPU
+        )
+
+    def finish(self, directory: str = LOG_DIR) -> Optional[str]:
+        """Write the report and return its path (``None`` when disabled)."""
+
+        if not self.enabled or self._finished:
+            return None
+        total = {
+            "type": "total",
+            "wall_ms": round((time.perf_counter() - self._origin) * 1000, 3),
+            "cpu_ms": round(time.process_time() * 1000, 3),
+        }
+        if tracemalloc.is_tracing():
+            total["py_peak_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+            tracemalloc.stop()
+        total.update(_qt_counts())
+        self._finished = True
+        os.makedirs(directory, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(directory, f"startup-{stamp}.jsonl")
+        header = {
+            "type": "run",
+            "started": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+        }
+        with open(path, "w", encoding="utf-8") as fh:
+            for line in [header, *self.records, total]:
+                fh.write(json.dumps(line, ensure_ascii=False) + "\n")
+        if self._profile is not None:
+            self._profile.disable()
+            self._profile.dump_stats(os.path.splitext(path)[0] + ".prof")
+        return path
+
+
+PROFILER = StartupProfiler(
+    FLAG in sys.argv or os.environ.get(ENV_FLAG) == "1",
+    cprofile=CPROFILE_FLAG in sys.argv,
+)
+
+
+def phase(name: str):
+    """Time a block as phase ``name`` of :data:`PROFILER`."""
+
+    return PROFILER.phase(name)
+
+
+# --- reports ----------------------------------------------------------------
+
+
+def load_report(path: str) -> Dict[str, Dict[str, float]]:
+    """Return ``{phase: {"wall_ms", "cpu_ms", "count"}}`` plus ``"total"``."""
+
+    phases: Dict[str, Dict[str, float]] = {}
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if entry.get("type") == "phase":
+                name = entry["phase"]
+            elif entry.get("type") == "total":
+                name = "total"
+            else:
+                continue
+            slot = phases.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0, "count": 0})
+            slot["wall_ms"] += float(entry.get("wall_ms", 0.0))
+            slot["cpu_ms"] += float(entry.get("cpu_ms", 0.0))
+            slot["count"] += 1
+    return phases
+
+
+def compare_reports(
+    old: Dict[str, Dict[str, float]],
+    new: Dict[str, Dict[str, float]],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """Diff two loaded reports phase by phase.
+
+    A phase is a regression when its wall time grew by more than
+    ``threshold`` percent and by at least :data:`MIN_DELTA_MS`.
+    """
+
+    rows: List[Dict[str, Any]] = []
+    names = list(old) + [name for name in new if name not in old]
+    for name in names:
+        before = old.get(name, {}).get("wall_ms")
+        after = new.get(name, {}).get("wall_ms")
+        delta = None if before is None or after is None else after - before
+        percent = None
+        if delta is not None and before:
+            percent = delta / before * 100
+        regression = (
+            delta is not None
+            and delta >= MIN_DELTA_MS
+            and (percent is None or percent > threshold)
+        )
+        rows.append(
+            {
+                "phase": name,
+                "old_ms": before,
+                "new_ms": after,
+                "delta_ms": delta,
+                "percent": percent,
+                "regression": regression,
+            }
+        )
+    return rows
+
+
+def _fmt(value: Optional[float], signed: bool = False, suffix: str = "") -> str:
+    if value is None:
+        return "—"
+    return f"{value:+.1f}{suffix}" if signed else f"{value:.1f}{suffix}"
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Render :func:`compare_reports` rows as a text table."""
+
+    width = max([len("phase")] + [len(row["phase"]) for row in rows])
+    lines = [f"{'phase':<{width}}  {'old ms':>10}  {'new ms':>10}  {'delta':>10}  {'%':>8}"]
+    for row in rows:
+        mark = "  <-- regression" if row["regression"] else ""
+        lines.append(
+            f"{row['phase']:<{width}}  {_fmt(row['old_ms']):>10}  {_fmt(row['new_ms']):>10}"
+            f"  {_fmt(row['delta_ms'], True):>10}  {_fmt(row['percent'], True, '%'):>8}{mark}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Startup profile reports")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compare = commands.add_parser("compare", help="сравнить два отчёта запуска")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="допустимый рост времени фазы, %%",
+    )
+    args = parser.parse_args(argv)
+    rows = compare_reports(load_report(args.old), load_report(args.new), args.threshold)
+    print(format_comparison(rows))
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,465 @@
+"""Monthly statistics dialog and its entry form."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Dict, List
+
+from PySide6 import QtWidgets, QtGui, QtCore
+import shiboken6
+
+import theme_registry
+from stats_model import StatsRecordModel, StatsSortProxy
+from widgets import read_sort_settings, StyledPushButton
+from resources import icon
+from effects import (
+    apply_neon_effect,
+    register_neon,
+    update_neon_filters,
+    update_neon_glow,
+)
+import appdata
+
+logger = logging.getLogger(__name__)
+
+
+class StatsEntryForm(QtWidgets.QWidget):
+    """Форма для ввода/редактирования статистики месяца."""
+
+    # ключ, заголовок, класс виджета
+    INPUT_FIELDS = [
+        ("work", "Работа", QtWidgets.QLineEdit),
+        ("status", "Статус", QtWidgets.QLineEdit),
+        ("adult", "18+", QtWidgets.QCheckBox),
+        ("total_chapters", "Всего глав", QtWidgets.QSpinBox),
+        ("chars_per_chapter", "Знаков глава", QtWidgets.QSpinBox),
+        ("planned", "Запланировано", QtWidgets.QSpinBox),
+        ("chapters", "Сделано глав", QtWidgets.QSpinBox),
+        ("progress", "Прогресс перевода", QtWidgets.QDoubleSpinBox),
+        ("release", "Выпуск", QtWidgets.QLineEdit),
+        ("profit", "Профит", QtWidgets.QDoubleSpinBox),
+        ("ads", "Затраты на рекламу", QtWidgets.QDoubleSpinBox),
+        ("views", "Просмотры", QtWidgets.QSpinBox),
+        ("likes", "Лайки", QtWidgets.QSpinBox),
+        ("thanks", "Спасибо", QtWidgets.QSpinBox),
+    ]
+
+    # колонки таблицы: все поля + вычисляемое "chars"
+    TABLE_COLUMNS = [(key, label) for key, label, _ in INPUT_FIELDS] + [
+        ("chars", "Знаков"),
+    ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setSizePolicy(
+            QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding
+        )
+        form = QtWidgets.QFormLayout(self)
+        form.setFieldGrowthPolicy(QtWidgets.QFormLayout.AllNonFixedFieldsGrow)
+        self._styled_inputs: list[tuple[QtWidgets.QWidget, str]] = []
+        self.widgets = {}
+        for key, label, cls in self.INPUT_FIELDS:
+            w = cls(self)
+            if isinstance(w, QtWidgets.QSpinBox):
+                w.setRange(0, 1_000_000_000)
+                w.setFixedWidth(w.sizeHint().width() + 20)
+            else:
+                w.setMinimumWidth(w.sizeHint().width())
+            if isinstance(w, QtWidgets.QDoubleSpinBox):
+                w.setRange(0, 1_000_000_000)
+                w.setDecimals(2)
+            if key == "progress" and isinstance(w, QtWidgets.QDoubleSpinBox):
+                w.setRange(0, 100)
+                w.setSuffix("%")
+            if isinstance(w, QtWidgets.QComboBox):
+                w.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
+            form.addRow(label, w)
+            self.widgets[key] = w
+            w.setAttribute(QtCore.Qt.WA_Hover, True)
+            selector: str | None = None
+            if isinstance(w, QtWidgets.QDoubleSpinBox):
+                selector = "QDoubleSpinBox"
+            elif isinstance(w, QtWidgets.QSpinBox):
+                selector = "QSpinBox"
+            elif isinstance(w, QtWidgets.QLineEdit):
+                selector = "QLineEdit"
+            if selector is not None:
+                self._styled_inputs.append((w, selector))
+            if key != "adult":  # avoid framing the entire row for checkbox
+                register_neon(w, appdata.CONFIG)
+
+        self.refresh_theme()
+
+    def get_record(self) -> Dict[str, int | float | str | bool]:
+        record: Dict[str, int | float | str | bool] = {}
+        for key, _, _ in self.INPUT_FIELDS:
+            w = self.widgets[key]
+            if isinstance(w, QtWidgets.QLineEdit):
+                record[key] = w.text().strip()
+            elif isinstance(w, QtWidgets.QCheckBox):
+                record[key] = w.isChecked()
+            else:  # spinboxes
+                record[key] = w.value()
+        record["chars"] = record["chapters"] * record["chars_per_chapter"]
+        return record
+
+    def set_record(self, record: Dict[str, int | float | str | bool]):
+        for key, _, _ in self.INPUT_FIELDS:
+            w = self.widgets[key]
+            val = record.get(key)
+            if isinstance(w, QtWidgets.QLineEdit):
+                w.setText(str(val) if val is not None else "")
+            elif isinstance(w, QtWidgets.QCheckBox):
+                w.setChecked(bool(val))
+            else:
+                w.setValue(val if isinstance(val, (int, float)) else 0)
+
+    def clear(self):
+        for key, _, _ in self.INPUT_FIELDS:
+            w = self.widgets[key]
+            if isinstance(w, QtWidgets.QLineEdit):
+                w.clear()
+            elif isinstance(w, QtWidgets.QCheckBox):
+                w.setChecked(False)
+            else:
+                w.setValue(0)
+
+    def refresh_theme(self) -> None:
+        """Rebuild input styles based on the current configuration."""
+
+        workspace = QtGui.QColor(appdata.CONFIG.get("workspace_color", "#1e1e21")).name()
+        accent = QtGui.QColor(appdata.CONFIG.get("accent_color", "#39ff14")).name()
+        try:
+            thickness = int(appdata.CONFIG.get("neon_thickness", 1))
+        except (TypeError, ValueError):
+            thickness = 1
+        thickness = max(0, thickness)
+
+        compiled = theme_registry.theme(
+            accent=accent, workspace=workspace, thickness=thickness
+        )
+        for widget, selector in self._styled_inputs:
+            if widget is None or not shiboken6.isValid(widget):
+                continue
+            # Each input keeps its own sheet: the neon toggle restores it.
+            sheet = compiled.get("input", selector, 8)
+            if getattr(widget, "_neon_effect", None) is not None:
+                widget._neon_prev_style = sheet
+                apply_neon_effect(widget, True, config=appdata.CONFIG)
+            else:
+                theme_registry.apply_style(widget, sheet)
+
+        update_neon_filters(self, appdata.CONFIG)
+
+
+class StatsDialog(QtWidgets.QDialog):
+    """Диалог для просмотра и редактирования статистики месяца."""
+
+    def __init__(self, year: int, month: int, parent=None):
+        super().__init__(parent)
+        self.setObjectName("StatsDialog")
+        self.setWindowTitle("Вводные данные")
+        self.resize(800, 500)
+
+        lay = QtWidgets.QVBoxLayout(self)
+        self.stats_model = StatsRecordModel(StatsEntryForm.TABLE_COLUMNS, self)
+        self.stats_proxy = StatsSortProxy(self)
+        self.stats_proxy.setSourceModel(self.stats_model)
+        self.table_stats = QtWidgets.QTableView(self)
+        self.table_stats.setModel(self.stats_proxy)
+        self.table_stats.setFocusPolicy(QtCore.Qt.StrongFocus)
+        self.table_stats.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table_stats.setSelectionBehavior(QtWidgets.QTableView.SelectRows)
+        self.table_stats.setSelectionMode(QtWidgets.QTableView.SingleSelection)
+        header = self.table_stats.horizontalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        header.setTextElideMode(QtCore.Qt.ElideNone)
+        header.setMinimumSectionSize(50)
+        header.setStretchLastSection(True)
+        self.table_stats.setSortingEnabled(True)
+        self.table_stats.verticalHeader().setVisible(False)
+        self.table_stats.verticalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.Stretch
+        )
+        self.table_stats.selectionModel().selectionChanged.connect(
+            self.on_table_selection
+        )
+        lay.addWidget(self.table_stats)
+
+        self._apply_table_style()
+
+        self.setAttribute(QtCore.Qt.WA_StyledBackground, True)
+        self.setAutoFillBackground(True)
+        self._apply_dialog_style()
+
+        self.form_stats = StatsEntryForm(self)
+        lay.addWidget(self.form_stats)
+
+        self.btn_box = QtWidgets.QDialogButtonBox(self)
+        self.btn_save = StyledPushButton("Сохранить", self, **appdata.button_config())
+        self.btn_save.setIcon(icon("save"))
+        self.btn_save.setIconSize(QtCore.QSize(20, 20))
+        self.btn_close = StyledPushButton("Закрыть", self, **appdata.button_config())
+        self.btn_close.setIcon(icon("x"))
+        self.btn_close.setIconSize(QtCore.QSize(20, 20))
+        for btn in (self.btn_save, self.btn_close):
+            btn.setFixedSize(btn.sizeHint())
+            btn.setStyleSheet(btn.styleSheet() + "border:1px solid transparent;")
+            btn.setAttribute(QtCore.Qt.WA_Hover, True)
+            register_neon(btn, appdata.CONFIG)
+        self.btn_box.addButton(self.btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
+        self.btn_box.addButton(self.btn_close, QtWidgets.QDialogButtonBox.RejectRole)
+        self.btn_box.accepted.connect(self.save_record)
+        self.btn_box.rejected.connect(self.reject)
+        lay.addWidget(self.btn_box)
+        lay.setStretch(0, 2)
+        lay.setStretch(1, 1)
+
+        self.current_index = None
+        self.year = year
+        self.month = month
+        self._settings = QtCore.QSettings("rabota2", "rabota2")
+        self._saved_sort: tuple[int, QtCore.Qt.SortOrder] | None = read_sort_settings(
+            self._settings, "StatsDialog"
+        )
+        header.sortIndicatorChanged.connect(self._on_sort_changed)
+        geom = self._settings.value("StatsDialog/geometry", type=QtCore.QByteArray)
+        if geom is not None:
+            self.restoreGeometry(geom)
+        self.load_stats(year, month)
+        sizes = self._settings.value("StatsDialog/columns", type=list)
+        for i, w in enumerate(sizes or []):
+            try:
+                self.table_stats.setColumnWidth(i, int(w))
+            except (TypeError, ValueError):
+                pass  # пропустить некорректное значение
+        self._apply_saved_sort()
+
+    def _apply_table_style(self) -> None:
+        """Собрать стили для таблицы и заголовка с учётом конфигурации."""
+
+        workspace = QtGui.QColor(appdata.CONFIG.get("workspace_color", "#1e1e21")).name()
+        accent = QtGui.QColor(appdata.CONFIG.get("accent_color", "#39ff14")).name()
+
+        compiled = theme_registry.theme(accent=accent, workspace=workspace)
+        table_style = compiled.get("dialog_table", True, "QTableView")
+
+        header_style = compiled.get("dialog_header", 8)
+
+        theme_registry.apply_style(self.table_stats, table_style)
+        header = self.table_stats.horizontalHeader()
+        theme_registry.apply_style(header, header_style)
+
+        highlight = QtGui.QColor(accent)
+        table_palette = self.table_stats.palette()
+        table_palette.setColor(QtGui.QPalette.Highlight, highlight)
+        self.table_stats.setPalette(table_palette)
+
+        header_palette = header.palette()
+        header_palette.setColor(QtGui.QPalette.Highlight, highlight)
+        header.setPalette(header_palette)
+
+        self.table_stats.setAttribute(QtCore.Qt.WA_Hover, True)
+        self.table_stats.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
+        header.setAttribute(QtCore.Qt.WA_Hover, True)
+
+        register_neon(self.table_stats, appdata.CONFIG)
+        register_neon(header, appdata.CONFIG)
+
+        apply_neon_effect(self.table_stats, True, config=appdata.CONFIG)
+        apply_neon_effect(header, True, shadow=False, border=False, config=appdata.CONFIG)
+
+    def _apply_dialog_style(self) -> None:
+        """Обновить палитру и обёртку диалога под текущую тему."""
+
+        workspace_color = QtGui.QColor(appdata.CONFIG.get("workspace_color", "#1e1e21"))
+        accent_color = QtGui.QColor(appdata.CONFIG.get("accent_color", "#39ff14"))
+
+        palette = QtGui.QPalette(self.palette())
+        for role in (
+            QtGui.QPalette.Window,
+            QtGui.QPalette.Base,
+            QtGui.QPalette.Button,
+            QtGui.QPalette.AlternateBase,
+        ):
+            palette.setColor(role, workspace_color)
+        text_color = QtGui.QColor("#f0f0f0")
+        palette.setColor(QtGui.QPalette.WindowText, text_color)
+        palette.setColor(QtGui.QPalette.Text, text_color)
+        palette.setColor(QtGui.QPalette.ButtonText, text_color)
+        palette.setColor(QtGui.QPalette.Highlight, accent_color)
+        palette.setColor(QtGui.QPalette.HighlightedText, QtGui.QColor("#000000"))
+        self.setPalette(palette)
+
+        base_style = theme_registry.theme(
+            accent=accent_color.name(), workspace=workspace_color.name()
+        ).get("frame", "StatsDialog")
+        theme_registry.apply_style(self, base_style)
+        # Только тень: цвет текста дочерних элементов не переопределяется.
+        if not update_neon_glow(self, 0.45, config=appdata.CONFIG):
+            apply_neon_effect(
+                self,
+                True,
+                shadow=True,
+                border=False,
+                intensity_scale=0.45,
+                thickness_scale=0.0,
+                config=appdata.CONFIG,
+            )
+            theme_registry.apply_style(self, base_style)
+        self._neon_prev_style = base_style
+
+    def refresh_theme(self) -> None:
+        """Обновить стили таблицы и формы ввода."""
+
+        self._apply_dialog_style()
+        self._apply_table_style()
+        if hasattr(self, "form_stats"):
+            self.form_stats.refresh_theme()
+        update_neon_filters(self.btn_box, appdata.CONFIG)
+
+    def resizeEvent(self, event):
+        self.table_stats.horizontalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.Interactive
+        )
+        super().resizeEvent(event)
+
+    def on_table_selection(self):
+        selection_model = self.table_stats.selectionModel()
+        if selection_model is None:
+            return
+
+        indexes = selection_model.selectedRows()
+        if indexes:
+            self.current_index = self.stats_proxy.source_row(indexes[0].row())
+            record = self.stats_model.record(self.current_index)
+            if record is not None:
+                self.form_stats.set_record(record)
+                return
+        # Nothing selected or out of range
+        self.current_index = None
+        self.form_stats.clear()
+
+    def reopen(self, year: int, month: int) -> bool:
+        """Show ``month`` again, re-reading it only if it changed since."""
+
+        if (year, month) != (self.year, self.month) or (
+            appdata.stats_signature(year) != self._stats_stamp
+        ):
+            self.load_stats(year, month)
+        else:
+            self.table_stats.clearSelection()
+            self.current_index = None
+            self.form_stats.clear()
+        return True
+
+    def load_stats(self, year: int, month: int):
+        self.year = year
+        self.month = month
+        self._stats_stamp = appdata.stats_signature(year)
+        path = os.path.join(appdata.stats_dir(year), f"{year}.json")
+        try:
+            data = appdata.load_stats_data(year)
+        except json.JSONDecodeError as exc:
+            logger.error("Failed to parse stats data from '%s': %s", path, exc)
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Ошибка",
+                "Данные повреждены или нечитаемы.",
+            )
+            data = {}
+        self.stats_model.set_records(data.get(str(month), []))
+        self.table_stats.resizeColumnsToContents()
+        self._update_scroll_policy()
+        self.current_index = None
+        self.form_stats.clear()
+        self._apply_saved_sort()
+
+    @property
+    def records(self) -> List[Dict[str, int | float | str | bool]]:
+        return self.stats_model.records
+
+    def save_record(self):
+        record = self.form_stats.get_record()
+        index = self.current_index
+        if index is None:
+            index = len(self.records)
+        appdata.save_stats_record(self.year, self.month, index, record)
+        self._stats_stamp = appdata.stats_signature(self.year)
+        # Only the saved row changes; the proxy moves it to its sorted place.
+        if index < len(self.records):
+            self.stats_model.set_record(index, record)
+        else:
+            index = self.stats_model.append_record(record)
+        self._fit_columns_to_row(index)
+        self.table_stats.clearSelection()
+        self.current_index = None
+        self.form_stats.clear()
+
+    def _fit_columns_to_row(self, row: int) -> None:
+        """Widen the columns that are too narrow for source ``row``."""
+
+        header = self.table_stats.horizontalHeader()
+        last = header.count() - 1
+        widened = False
+        for column in range(header.count()):
+            if column == last and header.stretchLastSection():
+                continue
+            index = self.stats_proxy.mapFromSource(self.stats_model.index(row, column))
+            width = self.table_stats.sizeHintForIndex(index).width()
+            if width > header.sectionSize(column):
+                header.resizeSection(column, width)
+                widened = True
+        if widened:
+            self._update_scroll_policy()
+
+    def _update_scroll_policy(self) -> None:
+        header = self.table_stats.horizontalHeader()
+        total_width = sum(header.sectionSize(i) for i in range(header.count()))
+        if total_width <= self.table_stats.viewport().width():
+            self.table_stats.setHorizontalScrollBarPolicy(
+                QtCore.Qt.ScrollBarAlwaysOff
+            )
+        else:
+            self.table_stats.setHorizontalScrollBarPolicy(
+                QtCore.Qt.ScrollBarAsNeeded
+            )
+
+    def closeEvent(self, event):
+        if self.current_index is not None or any(
+            self.form_stats.get_record().values()
+        ):
+            self.save_record()
+        self._settings.setValue("StatsDialog/geometry", self.saveGeometry())
+        cols = [
+            int(self.table_stats.columnWidth(i))
+            for i in range(self.stats_model.columnCount())
+        ]
+        self._settings.setValue("StatsDialog/columns", cols)
+        header = self.table_stats.horizontalHeader()
+        self._settings.setValue("StatsDialog/sortSection", int(header.sortIndicatorSection()))
+        self._settings.setValue(
+            "StatsDialog/sortOrder", int(header.sortIndicatorOrder().value)
+        )
+        self._settings.sync()
+        super().closeEvent(event)
+
+    def _on_sort_changed(self, section: int, order: QtCore.Qt.SortOrder) -> None:
+        self._saved_sort = (int(section), QtCore.Qt.SortOrder(order))
+
+    def _apply_saved_sort(self) -> None:
+        if not self.table_stats.isSortingEnabled():
+            return
+        section_order = self._saved_sort
+        if section_order is None:
+            header = self.table_stats.horizontalHeader()
+            section_order = (
+                int(header.sortIndicatorSection()),
+                QtCore.Qt.SortOrder(header.sortIndicatorOrder()),
+            )
+        section, order = section_order
+        if 0 <= section < self.stats_model.columnCount():
+            self.table_stats.sortByColumn(section, order)
+            self._saved_sort = (section, order)
@@ -0,0 +1,127 @@
+"""Model/view backing of the monthly statistics table.
+
+:class:`StatsDialog` used to rebuild a ``QTableWidgetItem`` for every cell
+of the month after each saved record.  :class:`StatsRecordModel` keeps the
+records of one month in their file order and reports a single changed or
+inserted row, while :class:`StatsSortProxy` sorts them for the view.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Sequence, Tuple
+
+from PySide6 import QtCore
+
+Record = Dict[str, int | float | str | bool]
+
+RecordRole = QtCore.Qt.UserRole + 1
+SortRole = QtCore.Qt.UserRole + 2
+
+
+class StatsRecordModel(QtCore.QAbstractTableModel):
+    """Records of a month × ``columns`` (``(key, title)`` pairs)."""
+
+    def __init__(
+        self,
+        columns: Sequence[Tuple[str, str]],
+        parent: QtCore.QObject | None = None,
+    ):
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._records: List[Record] = []
+
+    # --- Qt model API ---------------------------------------------------
+    def rowCount(self, parent=QtCore.QModelIndex()):  # noqa: N802 - Qt API
+        if parent.isValid():
+            return 0
+        return len(self._records)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):  # noqa: N802 - Qt API
+        if parent.isValid():
+            return 0
+        return len(self._columns)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._records)):
+            return None
+        record = self._records[index.row()]
+        if role == RecordRole:
+            return dict(record)
+        value = record.get(self._columns[index.column()][0], "")
+        if role == QtCore.Qt.DisplayRole:
+            if isinstance(value, bool):
+                return "✓" if value else ""
+            if isinstance(value, (int, float)):
+                return value
+            return str(value)
+        if role in (QtCore.Qt.EditRole, SortRole):
+            # booleans sort as numbers, like the former item data did
+            return int(value) if isinstance(value, bool) else value
+        if role == QtCore.Qt.TextAlignmentRole:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return int(QtCore.Qt.AlignCenter)
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):  # noqa: N802
+        if (
+            orientation == QtCore.Qt.Horizontal
+            and role == QtCore.Qt.DisplayRole
+            and 0 <= section < len(self._columns)
+        ):
+            return self._columns[section][1]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    # --- records --------------------------------------------------------
+    @property
+    def records(self) -> List[Record]:
+        return self._records
+
+    def record(self, row: int) -> Record | None:
+        if 0 <= row < len(self._records):
+            return self._records[row]
+        return None
+
+    def set_records(self, records: Sequence[Record]) -> None:
+        """Replace all records, e.g. when another month is loaded."""
+
+        self.beginResetModel()
+        self._records = [dict(rec) for rec in records]
+        self.endResetModel()
+
+    def set_record(self, row: int, record: Record) -> None:
+        """Replace the record at ``row`` and report that row only."""
+
+        if not (0 <= row < len(self._records)):
+            raise IndexError(row)
+        self._records[row] = dict(record)
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, len(self._columns) - 1)
+        )
+
+    def append_record(self, record: Record) -> int:
+        """Add ``record`` after the others and return its row."""
+
+        row = len(self._records)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._records.append(dict(record))
+        self.endInsertRows()
+        return row
+
+
+class StatsSortProxy(QtCore.QSortFilterProxyModel):
+    """Sorts the records by :data:`SortRole` and re-sorts edited rows."""
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self.setSortRole(SortRole)
+        self.setDynamicSortFilter(True)
+
+    def source_row(self, row: int) -> int:
+        """Row of the source model shown at proxy ``row``."""
+
+        return self.mapToSource(self.index(row, 0)).row()
@@ -0,0 +1,187 @@
+"""Crash-safe writes for the JSON stores.
+
+Every store (months, releases, stats, analytics, tops and ``config.json``)
+goes through :func:`write_json`.  A write first records the full payload in
+a journal file next to the target, then writes a temporary file, fsyncs it
+and atomically renames it over the target before dropping the journal.  A
+crash at any point leaves either the old file or the new one, never a
+truncated mix; :func:`recover` finishes or discards whatever a crash left
+behind.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal"
+TEMP_SUFFIX = ".tmp"
+
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(path, threading.Lock())
+
+
+def journal_path(path: str) -> str:
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}{JOURNAL_SUFFIX}")
+
+
+def _temp_path(path: str) -> str:
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}{TEMP_SUFFIX}")
+
+
+def _fsync_dir(directory: str) -> None:
+    if os.name == "nt":  # directories cannot be opened for fsync on Windows
+        return
+    try:
+        fd = os.open(directory or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_synced(path: str, text: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _checksum(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _replace(path: str, text: str) -> None:
+    tmp = _temp_path(path)
+    _write_synced(tmp, text)
+    os.replace(tmp, path)
+    _fsync_dir(os.path.dirname(path))
+
+
+def write_text(path: str, text: str) -> None:
+    """Atomically replace ``path`` with ``text`` through the journal."""
+
+    path = os.path.abspath(path)
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    journal = journal_path(path)
+    entry = json.dumps(
+        {"target": os.path.basename(path), "checksum": _checksum(text), "payload": text},
+        ensure_ascii=False,
+    )
+    with _lock_for(path):
+        _write_synced(journal, entry)
+        _fsync_dir(directory)
+        _replace(path, text)
+        os.remove(journal)
+
+
+def write_json(path: str, data: Any) -> None:
+    """Serialize ``data`` the way the stores always did and write it safely."""
+
+    write_text(path, json.dumps(data, ensure_ascii=False, indent=2))
+
+
+def _recover_journal(journal: str) -> bool:
+    """Replay a complete journal entry; return ``True`` if it was applied."""
+
+    directory, name = os.path.split(journal)
+    target = os.path.join(directory, name[1 : -len(JOURNAL_SUFFIX)])
+    applied = False
+    try:
+        with open(journal, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        payload = entry["payload"]
+        if (
+            entry.get("target") == os.path.basename(target)
+            and entry.get("checksum") == _checksum(payload)
+        ):
+            with _lock_for(target):
+                _replace(target, payload)
+            applied = True
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    if applied:
+        logger.info("Replayed journal for %s", target)
+    else:
+        logger.warning("Discarded incomplete journal for %s", target)
+    try:
+        os.remove(journal)
+    except OSError:
+        pass
+    return applied
+
+
+def recover_file(path: str) -> bool:
+    """Finish or discard an interrupted write of a single ``path``."""
+
+    path = os.path.abspath(path)
+    tmp = _temp_path(path)
+    if os.path.exists(tmp):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+    journal = journal_path(path)
+    if os.path.exists(journal):
+        return _recover_journal(journal)
+    return False
+
+
+def recover(locations: Iterable[Tuple[str, str]]) -> List[str]:
+    """Finish or discard interrupted writes of the known store files.
+
+    ``locations`` pairs a directory with a regular expression of the file
+    names written there.  Only those directories are listed (not walked) and
+    only ``.<name>.journal``/``.<name>.tmp`` leftovers of matching names are
+    touched: complete journals are replayed, torn ones and temporary files
+    removed.  Returns the paths whose journal was replayed.
+    """
+
+    replayed: List[str] = []
+    seen = set()
+    for directory, pattern in locations:
+        directory = os.path.abspath(directory)
+        if (directory, pattern) in seen:
+            continue
+        seen.add((directory, pattern))
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            continue
+        target_name = re.compile(pattern)
+        for name in names:
+            if not name.startswith("."):
+                continue
+            for suffix in (TEMP_SUFFIX, JOURNAL_SUFFIX):
+                if name.endswith(suffix) and target_name.fullmatch(name[1 : -len(suffix)]):
+                    break
+            else:
+                continue
+            full = os.path.join(directory, name)
+            if suffix == TEMP_SUFFIX:
+                try:
+                    os.remove(full)
+                except OSError:
+                    pass
+            elif _recover_journal(full):
+                replayed.append(os.path.join(directory, name[1 : -len(suffix)]))
+    return replayed
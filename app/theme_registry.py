@@ -0,0 +1,396 @@
+"""Compiled stylesheets per theme snapshot.
+
+Dialogs, the calendar and its day cells used to rebuild their QSS by string
+concatenation on every theme refresh and push it with ``setStyleSheet``,
+re-polishing each widget even when nothing changed.  Here every stylesheet
+is produced by a named builder from a :class:`ThemeSnapshot` and kept in the
+snapshot's :class:`CompiledTheme`, so a theme is compiled once.  Per-widget
+state (e.g. a calendar day outside the month) is expressed through dynamic
+properties in a shared stylesheet and toggled with :func:`set_style_state`.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+from PySide6 import QtGui, QtWidgets
+
+THEME_CAPACITY = 8
+
+Builder = Callable[..., str]
+_BUILDERS: Dict[str, Builder] = {}
+
+
+@dataclass(frozen=True)
+class ThemeSnapshot:
+    """Everything a stylesheet may depend on, as plain hashable values."""
+
+    accent: str = "#39ff14"
+    workspace: str = "#1e1e21"
+    text: str = "#f0f0f0"
+    thickness: int = 1
+    radius: int = 12
+
+
+def stylesheet(name: str) -> Callable[[Builder], Builder]:
+    """Register ``fn(snapshot, *args) -> str`` as the builder ``name``."""
+
+    def decorator(fn: Builder) -> Builder:
+        _BUILDERS[name] = fn
+        return fn
+
+    return decorator
+
+
+class CompiledTheme:
+    """Stylesheets of one snapshot, built on first use and then reused."""
+
+    def __init__(self, snapshot: ThemeSnapshot) -> None:
+        self.snapshot = snapshot
+        self._sheets: Dict[Tuple[str, tuple], str] = {}
+
+    def get(self, name: str, *args: Any) -> str:
+        key = (name, args)
+        sheet = self._sheets.get(key)
+        if sheet is None:
+            sheet = _BUILDERS[name](self.snapshot, *args)
+            self._sheets[key] = sheet
+        return sheet
+
+    def __len__(self) -> int:
+        return len(self._sheets)
+
+
+class ThemeRegistry:
+    """LRU of compiled themes keyed by snapshot."""
+
+    def __init__(self, capacity: int = THEME_CAPACITY) -> None:
+        self._capacity = max(1, capacity)
+        self._themes: "OrderedDict[ThemeSnapshot, CompiledTheme]" = OrderedDict()
+
+    def compile(self, snapshot: ThemeSnapshot) -> CompiledTheme:
+        theme = self._themes.get(snapshot)
+        if theme is None:
+            theme = CompiledTheme(snapshot)
+            self._themes[snapshot] = theme
+            while len(self._themes) > self._capacity:
+                self._themes.popitem(last=False)
+        else:
+            self._themes.move_to_end(snapshot)
+        return theme
+
+    def clear(self) -> None:
+        self._themes.clear()
+
+
+THEMES = ThemeRegistry()
+
+
+def theme(**values: Any) -> CompiledTheme:
+    """Return the compiled theme of a snapshot built from ``values``."""
+
+    return THEMES.compile(ThemeSnapshot(**values))
+
+
+def apply_style(widget: QtWidgets.QWidget, sheet: str) -> bool:
+    """Set ``sheet`` on ``widget`` unless it is already there.
+
+    Returns ``True`` when the widget was re-polished.
+    """
+
+    if widget.styleSheet() == sheet:
+        return False
+    widget.setStyleSheet(sheet)
+    return True
+
+
+def set_style_state(widget: QtWidgets.QWidget, name: str, value: Any) -> bool:
+    """Flip the dynamic property ``name`` and re-polish ``widget``.
+
+    Stylesheet rules selecting on ``[name="..."]`` then take effect without
+    any new QSS text.  Returns ``False`` if the value did not change.
+    """
+
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
+    return True
+
+
+# --- builders ---------------------------------------------------------------
+
+
+@stylesheet("input")
+def _input(snapshot: ThemeSnapshot, selector: str, radius: int) -> str:
+    # ``snapshot.workspace`` is the control background, ``thickness`` raw.
+    border = max(0, snapshot.thickness)
+    highlight_border = max(border, 1)
+    accent = snapshot.accent
+
+    subtle_border = QtGui.QColor(accent)
+    subtle_border.setAlpha(90)
+    subtle_name = subtle_border.name(QtGui.QColor.HexArgb)
+
+    base_border = "border:0px solid transparent;"
+    if border:
+        # use a subtle alpha in the resting state for softer appearance
+        base_border = f"border:{border}px solid {subtle_name};"
+
+    return (
+        f"{selector}{{"
+        f"background-color:{snapshot.workspace};"
+        f"border-radius:{radius}px;"
+        "padding:4px 8px;"
+        f"{base_border}"
+        "color:#f0f0f0;"
+        "selection-background-color:rgba(255,255,255,30);"
+        "selection-color:#000;"
+        "}"
+        f"{selector}:hover, {selector}:focus{{"
+        f"border:{highlight_border}px solid {accent};"
+        f"color:{accent};"
+        "}"
+    )
+
+
+@stylesheet("dialog_table")
+def _dialog_table(
+    snapshot: ThemeSnapshot, item_rule: bool = True, selector: str = "QTableWidget"
+) -> str:
+    return (
+        f"{selector}{{"
+        f"background-color:{snapshot.workspace};"
+        f"border:1px solid {snapshot.accent};"
+        "border-radius:8px;"
+        "selection-background-color:rgba(0,0,0,0);"
+        f"selection-color:{snapshot.accent};"
+        "gridline-color:rgba(255,255,255,40);"
+        "}"
+        + (f"{selector}::item{{border:0;}}" if item_rule else "")
+    )
+
+
+@stylesheet("dialog_header")
+def _dialog_header(snapshot: ThemeSnapshot, padding: int = 6) -> str:
+    return (
+        "QHeaderView::section{"
+        f"background-color:{snapshot.workspace};"
+        f"color:{snapshot.accent};"
+        f"padding:0 {padding}px;"
+        "border:0;"
+        f"border-bottom:1px solid {snapshot.accent};"
+        "}"
+    )
+
+
+def blend_for_hover(workspace: QtGui.QColor, accent: QtGui.QColor, ratio: float = 0.18) -> QtGui.QColor:
+    ratio = max(0.0, min(1.0, ratio))
+    return QtGui.QColor(
+        int(workspace.red() * (1 - ratio) + accent.red() * ratio),
+        int(workspace.green() * (1 - ratio) + accent.green() * ratio),
+        int(workspace.blue() * (1 - ratio) + accent.blue() * ratio),
+    )
+
+
+@stylesheet("header_section")
+def _header_section(snapshot: ThemeSnapshot) -> str:
+    hover = blend_for_hover(
+        QtGui.QColor(snapshot.workspace), QtGui.QColor(snapshot.accent)
+    ).name()
+    return (
+        "QHeaderView::section{"
+        f"background:{snapshot.workspace};"
+        f"color:{snapshot.accent};"
+        "padding:0 6px;"
+        "border:0;"
+        f"border-bottom:1px solid {snapshot.accent};"
+        "}"
+        f"QHeaderView::section:hover{{background:{hover};}}"
+    )
+
+
+def _selection_rgba(accent: str) -> str:
+    color = QtGui.QColor(accent)
+    return f"rgba({color.red()},{color.green()},{color.blue()},120)"
+
+
+@stylesheet("inner_table")
+def _inner_table(snapshot: ThemeSnapshot) -> str:
+    thickness = max(1, snapshot.thickness)
+    radius = max(0, snapshot.radius)
+    selection = _selection_rgba(snapshot.accent)
+    return (
+        "QTableWidget{"
+        f"background-color:{snapshot.workspace};"
+        f"color:{snapshot.text};"
+        f"selection-background-color:{selection};"
+        f"selection-color:{snapshot.text};"
+        f"border:{thickness}px solid {snapshot.accent};"
+        f"border-radius:{radius}px;"
+        "gridline-color:rgba(255,255,255,40);"
+        "}"
+        "QTableWidget::viewport{"
+        f"background-color:{snapshot.workspace};"
+        "border:0;"
+        f"border-radius:{max(0, radius - 1)}px;"
+        "}"
+        "QTableWidget::item{border:0;}"
+    )
+
+
+def _subtle_rgba(accent: str) -> str:
+    color = QtGui.QColor(accent)
+    color.setAlpha(90)
+    r, g, b, a = color.getRgb()
+    return f"rgba({r},{g},{b},{a})"
+
+
+@stylesheet("calendar_table")
+def _calendar_table(snapshot: ThemeSnapshot) -> str:
+    return (
+        "QTableWidget{"
+        f"background-color:{snapshot.workspace};"
+        f"color:{snapshot.text};"
+        f"selection-background-color:{_selection_rgba(snapshot.accent)};"
+        f"selection-color:{snapshot.text};"
+        f"border:1px solid {_subtle_rgba(snapshot.accent)};"
+        "border-radius:16px;"
+        "gridline-color:rgba(255,255,255,40);"
+        "}"
+        "QTableWidget::viewport{"
+        f"background-color:{snapshot.workspace};"
+        "border:0;"
+        "}"
+        "QTableWidget::item{border:0;}"
+    )
+
+
+@stylesheet("calendar_view")
+def _calendar_view(snapshot: ThemeSnapshot) -> str:
+    # The model calendar paints its cells itself; only the frame is styled.
+    return (
+        "QTableView{"
+        f"background-color:{snapshot.workspace};"
+        f"color:{snapshot.text};"
+        f"border:1px solid {_subtle_rgba(snapshot.accent)};"
+        "border-radius:16px;"
+        "gridline-color:rgba(255,255,255,40);"
+        "}"
+    )
+
+
+@stylesheet("calendar_days")
+def _calendar_days(snapshot: ThemeSnapshot) -> str:
+    # Shared by every pooled day cell; the adjacent-month look is selected
+    # through the ``calendar_in_month`` property.
+    return (
+        "QWidget#CalendarDay{"
+        f"background-color:{snapshot.workspace};"
+        f"color:{snapshot.text};"
+        "}"
+        'QWidget#CalendarDay[calendar_in_month="false"]{'
+        "background-color:#2a2a2a;"
+        "color:#777;"
+        "}"
+        'QLabel#CalendarDayLabel[calendar_in_month="false"]{color:#777;}'
+    )
+
+
+@stylesheet("frame")
+def _frame(snapshot: ThemeSnapshot, object_name: str, radius: int = 16) -> str:
+    # Rounded outline of a dialog or panel selected by its object name.
+    return (
+        f"#{object_name}{{"
+        f"background-color:{snapshot.workspace};"
+        f"color:{snapshot.text};"
+        f"border-radius:{radius}px;"
+        f"border:1px solid {snapshot.accent};"
+        "}"
+    )
+
+
+@stylesheet("sidebar")
+def _sidebar(snapshot: ThemeSnapshot, background: str) -> str:
+    return (
+        "#Sidebar{"
+        f"background-color:{background};"
+        f"border:1px solid {snapshot.accent};"
+        "border-radius:20px;"
+        "}"
+        f"#Sidebar QLabel{{color:{snapshot.accent};}}"
+    )
+
+
+@stylesheet("main_window")
+def _main_window(snapshot: ThemeSnapshot, input_base: str, icon_theme: str) -> str:
+    # Set once on the main window; its children and dialogs inherit it.
+    # ``input_base`` holds the gradient/flat background declarations.
+    icons = f"assets/icons/{icon_theme}"
+    button = (
+        "subcontrol-origin:border;"
+        "margin-left:2px;"
+        "border:1px solid transparent;"
+        "border-radius:8px;"
+        "width:16px;height:16px;"
+    )
+    return (
+        f"QStatusBar{{background-color:{snapshot.workspace};}}"
+        f"QSpinBox,QDoubleSpinBox,QTimeEdit,QComboBox,QLineEdit{{{input_base}}}"
+        "QSpinBox::up-button,QDoubleSpinBox::up-button{"
+        f"{button}subcontrol-position:right top;"
+        "}"
+        "QSpinBox::down-button,QDoubleSpinBox::down-button{"
+        f"{button}subcontrol-position:right bottom;"
+        "}"
+        "QSpinBox::up-arrow,QSpinBox::down-arrow,"
+        "QDoubleSpinBox::up-arrow,QDoubleSpinBox::down-arrow{width:10px;height:10px;}"
+        f"QSpinBox::up-arrow,QDoubleSpinBox::up-arrow{{image:url({icons}/chevron-up.svg);}}"
+        f"QSpinBox::down-arrow,QDoubleSpinBox::down-arrow{{image:url({icons}/chevron-down.svg);}}"
+        f"QComboBox::down-arrow{{image:url({icons}/chevron-down.svg);width:10px;height:10px;}}"
+        "QComboBox::drop-down{"
+        "subcontrol-origin:padding;"
+        "subcontrol-position:right center;"
+        "width:16px;"
+        "}"
+    )
+
+
+def build_input_neon_style(
+    selector: str,
+    *,
+    background: str,
+    accent: str,
+    thickness: int,
+    radius: int = 8,
+) -> str:
+    """Return a stylesheet block for neon-ready input widgets.
+
+    Parameters
+    ----------
+    selector:
+        CSS selector for the widget (e.g. ``"QSpinBox"``).
+    background:
+        Base background color for the control.
+    accent:
+        Accent color used for hover/focus states.
+    thickness:
+        Thickness of the border in pixels.  Values below ``0`` are clamped to
+        ``0`` to mirror slider input; hover/focus states still highlight the
+        control with at least a 1px outline.
+    radius:
+        Corner radius in pixels.
+    """
+
+    try:
+        border = max(0, int(thickness))
+    except (TypeError, ValueError):
+        border = 0
+    return theme(
+        accent=accent, workspace=background, thickness=border
+    ).get("input", selector, radius)
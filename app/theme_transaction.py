@@ -0,0 +1,130 @@
+"""Theme changes applied as one transaction.
+
+Applying settings used to re-run every theming step: fonts for every widget,
+the palette, the top bar background three times and the neon handles twice,
+even when only the accent color changed.  :class:`ThemeTransaction` compares
+the theme-relevant part of the previous and the new configuration and tells
+which aspects (fonts, palette, neon, gradient, day rows) are affected, so
+each of them is applied once while updates of the window are disabled.
+"""
+
+from __future__ import annotations
+
+import copy
+from contextlib import contextmanager
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Mapping, Optional, Tuple
+
+from PySide6 import QtWidgets
+
+ASPECT_KEYS: Dict[str, Tuple[str, ...]] = {
+    "fonts": ("font_family", "header_font", "text_font", "sidebar_font"),
+    "day_rows": ("day_rows",),
+    "palette": (
+        "accent_color",
+        "workspace_color",
+        "sidebar_color",
+        "monochrome",
+        "mono_saturation",
+        "gradient_colors",
+        "gradient_angle",
+        "inner_table_radius",
+        "theme",
+        "app_icon",
+        "sidebar_icon",
+    ),
+    "neon": (
+        "neon",
+        "neon_size",
+        "neon_intensity",
+        "neon_thickness",
+        "neon_renderer",
+    ),
+    "gradient": ("gradient_colors", "gradient_angle", "neon_thickness"),
+}
+
+ASPECTS: Tuple[str, ...] = tuple(ASPECT_KEYS)
+
+_THEME_KEYS: Tuple[str, ...] = tuple(
+    dict.fromkeys(key for keys in ASPECT_KEYS.values() for key in keys)
+)
+
+# Entry of :meth:`ThemeTransaction.applied_values` naming the aspects a
+# restricted transaction left for the next one.
+_PENDING_KEY = "_pending_aspects"
+
+
+def theme_values(config: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return a copy of the configuration entries theming depends on."""
+
+    return {key: copy.deepcopy(config.get(key)) for key in _THEME_KEYS}
+
+
+class ThemeTransaction:
+    """Aspects to re-apply when going from ``old`` to ``new`` settings.
+
+    ``old`` is the result of :meth:`applied_values` of the previous
+    transaction, or ``None`` when nothing was applied yet, which selects
+    every aspect.  ``only`` restricts the transaction to some aspects; the
+    others stay pending for the next transaction.
+    """
+
+    def __init__(
+        self,
+        old: Optional[Mapping[str, Any]],
+        new: Mapping[str, Any],
+        only: Optional[Iterable[str]] = None,
+    ) -> None:
+        self.values = theme_values(new)
+        if old is None:
+            self.changed_keys: FrozenSet[str] = frozenset(_THEME_KEYS)
+        else:
+            self.changed_keys = frozenset(
+                key for key in _THEME_KEYS if old.get(key) != self.values[key]
+            )
+        self.aspects: FrozenSet[str] = frozenset(
+            aspect
+            for aspect, keys in ASPECT_KEYS.items()
+            if self.changed_keys.intersection(keys)
+        )
+        if old is not None:
+            self.aspects |= old.get(_PENDING_KEY, frozenset())
+        # Changed aspects left for a later transaction.
+        self.pending: FrozenSet[str] = frozenset()
+        if only is not None:
+            self.pending = self.aspects.difference(only)
+            self.aspects = self.aspects.intersection(only)
+
+    def __contains__(self, aspect: str) -> bool:
+        return aspect in self.aspects
+
+    def __bool__(self) -> bool:
+        return bool(self.aspects)
+
+    def any(self, *aspects: str) -> bool:
+        return not self.aspects.isdisjoint(aspects)
+
+    def applied_values(self) -> Dict[str, Any]:
+        """Theme values to pass as ``old`` once :attr:`aspects` are applied.
+
+        They also carry the :attr:`pending` aspects, which the next
+        transaction then selects whatever changed.
+        """
+
+        values: Dict[str, Any] = dict(self.values)
+        if self.pending:
+            values[_PENDING_KEY] = self.pending
+        return values
+
+    @contextmanager
+    def applying(self, widget: QtWidgets.QWidget) -> Iterator["ThemeTransaction"]:
+        """Disable updates of ``widget`` while the aspects are applied.
+
+        Re-enabling updates schedules the single repaint of the window.
+        """
+
+        enabled = widget.updatesEnabled()
+        widget.setUpdatesEnabled(False)
+        try:
+            yield self
+        finally:
+            widget.setUpdatesEnabled(enabled)
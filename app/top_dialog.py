@@ -0,0 +1,379 @@
+"""Dialog aggregating and saving top rankings for a period."""
+
+from __future__ import annotations
+
+import logging
+
+from PySide6 import QtWidgets, QtGui, QtCore
+import shiboken6
+
+import theme_registry
+from widgets import NeonTableWidget, read_sort_settings, StyledPushButton
+from resources import icon
+from effects import (
+    apply_neon_effect,
+    register_neon,
+    update_neon_filters,
+)
+import appdata
+
+logger = logging.getLogger(__name__)
+
+
+class TopDialog(QtWidgets.QDialog):
+    """Агрегирование и сохранение топов за период."""
+
+    def __init__(self, year, parent=None):
+        super().__init__(parent)
+        self.year = year
+        self.results = []
+        self.setWindowTitle("Топы")
+        self.resize(700, 400)
+
+        lay = QtWidgets.QVBoxLayout(self)
+        top = QtWidgets.QFormLayout()
+
+        self.spin_year = QtWidgets.QSpinBox(self)
+        self.spin_year.setRange(2000, 2100)
+        self.spin_year.setValue(year)
+
+        self.combo_mode = QtWidgets.QComboBox(self)
+        self.combo_mode.addItem("Месяц", "month")
+        self.combo_mode.addItem("Квартал", "quarter")
+        self.combo_mode.addItem("Полугодие", "half")
+        self.combo_mode.addItem("Год", "year")
+        self.combo_mode.currentIndexChanged.connect(self._mode_changed)
+        self.combo_period = QtWidgets.QComboBox(self)
+
+        self._input_selectors: dict[QtWidgets.QWidget, str] = {
+            self.spin_year: "QSpinBox",
+            self.combo_mode: "QComboBox",
+            self.combo_period: "QComboBox",
+        }
+        for widget in self._input_selectors:
+            widget.setAttribute(QtCore.Qt.WA_Hover, True)
+            register_neon(widget, appdata.CONFIG)
+            view_getter = getattr(widget, "view", None)
+            view = view_getter() if callable(view_getter) else None
+            if view is not None and shiboken6.isValid(view):
+                # the popup is a window of its own: route it to the combo box
+                view.setAttribute(QtCore.Qt.WA_Hover, True)
+                register_neon(view, appdata.CONFIG, owner=widget)
+                viewport_getter = getattr(view, "viewport", None)
+                viewport = viewport_getter() if callable(viewport_getter) else None
+                if viewport is not None and shiboken6.isValid(viewport):
+                    viewport.setAttribute(QtCore.Qt.WA_Hover, True)
+                    register_neon(viewport, appdata.CONFIG, owner=widget)
+
+        self._fill_periods()
+
+        self.btn_calc = StyledPushButton("Сформировать", self, **appdata.button_config())
+        self.btn_calc.clicked.connect(self.calculate)
+        self.btn_calc.apply_base_style()
+        self.btn_calc._apply_neon_profile("idle")
+
+        row = QtWidgets.QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.addWidget(self.spin_year)
+        row.addWidget(self.combo_mode)
+        row.addWidget(self.combo_period)
+        row.addWidget(self.btn_calc)
+
+        top.addRow(QtWidgets.QLabel("Год:"), row)
+        lay.addLayout(top)
+
+        headers = [
+            "№",
+            "Работа",
+            "Статус",
+            "Всего глав",
+            "Запланировано",
+            "Сделано глав",
+            "Прогресс перевода",
+            "Выпуск",
+            "Знаков",
+            "Просмотров",
+            "Профит",
+            "РК",
+            "Лайков",
+            "Спасибо",
+        ]
+        self.table = NeonTableWidget(0, len(headers), self)
+        self.table.setHorizontalHeaderLabels(headers)
+        self.table.setStyleSheet(
+            "QTableWidget{border:1px solid #555; border-radius:8px;} "
+            "QTableWidget::item{border:0;} "
+            "QHeaderView::section{padding:0 8px;}"
+        )
+        self.table.horizontalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.Interactive
+        )
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.Stretch
+        )
+        self.table.setSortingEnabled(True)
+
+        app = QtWidgets.QApplication.instance()
+        self.setFont(app.font())
+        self.table.setFont(app.font())
+        header_font = QtGui.QFont(appdata.CONFIG.get("header_font"))
+        table_header = self.table.horizontalHeader()
+        table_header.setFont(header_font)
+        table_header.sortIndicatorChanged.connect(self._on_sort_changed)
+
+        lay.addWidget(self.table, 1)
+
+        box = QtWidgets.QDialogButtonBox(self)
+        btn_save = StyledPushButton("Сохранить", self, **appdata.button_config())
+        btn_save.setIcon(icon("save"))
+        btn_save.setIconSize(QtCore.QSize(20, 20))
+        btn_close = StyledPushButton("Закрыть", self, **appdata.button_config())
+        btn_close.setIcon(icon("x"))
+        btn_close.setIconSize(QtCore.QSize(20, 20))
+        box.addButton(btn_save, QtWidgets.QDialogButtonBox.AcceptRole)
+        box.addButton(btn_close, QtWidgets.QDialogButtonBox.RejectRole)
+        box.accepted.connect(self._save_and_accept)
+        box.rejected.connect(self.reject)
+        lay.addWidget(box)
+        for b in (btn_save, btn_close):
+            b.setFixedSize(b.sizeHint())
+
+        self._settings = QtCore.QSettings("rabota2", "rabota2")
+        self._saved_sort: tuple[int, QtCore.Qt.SortOrder] | None = read_sort_settings(
+            self._settings, "TopDialog"
+        )
+        geom = self._settings.value("TopDialog/geometry", type=QtCore.QByteArray)
+        if geom is not None:
+            self.restoreGeometry(geom)
+        self.calculate()
+        # Rollups make a recalculation cheap enough to follow every switch.
+        self.spin_year.valueChanged.connect(lambda _: self.calculate())
+        self.combo_period.currentIndexChanged.connect(
+            lambda index: self.calculate() if index >= 0 else None
+        )
+        self.refresh_theme()
+        sizes = self._settings.value("TopDialog/columns", type=list)
+        for i, w in enumerate(sizes or []):
+            try:
+                self.table.setColumnWidth(i, int(w))
+            except (TypeError, ValueError):
+                pass  # пропустить некорректное значение
+
+    def refresh_theme(self) -> None:
+        """Пересобрать стили таблицы и заголовков с учётом темы."""
+
+        workspace = QtGui.QColor(appdata.CONFIG.get("workspace_color", "#1e1e21")).name()
+        accent = QtGui.QColor(appdata.CONFIG.get("accent_color", "#39ff14")).name()
+        try:
+            thickness = int(appdata.CONFIG.get("neon_thickness", 1))
+        except (TypeError, ValueError):
+            thickness = 1
+        thickness = max(0, thickness)
+
+        header = self.table.horizontalHeader()
+
+        self.table.setAttribute(QtCore.Qt.WA_Hover, True)
+        self.table.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
+        header.setAttribute(QtCore.Qt.WA_Hover, True)
+
+        for widget, selector in self._input_selectors.items():
+            if widget is None or not shiboken6.isValid(widget):
+                continue
+            style = theme_registry.build_input_neon_style(
+                selector,
+                background=workspace,
+                accent=accent,
+                thickness=thickness,
+            )
+            widget.setStyleSheet(style)
+            update_neon_filters(widget, appdata.CONFIG)
+
+        self.btn_calc.update_gradient(**appdata.button_config())
+        self.btn_calc.apply_base_style()
+        self.btn_calc._apply_neon_profile("idle")
+
+        if getattr(self.table, "_neon_effect", None):
+            apply_neon_effect(self.table, False, config=appdata.CONFIG)
+        if getattr(header, "_neon_effect", None):
+            apply_neon_effect(header, False, config=appdata.CONFIG)
+
+        highlight = QtGui.QColor(accent)
+        table_palette = self.table.palette()
+        table_palette.setColor(QtGui.QPalette.Highlight, highlight)
+        self.table.setPalette(table_palette)
+
+        header_palette = header.palette()
+        header_palette.setColor(QtGui.QPalette.Highlight, highlight)
+        header.setPalette(header_palette)
+
+        compiled = theme_registry.theme(accent=accent, workspace=workspace)
+        table_style = compiled.get("dialog_table")
+        header_style = compiled.get("dialog_header", 8)
+
+        theme_registry.apply_style(self.table, table_style)
+        theme_registry.apply_style(header, header_style)
+
+        apply_neon_effect(self.table, True, config=appdata.CONFIG)
+        apply_neon_effect(header, True, shadow=False, border=False, config=appdata.CONFIG)
+        update_neon_filters(self.table, appdata.CONFIG)
+        update_neon_filters(header, appdata.CONFIG)
+
+    def resizeEvent(self, event):
+        self.table.horizontalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.Interactive
+        )
+        super().resizeEvent(event)
+
+    def _mode_changed(self):
+        self._fill_periods()
+        self.calculate()
+
+    def _fill_periods(self) -> None:
+        mode = self.combo_mode.currentData()
+        # Refilling must not recalculate with a period of the previous mode.
+        blocker = QtCore.QSignalBlocker(self.combo_period)
+        self.combo_period.clear()
+        if mode == "month":
+            for i, m in enumerate(appdata.RU_MONTHS, 1):
+                self.combo_period.addItem(m, i)
+            self.combo_period.setEnabled(True)
+        elif mode == "quarter":
+            for i in range(1, 5):
+                self.combo_period.addItem(str(i), i)
+            self.combo_period.setEnabled(True)
+        elif mode == "half":
+            for i in range(1, 3):
+                self.combo_period.addItem(str(i), i)
+            self.combo_period.setEnabled(True)
+        else:
+            self.combo_period.setEnabled(False)
+        del blocker
+
+    # --- helpers -------------------------------------------------------
+    def reopen(self, year) -> bool:
+        """Show ``year`` again, recalculating only if its stats changed since."""
+
+        if self.spin_year.value() != year:
+            self.spin_year.setValue(year)  # recalculates
+        elif appdata.stats_signature(year) != self._stamp:
+            self.calculate()
+        return True
+
+    def calculate(self):
+        year = self.spin_year.value()
+        self._stamp = appdata.stats_signature(year)
+        rankings = appdata.top_rankings(year).get(self._period_key(), {})
+        results = [(r["work"], r) for r in rankings.get("results", [])]
+        self.results = results
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        sums = {
+            "total_chapters": 0,
+            "planned": 0,
+            "chapters": 0,
+            "chars": 0,
+            "views": 0,
+            "profit": 0.0,
+            "ads": 0.0,
+            "likes": 0,
+            "thanks": 0,
+        }
+        for idx, (work, vals) in enumerate(results, 1):
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(idx)))
+            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(work))
+            self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(vals.get("status", "")))
+            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(str(vals["total_chapters"])))
+            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(vals["planned"])))
+            self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(str(vals["chapters"])))
+            self.table.setItem(
+                row, 6, QtWidgets.QTableWidgetItem(f"{round(vals['progress'], 2)}%")
+            )
+            self.table.setItem(row, 7, QtWidgets.QTableWidgetItem(vals.get("release", "")))
+            self.table.setItem(row, 8, QtWidgets.QTableWidgetItem(str(vals["chars"])))
+            self.table.setItem(row, 9, QtWidgets.QTableWidgetItem(str(vals["views"])))
+            self.table.setItem(row, 10, QtWidgets.QTableWidgetItem(str(round(vals["profit"], 2))))
+            self.table.setItem(row, 11, QtWidgets.QTableWidgetItem(str(round(vals["ads"], 2))))
+            self.table.setItem(row, 12, QtWidgets.QTableWidgetItem(str(vals["likes"])))
+            self.table.setItem(row, 13, QtWidgets.QTableWidgetItem(str(vals["thanks"])))
+
+            # accumulate sums
+            sums["total_chapters"] += vals["total_chapters"]
+            sums["planned"] += vals["planned"]
+            sums["chapters"] += vals["chapters"]
+            sums["chars"] += vals["chars"]
+            sums["views"] += vals["views"]
+            sums["profit"] += vals["profit"]
+            sums["ads"] += vals["ads"]
+            sums["likes"] += vals["likes"]
+            sums["thanks"] += vals["thanks"]
+
+        if results:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            self.table.setItem(row, 1, QtWidgets.QTableWidgetItem("Итого"))
+            self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(str(sums["total_chapters"])))
+            self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(sums["planned"])))
+            self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(str(sums["chapters"])))
+            self.table.setItem(row, 8, QtWidgets.QTableWidgetItem(str(sums["chars"])))
+            self.table.setItem(row, 9, QtWidgets.QTableWidgetItem(str(sums["views"])))
+            self.table.setItem(row, 10, QtWidgets.QTableWidgetItem(str(round(sums["profit"], 2))))
+            self.table.setItem(row, 11, QtWidgets.QTableWidgetItem(str(round(sums["ads"], 2))))
+            self.table.setItem(row, 12, QtWidgets.QTableWidgetItem(str(sums["likes"])))
+            self.table.setItem(row, 13, QtWidgets.QTableWidgetItem(str(sums["thanks"])))
+        self.table.setSortingEnabled(True)
+        self.table.resizeColumnsToContents()
+        header = self.table.horizontalHeader()
+        header.setMinimumSectionSize(50)
+        header.setTextElideMode(QtCore.Qt.ElideNone)
+        self._apply_saved_sort()
+
+    def _period_key(self):
+        mode = self.combo_mode.currentData()
+        if mode == "month" and self.combo_period.isEnabled():
+            return f"M{self.combo_period.currentData():02d}"
+        if mode == "quarter" and self.combo_period.isEnabled():
+            return f"Q{self.combo_period.currentData()}"
+        if mode == "half" and self.combo_period.isEnabled():
+            return f"H{self.combo_period.currentData()}"
+        return "Y"
+
+    def save(self):
+        # top_rankings() holds every period key, so the file stays complete.
+        year = self.spin_year.value()
+        appdata.save_top_data(year, appdata.top_rankings(year))
+
+    def _save_and_accept(self):
+        self.save()
+        self.accept()
+
+    def closeEvent(self, event):
+        self.save()
+        self._settings.setValue("TopDialog/geometry", self.saveGeometry())
+        cols = [int(self.table.columnWidth(i)) for i in range(self.table.columnCount())]
+        self._settings.setValue("TopDialog/columns", cols)
+        header = self.table.horizontalHeader()
+        self._settings.setValue("TopDialog/sortSection", int(header.sortIndicatorSection()))
+        self._settings.setValue("TopDialog/sortOrder", int(header.sortIndicatorOrder().value))
+        self._settings.sync()
+        super().closeEvent(event)
+
+    def _on_sort_changed(self, section: int, order: QtCore.Qt.SortOrder) -> None:
+        self._saved_sort = (int(section), QtCore.Qt.SortOrder(order))
+
+    def _apply_saved_sort(self) -> None:
+        if not self.table.isSortingEnabled():
+            return
+        section_order = self._saved_sort
+        if section_order is None:
+            header = self.table.horizontalHeader()
+            section_order = (
+                int(header.sortIndicatorSection()),
+                QtCore.Qt.SortOrder(header.sortIndicatorOrder()),
+            )
+        section, order = section_order
+        if 0 <= section < self.table.columnCount():
+            self.table.sortByColumn(section, order)
+            self._saved_sort = (section, order)
@@ -1,15 +1,39 @@
 import math
-import re
+from dataclasses import dataclass
 
 from PySide6 import QtWidgets, QtGui, QtCore
-
-from effects import apply_neon_effect
+import shiboken6
+
+import config as app_config
+from effects import (
+    apply_neon_effect,
+    neon_registered,
+    register_neon,
+    unregister_neon,
+    update_neon_glow,
+)
 from resources import icon
 from config import CONFIG
 
 
+@dataclass(frozen=True)
+class _ButtonPaint:
+    """Brush, border pen and text color of one button state."""
+
+    brush: QtGui.QBrush
+    pen: QtGui.QPen
+    text: QtGui.QColor
+
+
 class ButtonStyleMixin:
-    """Mixin providing sidebar-style appearance and hover behaviour."""
+    """Mixin providing sidebar-style appearance and hover behaviour.
+
+    The gradient, border and text are painted from :class:`_ButtonPaint`
+    objects cached per state, so hovering only switches the state and
+    retints the glow; the stylesheet is set on theme changes alone.
+    """
+
+    _RADIUS = 16
 
     def __init__(
         self,
@@ -27,7 +51,8 @@ class ButtonStyleMixin:
         self._gradient_colors = gradient_colors or ["#39ff14", "#2d7cdb"]
         self._gradient_angle = gradient_angle
         self._neon_thickness = neon_thickness
-        self._state_styles: dict[str, str] = {}
+        self._base_sheet = ""
+        self._paint_states: dict[str, _ButtonPaint] = {}
         self._current_state = "idle"
         self._neon_profiles = {
             "idle": {
@@ -56,18 +81,19 @@ class ButtonStyleMixin:
             self._neon_thickness = neon_thickness
         self._update_state_styles()
 
+    def _gradient_end(self) -> tuple[float, float]:
+        rad = math.radians(self._gradient_angle)
+        return 0.5 + 0.5 * math.cos(rad), 0.5 + 0.5 * math.sin(rad)
+
     def _base_style(self) -> str:
         """Build the base style using current configuration."""
         thickness = self._neon_thickness
         grad = self._gradient_colors
-        angle = self._gradient_angle
-        rad = math.radians(angle)
-        x2 = 0.5 + 0.5 * math.cos(rad)
-        y2 = 0.5 + 0.5 * math.sin(rad)
+        x2, y2 = self._gradient_end()
         pad_v = max(0, 8 - thickness)
         pad_h = max(0, 12 - thickness)
         return (
-            "border-radius:16px;"
+            f"border-radius:{self._RADIUS}px;"
             f"padding:{pad_v}px {pad_h}px;"
             f"border:{thickness}px solid transparent; min-width:24px; min-height:24px;"
             "color:white;"
@@ -99,44 +125,78 @@ class ButtonStyleMixin:
         blue = round(base_color.blue() * (1 - ratio) + accent_color.blue() * ratio)
         return QtGui.QColor(red, green, blue).name()
 
-    def _hover_style(self) -> str:
+    def _border_width(self, state: str) -> int:
+        scale = self._neon_profiles.get(state, self._neon_profiles["idle"])["thickness_scale"]
+        thickness = max(0, int(self._neon_thickness))
+        width = int(round(thickness * scale))
+        if thickness > 0 and scale > 0 and width == 0:
+            width = 1
+        return width
+
+    def _build_state_paint(self, state: str) -> _ButtonPaint:
         accent = self._accent_color()
-        blended_colors = [
-            self._blend_colors(color, accent, 0.25) for color in self._gradient_colors
-        ]
-        angle = math.radians(self._gradient_angle)
-        x2 = 0.5 + 0.5 * math.cos(angle)
-        y2 = 0.5 + 0.5 * math.sin(angle)
-        gradient_stops = []
-        if blended_colors:
-            gradient_stops.append(f"stop:0 {blended_colors[0]}")
-        gradient_stops.append(f"stop:0.5 {accent}")
-        if blended_colors:
-            gradient_stops.append(f"stop:1 {blended_colors[-1]}")
-        gradient_definition = ", ".join(gradient_stops)
-        return (
-            "border-radius:16px;"
-            f"background: qlineargradient(x1:0,y1:0,x2:{x2:.2f},y2:{y2:.2f},{gradient_definition});"
-            f"border:{self._neon_thickness}px solid {accent};"
-            f"color:{accent};"
-        )
+        x2, y2 = self._gradient_end()
+        gradient = QtGui.QLinearGradient(0, 0, x2, y2)
+        gradient.setCoordinateMode(QtGui.QGradient.ObjectMode)
+        if state == "hover":
+            blended = [
+                self._blend_colors(color, accent, 0.25) for color in self._gradient_colors
+            ]
+            if blended:
+                gradient.setColorAt(0, QtGui.QColor(blended[0]))
+            gradient.setColorAt(0.5, QtGui.QColor(accent))
+            if blended:
+                gradient.setColorAt(1, QtGui.QColor(blended[-1]))
+            text = QtGui.QColor(accent)
+        else:
+            gradient.setColorAt(0, QtGui.QColor(self._gradient_colors[0]))
+            gradient.setColorAt(1, QtGui.QColor(self._gradient_colors[-1]))
+            text = self.palette().color(QtGui.QPalette.ButtonText)
+            if not text.isValid():
+                text = QtGui.QColor("white")
+        width = self._border_width(state)
+        pen = QtGui.QPen(QtGui.QColor(accent), width) if width else QtGui.QPen(QtCore.Qt.NoPen)
+        return _ButtonPaint(QtGui.QBrush(gradient), pen, text)
+
+    def _state_paint(self, state: str | None = None) -> _ButtonPaint:
+        state = state or self._current_state
+        paint = self._paint_states.get(state)
+        if paint is None:
+            paint = self._build_state_paint(state)
+            self._paint_states[state] = paint
+        return paint
+
+    def _paint_frame(self, painter: QtGui.QPainter) -> None:
+        """Paint the gradient background and neon border of the current state."""
+
+        paint = self._state_paint()
+        inset = paint.pen.widthF() / 2 if paint.pen.style() != QtCore.Qt.NoPen else 0.0
+        rect = QtCore.QRectF(self.rect()).adjusted(inset, inset, -inset, -inset)
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        painter.setPen(paint.pen)
+        painter.setBrush(paint.brush)
+        painter.drawRoundedRect(rect, self._RADIUS, self._RADIUS)
+        painter.restore()
 
     def _apply_hover(self, on: bool) -> None:
         state = "hover" if on else "idle"
-        self._apply_style_state(state)
+        if state == self._current_state:
+            return
+        self._current_state = state
+        profile = self._neon_profiles.get(state, self._neon_profiles["idle"])
+        if not update_neon_glow(self, profile["intensity_scale"], config=CONFIG):
+            self._apply_neon_profile(state)
+        self.update()
 
     def _update_state_styles(self) -> None:
-        base = self._base_style()
-        self._state_styles = {
-            "idle": base,
-            "hover": base + self._hover_style(),
-        }
+        self._base_sheet = self._base_style()
+        self._paint_states.clear()
 
     def _apply_style_state(self, state: str) -> None:
-        if state not in self._state_styles:
-            self._update_state_styles()
         self._current_state = state
-        self.setStyleSheet(self._state_styles[state])
+        self.setStyleSheet(self._base_sheet)
+        self.update()
 
     def _apply_neon_profile(self, state: str) -> None:
         profile = self._neon_profiles.get(state, self._neon_profiles["idle"])
@@ -161,14 +221,18 @@ class ButtonStyleMixin:
         self._apply_neon_profile(state_name)
 
     # --- events ------------------------------------------------------
+    def changeEvent(self, event):  # noqa: D401
+        if event.type() == QtCore.QEvent.PaletteChange:
+            self._paint_states.clear()
+        super().changeEvent(event)
+
     def enterEvent(self, event):  # noqa: D401
-        self.apply_neon_state("hover")
+        self._apply_hover(True)
         super().enterEvent(event)
 
     def leaveEvent(self, event):  # noqa: D401
         selected = bool(self.property("neon_selected"))
-        state = "hover" if selected else "idle"
-        self.apply_neon_state(state)
+        self._apply_hover(selected)
         super().leaveEvent(event)
 
 
@@ -192,6 +256,17 @@ class StyledPushButton(ButtonStyleMixin, QtWidgets.QPushButton):
         )
         self.apply_base_style()
 
+    def paintEvent(self, event):  # noqa: D401
+        option = QtWidgets.QStyleOptionButton()
+        self.initStyleOption(option)
+        painter = QtWidgets.QStylePainter(self)
+        self._paint_frame(painter)
+        option.rect = self.style().subElementRect(
+            QtWidgets.QStyle.SE_PushButtonContents, option, self
+        )
+        option.palette.setColor(QtGui.QPalette.ButtonText, self._state_paint().text)
+        painter.drawControl(QtWidgets.QStyle.CE_PushButtonLabel, option)
+
 
 class StyledToolButton(ButtonStyleMixin, QtWidgets.QToolButton):
     """QToolButton with shared styling mixin and centered content."""
@@ -225,40 +300,18 @@ class StyledToolButton(ButtonStyleMixin, QtWidgets.QToolButton):
 
         return self._content_spacing
 
-    @staticmethod
-    def _extract_text_color(style_sheet: str) -> QtGui.QColor | None:
-        """Return the last declared ``color:`` from ``style_sheet`` if valid."""
-
-        if not style_sheet:
-            return None
-        color_value: QtGui.QColor | None = None
-        for match in re.finditer(r"color\s*:\s*([^;]+)", style_sheet, re.IGNORECASE):
-            candidate = QtGui.QColor(match.group(1).strip())
-            if candidate.isValid():
-                color_value = candidate
-        return color_value
-
     def _resolve_text_color(self, option: QtWidgets.QStyleOptionToolButton) -> QtGui.QColor:
-        """Determine the text color using style option and stylesheet hints."""
+        """Return the text color of the current hover state."""
 
-        text_color = option.palette.color(QtGui.QPalette.ButtonText)
-        css_color = self._extract_text_color(self.styleSheet())
-        if css_color is not None:
-            text_color = css_color
-        if not text_color.isValid():
-            text_color = QtGui.QColor("white")
-        return text_color
+        return self._state_paint().text
 
     def paintEvent(self, event):  # noqa: D401
         option = QtWidgets.QStyleOptionToolButton()
         self.initStyleOption(option)
 
         painter = QtWidgets.QStylePainter(self)
+        self._paint_frame(painter)
         painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
-        base_option = QtWidgets.QStyleOptionToolButton(option)
-        base_option.icon = QtGui.QIcon()
-        base_option.text = ""
-        painter.drawComplexControl(QtWidgets.QStyle.CC_ToolButton, base_option)
 
         contents = self.style().subControlRect(
             QtWidgets.QStyle.CC_ToolButton,
@@ -350,3 +403,62 @@ class StyledToolButton(ButtonStyleMixin, QtWidgets.QToolButton):
                 alignment = QtCore.Qt.AlignHCenter | QtCore.Qt.AlignTop
             painter.setPen(QtGui.QPen(self._resolve_text_color(option)))
             painter.drawText(text_rect, alignment, text)
+
+
+def read_sort_settings(
+    settings: QtCore.QSettings, prefix: str
+) -> tuple[int, QtCore.Qt.SortOrder] | None:
+    section = settings.value(f"{prefix}/sortSection")
+    order = settings.value(f"{prefix}/sortOrder")
+    try:
+        section_int = int(section)
+        order_enum = QtCore.Qt.SortOrder(int(order))
+    except (TypeError, ValueError):
+        return None
+    return section_int, order_enum
+
+
+class NeonTableWidget(QtWidgets.QTableWidget):
+    """Вложенная таблица с neonовым подсвечиванием при наведении и фокусе."""
+
+    def __init__(self, rows, cols, parent=None, use_neon=True):
+        super().__init__(rows, cols, parent)
+        self.setFocusPolicy(QtCore.Qt.StrongFocus)
+        self._active_editor: QtWidgets.QLineEdit | None = None
+        self._neon_enabled = use_neon
+        self.setStyleSheet(
+            "QTableWidget, QTableWidget::viewport{border:1px solid transparent;}\n"
+            "QTableWidget::item:selected{background:transparent;}"
+        )
+
+    def focusOutEvent(self, e):
+        super().focusOutEvent(e)
+        self.clearSelection()
+
+    def itemSelectionChanged(self):
+        super().itemSelectionChanged()
+        self.clearSelection()
+
+    def edit(self, index, trigger, event):
+        res = super().edit(index, trigger, event)
+        if res and self._neon_enabled:
+            editor = self.findChild(QtWidgets.QLineEdit)
+            if editor is not None:
+                previous = self._active_editor
+                if (
+                    previous is not None
+                    and previous is not editor
+                    and shiboken6.isValid(previous)
+                ):
+                    unregister_neon(previous)
+                    apply_neon_effect(previous, False, config=app_config.CONFIG)
+                if not neon_registered(editor):
+                    editor.setAttribute(QtCore.Qt.WA_Hover, True)
+                    editor.setStyleSheet(
+                        editor.styleSheet() + "border:1px solid transparent;"
+                    )
+                    # the dispatcher switches the neon off once focus leaves
+                    register_neon(editor, app_config.CONFIG)
+                apply_neon_effect(editor, True, shadow=False, config=app_config.CONFIG)
+                self._active_editor = editor
+        return res
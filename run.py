@@ -1,52 +1,192 @@
 from __future__ import annotations
 
 import argparse
-import importlib.util
+import hashlib
+import json
 import os
+import runpy
 import subprocess
 import sys
+import time
 from pathlib import Path
 
+LAUNCHED_AT = time.time()
+
 if sys.version_info < (3, 11):
     sys.exit('Требуется Python 3.11+')
 
 ROOT = Path(__file__).resolve().parent
 VENV_DIR = ROOT / '.venv'
 PYTHON = VENV_DIR / ('Scripts' if os.name == 'nt' else 'bin') / 'python'
+REQUIREMENTS = ROOT / 'requirements.txt'
+APP_MAIN = ROOT / 'app' / 'main.py'
+# Stored in the venv root so writing it does not touch site-packages.
+FINGERPRINT_PATH = VENV_DIR / 'rabota2-fingerprint.json'
 LOG_DIR = ROOT / 'logs'
 LOG_PATH = LOG_DIR / 'startup.log'
+# Imported by the venv interpreter to check an existing environment.
+RUNTIME_IMPORTS = ('PySide6',)
+
+
+def _site_packages() -> Path | None:
+    if os.name == 'nt':
+        candidates = [VENV_DIR / 'Lib' / 'site-packages']
+    else:
+        candidates = sorted((VENV_DIR / 'lib').glob('python*/site-packages'))
+    return next((path for path in candidates if path.is_dir()), None)
+
+
+def environment_fingerprint() -> dict | None:
+    """Describe the installed environment without starting its interpreter.
+
+    The requirements hash, the interpreter version recorded in
+    ``pyvenv.cfg`` and the mtime of site-packages (changed by every pip
+    install or uninstall) are enough to tell that nothing needs checking.
+    """
+
+    cfg = VENV_DIR / 'pyvenv.cfg'
+    site = _site_packages()
+    if not PYTHON.exists() or not cfg.exists() or site is None:
+        return None
+    version = ''
+    for line in cfg.read_text(encoding='utf-8', errors='replace').splitlines():
+        key, _, value = line.partition('=')
+        if key.strip() in ('version', 'version_info'):
+            version = value.strip()
+            break
+    return {
+        'requirements': hashlib.sha256(REQUIREMENTS.read_bytes()).hexdigest(),
+        'python': version,
+        'site_packages_mtime': site.stat().st_mtime_ns,
+    }
+
+
+def _stored_fingerprint() -> dict | None:
+    try:
+        return json.loads(FINGERPRINT_PATH.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def _store_fingerprint() -> None:
+    fingerprint = environment_fingerprint()
+    if fingerprint is not None:
+        FINGERPRINT_PATH.write_text(json.dumps(fingerprint), encoding='utf-8')
+
+
+def _runtime_importable() -> bool:
+    """Check that the venv interpreter can import the app's dependencies."""
+
+    code = subprocess.call(
+        [str(PYTHON), '-c', '; '.join(f'import {name}' for name in RUNTIME_IMPORTS)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return code == 0
+
+
+def prepare_environment(force: bool = False) -> int:
+    """Create the venv and install requirements when they may be missing.
+
+    pip runs for a new venv, with ``--install`` and after
+    ``requirements.txt`` changed.  Any other fingerprint mismatch (no stored
+    fingerprint yet, a pip run by hand) only probes the imports.  A failed
+    pip run in an existing venv is reported and the app starts anyway.
+    """
+
+    created = not PYTHON.exists()
+    if not force and not created:
+        current = environment_fingerprint()
+        stored = _stored_fingerprint()
+        if current is not None and current == stored:
+            return 0
+        same_requirements = (
+            current is not None
+            and (stored is None or stored.get('requirements') == current['requirements'])
+        )
+        if same_requirements and _runtime_importable():
+            _store_fingerprint()
+            return 0
+
+    if created:
+        subprocess.check_call([sys.executable, "-m", "venv", str(VENV_DIR)])
+    try:
+        subprocess.check_call(
+            [str(PYTHON), "-m", "pip", "install", "--upgrade", "-r", str(REQUIREMENTS)]
+        )
+    except subprocess.CalledProcessError as exc:
+        print(f"Не удалось установить зависимости: {exc}", file=sys.stderr)
+        if created or force:
+            return exc.returncode
+        print("Запуск с уже установленными пакетами", file=sys.stderr)
+        return 0
+    _store_fingerprint()
+    return 0
 
 
-def ensure_gui_dependencies() -> None:
-    """Проверить наличие tkinter и customtkinter и подсказать установку."""
+def _in_venv() -> bool:
+    return Path(sys.prefix).resolve() == VENV_DIR.resolve()
 
-    has_tkinter = importlib.util.find_spec("tkinter") is not None
-    has_customtkinter = importlib.util.find_spec("customtkinter") is not None
 
-    if not has_tkinter:
-        message = (
-            "tkinter не найден. Установите поддержку Tcl/Tk для вашей ОС."
-        )
-        if sys.platform.startswith("win"):
-            message += (
-                " В установщике Python выберите «Modify > tcl/tk and IDLE»."
-            )
-        elif sys.platform == "darwin":
-            message += (
-                " На macOS установите Python с сайта python.org или добавьте"
-                " пакет Tcl/Tk через Homebrew: `brew install tcl-tk`."
-            )
-        else:
-            message += (
-                " На Linux обычно достаточно установить пакет python3-tk"
-                " через менеджер пакетов, например: `sudo apt install python3-tk`."
-            )
-        print(message)
-
-    if not has_customtkinter:
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "customtkinter"]
-        )
+def _redirect_output() -> int:
+    """Send fds 1 and 2 to the startup log; return a copy of the old stderr."""
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(2)
+    fd = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    os.dup2(fd, 1)
+    os.dup2(fd, 2)
+    os.close(fd)
+    return saved
+
+
+def _report_failure(code: int, stderr_fd: int | None = None) -> None:
+    message = f"Application failed with exit code {code}. See {LOG_PATH} for details\n"
+    if stderr_fd is None:
+        sys.stderr.write(message)
+    else:
+        os.write(stderr_fd, message.encode(errors='replace'))
+
+
+def launch(app_args: list[str]) -> int:
+    """Start the application without keeping a launcher process around.
+
+    Under the venv interpreter the app runs in this process; otherwise the
+    launcher is replaced with ``os.execv``.  Windows has no real ``exec``,
+    so there a child process is still waited for.
+    """
+
+    os.environ['RABOTA2_LAUNCH_TIME'] = repr(LAUNCHED_AT)
+    argv = [str(APP_MAIN), *app_args]
+
+    if _in_venv():
+        stderr_fd = _redirect_output()
+        sys.argv = argv
+        sys.path.insert(0, str(APP_MAIN.parent))
+        try:
+            runpy.run_path(str(APP_MAIN), run_name='__main__')
+            code = 0
+        except SystemExit as exc:
+            code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+        if code:
+            _report_failure(code, stderr_fd)
+        return code
+
+    if os.name != 'nt':
+        # Nothing is left to report a crash after exec; name the log now.
+        stderr_fd = _redirect_output()
+        os.write(stderr_fd, f"Application output goes to {LOG_PATH}\n".encode(errors='replace'))
+        os.close(stderr_fd)
+        os.execv(str(PYTHON), [str(PYTHON), *argv])
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    with LOG_PATH.open("w", encoding="utf-8") as log_file:
+        code = subprocess.call([str(PYTHON), *argv], stdout=log_file, stderr=log_file)
+    if code:
+        _report_failure(code)
+    return code
 
 
 def main() -> int:
@@ -56,50 +196,13 @@ def main() -> int:
         action="store_true",
         help="переустановить зависимости в виртуальном окружении",
     )
-    args = parser.parse_args()
-
-    created = False
-    if not VENV_DIR.exists():
-        subprocess.check_call([sys.executable, "-m", "venv", str(VENV_DIR)])
-        created = True
-
-    if created or args.install:
-        try:
-            subprocess.check_call(
-                [
-                    str(PYTHON),
-                    "-m",
-                    "pip",
-                    "install",
-                    "--upgrade",
-                    "-r",
-                    str(ROOT / "requirements.txt"),
-                ]
-            )
-        except subprocess.CalledProcessError as exc:
-            print(f"Не удалось установить зависимости: {exc}", file=sys.stderr)
-            return exc.returncode
-
-    ensure_gui_dependencies()
+    # Остальные аргументы (например, --profile-startup) передаются приложению.
+    args, app_args = parser.parse_known_args()
 
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
-    with LOG_PATH.open("w", encoding="utf-8") as log_file:
-        proc = subprocess.Popen(
-            [str(PYTHON), str(ROOT / "app" / "main.py")],
-            stdout=log_file,
-            stderr=log_file,
-            text=True,
-        )
-        proc.wait()
-
-    if proc.returncode != 0:
-        print(
-            f"Application failed with exit code {proc.returncode}. See {LOG_PATH} for details",
-            file=sys.stderr,
-        )
-        return proc.returncode
-
-    return 0
+    code = prepare_environment(force=args.install)
+    if code:
+        return code
+    return launch(app_args)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,17 @@
+import gc
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _collect_leaked_widgets():
+    """Destroy windows left over by a test before the next one starts.
+
+    Top-level widgets are kept alive by reference cycles through their signal
+    connections.  Without an explicit collection the cyclic GC deletes them
+    at a random allocation in a later test, in the middle of Qt event
+    delivery, which crashes the interpreter.
+    """
+
+    yield
+    gc.collect()
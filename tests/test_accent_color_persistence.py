@@ -10,12 +10,13 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
+import appdata
 
 
 def test_accent_color_persists_across_restart(tmp_path, monkeypatch):
     # use temporary config file
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -45,7 +46,7 @@ def test_accent_color_persists_across_restart(tmp_path, monkeypatch):
     window.close()
     app.processEvents()
 
-    main.CONFIG = main.load_config()
+    appdata.reload_config()
     window2 = main.MainWindow()
     window2.apply_settings()
 
@@ -32,7 +32,7 @@ def test_sidebar_updates_on_accent_change(monkeypatch):
 
     new_color = "#ff0000"
     main.CONFIG["accent_color"] = new_color
-    window.apply_palette()
+    window.apply_theme()
 
     assert calls, "apply_style was not called"
     accent_name, highlight_name = calls[-1]
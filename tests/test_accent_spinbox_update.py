@@ -13,11 +13,12 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
+import appdata
 
 
 def test_accent_color_updates_spinbox_border(tmp_path):
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -26,7 +27,7 @@ def test_accent_color_updates_spinbox_border(tmp_path):
 
     new_accent = "#ff8800"
     main.CONFIG["accent_color"] = new_accent
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     window.apply_theme()
@@ -18,6 +18,7 @@ import resources  # noqa: E402
 resources.register_fonts = lambda: None  # noqa: E305
 
 import app.main as main  # noqa: E402
+from effects import neon_dispatcher, neon_registered  # noqa: E402
 
 
 def test_analytics_dialog_theme_uses_accent_and_neon(monkeypatch):
@@ -34,7 +35,7 @@ def test_analytics_dialog_theme_uses_accent_and_neon(monkeypatch):
 
     assert getattr(dialog.table, "_neon_effect", None) is not None
     assert dialog.table.graphicsEffect() is not None
-    assert getattr(dialog.table, "_neon_filter", None) is not None
+    assert neon_registered(dialog.table)
 
     dialog.close()
     app.quit()
@@ -58,9 +59,9 @@ def test_analytics_spin_year_border_updates_with_accent(monkeypatch):
     palette = dialog.spin_year.palette()
     assert palette.color(QtGui.QPalette.Highlight).name().lower() == accent.lower()
 
-    filt = getattr(dialog.spin_year, "_neon_filter", None)
-    assert filt is not None
-    assert filt._config.get("accent_color") == accent
+    target = neon_dispatcher().target_for(dialog.spin_year)
+    assert target is not None
+    assert target[1].get("accent_color") == accent
 
     dialog.close()
     app.quit()
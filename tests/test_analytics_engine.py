@@ -0,0 +1,42 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+
+import analytics
+
+
+def test_year_matrix_aggregates_all_months_in_one_pass():
+    stats = {
+        "1": [
+            {"work": "A", "status": "Завершен", "chapters": 3, "profit": 100, "ads": 10},
+            {"work": "B", "status": "Онгоинг", "chars": "500", "views": 7, "likes": 2},
+        ],
+        "3": [{"work": "C", "profit": "12.5", "thanks": 1}],
+        "13": [{"work": "ignored"}],
+        "misc": [],
+    }
+    matrix = analytics.year_matrix(stats, {"1": 20.0})
+
+    assert len(matrix) == 12
+    jan = matrix[0]
+    assert jan["Работ"] == 2
+    assert jan["Завершенных"] == 1 and jan["Онгоингов"] == 1
+    assert (jan["Глав"], jan["Знаков"], jan["Просмотров"], jan["Лайков"]) == (3, 500, 7, 2)
+    assert jan["Чистыми"] == pytest.approx(70.0)
+    assert matrix[2]["Чистыми"] == pytest.approx(12.5)
+    assert matrix[1] == analytics.month_indicators([])
+    assert set(jan) == set(analytics.COMPUTED_INDICATORS)
+    assert analytics.month_indicators(stats["1"], 20.0) == jan
+
+
+def test_engine_imports_without_qt():
+    code = (
+        "import sys; sys.path.insert(0, %r); import analytics; "
+        "assert not any(m.startswith('PySide6') for m in sys.modules)" % str(APP_DIR)
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
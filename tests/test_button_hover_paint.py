@@ -0,0 +1,86 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+import config
+import glow
+import widgets
+from widgets import StyledPushButton, StyledToolButton
+
+
+def _app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def _hover(button, on):
+    if on:
+        event = QtGui.QEnterEvent(QtCore.QPointF(), QtCore.QPointF(), QtCore.QPointF())
+    else:
+        event = QtCore.QEvent(QtCore.QEvent.Leave)
+    QtWidgets.QApplication.sendEvent(button, event)
+
+
+def test_hover_swaps_cached_paint_without_restyling(monkeypatch):
+    monkeypatch.setitem(widgets.CONFIG, "neon_renderer", "overlay")
+    monkeypatch.setitem(config.CONFIG, "neon_renderer", "overlay")
+    app = _app()
+    window = QtWidgets.QWidget()
+    window.resize(300, 120)
+    button = StyledToolButton(window)
+    button.setText("Hover")
+    button.setGeometry(20, 20, 160, 48)
+    window.show()
+    app.processEvents()
+
+    sheet = button.styleSheet()
+    idle_paint = button._state_paint()
+    calls = []
+    monkeypatch.setattr(button, "setStyleSheet", lambda s: calls.append(s))
+
+    _hover(button, True)
+    hover_paint = button._state_paint()
+    assert button._current_state == "hover"
+    assert hover_paint is not idle_paint
+    accent = button.palette().color(QtGui.QPalette.Highlight)
+    assert hover_paint.pen.color() == accent
+    assert hover_paint.text == accent
+    hover_glow = glow.glow_spec(button)
+    assert hover_glow is not None
+
+    _hover(button, False)
+    assert button._state_paint() is idle_paint
+    idle_glow = glow.glow_spec(button)
+    assert QtGui.QColor.fromRgba(idle_glow.rgba).alpha() < QtGui.QColor.fromRgba(
+        hover_glow.rgba
+    ).alpha()
+
+    _hover(button, True)
+    assert button._state_paint() is hover_paint
+    assert calls == []
+    assert button.styleSheet() == sheet
+    window.close()
+
+
+def test_push_button_paints_gradient_from_brush():
+    app = _app()
+    window = QtWidgets.QWidget()
+    window.resize(200, 80)
+    button = StyledPushButton("Go", window, gradient_colors=["#ff0000", "#ff0000"])
+    button.setGeometry(10, 10, 120, 40)
+    window.show()
+    app.processEvents()
+
+    image = button.grab().toImage()
+    center = image.pixelColor(image.width() // 2 + 30, image.height() // 2)
+    assert center.red() > 200 and center.green() < 60
+
+    button.update_gradient(gradient_colors=["#0000ff", "#0000ff"])
+    image = button.grab().toImage()
+    center = image.pixelColor(image.width() // 2 + 30, image.height() // 2)
+    assert center.blue() > 200 and center.red() < 60
+    window.close()
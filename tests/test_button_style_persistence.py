@@ -14,6 +14,8 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
+import appdata
+import glow
 from widgets import StyledToolButton, StyledPushButton
 from config import CONFIG
 
@@ -30,7 +32,7 @@ def test_gradient_and_neon_persist_across_buttons_and_dialog(monkeypatch):
 
     main.CONFIG["gradient_colors"] = ["#123456", "#654321"]
     main.CONFIG["neon"] = True
-    monkeypatch.setattr(main, "load_config", lambda: main.CONFIG)
+    monkeypatch.setattr(appdata, "load_config", lambda: main.CONFIG)
 
     window.apply_settings()
 
@@ -42,9 +44,9 @@ def test_gradient_and_neon_persist_across_buttons_and_dialog(monkeypatch):
         assert f"stop:1 {grad[1].lower()}" in style
 
     # все кнопки сохраняют неоновый контур (selected усиливает эффект)
-    assert window.sidebar.buttons[0].graphicsEffect() is not None
-    assert window.topbar.btn_prev.graphicsEffect() is not None
-    assert btn_dialog.graphicsEffect() is not None
+    assert glow.glow_spec(window.sidebar.buttons[0]) is not None
+    assert glow.glow_spec(window.topbar.btn_prev) is not None
+    assert glow.glow_spec(btn_dialog) is not None
 
     dlg.close()
 
@@ -58,7 +60,7 @@ def test_gradient_and_neon_persist_across_buttons_and_dialog(monkeypatch):
     sidebar_btn = window.sidebar.buttons[0]
     style = sidebar_btn.styleSheet().lower()
     assert f"stop:0 {grad[0].lower()}" in style
-    assert sidebar_btn.graphicsEffect() is not None
+    assert glow.glow_spec(sidebar_btn) is not None
 
     dlg.close()
     window.close()
@@ -82,9 +84,9 @@ def test_sidebar_apply_style_preserves_idle_neon(monkeypatch):
     assert sidebar.last_active_button is sidebar.buttons[0]
 
     inactive_button = sidebar.buttons[1]
-    effect = inactive_button.graphicsEffect()
 
-    assert isinstance(effect, main.FixedDropShadowEffect)
+    assert inactive_button.graphicsEffect() is None
+    assert glow.glow_spec(inactive_button) is not None
 
     window.close()
     app.quit()
@@ -132,20 +134,20 @@ def test_sidebar_settings_button_text_and_neon_persist(monkeypatch):
     settings_btn = sidebar.btn_settings
     assert settings_btn.text() == "Настройки"
     assert settings_btn.toolButtonStyle() == QtCore.Qt.ToolButtonTextBesideIcon
-    assert isinstance(settings_btn.graphicsEffect(), main.FixedDropShadowEffect)
+    assert glow.glow_spec(settings_btn) is not None
 
     sidebar.set_collapsed(True)
     QtWidgets.QApplication.processEvents()
 
     assert settings_btn.toolButtonStyle() == QtCore.Qt.ToolButtonIconOnly
-    assert isinstance(settings_btn.graphicsEffect(), main.FixedDropShadowEffect)
+    assert glow.glow_spec(settings_btn) is not None
 
     sidebar.set_collapsed(False)
     QtWidgets.QApplication.processEvents()
 
     assert settings_btn.toolButtonStyle() == QtCore.Qt.ToolButtonTextBesideIcon
     assert settings_btn.text() == "Настройки"
-    assert isinstance(settings_btn.graphicsEffect(), main.FixedDropShadowEffect)
+    assert glow.glow_spec(settings_btn) is not None
 
     window.close()
     app.quit()
@@ -166,14 +168,14 @@ def test_sidebar_toggle_button_style_and_neon_match(monkeypatch):
     assert toggle_btn.toolButtonStyle() == QtCore.Qt.ToolButtonTextBesideIcon
     assert toggle_btn.contentSpacing() == reference_btn.contentSpacing()
     assert toggle_btn.styleSheet() == reference_btn.styleSheet()
-    assert isinstance(toggle_btn.graphicsEffect(), main.FixedDropShadowEffect)
+    assert glow.glow_spec(toggle_btn) is not None
 
     sidebar.set_collapsed(True)
     QtWidgets.QApplication.processEvents()
 
     assert toggle_btn.toolButtonStyle() == QtCore.Qt.ToolButtonIconOnly
     assert toggle_btn.contentSpacing() == 0
-    assert isinstance(toggle_btn.graphicsEffect(), main.FixedDropShadowEffect)
+    assert glow.glow_spec(toggle_btn) is not None
 
     sidebar.set_collapsed(False)
     QtWidgets.QApplication.processEvents()
@@ -181,7 +183,7 @@ def test_sidebar_toggle_button_style_and_neon_match(monkeypatch):
     assert toggle_btn.toolButtonStyle() == QtCore.Qt.ToolButtonTextBesideIcon
     assert toggle_btn.contentSpacing() == reference_btn.contentSpacing()
     assert toggle_btn.styleSheet() == reference_btn.styleSheet()
-    assert isinstance(toggle_btn.graphicsEffect(), main.FixedDropShadowEffect)
+    assert glow.glow_spec(toggle_btn) is not None
 
     window.close()
     app.quit()
@@ -233,7 +235,7 @@ def test_sidebar_frame_style_uses_accent_border(monkeypatch):
     monkeypatch.setitem(main.CONFIG, "sidebar_color", "#101010")
 
     window = main.MainWindow()
-    window.apply_palette()
+    window.apply_theme()
     sidebar = window.sidebar
 
     def current_style() -> str:
@@ -244,7 +246,7 @@ def test_sidebar_frame_style_uses_accent_border(monkeypatch):
     assert "#ff44aa" in initial_style
 
     monkeypatch.setitem(main.CONFIG, "accent_color", "#33cc55")
-    window.apply_palette()
+    window.apply_theme()
     updated_style = current_style()
     assert "#33cc55" in updated_style
     assert "#ff44aa" not in updated_style
@@ -11,6 +11,7 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
+import glow
 from widgets import StyledPushButton
 
 
@@ -30,8 +31,7 @@ def test_apply_settings_preserves_idle_neon(monkeypatch):
     window.apply_settings()
     QtWidgets.QApplication.processEvents()
 
-    effect = idle_button.graphicsEffect()
-    assert effect is not None
+    assert glow.glow_spec(idle_button) is not None
 
     style = idle_button.styleSheet().lower()
     accent = main.CONFIG.get("accent_color", "#39ff14").lower()
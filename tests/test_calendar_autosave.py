@@ -0,0 +1,91 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtCore, QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+import autosave
+
+
+def _wait(ms):
+    loop = QtCore.QEventLoop()
+    QtCore.QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def test_scheduler_coalesces_bursts_into_one_write():
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    state = {"value": 0}
+    written = []
+    scheduler = autosave.SaveScheduler(
+        lambda: dict(state), written.append, delay_ms=30
+    )
+    for i in range(10):
+        state["value"] = i
+        scheduler.mark_dirty()
+    assert scheduler.is_dirty()
+    _wait(100)
+    scheduler.flush(wait=True)
+    assert written == [{"value": 9}]
+    assert not scheduler.is_dirty()
+
+    scheduler.flush(wait=True)
+    assert len(written) == 1
+    scheduler.deleteLater()
+    app.processEvents()
+
+
+def test_calendar_edits_are_saved_once_on_navigation(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    table = main.ExcelCalendarTable()
+    try:
+        table.load_month_data(2024, 5)
+        writes = []
+        monkeypatch.setattr(table._autosave, "_write", writes.append)
+        first = next(c for c, d in table.date_map.items() if d.month == 5 and d.day == 1)
+        second = next(c for c, d in table.date_map.items() if d.month == 5 and d.day == 2)
+        for coords, text in ((first, "a"), (second, "b")):
+            inner = table.cell_tables[coords]
+            inner.setItem(0, 0, QtWidgets.QTableWidgetItem(text))
+        assert writes == []
+
+        table.go_next_month()
+        table.flush_pending_save(wait=True)
+        assert len(writes) == 1
+        assert writes[0].days[1][0]["work"] == "a"
+        assert writes[0].days[2][0]["work"] == "b"
+
+        # The snapshot is served from memory before it reaches the disk.
+        table.go_prev_month()
+        assert {"a", "b"} <= set(table.work_names())
+        assert len(writes) == 1
+    finally:
+        table.deleteLater()
+        app.processEvents()
+
+
+def test_flush_writes_pending_edits_to_disk(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    table = main.ExcelCalendarTable()
+    try:
+        table.load_month_data(2024, 7)
+        coords = next(c for c, d in table.date_map.items() if d.month == 7 and d.day == 9)
+        table.cell_tables[coords].setItem(0, 1, QtWidgets.QTableWidgetItem("3"))
+        table.flush_pending_save(wait=True)
+        saved = json.loads((tmp_path / "months" / "2024-07.json").read_text(encoding="utf-8"))
+        assert saved["days"]["9"] == [{"work": "", "plan": "3", "done": ""}]
+    finally:
+        table.deleteLater()
+        app.processEvents()
@@ -13,12 +13,13 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
+import appdata
 
 
 def test_day_label_font_updates_immediately(tmp_path):
     main.CONFIG["header_font"] = "Arial"
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -37,8 +38,8 @@ def test_day_label_font_updates_immediately(tmp_path):
 
 def test_header_font_persists_after_month_change(tmp_path):
     main.CONFIG["header_font"] = "Arial"
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
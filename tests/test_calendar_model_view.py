@@ -0,0 +1,63 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+import calendar_model
+
+
+def test_model_view_calendar_swaps_data_and_autosaves(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+
+    months = tmp_path / "months"
+    months.mkdir()
+    (months / "2024-03.json").write_text(
+        json.dumps(
+            {
+                "year": 2024,
+                "month": 3,
+                "days": {str(d): [{"work": f"w{d}", "plan": "1", "done": ""}] for d in range(1, 11)},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    view = main.ModelCalendarView()
+    try:
+        view.load_month_data(2024, 3)
+        model = view.model()
+        coords = next(c for c, d in view.date_map.items() if d.month == 3 and d.day == 5)
+        index = model.index(*coords)
+        assert index.data(calendar_model.EntriesRole)[0]["work"] == "w5"
+        assert model.rowCount() == len(
+            {r for r, _c in view.date_map}
+        )
+
+        model.set_entry(index, 1, 2, "готово")
+        view.flush_pending_save(wait=True)
+        saved = main.MonthData.load(2024, 3)
+        assert saved.days[5][1] == {"work": "", "plan": "", "done": "готово"}
+        assert saved.days[10] == [{"work": "w10", "plan": "1", "done": ""}]
+
+        view.go_next_month()
+        assert (view.year, view.month) == (2024, 4)
+        assert view.work_names() == []
+        assert view.cell_tables == {}
+
+        view.go_prev_month()
+        assert "w10" in view.work_names()
+    finally:
+        view.deleteLater()
+        app.processEvents()
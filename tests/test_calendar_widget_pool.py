@@ -0,0 +1,64 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+
+
+def test_calendar_reuses_day_widgets_between_months(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    months = tmp_path / "months"
+    months.mkdir()
+    (months / "2024-09.json").write_text(
+        json.dumps(
+            {"year": 2024, "month": 9, "days": {"5": [{"work": "w5", "plan": "1", "done": ""}]}}
+        ),
+        encoding="utf-8",
+    )
+
+    table = main.ExcelCalendarTable()
+    try:
+        # September 2024 spans six weeks, October 2024 only five.
+        table.load_month_data(2024, 9)
+        containers = dict(table.cell_containers)
+        inners = dict(table.cell_tables)
+        assert len(containers) == 42
+        coords = next(c for c, d in table.date_map.items() if d.month == 9 and d.day == 5)
+        assert table.cell_tables[coords].item(0, 0).text() == "w5"
+
+        table.load_month_data(2024, 10)
+        assert table.rowCount() == 6
+        assert table.isRowHidden(5)
+        assert len(table.date_map) == 35
+        assert all(table.cell_containers[c] is w for c, w in containers.items())
+        assert all(table.cell_tables[c] is t for c, t in inners.items())
+        for c, day in table.date_map.items():
+            assert table.day_labels[c].text() == str(day.day)
+            assert table.cell_containers[c].isEnabled() == (day.month == 10)
+        item = table.cell_tables[coords].item(0, 0)
+        assert item is None or item.text() == ""
+
+        table.load_month_data(2024, 9)
+        assert not table.isRowHidden(5)
+        assert table.cell_tables[coords] is inners[coords]
+        assert table.cell_tables[coords].item(0, 0).text() == "w5"
+
+        monkeypatch.setitem(main.CONFIG, "day_rows", 2)
+        table.update_day_rows()
+        assert table.cell_tables[coords] is inners[coords]
+        assert table.cell_tables[coords].rowCount() == 2
+    finally:
+        table.deleteLater()
+        app.processEvents()
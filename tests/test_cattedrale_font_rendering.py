@@ -9,6 +9,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
 from PySide6 import QtWidgets, QtGui
 
 import app.main as main
+import appdata
 
 
 def test_cattedrale_font_applied(tmp_path):
@@ -16,10 +17,10 @@ def test_cattedrale_font_applied(tmp_path):
     fid = QtGui.QFontDatabase.addApplicationFont(str(font_path))
     family = QtGui.QFontDatabase.applicationFontFamilies(fid)[0]
 
-    main.CONFIG_PATH = str(tmp_path / "config.json")
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
     main.CONFIG["header_font"] = family
     main.CONFIG["sidebar_font"] = family
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -0,0 +1,87 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+import changelog
+
+
+def test_month_edits_append_day_deltas_and_compact(tmp_path, monkeypatch):
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    monkeypatch.setattr(changelog, "COMPACT_THRESHOLD", 4)
+    snapshot = tmp_path / "months" / "2024-03.json"
+    log = tmp_path / "months" / "2024.log"
+
+    md = main.MonthData(2024, 3, {1: [{"work": "a", "plan": "1", "done": ""}]})
+    md.write()
+    assert snapshot.exists() and not log.exists()
+
+    md.days[2] = [{"work": "b", "plan": "", "done": ""}]
+    md.write()
+    entries = [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+    assert entries == [
+        {"op": "set", "month": 3, "item": 2, "value": [{"work": "b", "plan": "", "done": ""}]}
+    ]
+    assert "2" not in json.loads(snapshot.read_text(encoding="utf-8"))["days"]
+
+    del md.days[1]
+    md.write()
+    assert main.MonthData.load(2024, 3).days == {2: [{"work": "b", "plan": "", "done": ""}]}
+
+    # A torn last line from a crash during append is ignored.
+    with log.open("a", encoding="utf-8") as f:
+        f.write('{"op": "set", "month": 3, "it')
+    assert main.MonthData.load(2024, 3).days == {2: [{"work": "b", "plan": "", "done": ""}]}
+
+    md.days[5] = [{"work": "c", "plan": "", "done": "1"}]
+    md.write()
+    assert not log.exists()
+    data = json.loads(snapshot.read_text(encoding="utf-8"))
+    assert set(data["days"]) == {"2", "5"}
+
+
+def test_stats_records_go_through_year_log(tmp_path, monkeypatch):
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    stats = Path(appdata.stats_dir(2024))
+    (stats / "2024.json").write_text(
+        json.dumps({"1": [{"work": "Alpha"}], "2": [{"work": "Beta"}]}), encoding="utf-8"
+    )
+
+    appdata.save_stats_record(2024, 2, 0, {"work": "Beta", "chapters": 3})
+    appdata.save_stats_record(2024, 2, 1, {"work": "Gamma"})
+
+    raw = json.loads((stats / "2024.json").read_text(encoding="utf-8"))
+    assert raw["2"] == [{"work": "Beta"}]
+    assert len((stats / "2024.log").read_text(encoding="utf-8").splitlines()) == 2
+    assert appdata.load_stats_data(2024) == {
+        "1": [{"work": "Alpha"}],
+        "2": [{"work": "Beta", "chapters": 3}, {"work": "Gamma"}],
+    }
+
+
+def test_logs_of_one_file_share_a_lock_and_load_waits_for_compaction(tmp_path, monkeypatch):
+    import threading
+
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    path = str(tmp_path / "2024.log")
+    assert changelog.YearLog(path)._lock is changelog.YearLog(path)._lock
+    assert changelog.YearLog(path)._lock is not changelog.YearLog(path + "x")._lock
+
+    main.MonthData(2024, 3, {1: [{"work": "a", "plan": "", "done": ""}]}).write()
+    loaded = []
+    with main._MONTH_LOG_LOCK:
+        worker = threading.Thread(target=lambda: loaded.append(main.MonthData.load(2024, 3)))
+        worker.start()
+        worker.join(0.2)
+        assert loaded == []  # blocked while a compaction could be running
+    worker.join(5)
+    assert loaded[0].days == {1: [{"work": "a", "plan": "", "done": ""}]}
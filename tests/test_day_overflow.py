@@ -0,0 +1,153 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+import calendar_model
+
+ENTRIES = [{"work": f"w{i}", "plan": str(i), "done": ""} for i in range(6)]
+
+
+def _write_month(tmp_path):
+    months = tmp_path / "months"
+    months.mkdir()
+    (months / "2024-03.json").write_text(
+        json.dumps({"year": 2024, "month": 3, "days": {"5": ENTRIES}}), encoding="utf-8"
+    )
+
+
+def _works(inner):
+    return [
+        inner.item(row, 0).text() if inner.item(row, 0) else ""
+        for row in range(inner.rowCount())
+    ]
+
+
+def test_scroll_limit_leaves_room_for_a_new_entry():
+    assert calendar_model.scroll_limit(2, 4) == 0
+    assert calendar_model.scroll_limit(4, 4) == 1
+    assert calendar_model.scroll_limit(6, 2) == 5
+    assert calendar_model.hidden_entries(6, 0, 2) == 4
+    assert calendar_model.hidden_entries(6, 5, 2) == 5
+
+
+def test_widget_calendar_keeps_entries_beyond_the_visible_rows(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    monkeypatch.setitem(main.CONFIG, "day_rows", 2)
+    _write_month(tmp_path)
+    table = main.ExcelCalendarTable()
+    try:
+        table.load_month_data(2024, 3)
+        coords = next(c for c, d in table.date_map.items() if d.month == 3 and d.day == 5)
+        inner = table.cell_tables[coords]
+        assert inner.rowCount() == 2
+        assert _works(inner) == ["w0", "w1"]
+        button = table._more_buttons[coords]
+        assert button.text() == "+4" and not button.isHidden()
+        other = next(c for c, d in table.date_map.items() if d.month == 3 and d.day == 6)
+        assert other not in table._more_buttons
+
+        assert table.scroll_day(coords, 3)
+        assert _works(inner) == ["w3", "w4"]
+        inner.item(1, 0).setText("edited")
+        table.flush_pending_save(wait=True)
+        saved = main.MonthData.load(2024, 3).days[5]
+        assert [row["work"] for row in saved] == ["w0", "w1", "w2", "w3", "edited", "w5"]
+
+        # The last offset shows an empty row for the next entry.
+        while table.scroll_day(coords, 1):
+            pass
+        assert _works(inner) == ["w5", ""]
+        inner.setItem(1, 0, QtWidgets.QTableWidgetItem("w6"))
+        assert len(table._month_days[5]) == 7
+        assert "w6" in table.work_names()
+
+        monkeypatch.setitem(main.CONFIG, "day_rows", 8)
+        table.update_day_rows()
+        assert _works(inner)[:7] == ["w0", "w1", "w2", "w3", "edited", "w5", "w6"]
+        assert button.isHidden()
+    finally:
+        table.deleteLater()
+        app.processEvents()
+
+
+def test_popup_editor_replaces_the_day(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    monkeypatch.setitem(main.CONFIG, "day_rows", 2)
+    _write_month(tmp_path)
+    dialog_cls = main.dialog_class("DayEntriesDialog")
+
+    def accept(self):
+        assert self.table.rowCount() == len(ENTRIES) + 1
+        self.table.item(len(ENTRIES), 0).setText("added")
+        self.table.selectRow(0)
+        self.remove_selected_rows()
+        return QtWidgets.QDialog.Accepted
+
+    monkeypatch.setattr(dialog_cls, "exec", accept)
+    table = main.ExcelCalendarTable()
+    view = main.ModelCalendarView(load=False)
+    try:
+        table.load_month_data(2024, 3)
+        coords = next(c for c, d in table.date_map.items() if d.month == 3 and d.day == 5)
+        table._more_buttons[coords].click()
+        expected = [f"w{i}" for i in range(1, 6)] + ["added"]
+        assert [row["work"] for row in table._month_days[5]] == expected
+        assert table._more_buttons[coords].text() == "+4"
+
+        view.load_month_data(2024, 3)
+        index = view.model().index(*coords)
+        assert view.open_day_editor(coords)
+        assert [row["work"] for row in index.data(calendar_model.EntriesRole)] == expected
+    finally:
+        table.deleteLater()
+        view.deleteLater()
+        app.processEvents()
+
+
+def test_model_calendar_scrolls_and_edits_the_window(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    monkeypatch.setitem(main.CONFIG, "day_rows", 2)
+    _write_month(tmp_path)
+    view = main.ModelCalendarView()
+    try:
+        view.load_month_data(2024, 3)
+        model = view.model()
+        coords = next(c for c, d in view.date_map.items() if d.month == 3 and d.day == 5)
+        index = model.index(*coords)
+        assert model.hidden_count(index) == 4
+        view.resize(900, 700)
+        assert not view.grab().isNull()  # paints the "+4" marker
+        assert not model.scroll_day(index, -1)
+        assert model.scroll_day(index, 2)
+        assert model.row_offset(index) == 2
+
+        delegate = view.itemDelegate()
+        delegate.set_edit_target(1, 0)
+        editor = QtWidgets.QLineEdit()
+        delegate.setEditorData(editor, index)
+        assert editor.text() == "w3"
+        editor.setText("edited")
+        delegate.setModelData(editor, model, index)
+        assert index.data(calendar_model.EntriesRole)[3]["work"] == "edited"
+        assert len(index.data(calendar_model.EntriesRole)) == 6
+
+        view.load_month_data(2024, 3)
+        assert model.row_offset(model.index(*coords)) == 0
+    finally:
+        view.deleteLater()
+        app.processEvents()
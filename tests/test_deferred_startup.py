@@ -0,0 +1,78 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+
+
+def _wait_for(signal, timeout=5000):
+    loop = QtCore.QEventLoop()
+    signal.connect(loop.quit)
+    QtCore.QTimer.singleShot(timeout, loop.quit)
+    loop.exec()
+
+
+def test_window_is_painted_before_month_data(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    monkeypatch.setitem(main.CONFIG, "calendar_mode", "excel")
+    main.MONTH_CACHE.clear()
+    window = main.MainWindow(deferred=True)
+    try:
+        table = window.table
+        assert table.date_map == {}
+        assert table.cell_containers == {}
+        assert table.rowCount() >= 4
+        pending = main.theme_transaction.ThemeTransaction(window._applied_theme, main.CONFIG)
+        assert pending.aspects == {"neon", "gradient"}
+
+        events = []
+        marks = []
+        monkeypatch.setattr(
+            main.startup_profiler.PROFILER, "mark", lambda name: marks.append(name) or 0.0
+        )
+        load = table.load_month_data
+
+        def load_month_data(year, month):
+            events.append("data")
+            return load(year, month)
+
+        monkeypatch.setattr(table, "load_month_data", load_month_data)
+        window.showMaximized()
+        window.start_deferred_startup(lambda: events.append("task"))
+        _wait_for(window.startup_finished)
+
+        assert marks == ["first_paint"]
+        assert events == ["data", "task"]
+        assert len(table.date_map) == 7 * table.rowCount()
+        assert all(table.day_labels[c].text() for c in table.date_map)
+        assert not main.theme_transaction.ThemeTransaction(window._applied_theme, main.CONFIG)
+    finally:
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+
+def test_unloaded_calendar_does_not_overwrite_month(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    for cls in (main.ExcelCalendarTable, main.ModelCalendarView):
+        table = cls(load=False)
+        try:
+            table.save_current_month()
+            assert not (tmp_path / "months").exists() or not any(
+                (tmp_path / "months").iterdir()
+            )
+        finally:
+            table.deleteLater()
+    app.processEvents()
@@ -0,0 +1,112 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtGui, QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+
+
+def _window(tmp_path, monkeypatch):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    monkeypatch.setattr(appdata, "CONFIG_PATH", str(tmp_path / "config.json"))
+    for name in ("StatsDialog", "AnalyticsDialog", "ReleaseDialog", "TopDialog", "SettingsDialog"):
+        monkeypatch.setattr(main.dialog_class(name), "exec", lambda self: 0)
+    return main.MainWindow()
+
+
+def _count(monkeypatch, cls, method):
+    calls = []
+    original = getattr(cls, method)
+
+    def wrapper(self, *args):
+        calls.append(args)
+        return original(self, *args)
+
+    monkeypatch.setattr(cls, method, wrapper)
+    return calls
+
+
+def test_dialogs_are_reused_and_reload_only_changed_data(tmp_path, monkeypatch):
+    window = _window(tmp_path, monkeypatch)
+    try:
+        year, month = window.table.year, window.table.month
+        loads = _count(monkeypatch, main.StatsDialog, "load_stats")
+        window.open_input_dialog()
+        first = window._dialogs.get("StatsDialog", year, month)
+        assert len(loads) == 1
+
+        first.form_stats.widgets["work"].setText("draft")
+        window.open_input_dialog()
+        assert window._dialogs.get("StatsDialog", year, month) is first
+        assert len(loads) == 1
+        assert first.form_stats.widgets["work"].text() == ""
+
+        appdata.save_stats_record(year, month, 0, {"work": "Alpha"})
+        window.open_input_dialog()
+        assert len(loads) == 2
+        assert first.records[0]["work"] == "Alpha"
+
+        window.next_month()
+        window.open_input_dialog()
+        assert len(loads) == 3
+        assert first.month == window.table.month
+
+        calcs = _count(monkeypatch, main.TopDialog, "calculate")
+        window.open_top_dialog()
+        top = window._dialogs.get("TopDialog", window.table.year)
+        window.open_top_dialog()
+        assert len(calcs) == 1
+        appdata.save_stats_record(window.table.year, window.table.month, 0, {"work": "Beta"})
+        window.open_top_dialog()
+        assert len(calcs) == 2
+        assert window._dialogs.get("TopDialog", window.table.year) is top
+        appdata.wait_top_rankings()
+    finally:
+        window.close()
+
+
+def test_release_dialog_reloads_after_file_change(tmp_path, monkeypatch):
+    window = _window(tmp_path, monkeypatch)
+    try:
+        year, month = window.table.year, window.table.month
+        loads = _count(monkeypatch, main.ReleaseDialog, "load")
+        window.open_release_dialog()
+        dlg = window._dialogs.get("ReleaseDialog", year, month, [])
+        window.open_release_dialog()
+        assert len(loads) == 1
+
+        appdata.save_release_data(year, month, {"days": {"3": [{"work": "Gamma", "chapters": 2}]}})
+        window.open_release_dialog()
+        assert len(loads) == 2
+        assert dlg.table.model().index(0, 1).data() == "Gamma"
+    finally:
+        window.close()
+
+
+def test_settings_dialog_is_rebuilt_after_dismissed_edits(tmp_path, monkeypatch):
+    window = _window(tmp_path, monkeypatch)
+    try:
+        dlg = window._dialogs.get("SettingsDialog")
+        assert window._dialogs.get("SettingsDialog") is dlg
+
+        dlg.spin_day_rows.setValue(dlg.spin_day_rows.value() + 1)  # saved at once
+        assert window._dialogs.get("SettingsDialog") is dlg
+
+        dlg.edit_path.setText(str(tmp_path / "elsewhere"))  # never confirmed
+        fresh = window._dialogs.get("SettingsDialog")
+        assert fresh is not dlg
+
+        monkeypatch.setitem(main.CONFIG, "header_font", "Some Other Font")
+        assert window._dialogs.get("SettingsDialog") is not fresh
+    finally:
+        window.close()
@@ -13,6 +13,7 @@ import resources  # noqa: E402
 resources.register_fonts = lambda: None
 
 import app.main as main  # noqa: E402
+import appdata  # noqa: E402
 
 
 @pytest.mark.parametrize(
@@ -27,8 +28,8 @@ import app.main as main  # noqa: E402
 )
 def test_dialog_geometry_persist(tmp_path, monkeypatch, factory):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
     dlg = factory(None)
     size = QtCore.QSize(640, 480)
@@ -48,8 +49,8 @@ def test_dialog_geometry_persist(tmp_path, monkeypatch, factory):
 
 def test_calendar_columns_persist(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
     window = main.MainWindow()
     # Adjust inner day table column widths via header resizing
@@ -68,36 +69,35 @@ def test_calendar_columns_persist(tmp_path, monkeypatch):
     app.quit()
 
 
+def _fill_row(dlg, row, *texts):
+    model = dlg.table.model()
+    for column, text in enumerate(texts):
+        model.setData(model.index(row, column), text)
+
+
+def _table_rows(dlg):
+    model = dlg.table.model()
+    return [
+        tuple(model.index(row, column).data() for column in range(model.columnCount()))
+        for row in range(model.rowCount())
+    ]
+
+
 def test_release_dialog_restores_multiple_entries(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
 
     dlg = main.ReleaseDialog(2024, 1, [], None)
     # заполнить первую (пустую) строку
-    dlg.table.item(0, 0).setText("5")
-    dlg.table.item(0, 1).setText("Alpha")
-    dlg.table.item(0, 2).setText("2")
-    dlg.table.item(0, 3).setText("10:00")
+    _fill_row(dlg, 0, "5", "Alpha", "2", "10:00")
     dlg.add_row(day=5, entry={"work": "Beta", "chapters": 1, "time": "12:00"})
     dlg.save()
     dlg.close()
 
     dlg2 = main.ReleaseDialog(2024, 1, [], None)
-    rows = []
-    for row in range(dlg2.table.rowCount()):
-        work_item = dlg2.table.item(row, 1)
-        if work_item is None or not work_item.text().strip():
-            continue
-        rows.append(
-            (
-                dlg2.table.item(row, 0).text(),
-                work_item.text(),
-                dlg2.table.item(row, 2).text(),
-                dlg2.table.item(row, 3).text(),
-            )
-        )
+    rows = [row for row in _table_rows(dlg2) if row[1].strip()]
 
     assert rows == [("5", "Alpha", "2", "10:00"), ("5", "Beta", "1", "12:00")]
     dlg2.close()
@@ -106,33 +106,18 @@ def test_release_dialog_restores_multiple_entries(tmp_path, monkeypatch):
 
 def test_release_dialog_preserves_february_data(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
 
     dlg = main.ReleaseDialog(2024, 2, [], None)
-    assert dlg.table.rowCount() >= 28
-    dlg.table.item(0, 0).setText("28")
-    dlg.table.item(0, 1).setText("Gamma")
-    dlg.table.item(0, 2).setText("3")
-    dlg.table.item(0, 3).setText("09:30")
+    assert dlg.table.model().rowCount() >= 28
+    _fill_row(dlg, 0, "28", "Gamma", "3", "09:30")
     dlg.save()
     dlg.close()
 
     dlg2 = main.ReleaseDialog(2024, 2, [], None)
-    restored = []
-    for row in range(dlg2.table.rowCount()):
-        work_item = dlg2.table.item(row, 1)
-        if work_item is None or not work_item.text().strip():
-            continue
-        restored.append(
-            (
-                dlg2.table.item(row, 0).text(),
-                work_item.text(),
-                dlg2.table.item(row, 2).text(),
-                dlg2.table.item(row, 3).text(),
-            )
-        )
+    restored = [row for row in _table_rows(dlg2) if row[1].strip()]
 
     assert restored == [("28", "Gamma", "3", "09:30")]
     dlg2.close()
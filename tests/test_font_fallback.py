@@ -9,15 +9,15 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
 from PySide6 import QtWidgets, QtGui
 
 import app.main as main
+import appdata
 import resources
 
 
 def test_register_fonts_falls_back_to_exo2(monkeypatch, tmp_path):
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
 
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    main.CONFIG = main.load_config()
-    main.config.CONFIG = main.CONFIG
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    appdata.reload_config()
 
     monkeypatch.setattr(resources, "_filter_supported_families", lambda families, source: set())
 
@@ -34,9 +34,8 @@ def test_register_fonts_falls_back_to_exo2(monkeypatch, tmp_path):
 def test_resolve_font_config_rejects_unsupported(monkeypatch, tmp_path):
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
 
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
-    main.CONFIG = main.load_config()
-    main.config.CONFIG = main.CONFIG
+    monkeypatch.setattr(appdata, "CONFIG_PATH", str(tmp_path / "config.json"))
+    appdata.reload_config()
     main.CONFIG.update(
         {
             "header_font": "Unsupported",
@@ -63,7 +62,7 @@ def test_resolve_font_config_rejects_unsupported(monkeypatch, tmp_path):
         assert main.CONFIG["text_font"] == "Exo 2"
         assert main.CONFIG["sidebar_font"] == "Exo 2"
         assert main.CONFIG["font_family"] == "Exo 2"
-        with open(main.CONFIG_PATH, "r", encoding="utf-8") as fh:
+        with open(appdata.CONFIG_PATH, "r", encoding="utf-8") as fh:
             stored = json.load(fh)
         assert stored["header_font"] == "Exo 2"
         assert stored["text_font"] == "Exo 2"
@@ -76,9 +75,8 @@ def test_resolve_font_config_rejects_unsupported(monkeypatch, tmp_path):
 def test_settings_dialog_restores_exo_on_invalid_selection(monkeypatch, tmp_path):
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
 
-    monkeypatch.setattr(main, "CONFIG_PATH", str(tmp_path / "config.json"))
-    main.CONFIG = main.load_config()
-    main.config.CONFIG = main.CONFIG
+    monkeypatch.setattr(appdata, "CONFIG_PATH", str(tmp_path / "config.json"))
+    appdata.reload_config()
 
     monkeypatch.setattr(
         resources,
@@ -0,0 +1,59 @@
+import importlib.util
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtGui, QtWidgets
+
+import resources
+
+
+def _fresh_resources():
+    # Other test modules replace ``resources.register_fonts`` on import.
+    spec = importlib.util.spec_from_file_location(
+        "resources_under_test", resources.__file__
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_register_fonts_defers_secondary_faces(monkeypatch):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    resources = _fresh_resources()
+
+    def no_scan():
+        raise AssertionError("font database scanned during registration")
+
+    batches = []
+
+    def validate(families, source):
+        batches.append(set(families))
+        return set(families)
+
+    monkeypatch.setattr(QtGui.QFontDatabase, "families", staticmethod(no_scan))
+    monkeypatch.setattr(resources, "_filter_supported_families", validate)
+
+    resources.register_fonts(defer=True)
+
+    assert {"Exo 2"} in batches
+    assert len(batches) == 2  # Cattedrale, then the Exo 2 batch
+    deferred = list(resources._DEFERRED_FONT_FILES)
+    names = {os.path.basename(path) for path in deferred}
+    assert names and not names & set(resources.ESSENTIAL_EXO2_FACES)
+    assert "Exo2-Italic.ttf" in names
+
+    assert "Exo 2" in resources.register_deferred_fonts()
+    assert resources._DEFERRED_FONT_FILES == []
+    assert resources._FONT_FILES["Exo 2"] in deferred
+
+
+def test_cattedrale_family_comes_from_qt():
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    path = os.path.join(resources.FONTS_DIR, resources.CATTEDRALE_FILE)
+    family = resources.register_cattedrale(path)
+    assert family != "Exo 2"
+    assert resources._FONT_FILES[family] == path
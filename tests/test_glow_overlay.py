@@ -0,0 +1,151 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+import glow
+from effects import apply_neon_effect
+
+CONFIG = {"neon_renderer": "overlay", "neon_size": 12, "neon_intensity": 200}
+
+
+def _app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_highlight_registers_glow_instead_of_effect():
+    app = _app()
+    window = QtWidgets.QWidget()
+    window.resize(300, 200)
+    button = QtWidgets.QPushButton("Neon", window)
+    button.setGeometry(40, 40, 100, 30)
+    window.show()
+    app.processEvents()
+
+    apply_neon_effect(button, True, config=CONFIG)
+    assert button.graphicsEffect() is None
+    spec = glow.glow_spec(button)
+    assert spec is not None and spec.blur == 12
+    assert QtGui.QColor.fromRgba(spec.rgba).alpha() == 200
+    overlay = window._glow_overlay
+    assert list(overlay.glows().values()) == [spec]
+    assert getattr(button, "_neon_effect", None) is not None
+
+    # the overlay paints without touching the widget
+    window.grab()
+
+    apply_neon_effect(button, False, config=CONFIG)
+    assert glow.glow_spec(button) is None
+    assert overlay.glows() == {}
+    window.close()
+
+
+def test_unparented_widget_glows_once_placed_into_window():
+    app = _app()
+    label = QtWidgets.QLabel("late")
+    apply_neon_effect(label, True, config=CONFIG)
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(window)
+    layout.addWidget(label)
+    window.show()
+    app.processEvents()
+    assert glow.glow_spec(label) in window._glow_overlay.glows().values()
+    apply_neon_effect(label, False, config=CONFIG)
+    window.close()
+
+
+def test_glow_pixmaps_are_cached_and_leave_widget_area_clear():
+    _app()
+    cache = glow.GlowPixmapCache(capacity=2)
+    spec = glow.GlowSpec(QtGui.QColor(57, 255, 20, 255).rgba(), blur=10, radius=4)
+    size = QtCore.QSize(60, 20)
+
+    pixmap = cache.get(size, spec)
+    assert cache.get(size, spec) is pixmap
+    assert cache.misses == 1
+    assert (pixmap.width(), pixmap.height()) == (80, 40)
+
+    image = pixmap.toImage()
+    assert image.pixelColor(40, 20).alpha() == 0  # inside the widget
+    assert image.pixelColor(40, 7).alpha() > 0  # just above its edge
+
+    cache.get(QtCore.QSize(10, 10), spec)
+    cache.get(QtCore.QSize(20, 10), spec)
+    assert len(cache) == 2
+
+
+def test_glow_follows_ancestor_and_stays_inside_it():
+    app = _app()
+    window = QtWidgets.QWidget()
+    window.resize(300, 200)
+    container = QtWidgets.QWidget(window)
+    container.setGeometry(50, 50, 150, 60)
+    button = QtWidgets.QPushButton("Neon", container)
+    button.setGeometry(0, 0, 100, 30)
+    window.show()
+    app.processEvents()
+    before = window.grab().toImage()
+
+    apply_neon_effect(button, True, config=CONFIG)
+    overlay = window._glow_overlay
+    spec = glow.glow_spec(button)
+    assert overlay._glow_clip(button, spec).boundingRect() == QtCore.QRect(50, 50, 112, 42)
+    after = window.grab().toImage()
+    assert after.pixelColor(100, 84) != before.pixelColor(100, 84)  # below the button
+    assert after.pixelColor(100, 46) == before.pixelColor(100, 46)  # outside the container
+
+    key = glow._key(button)
+    painted = QtCore.QRect(overlay._painted[key])
+    container.move(80, 50)  # e.g. the sidebar sliding
+    assert overlay._painted[key] == painted.translated(30, 0)
+
+    apply_neon_effect(button, False, config=CONFIG)
+    assert glow._key(container) not in glow._get_tracker()._ancestors
+    window.close()
+
+
+def test_adjacent_glows_stay_under_widgets_stacked_above():
+    app = _app()
+    window = QtWidgets.QWidget()
+    window.resize(300, 120)
+    first = QtWidgets.QPushButton("A", window)
+    first.setGeometry(20, 40, 100, 30)
+    second = QtWidgets.QPushButton("B", window)  # created later, stacked above
+    second.setGeometry(124, 40, 100, 30)
+    window.show()
+    app.processEvents()
+    before = window.grab().toImage()
+    inside_first = QtCore.QPoint(117, 55)
+    inside_second = QtCore.QPoint(127, 55)
+
+    apply_neon_effect(first, True, config=CONFIG)
+    overlay = window._glow_overlay
+    assert not overlay._glow_clip(first, glow.glow_spec(first)).contains(inside_second)
+    after = window.grab().toImage()
+    assert after.pixelColor(inside_second) == before.pixelColor(inside_second)
+    assert after.pixelColor(70, 36) != before.pixelColor(70, 36)  # above the first
+
+    # like a drop shadow, the later widget's glow covers the earlier widget
+    apply_neon_effect(second, True, config=CONFIG)
+    both = window.grab().toImage()
+    assert both.pixelColor(inside_first) != after.pixelColor(inside_first)
+    apply_neon_effect(first, False, config=CONFIG)
+    second_only = window.grab().toImage()
+    assert both.pixelColor(inside_second) == second_only.pixelColor(inside_second)
+
+    # raising the first widget swaps which glow is cut
+    apply_neon_effect(first, True, config=CONFIG)
+    first.raise_()
+    app.processEvents()
+    assert not overlay._glow_clip(second, glow.glow_spec(second)).contains(inside_first)
+    assert overlay._glow_clip(first, glow.glow_spec(first)).contains(inside_second)
+    raised = window.grab().toImage()
+    assert raised.pixelColor(inside_second) != second_only.pixelColor(inside_second)
+
+    apply_neon_effect(first, False, config=CONFIG)
+    apply_neon_effect(second, False, config=CONFIG)
+    window.close()
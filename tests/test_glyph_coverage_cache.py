@@ -0,0 +1,90 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtWidgets
+
+import resources
+
+
+def _counting_scan(monkeypatch):
+    scanned = []
+
+    def scan(family):
+        scanned.append(family)
+        return (False, "кириллический") if family == "Latin Only" else (True, None)
+
+    monkeypatch.setattr(resources, "_scan_required_glyphs", scan)
+    return scanned
+
+
+def test_coverage_is_scanned_once_and_persisted(monkeypatch, tmp_path):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    scanned = _counting_scan(monkeypatch)
+    cache = resources.GlyphCoverageCache()
+    monkeypatch.setattr(resources, "GLYPH_CACHE", cache)
+    cache.set_path(str(tmp_path / resources.GLYPH_CACHE_FILE))
+
+    valid = resources.filter_supported_families(
+        ["Good", "Latin Only"], "test", emit_warnings=False
+    )
+    assert valid == {"Good"}
+    assert resources.family_support_details("Latin Only") == (False, "кириллический")
+    assert scanned == ["Good", "Latin Only"]
+    assert (tmp_path / resources.GLYPH_CACHE_FILE).exists()
+
+    reloaded = resources.GlyphCoverageCache(str(tmp_path / resources.GLYPH_CACHE_FILE))
+    assert reloaded.check("Good") == (True, None)
+    assert reloaded.misses == 0
+    assert scanned == ["Good", "Latin Only"]
+
+
+def test_changed_font_file_invalidates_entry(monkeypatch, tmp_path):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    scanned = _counting_scan(monkeypatch)
+    font_file = tmp_path / "Bundled.ttf"
+    font_file.write_bytes(b"v1")
+    monkeypatch.setitem(resources._FONT_FILES, "Bundled", str(font_file))
+    cache = resources.GlyphCoverageCache()
+
+    cache.check("Bundled")
+    cache.check("Bundled")
+    assert scanned == ["Bundled"]
+
+    stat = font_file.stat()
+    os.utime(font_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache.check("Bundled")
+    assert scanned == ["Bundled", "Bundled"]
+
+
+def test_warm_fills_cache_in_background(monkeypatch, tmp_path):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    _counting_scan(monkeypatch)
+    path = tmp_path / resources.GLYPH_CACHE_FILE
+    cache = resources.GlyphCoverageCache(str(path))
+
+    assert cache.warm(["A", "B", "Latin Only"]).result(timeout=5) == 3
+    assert cache.lookup("Latin Only") == (False, "кириллический")
+    assert path.exists()
+    assert cache.warm(["A", "B"]).result(timeout=5) == 0
+
+
+def test_real_scan_of_bundled_exo2(tmp_path):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from PySide6 import QtGui
+
+    font_file = Path(__file__).resolve().parent.parent / "assets" / "fonts" / "Exo2" / "Exo2-Regular.ttf"
+    font_id = QtGui.QFontDatabase.addApplicationFont(str(font_file))
+    assert font_id != -1
+    family = QtGui.QFontDatabase.applicationFontFamilies(font_id)[0]
+
+    assert resources._scan_required_glyphs(family) == (True, None)
+    cache = resources.GlyphCoverageCache(str(tmp_path / resources.GLYPH_CACHE_FILE))
+    assert cache.check(family) == (True, None)
+    cache.save()
+    reloaded = resources.GlyphCoverageCache(str(tmp_path / resources.GLYPH_CACHE_FILE))
+    assert reloaded.check(family) == (True, None)
+    assert reloaded.misses == 0
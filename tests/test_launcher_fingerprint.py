@@ -0,0 +1,83 @@
+import importlib.util
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _launcher(tmp_path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("launcher", ROOT / "run.py")
+    run = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(run)
+    venv = tmp_path / ".venv"
+    python = venv / "bin" / "python"
+    python.parent.mkdir(parents=True)
+    python.write_text("")
+    (venv / "pyvenv.cfg").write_text("home = /usr/bin\nversion = 3.11.9\n")
+    for site in ("lib/python3.11/site-packages", "Lib/site-packages"):
+        (venv / site).mkdir(parents=True, exist_ok=True)
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text("PySide6==6.9.2\n")
+    monkeypatch.setattr(run, "VENV_DIR", venv)
+    monkeypatch.setattr(run, "PYTHON", python)
+    monkeypatch.setattr(run, "REQUIREMENTS", requirements)
+    monkeypatch.setattr(run, "FINGERPRINT_PATH", venv / "fingerprint.json")
+    calls = []
+    monkeypatch.setattr(run.subprocess, "check_call", lambda cmd: calls.append(cmd))
+    run.probes = []
+
+    def probe(cmd, **_kwargs):
+        run.probes.append(cmd)
+        return 0
+
+    monkeypatch.setattr(run.subprocess, "call", probe)
+    return run, calls
+
+
+def test_install_is_skipped_while_fingerprint_matches(tmp_path, monkeypatch):
+    run, calls = _launcher(tmp_path, monkeypatch)
+
+    # An existing venv without a fingerprint is only probed, not reinstalled.
+    assert run.prepare_environment() == 0
+    assert calls == [] and len(run.probes) == 1
+    assert run.FINGERPRINT_PATH.exists()
+    assert run.prepare_environment() == 0
+    assert calls == [] and len(run.probes) == 1
+
+    run.REQUIREMENTS.write_text("PySide6==6.9.3\n")
+    assert run.prepare_environment() == 0
+    assert len(calls) == 1 and "pip" in calls[0]
+    assert run.prepare_environment(force=True) == 0
+    assert len(calls) == 2
+
+
+def test_changed_environment_is_checked_again(tmp_path, monkeypatch):
+    run, calls = _launcher(tmp_path, monkeypatch)
+    run.prepare_environment()
+
+    cfg = run.VENV_DIR / "pyvenv.cfg"
+    cfg.write_text(cfg.read_text().replace("3.11.9", "3.12.1"))
+    run.prepare_environment()
+    assert len(run.probes) == 2 and calls == []
+
+    monkeypatch.setattr(run.subprocess, "call", lambda cmd, **_kwargs: 1)
+    cfg.write_text(cfg.read_text().replace("3.12.1", "3.12.2"))
+    run.prepare_environment()
+    assert len(calls) == 1
+
+
+def test_failed_install_is_reported(tmp_path, monkeypatch, capsys):
+    run, _calls = _launcher(tmp_path, monkeypatch)
+
+    def fail(cmd):
+        raise subprocess.CalledProcessError(3, cmd)
+
+    run.prepare_environment()
+    monkeypatch.setattr(run.subprocess, "check_call", fail)
+    run.REQUIREMENTS.write_text("PySide6==6.9.3\n")
+    # An existing venv still starts when pip cannot run (offline, proxy).
+    assert run.prepare_environment() == 0
+    assert "Не удалось установить зависимости" in capsys.readouterr().err
+    assert run.prepare_environment() == 0
+    assert "Не удалось установить зависимости" in capsys.readouterr().err  # tried again
+    assert run.prepare_environment(force=True) == 3
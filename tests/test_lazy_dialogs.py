@@ -0,0 +1,57 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+APP_DIR = Path(__file__).resolve().parent.parent / "app"
+sys.path.insert(0, str(APP_DIR))
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+
+DIALOG_MODULES = (
+    "release_dialog",
+    "stats_dialog",
+    "analytics_dialog",
+    "top_dialog",
+    "settings_dialog",
+    "day_entries_dialog",
+)
+
+
+def test_main_window_import_does_not_load_dialogs():
+    # A fresh interpreter: other tests have imported the dialogs already.
+    code = (
+        "import sys, main\n"
+        f"print(sorted(set({DIALOG_MODULES!r}) & set(sys.modules)))\n"
+        "main.TopDialog\n"
+        "print('top_dialog' in sys.modules)\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=APP_DIR,
+        env=dict(os.environ, QT_QPA_PLATFORM="offscreen"),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split("\n")
+    assert out[0] == "[]"
+    assert out[1] == "True"
+
+
+def test_dialog_classes_resolve_through_main():
+    cls = main.dialog_class("StatsDialog")
+    assert cls is main.StatsDialog
+    assert cls.__module__ == "stats_dialog"
+    assert cls in main.loaded_dialog_classes("StatsDialog", "Missing")
+    # dialog modules share CONFIG through appdata, not the entry script
+    import stats_dialog
+
+    assert stats_dialog.appdata is appdata
+    assert appdata.CONFIG is main.CONFIG
+    assert "main" not in sys.modules
@@ -12,19 +12,20 @@ import resources  # noqa: E402
 resources.register_fonts = lambda: None
 
 import app.main as main  # noqa: E402
+import appdata  # noqa: E402
 
 
 def test_month_data_respects_updated_save_path(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
-    original_base = main.BASE_SAVE_PATH
+    original_base = appdata.BASE_SAVE_PATH
     original_save_path = main.CONFIG.get("save_path")
     table = None
     try:
         old_dir = tmp_path / "old"
         new_dir = tmp_path / "new"
-        main.BASE_SAVE_PATH = str(old_dir)
-        main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+        appdata.BASE_SAVE_PATH = str(old_dir)
+        main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
 
         table = main.ExcelCalendarTable()
         table.save_current_month()
@@ -37,7 +38,7 @@ def test_month_data_respects_updated_save_path(tmp_path, monkeypatch):
         assert not old_file.exists()
 
         main.CONFIG["save_path"] = str(new_dir)
-        main.BASE_SAVE_PATH = str(new_dir)
+        appdata.BASE_SAVE_PATH = str(new_dir)
 
         table.save_current_month()
 
@@ -49,7 +50,7 @@ def test_month_data_respects_updated_save_path(tmp_path, monkeypatch):
             table.deleteLater()
         app.processEvents()
         app.quit()
-        main.BASE_SAVE_PATH = original_base
+        appdata.BASE_SAVE_PATH = original_base
         if original_save_path is not None:
             main.CONFIG["save_path"] = original_save_path
         else:
@@ -0,0 +1,90 @@
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+import month_cache
+
+
+def test_prefetcher_serves_neighbours_from_cache_and_drops_stale_loads():
+    calls = []
+    release = threading.Event()
+
+    def loader(year, month):
+        calls.append((year, month))
+        if (year, month) == (2024, 6):
+            release.wait(5)
+        return {"year": year, "month": month, "rows": []}
+
+    cache = month_cache.MonthPrefetcher(loader, capacity=3)
+    cache.prefetch_around(2024, 1, years=False)
+    assert cache.get(2023, 12)["month"] == 12
+    assert cache.get(2024, 2)["month"] == 2
+    assert sorted(calls) == [(2023, 12), (2024, 2)]
+
+    copy = cache.get(2024, 2)
+    copy["rows"].append("x")
+    assert cache.get(2024, 2)["rows"] == []
+
+    # A save while the month is still being read must win over the old data.
+    cache.prefetch(2024, 6)
+    cache.invalidate(2024, 6)
+    release.set()
+    cache.get(2024, 6)
+    assert calls.count((2024, 6)) == 2
+
+    for m in (7, 8, 9):
+        cache.get(2024, m)
+    calls.clear()
+    cache.get(2024, 2)
+    assert calls == [(2024, 2)]
+
+
+def test_calendar_navigation_uses_prefetched_months(tmp_path, monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    table = main.ExcelCalendarTable()
+    try:
+        table.load_month_data(2024, 5)
+        table.save_current_month()
+        months = tmp_path / "months"
+        (months / "2024-06.json").write_text(
+            json.dumps({"year": 2024, "month": 6, "days": {"3": [{"work": "w3"}]}}),
+            encoding="utf-8",
+        )
+        main.MONTH_CACHE.invalidate(2024, 6)
+        table.load_month_data(2024, 5)
+        main.MONTH_CACHE.wait()
+
+        loads = []
+        original = main.MONTH_CACHE._loader
+        monkeypatch.setattr(
+            main.MONTH_CACHE,
+            "_loader",
+            lambda y, m: loads.append((y, m)) or original(y, m),
+        )
+        table.go_next_month()
+        assert (table.year, table.month) == (2024, 6)
+        assert (2024, 6) not in loads
+        assert "w3" in table.work_names()
+
+        coords = next(c for c, d in table.date_map.items() if d.month == 6 and d.day == 3)
+        table.cell_tables[coords].item(0, 0).setText("changed")
+        table.go_prev_month()
+        table.go_next_month()
+        assert "changed" in table.work_names()
+    finally:
+        table.deleteLater()
+        app.processEvents()
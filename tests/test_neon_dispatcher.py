@@ -0,0 +1,106 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtCore, QtWidgets
+
+import effects
+from effects import neon_dispatcher, neon_registered, register_neon, unregister_neon
+
+CONFIG = {"neon_renderer": "effect"}
+
+
+def _app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_focus_change_moves_neon_between_registered_widgets():
+    app = _app()
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(window)
+    first = QtWidgets.QLineEdit(window)
+    second = QtWidgets.QLineEdit(window)
+    plain = QtWidgets.QLineEdit(window)
+    for w in (first, second, plain):
+        layout.addWidget(w)
+    register_neon(first, CONFIG)
+    register_neon(second, CONFIG)
+    window.show()
+    app.processEvents()
+
+    dispatcher = neon_dispatcher()
+    assert dispatcher is effects.neon_dispatcher()
+    assert neon_registered(first) and neon_registered(second)
+    assert not neon_registered(plain)
+
+    dispatcher._on_focus_changed(None, first)
+    assert first._neon_effect is not None
+    dispatcher._on_focus_changed(first, second)
+    assert first._neon_effect is None
+    assert second._neon_effect is not None
+    dispatcher._on_focus_changed(second, plain)
+    assert second._neon_effect is None
+    assert getattr(plain, "_neon_effect", None) is None
+    window.close()
+
+
+def test_owner_routes_helpers_to_their_control():
+    _app()
+    table = QtWidgets.QTableWidget(2, 2)
+    register_neon(table, CONFIG)
+    combo = QtWidgets.QComboBox()
+    register_neon(combo, CONFIG)
+    register_neon(combo.view(), CONFIG, owner=combo)
+    dispatcher = neon_dispatcher()
+
+    # children without a registration of their own fall back to the ancestor
+    dispatcher._on_focus_changed(None, table.viewport())
+    assert table._neon_effect is not None
+    dispatcher._on_focus_changed(table.viewport(), combo.view())
+    assert table._neon_effect is None
+    assert combo._neon_effect is not None
+
+    # re-registering keeps the owner and only swaps the config
+    register_neon(combo.view(), {"neon_renderer": "effect", "neon": True})
+    assert dispatcher.target_for(combo.view())[0] is combo
+
+    unregister_neon(table)
+    assert not neon_registered(table)
+    dispatcher._on_focus_changed(combo.view(), table)
+    assert getattr(table, "_neon_effect", None) is None
+
+
+def test_registry_forgets_destroyed_widgets():
+    app = _app()
+    widget = QtWidgets.QLineEdit()
+    register_neon(widget, CONFIG)
+    dispatcher = neon_dispatcher()
+    key = effects._cpp_key(widget)
+    assert key in dispatcher._targets
+    widget.deleteLater()
+    QtCore.QCoreApplication.sendPostedEvents(None, QtCore.QEvent.DeferredDelete)
+    app.processEvents()
+    assert key not in dispatcher._targets
+
+
+def test_registered_widgets_get_no_event_filter(monkeypatch):
+    _app()
+    installed = []
+    original = QtCore.QObject.installEventFilter
+
+    def recording(self, filt):
+        installed.append(self)
+        return original(self, filt)
+
+    monkeypatch.setattr(QtCore.QObject, "installEventFilter", recording)
+    edit = QtWidgets.QLineEdit()
+    table = QtWidgets.QTableWidget(2, 2)
+    register_neon(edit, CONFIG)
+    register_neon(table.viewport(), CONFIG, owner=table)
+    assert installed == []
+    assert not hasattr(effects.NeonDispatcher, "eventFilter") or (
+        effects.NeonDispatcher.eventFilter is QtCore.QObject.eventFilter
+    )
@@ -11,7 +11,7 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
-from app.effects import NeonEventFilter
+from effects import register_neon
 
 
 def test_neon_persists_during_edit_and_stops_after():
@@ -23,9 +23,7 @@ def test_neon_persists_during_edit_and_stops_after():
     table.setAttribute(QtCore.Qt.WA_Hover, True)
     table.viewport().setAttribute(QtCore.Qt.WA_Hover, True)
 
-    filt = NeonEventFilter(table, main.CONFIG)
-    table.installEventFilter(filt)
-    table.viewport().installEventFilter(filt)
+    register_neon(table, main.CONFIG)
 
     table.show()
     table.setFocus()
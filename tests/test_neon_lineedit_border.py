@@ -11,7 +11,7 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
-from app.effects import NeonEventFilter
+from effects import register_neon
 
 
 def test_neon_border_toggles_without_resizing():
@@ -21,8 +21,7 @@ def test_neon_border_toggles_without_resizing():
     edit = QtWidgets.QLineEdit()
     edit.setAttribute(QtCore.Qt.WA_Hover, True)
     edit.setStyleSheet("border:1px solid transparent;")
-    filt = NeonEventFilter(edit, main.CONFIG)
-    edit.installEventFilter(filt)
+    register_neon(edit, main.CONFIG)
     edit.show()
     edit.resize(100, 30)
     QtWidgets.QApplication.processEvents()
@@ -37,7 +36,7 @@ def test_neon_border_toggles_without_resizing():
     other = QtWidgets.QLineEdit()
     other.setAttribute(QtCore.Qt.WA_Hover, True)
     other.setStyleSheet("border:1px solid transparent;")
-    other.installEventFilter(NeonEventFilter(other, main.CONFIG))
+    register_neon(other, main.CONFIG)
     other.show()
     other.setFocus()
     QtWidgets.QApplication.processEvents()
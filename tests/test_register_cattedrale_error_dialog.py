@@ -16,12 +16,9 @@ def test_register_cattedrale_error_dialog(monkeypatch):
     w.show()
     QtWidgets.QApplication.processEvents()
     called = {}
-    monkeypatch.setattr(resources, "tk", None)
-    monkeypatch.setattr(resources, "ctk", None)
-    monkeypatch.setattr(resources, "tkfont", None)
     monkeypatch.setattr(QtWidgets.QMessageBox, "critical", lambda *a, **k: called.setdefault("called", True))
 
-    fam = resources.register_cattedrale("dummy.ttf")
+    fam = resources.register_cattedrale("missing-font.ttf")
     assert fam == "Exo 2"
     assert called.get("called")
     w.close()
@@ -0,0 +1,117 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+from release_model import ReleaseRowsModel
+
+
+def _texts(model, column):
+    return [model.index(row, column).data() for row in range(model.rowCount())]
+
+
+def test_month_is_loaded_in_one_reset_sorted_by_day():
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    model = ReleaseRowsModel()
+    seen = []
+    model.modelReset.connect(lambda: seen.append("reset"))
+    model.rowsInserted.connect(lambda *_: seen.append("inserted"))
+    days = {
+        "12": [{"work": "Gamma", "chapters": 1}],
+        "3": [{"work": "Alpha", "chapters": 2, "time": "10:00"}, {"work": "Beta"}],
+        "31": [{"work": "Late"}],
+    }
+    model.set_month(days, 30)
+
+    assert seen == ["reset"]
+    assert model.rowCount() == 30
+    assert _texts(model, 0)[:4] == ["3", "3", "12", ""]
+    assert _texts(model, 1)[:3] == ["Alpha", "Beta", "Gamma"]
+    assert model.index(0, 2).data() == "2"
+    assert "Late" not in _texts(model, 1)
+
+
+def test_edited_day_moves_the_row_to_its_place():
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    model = ReleaseRowsModel()
+    model.set_month({"3": [{"work": "Alpha"}], "12": [{"work": "Gamma"}]}, 15)
+    edits = []
+    model.edited.connect(lambda: edits.append(True))
+
+    assert model.setData(model.index(3, 0), "7")
+    assert _texts(model, 0)[:3] == ["3", "7", "12"]
+    assert model.setData(model.index(2, 0), "1")
+    assert _texts(model, 1)[:3] == ["Gamma", "Alpha", ""]
+    assert not model.setData(model.index(0, 0), "1")  # unchanged
+    assert len(edits) == 2
+
+    assert model.add_row(3, {"work": "Beta"}) == 2
+    assert _texts(model, 1)[:3] == ["Gamma", "Alpha", "Beta"]
+
+
+def test_dialog_writes_edits_once(tmp_path, monkeypatch):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    writes = []
+    original = appdata.save_release_data
+
+    def counting(year, month, data):
+        writes.append(data)
+        original(year, month, data)
+
+    monkeypatch.setattr(appdata, "save_release_data", counting)
+    dlg = main.ReleaseDialog(2024, 2, [], None)
+    try:
+        model = dlg.rows_model
+        assert model.rowCount() == 29
+        for column, text in enumerate(("5", "Alpha", "2", "10:00")):
+            model.setData(model.index(0, column), text)
+        dlg.add_row(day=5, entry={"work": "Beta", "chapters": 1})
+        assert writes == []
+        assert dlg._save_timer.isActive()
+
+        dlg.show()
+        dlg.hide()
+        assert len(writes) == 1
+        assert writes[0]["days"] == {
+            "5": [
+                {"work": "Alpha", "chapters": 2, "time": "10:00"},
+                {"work": "Beta", "chapters": 1, "time": ""},
+            ]
+        }
+        dlg.flush()
+        assert len(writes) == 1
+    finally:
+        dlg.deleteLater()
+
+
+def test_deferred_save_survives_a_locked_database(tmp_path, monkeypatch):
+    import sqlite3
+
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+
+    def locked(*_args):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(appdata, "save_release_data", locked)
+    dlg = main.ReleaseDialog(2024, 2, [], None)
+    try:
+        dlg.rows_model.setData(dlg.rows_model.index(0, 1), "Alpha")
+        dlg.show()
+        dlg.hide()  # flushes from hideEvent
+        assert not dlg._dirty
+    finally:
+        dlg.deleteLater()
@@ -8,20 +8,19 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
 from PySide6 import QtWidgets
 
 import app.main as main
+import appdata
 
 
 def test_load_config_creates_neon_enabled_config(tmp_path):
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    main.CONFIG = main.load_config()
-    main.config.CONFIG = main.CONFIG
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    appdata.reload_config()
 
     assert main.CONFIG["neon"] is True
 
 
 def test_settings_dialog_uses_exo2_by_default(tmp_path):
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    main.CONFIG = main.load_config()
-    main.config.CONFIG = main.CONFIG
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    appdata.reload_config()
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
     dlg = main.SettingsDialog()
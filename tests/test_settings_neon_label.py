@@ -11,12 +11,13 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
+import appdata
 
 
 def test_lbl_month_keeps_neon_during_and_after_settings(monkeypatch):
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
     main.CONFIG["neon"] = True
-    monkeypatch.setattr(main, "load_config", lambda: main.CONFIG)
+    monkeypatch.setattr(appdata, "load_config", lambda: main.CONFIG)
     window = main.MainWindow()
 
     def fake_exec(self):
@@ -13,12 +13,14 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
+import appdata
+from effects import neon_dispatcher
 
 
 def test_neon_preset_updates_config_and_filters(tmp_path):
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
 
-    original_path = main.CONFIG_PATH
+    original_path = appdata.CONFIG_PATH
     original_config = dict(main.CONFIG)
     dlg = None
     try:
@@ -30,7 +32,7 @@ def test_neon_preset_updates_config_and_filters(tmp_path):
             }
         )
         tmp_config = tmp_path / "config.json"
-        main.CONFIG_PATH = str(tmp_config)
+        appdata.CONFIG_PATH = str(tmp_config)
         with open(tmp_config, "w", encoding="utf-8") as f:
             json.dump(main.CONFIG, f)
 
@@ -49,13 +51,13 @@ def test_neon_preset_updates_config_and_filters(tmp_path):
             main.CONFIG["neon_intensity"],
         ) == expected
 
-        neon_filter = getattr(dlg.sld_neon_size, "_neon_filter", None)
-        assert neon_filter is not None
-        assert neon_filter._config["neon_size"] == expected[0]
+        target = neon_dispatcher().target_for(dlg.sld_neon_size)
+        assert target is not None
+        assert target[1]["neon_size"] == expected[0]
     finally:
         if dlg is not None:
             dlg.close()
         main.CONFIG.clear()
         main.CONFIG.update(original_config)
-        main.CONFIG_PATH = original_path
+        appdata.CONFIG_PATH = original_path
         app.quit()
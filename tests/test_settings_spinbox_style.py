@@ -8,12 +8,12 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
 from PySide6 import QtWidgets
 
 import app.main as main
+import appdata
 
 
 def _prepare_config(tmp_path):
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    main.CONFIG = main.load_config()
-    main.config.CONFIG = main.CONFIG
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    appdata.reload_config()
 
 
 def test_spin_day_rows_updates_accent_color(tmp_path):
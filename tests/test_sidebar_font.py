@@ -12,12 +12,13 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
+import appdata
 
 
 def test_sidebar_font_persists(tmp_path):
     main.CONFIG["sidebar_font"] = "Arial"
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -32,7 +33,7 @@ def test_sidebar_font_persists(tmp_path):
     assert first_btn.font().family() == "DejaVu Serif"
 
     main.CONFIG["workspace_color"] = "#ffffff"
-    window.apply_palette()
+    window.apply_theme()
     assert first_btn.font().family() == "DejaVu Serif"
 
     window.apply_settings()
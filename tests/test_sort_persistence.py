@@ -15,20 +15,21 @@ import resources  # noqa: E402
 resources.register_fonts = lambda: None
 
 import app.main as main  # noqa: E402
+import appdata  # noqa: E402
 
 
 def _prepare_environment(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
     base = tmp_path / "data"
-    main.BASE_SAVE_PATH = str(base)
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(base)
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
     return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
 
 
 def test_stats_dialog_restores_sort(tmp_path, monkeypatch):
     app = _prepare_environment(tmp_path, monkeypatch)
 
-    stats_path = Path(main.stats_dir(2024)) / "2024.json"
+    stats_path = Path(appdata.stats_dir(2024)) / "2024.json"
     stats_path.parent.mkdir(parents=True, exist_ok=True)
     with open(stats_path, "w", encoding="utf-8") as fh:
         json.dump(
@@ -87,11 +88,11 @@ def test_stats_dialog_restores_sort(tmp_path, monkeypatch):
     header = dlg2.table_stats.horizontalHeader()
     assert header.sortIndicatorSection() == 0
     assert header.sortIndicatorOrder() == QtCore.Qt.SortOrder.DescendingOrder
+    model = dlg2.table_stats.model()
     works = [
-        dlg2.table_stats.item(row, 0).text()
-        for row in range(dlg2.table_stats.rowCount())
-        if dlg2.table_stats.item(row, 0) is not None
-        and dlg2.table_stats.item(row, 0).text()
+        model.index(row, 0).data()
+        for row in range(model.rowCount())
+        if model.index(row, 0).data()
     ]
     assert works[:2] == ["Beta", "Alpha"]
     dlg2.close()
@@ -101,7 +102,7 @@ def test_stats_dialog_restores_sort(tmp_path, monkeypatch):
 def test_top_dialog_restores_sort(tmp_path, monkeypatch):
     app = _prepare_environment(tmp_path, monkeypatch)
 
-    stats_path = Path(main.stats_dir(2024)) / "2024.json"
+    stats_path = Path(appdata.stats_dir(2024)) / "2024.json"
     stats_path.parent.mkdir(parents=True, exist_ok=True)
     with open(stats_path, "w", encoding="utf-8") as fh:
         json.dump(
@@ -0,0 +1,85 @@
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+import sqlite_store
+
+
+def _write(path: Path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_sqlite_backend_imports_json_and_serves_all_stores(tmp_path, monkeypatch):
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    _write(
+        tmp_path / "months" / "2024-03.json",
+        {"year": 2024, "month": 3, "days": {"5": [{"work": "Alpha", "plan": "2", "done": ""}]}},
+    )
+    (tmp_path / "months" / "2024.log").write_text(
+        json.dumps({"op": "set", "month": 3, "item": 6, "value": [{"work": "Beta", "plan": "", "done": "1"}]})
+        + "\n",
+        encoding="utf-8",
+    )
+    _write(tmp_path / "2024" / "stats" / "2024.json", {"3": [{"work": "Alpha", "profit": 10}]})
+    _write(
+        tmp_path / "2024" / "release" / "03.json",
+        {"works": ["Alpha"], "days": {"5": [{"work": "Alpha", "chapters": 2, "time": "10:00"}]}},
+    )
+    _write(tmp_path / "2024" / "year" / "2024.json", {"commission": {"3": 1.5}})
+    _write(tmp_path / "2024" / "top" / "2024.json", {"Y": {"results": []}})
+
+    monkeypatch.setitem(main.CONFIG, "storage_backend", "sqlite")
+    try:
+        store = main.active_sqlite_store()
+        assert store is not None
+        assert main.MonthData.load(2024, 3).days == {
+            5: [{"work": "Alpha", "plan": "2", "done": ""}],
+            6: [{"work": "Beta", "plan": "", "done": "1"}],
+        }
+        assert appdata.load_stats_data(2024) == {"3": [{"work": "Alpha", "profit": 10}]}
+        assert appdata.load_release_data(2024, 3)["days"]["5"][0]["time"] == "10:00"
+        assert appdata.load_year_values(2024) == {"commission": {"3": 1.5}}
+        assert appdata.load_top_data(2024) == {"Y": {"results": []}}
+
+        md = main.MonthData.load(2024, 3)
+        md.days[5][0]["done"] = "2"
+        del md.days[6]
+        md.write()
+        appdata.save_stats_record(2024, 3, 1, {"work": "Gamma"})
+
+        db = sqlite3.connect(tmp_path / sqlite_store.DB_FILENAME)
+        try:
+            assert db.execute(
+                "SELECT day, done FROM month_rows WHERE year = 2024 AND month = 3"
+            ).fetchall() == [(5, "2")]
+            indexes = {row[1] for row in db.execute("SELECT * FROM sqlite_master WHERE type = 'index'")}
+            assert {"month_rows_work", "stats_records_work", "release_rows_work"} <= indexes
+        finally:
+            db.close()
+
+        # The JSON snapshot is untouched until the database is exported.
+        snapshot = json.loads((tmp_path / "months" / "2024-03.json").read_text(encoding="utf-8"))
+        assert snapshot["days"]["5"][0]["done"] == ""
+        monkeypatch.setitem(main.CONFIG, "storage_backend", "json")
+        main.migrate_storage_backend("sqlite", str(tmp_path))
+
+        assert not (tmp_path / "months" / "2024.log").exists()
+        assert main.MonthData.load(2024, 3).days == {5: [{"work": "Alpha", "plan": "2", "done": "2"}]}
+        assert appdata.load_stats_data(2024)["3"][1] == {"work": "Gamma"}
+    finally:
+        with appdata._SQLITE_LOCK:
+            store = appdata._SQLITE_STORES.pop(os.path.abspath(str(tmp_path)), None)
+        if store is not None:
+            store.close()
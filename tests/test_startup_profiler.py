@@ -0,0 +1,74 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtWidgets
+
+import startup_profiler
+from startup_profiler import StartupProfiler
+
+
+def _report(tmp_path, name, phases):
+    path = tmp_path / name
+    lines = [{"type": "run"}]
+    lines += [{"type": "phase", "phase": p, "wall_ms": ms, "cpu_ms": ms} for p, ms in phases]
+    lines.append({"type": "total", "wall_ms": sum(ms for _p, ms in phases), "cpu_ms": 0})
+    path.write_text("\n".join(json.dumps(line) for line in lines), encoding="utf-8")
+    return str(path)
+
+
+def test_phases_are_written_as_json_lines(tmp_path):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    profiler = StartupProfiler(True)
+    with profiler.phase("main_window"):
+        with profiler.phase("load_month_data"):
+            widgets = [QtWidgets.QLabel() for _ in range(3)]
+            data = [bytearray(256 * 1024)]
+        del data
+    path = profiler.finish(str(tmp_path))
+    assert profiler.finish(str(tmp_path)) is None
+
+    entries = [json.loads(line) for line in Path(path).read_text(encoding="utf-8").splitlines()]
+    assert [e["type"] for e in entries] == ["run", "phase", "phase", "total"]
+    inner, outer = entries[1], entries[2]
+    assert (inner["phase"], inner["parent"]) == ("load_month_data", "main_window")
+    assert outer["parent"] is None
+    assert outer["wall_ms"] >= inner["wall_ms"]
+    assert inner["widgets"] >= 3 and inner["qobjects"] >= inner["widgets"]
+    assert inner["py_peak_kb"] >= 256
+    assert outer["py_peak_kb"] >= inner["py_peak_kb"]
+    del widgets
+
+
+def test_disabled_profiler_records_nothing(tmp_path):
+    profiler = StartupProfiler(False)
+    with profiler.phase("anything"):
+        pass
+    assert profiler.records == []
+    assert profiler.finish(str(tmp_path)) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_compare_flags_slower_phases(tmp_path, capsys):
+    old = _report(tmp_path, "old.jsonl", [("import", 100.0), ("main_window", 200.0)])
+    new = _report(
+        tmp_path, "new.jsonl", [("import", 102.0), ("main_window", 260.0), ("show", 5.0)]
+    )
+    rows = {
+        row["phase"]: row
+        for row in startup_profiler.compare_reports(
+            startup_profiler.load_report(old), startup_profiler.load_report(new)
+        )
+    }
+    assert not rows["import"]["regression"]
+    assert rows["main_window"]["regression"]
+    assert rows["main_window"]["delta_ms"] == 60.0
+    assert rows["show"]["old_ms"] is None
+
+    assert startup_profiler.main(["compare", old, new]) == 1
+    assert "main_window" in capsys.readouterr().out
+    assert startup_profiler.main(["compare", old, old]) == 0
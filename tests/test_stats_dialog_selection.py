@@ -14,6 +14,8 @@ import resources  # noqa: E402
 resources.register_fonts = lambda: None
 
 import app.main as main  # noqa: E402  pylint: disable=wrong-import-position
+import appdata  # noqa: E402
+from effects import neon_registered  # noqa: E402
 
 
 def _make_record(work: str, profit: float) -> dict[str, object]:
@@ -37,11 +39,11 @@ def _make_record(work: str, profit: float) -> dict[str, object]:
 
 def test_stats_dialog_selects_actual_record(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
 
     year, month = 2024, 5
-    stats_path = Path(main.stats_dir(year)) / f"{year}.json"
+    stats_path = Path(appdata.stats_dir(year)) / f"{year}.json"
     stats_path.parent.mkdir(parents=True, exist_ok=True)
     data = {str(month): [_make_record("Alpha", 100.0), _make_record("Beta", 200.0)]}
     stats_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -51,7 +53,7 @@ def test_stats_dialog_selects_actual_record(tmp_path, monkeypatch):
     dialog.show()
     app.processEvents()
 
-    dialog.table_stats.sortItems(0, QtCore.Qt.DescendingOrder)
+    dialog.table_stats.sortByColumn(0, QtCore.Qt.DescendingOrder)
     app.processEvents()
 
     dialog.table_stats.selectRow(0)
@@ -68,11 +70,11 @@ def test_stats_dialog_selects_actual_record(tmp_path, monkeypatch):
 
 def test_stats_dialog_table_style_uses_accent(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
 
     year, month = 2024, 6
-    stats_path = Path(main.stats_dir(year)) / f"{year}.json"
+    stats_path = Path(appdata.stats_dir(year)) / f"{year}.json"
     stats_path.parent.mkdir(parents=True, exist_ok=True)
     data = {str(month): [_make_record("Gamma", 50.0)]}
     stats_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -88,8 +90,8 @@ def test_stats_dialog_table_style_uses_accent(tmp_path, monkeypatch):
 
     assert accent in table_style
     assert accent in header_style
-    assert getattr(dialog.table_stats, "_neon_filter", None) is not None
-    assert getattr(dialog.table_stats.horizontalHeader(), "_neon_filter", None) is not None
+    assert neon_registered(dialog.table_stats)
+    assert neon_registered(dialog.table_stats.horizontalHeader())
 
     dialog.close()
     app.processEvents()
@@ -98,11 +100,11 @@ def test_stats_dialog_table_style_uses_accent(tmp_path, monkeypatch):
 
 def test_stats_entry_form_refresh_theme_updates_styles(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
 
     year, month = 2024, 7
-    stats_path = Path(main.stats_dir(year)) / f"{year}.json"
+    stats_path = Path(appdata.stats_dir(year)) / f"{year}.json"
     stats_path.parent.mkdir(parents=True, exist_ok=True)
     data = {str(month): [_make_record("Delta", 75.0)]}
     stats_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -146,11 +148,11 @@ def test_stats_entry_form_refresh_theme_updates_styles(tmp_path, monkeypatch):
 
 def test_stats_dialog_updates_background_after_theme_change(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
 
     year, month = 2024, 8
-    stats_path = Path(main.stats_dir(year)) / f"{year}.json"
+    stats_path = Path(appdata.stats_dir(year)) / f"{year}.json"
     stats_path.parent.mkdir(parents=True, exist_ok=True)
     data = {str(month): [_make_record("Omega", 125.0)]}
     stats_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -0,0 +1,83 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtCore, QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+from stats_model import StatsRecordModel, StatsSortProxy
+
+
+def _signals(model):
+    seen = []
+    model.modelReset.connect(lambda: seen.append("reset"))
+    model.rowsInserted.connect(lambda _p, first, last: seen.append(("inserted", first, last)))
+    model.dataChanged.connect(
+        lambda tl, br, _roles=None: seen.append(("changed", tl.row(), br.row()))
+    )
+    return seen
+
+
+def test_model_reports_single_rows_and_proxy_sorts():
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    model = StatsRecordModel([("work", "Работа"), ("adult", "18+"), ("chapters", "Главы")])
+    model.set_records([{"work": "Beta", "chapters": 5}, {"work": "Alpha", "adult": True}])
+    proxy = StatsSortProxy()
+    proxy.setSourceModel(model)
+    proxy.sort(0, QtCore.Qt.AscendingOrder)
+    seen = _signals(model)
+
+    assert model.index(1, 1).data() == "✓"
+    assert model.index(0, 1).data() == ""
+    assert model.index(0, 2).data() == 5
+    assert [proxy.index(r, 0).data() for r in range(2)] == ["Alpha", "Beta"]
+
+    model.set_record(0, {"work": "Aardvark", "chapters": 6})
+    assert seen == [("changed", 0, 0)]
+    assert [proxy.index(r, 0).data() for r in range(2)] == ["Aardvark", "Alpha"]
+    assert proxy.source_row(0) == 0
+
+    assert model.append_record({"work": "Zeta"}) == 2
+    assert seen[1:] == [("inserted", 2, 2)]
+    assert proxy.index(2, 0).data() == "Zeta"
+
+
+def test_saving_a_record_does_not_reload_the_month(tmp_path, monkeypatch):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    appdata.save_stats_record(2024, 1, 0, {"work": "Alpha", "chapters": 1})
+    appdata.save_stats_record(2024, 1, 1, {"work": "Beta", "chapters": 2})
+
+    dlg = main.StatsDialog(2024, 1, None)
+    try:
+        dlg.table_stats.sortByColumn(0, QtCore.Qt.DescendingOrder)
+        seen = _signals(dlg.stats_model)
+
+        dlg.table_stats.selectRow(1)  # Alpha, sorted after Beta
+        assert dlg.current_index == 0
+        dlg.form_stats.widgets["chapters"].setValue(7)
+        dlg.save_record()
+        assert seen == [("changed", 0, 0)]
+        assert dlg.current_index is None
+
+        dlg.form_stats.widgets["work"].setText("Gamma")
+        dlg.save_record()
+        assert seen[1:] == [("inserted", 2, 2)]
+
+        model = dlg.table_stats.model()
+        assert [model.index(r, 0).data() for r in range(3)] == ["Gamma", "Beta", "Alpha"]
+        stored = appdata.load_stats_data(2024)["1"]
+        assert [rec["work"] for rec in stored] == ["Alpha", "Beta", "Gamma"]
+        assert stored[0]["chapters"] == 7
+        assert dlg.reopen(2024, 1) and "reset" not in seen
+    finally:
+        dlg.deleteLater()
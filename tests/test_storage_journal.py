@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import storage
+
+
+def test_write_json_replaces_atomically_and_leaves_no_journal(tmp_path):
+    target = tmp_path / "stats" / "2024.json"
+    storage.write_json(str(target), {"1": [{"work": "Альфа"}]})
+    storage.write_json(str(target), {"2": []})
+    assert json.loads(target.read_text(encoding="utf-8")) == {"2": []}
+    assert sorted(os.listdir(target.parent)) == ["2024.json"]
+
+
+def test_recover_replays_complete_journal_and_discards_torn_one(tmp_path):
+    months = tmp_path / "months"
+    months.mkdir()
+    good = months / "2024-01.json"
+    good.write_text('{"year": 20', encoding="utf-8")  # truncated by a crash
+    payload = json.dumps({"year": 2024, "month": 1, "days": {}})
+    Path(storage.journal_path(str(good))).write_text(
+        json.dumps(
+            {"target": good.name, "checksum": storage._checksum(payload), "payload": payload}
+        ),
+        encoding="utf-8",
+    )
+
+    torn = months / "2024-02.json"
+    torn.write_text('{"year": 2024, "month": 2, "days": {}}', encoding="utf-8")
+    Path(storage.journal_path(str(torn))).write_text('{"target": "2024-02.json", "chec', encoding="utf-8")
+    (months / ".2024-02.json.tmp").write_text("{", encoding="utf-8")
+    # Files the store never writes are left alone, also in other folders.
+    (months / ".notes.txt.tmp").write_text("mine", encoding="utf-8")
+    nested = months / "backup"
+    nested.mkdir()
+    (nested / ".2024-03.json.tmp").write_text("{", encoding="utf-8")
+
+    replayed = storage.recover([(str(months), r"\d{4}-\d{2}\.json")])
+
+    assert replayed == [str(good)]
+    assert json.loads(good.read_text(encoding="utf-8"))["month"] == 1
+    assert json.loads(torn.read_text(encoding="utf-8"))["month"] == 2
+    assert sorted(os.listdir(months)) == [".notes.txt.tmp", "2024-01.json", "2024-02.json", "backup"]
+    assert os.listdir(nested) == [".2024-03.json.tmp"]
+
+
+def test_store_locations_cover_only_the_store_folders(tmp_path, monkeypatch):
+    import appdata
+
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    (tmp_path / "2024" / "stats").mkdir(parents=True)
+    (tmp_path / "Documents").mkdir()
+    stats = tmp_path / "2024" / "stats" / "2024.json"
+    stats.write_text("{}", encoding="utf-8")
+    (tmp_path / "2024" / "stats" / ".2024.json.tmp").write_text("{", encoding="utf-8")
+    (tmp_path / "Documents" / ".draft.json.tmp").write_text("x", encoding="utf-8")
+
+    locations = appdata.store_locations()
+    assert (str(tmp_path / "2024" / "stats"), r"2024\.json") in locations
+    assert not any("Documents" in directory for directory, _pattern in locations)
+    storage.recover(locations)
+    assert os.listdir(stats.parent) == ["2024.json"]
+    assert os.listdir(tmp_path / "Documents") == [".draft.json.tmp"]
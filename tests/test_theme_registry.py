@@ -0,0 +1,96 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtCore, QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+import appdata
+import theme_registry
+
+
+def test_theme_is_compiled_once_per_snapshot():
+    first = theme_registry.theme(accent="#ff0000", workspace="#101010")
+    sheet = first.get("dialog_table")
+    assert theme_registry.theme(accent="#ff0000", workspace="#101010") is first
+    assert first.get("dialog_table") is sheet
+    assert "border:1px solid #ff0000" in sheet
+    assert "QTableWidget::item" not in first.get("dialog_table", False)
+
+    other = theme_registry.theme(accent="#00ff00", workspace="#101010")
+    assert other is not first
+    assert "#00ff00" in other.get("dialog_header", 8)
+    assert "padding:0 8px" in other.get("dialog_header", 8)
+
+
+def test_input_style_keeps_subtle_resting_border():
+    style = theme_registry.build_input_neon_style(
+        "QSpinBox", background="#202020", accent="#39ff14", thickness=2
+    )
+    assert style.startswith("QSpinBox{background-color:#202020;")
+    assert "border:2px solid #5a39ff14;" in style
+    assert "QSpinBox:hover, QSpinBox:focus{border:2px solid #39ff14;" in style
+    assert theme_registry.build_input_neon_style(
+        "QSpinBox", background="#202020", accent="#39ff14", thickness=2
+    ) is style
+
+
+def test_apply_style_skips_identical_sheets():
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    widget = QtWidgets.QLabel()
+    assert theme_registry.apply_style(widget, "color:#fff;")
+    assert not theme_registry.apply_style(widget, "color:#fff;")
+
+
+def test_calendar_day_state_is_a_property_flip(tmp_path, monkeypatch):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    table = main.ExcelCalendarTable()
+    try:
+        table.load_month_data(2024, 9)
+        outside = next(c for c, d in table.date_map.items() if d.month != 9)
+        inside = next(c for c, d in table.date_map.items() if d.month == 9)
+        container = table.cell_containers[outside]
+        sheet = container.styleSheet()
+        assert container.property("calendar_in_month") is False
+        assert table.day_labels[outside].property("calendar_in_month") is False
+        assert table.cell_containers[inside].property("calendar_in_month") is True
+        assert 'CalendarDay[calendar_in_month="false"]' in table.viewport().styleSheet()
+
+        table.load_month_data(2024, 10)
+        assert table.cell_containers[outside].styleSheet() == sheet
+    finally:
+        table.deleteLater()
+
+
+def test_sidebar_neon_sheet_parses(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setitem(main.CONFIG, "sidebar_collapsed", False)
+    warnings = []
+
+    def handler(_mode, _context, message):
+        if "Could not parse stylesheet" in message:
+            warnings.append(message)
+
+    previous = QtCore.qInstallMessageHandler(handler)
+    sidebar = main.CollapsibleSidebar()
+    try:
+        sidebar.apply_style("#ff44aa", "#101010")
+        sidebar.show()
+        app.processEvents()
+        sheet = sidebar.styleSheet()
+        assert sheet.startswith("#Sidebar{background-color:#101010;")
+        # the neon text color is a rule of its own, not a trailing declaration
+        assert sheet.rstrip().endswith("}")
+        assert "#Sidebar{color:#ff44aa;" in sheet
+        assert warnings == []
+    finally:
+        QtCore.qInstallMessageHandler(previous)
+        sidebar.deleteLater()
@@ -0,0 +1,79 @@
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+from PySide6 import QtGui, QtWidgets
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import app.main as main
+from theme_transaction import ASPECTS, ThemeTransaction, theme_values
+
+
+def test_transaction_selects_changed_aspects():
+    base = {"accent_color": "#39ff14", "gradient_colors": ["#000000", "#ffffff"]}
+    old = theme_values(base)
+
+    assert ThemeTransaction(None, base).aspects == frozenset(ASPECTS)
+    assert not ThemeTransaction(old, dict(base))
+
+    accent = ThemeTransaction(old, dict(base, accent_color="#ff0000"))
+    assert accent.aspects == {"palette"}
+    assert "fonts" not in accent
+
+    gradient = ThemeTransaction(old, dict(base, gradient_colors=["#111111", "#ffffff"]))
+    assert gradient.aspects == {"palette", "gradient"}
+    assert ThemeTransaction(old, dict(base, day_rows=9)).aspects == {"day_rows"}
+
+    # in-place edits of the applied config are still seen as changes
+    base["gradient_colors"][0] = "#222222"
+    assert "gradient" in ThemeTransaction(old, base)
+
+
+def test_restricted_transaction_leaves_other_aspects_pending():
+    base = {"accent_color": "#39ff14", "gradient_colors": ["#000000", "#ffffff"]}
+
+    first = ThemeTransaction(None, base, only=("fonts", "palette"))
+    assert first.aspects == {"fonts", "palette"}
+    assert first.pending == {"day_rows", "neon", "gradient"}
+
+    # gradient_colors is shared with the pending gradient aspect
+    rest = ThemeTransaction(first.applied_values(), base)
+    assert rest.aspects == {"day_rows", "neon", "gradient"}
+    assert not ThemeTransaction(rest.applied_values(), base)
+
+
+def test_accent_change_applies_each_step_once(monkeypatch):
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = main.MainWindow()
+    calls = {"fonts": 0, "background": 0, "neon_filters": 0}
+
+    def count(name, func):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(window, "_apply_font_aspect", count("fonts", window._apply_font_aspect))
+    monkeypatch.setattr(
+        window.topbar, "apply_background", count("background", window.topbar.apply_background)
+    )
+    monkeypatch.setattr(
+        main, "update_neon_filters", count("neon_filters", main.update_neon_filters)
+    )
+
+    window.apply_settings()
+    assert calls == {"fonts": 0, "background": 0, "neon_filters": 0}
+
+    monkeypatch.setitem(main.CONFIG, "accent_color", "#ff2288")
+    window.apply_settings()
+    assert calls == {"fonts": 0, "background": 1, "neon_filters": 1}
+    assert app.palette().color(QtGui.QPalette.Highlight).name() == "#ff2288"
+    assert window.updatesEnabled()
+    window.close()
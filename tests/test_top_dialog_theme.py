@@ -4,7 +4,6 @@ import sys
 from pathlib import Path
 
 from PySide6 import QtGui, QtWidgets
-import shiboken6
 
 os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
@@ -14,6 +13,9 @@ import resources  # noqa: E402
 resources.register_fonts = lambda: None
 
 import app.main as main  # noqa: E402  pylint: disable=wrong-import-position
+import appdata  # noqa: E402
+import glow  # noqa: E402
+from effects import neon_registered  # noqa: E402
 
 
 def _make_top_record(work: str, profit: float) -> dict[str, object]:
@@ -36,8 +38,8 @@ def _make_top_record(work: str, profit: float) -> dict[str, object]:
 
 def test_top_dialog_table_uses_accent_color(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
 
     accent_color = "#123abc"
     workspace_color = "#202124"
@@ -45,7 +47,7 @@ def test_top_dialog_table_uses_accent_color(tmp_path, monkeypatch):
     main.CONFIG["workspace_color"] = workspace_color
 
     year = 2024
-    stats_path = Path(main.stats_dir(year)) / f"{year}.json"
+    stats_path = Path(appdata.stats_dir(year)) / f"{year}.json"
     stats_path.parent.mkdir(parents=True, exist_ok=True)
     stats_data = {"1": [_make_top_record("Project Alpha", 250.0)]}
     stats_path.write_text(json.dumps(stats_data, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -68,8 +70,8 @@ def test_top_dialog_table_uses_accent_color(tmp_path, monkeypatch):
 
     assert accent in table_style
     assert accent in header_style
-    assert getattr(dialog.table, "_neon_filter", None) is not None
-    assert getattr(dialog.table.horizontalHeader(), "_neon_filter", None) is not None
+    assert neon_registered(dialog.table)
+    assert neon_registered(dialog.table.horizontalHeader())
 
     dialog.close()
     app.processEvents()
@@ -78,8 +80,8 @@ def test_top_dialog_table_uses_accent_color(tmp_path, monkeypatch):
 
 def test_top_dialog_refresh_updates_filter_controls(tmp_path, monkeypatch):
     monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
-    main.BASE_SAVE_PATH = str(tmp_path / "data")
-    main.CONFIG["save_path"] = main.BASE_SAVE_PATH
+    appdata.BASE_SAVE_PATH = str(tmp_path / "data")
+    main.CONFIG["save_path"] = appdata.BASE_SAVE_PATH
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
     dialog = main.TopDialog(2024)
@@ -98,8 +100,7 @@ def test_top_dialog_refresh_updates_filter_controls(tmp_path, monkeypatch):
     style = dialog.spin_year.styleSheet().lower()
     assert f"border:1px solid {accent}" in style
 
-    effect = dialog.btn_calc.graphicsEffect()
-    assert effect is not None and shiboken6.isValid(effect)
+    assert glow.glow_spec(dialog.btn_calc) is not None
 
     dialog.close()
     app.processEvents()
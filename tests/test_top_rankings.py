@@ -0,0 +1,76 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import resources
+
+resources.register_fonts = lambda: None
+
+import analytics
+import app.main as main
+import appdata
+from PySide6 import QtWidgets
+
+
+def test_period_keys_cover_every_top_period():
+    assert len(analytics.PERIOD_KEYS) == 19
+    assert analytics.period_months("M03") == (3, 3)
+    assert analytics.period_months("Q4") == (10, 12)
+    assert analytics.period_months("H2") == (7, 12)
+    assert analytics.period_months("Y") == (1, 12)
+
+
+def test_stats_save_materializes_all_periods(tmp_path, monkeypatch):
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    stats = Path(appdata.stats_dir(2024)) / "2024.json"
+    stats.write_text(json.dumps({"1": [{"work": "A", "chapters": 2}]}), encoding="utf-8")
+
+    appdata.save_stats_record(2024, 5, 0, {"work": "B", "chapters": 4, "status": "Онгоинг"})
+    appdata.wait_top_rankings()
+
+    top = json.loads((Path(appdata.top_dir(2024)) / "2024.json").read_text(encoding="utf-8"))
+    assert sorted(top) == sorted(analytics.PERIOD_KEYS)
+    assert [r["work"] for r in top["Y"]["results"]] == ["A", "B"]
+    assert [r["work"] for r in top["Q2"]["results"]] == ["B"]
+    assert top["M05"]["results"][0]["chapters"] == 4
+    assert top["M02"]["results"] == []
+    assert "done" not in top["Y"]["results"][0]
+
+    # the dialog reads the materialized copy instead of recomputing
+    monkeypatch.setattr(appdata, "load_stats_data", lambda year: (_ for _ in ()).throw(AssertionError))
+    assert appdata.top_rankings(2024) == top
+
+
+def test_top_dialog_shows_materialized_period(tmp_path, monkeypatch):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    appdata.save_stats_record(2023, 3, 0, {"work": "C", "chapters": 7})
+    appdata.wait_top_rankings()
+
+    dlg = main.TopDialog(2023)
+    dlg.combo_mode.setCurrentIndex(dlg.combo_mode.findData("year"))
+    assert dlg._period_key() == "Y"
+    assert [w for w, _vals in dlg.results] == ["C"]
+    dlg.save()
+    top = json.loads((Path(appdata.top_dir(2023)) / "2023.json").read_text(encoding="utf-8"))
+    assert sorted(top) == sorted(analytics.PERIOD_KEYS)
+    dlg.deleteLater()
+
+
+def test_top_dialog_mode_switch_calculates_once(tmp_path, monkeypatch):
+    QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    dlg = main.TopDialog(2023)
+    dlg.combo_mode.setCurrentIndex(dlg.combo_mode.findData("year"))
+    keys = []
+    original = dlg.calculate
+    monkeypatch.setattr(dlg, "calculate", lambda: (keys.append(dlg._period_key()), original()))
+    dlg.combo_mode.setCurrentIndex(dlg.combo_mode.findData("quarter"))
+    assert keys == ["Q1"]
+    dlg.combo_period.setCurrentIndex(1)
+    assert keys == ["Q1", "Q2"]
+    dlg.deleteLater()
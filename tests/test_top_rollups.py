@@ -0,0 +1,77 @@
+import json
+import os
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+import analytics
+import appdata
+
+
+def _naive_totals(stats, months):
+    """Record-by-record aggregation as TopDialog used to do it."""
+
+    totals = {}
+    for m in months:
+        for rec in stats.get(str(m), []):
+            t = totals.setdefault(rec.get("work", ""), analytics._empty_total())
+            t["status"] = rec.get("status", t["status"])
+            t["total_chapters"] = max(t["total_chapters"], int(rec.get("total_chapters", 0) or 0))
+            for key, conv in analytics.TOP_SUM_FIELDS:
+                t[key] += conv(rec.get(key, 0) or 0)
+            if rec.get("progress") is not None:
+                t["progress"] = rec["progress"]
+            if rec.get("release"):
+                t["release"] = rec["release"]
+            if "заверш" in (rec.get("status", "") or "").lower():
+                t["done"] += 1
+    return totals
+
+
+def test_rollups_match_record_aggregation_for_every_range():
+    rnd = random.Random(5)
+    stats = {}
+    for month in range(1, 13):
+        records = []
+        for _ in range(rnd.randint(0, 4)):
+            rec = {"work": rnd.choice("ABCD"), "chapters": rnd.randint(0, 9), "profit": rnd.randint(0, 50)}
+            if rnd.random() < 0.5:
+                rec["status"] = rnd.choice(["Онгоинг", "Завершен", ""])
+            if rnd.random() < 0.5:
+                rec["total_chapters"] = rnd.randint(0, 200)
+            if rnd.random() < 0.3:
+                rec["release"] = f"{month:02d}.2024"
+            if rnd.random() < 0.3:
+                rec["progress"] = rnd.randint(0, 100)
+            records.append(rec)
+        stats[str(month)] = records
+
+    rollups = analytics.TopRollups(stats)
+    for first in range(1, 13):
+        for last in range(first, 13):
+            expected = _naive_totals(stats, range(first, last + 1))
+            got = rollups.totals(first, last)
+            assert got.keys() == expected.keys()
+            for work, vals in expected.items():
+                for key, value in vals.items():
+                    assert got[work][key] == pytest.approx(value), (first, last, work, key)
+
+
+def test_rollups_are_rebuilt_only_after_stats_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(appdata, "BASE_SAVE_PATH", str(tmp_path))
+    stats = Path(appdata.stats_dir(2024)) / "2024.json"
+    stats.write_text(json.dumps({"1": [{"work": "A", "chapters": 2}]}), encoding="utf-8")
+
+    first = appdata.stats_rollups(2024)
+    assert appdata.stats_rollups(2024) is first
+
+    appdata.save_stats_record(2024, 2, 0, {"work": "A", "chapters": 3})
+    second = appdata.stats_rollups(2024)
+    assert second is not first
+    assert second.totals(1, 12)["A"]["chapters"] == 5
+    assert appdata.stats_rollups(2024) is second
@@ -15,6 +15,7 @@ if not hasattr(QtGui.QFontDatabase, "supportsCharacter"):
     QtGui.QFontDatabase.supportsCharacter = staticmethod(lambda *args, **kwargs: True)
 
 import app.main as main
+import appdata
 
 
 def _extract_first_opaque_color(pixmap: QtGui.QPixmap) -> QtGui.QColor:
@@ -29,8 +30,8 @@ def _extract_first_opaque_color(pixmap: QtGui.QPixmap) -> QtGui.QColor:
 
 def test_workspace_color_updates_bars_and_persists(tmp_path, monkeypatch):
     main.CONFIG["workspace_color"] = "#111111"
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -44,11 +45,11 @@ def test_workspace_color_updates_bars_and_persists(tmp_path, monkeypatch):
     dlg.choose_workspace_color()
 
     assert window.topbar.palette().color(QtGui.QPalette.Window).name() == new_color.name()
-    assert f"background-color:{new_color.name()}" in window.statusBar().styleSheet()
+    assert f"QStatusBar{{background-color:{new_color.name()};}}" in window.styleSheet()
 
     dlg.close()
     assert window.topbar.palette().color(QtGui.QPalette.Window).name() == new_color.name()
-    assert f"background-color:{new_color.name()}" in window.statusBar().styleSheet()
+    assert f"QStatusBar{{background-color:{new_color.name()};}}" in window.styleSheet()
 
     window.close()
     app.quit()
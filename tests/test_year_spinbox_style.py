@@ -12,12 +12,13 @@ import resources
 resources.register_fonts = lambda: None
 
 import app.main as main
+import appdata
 
 
 def test_year_spinbox_border_persists(tmp_path):
     # Use temporary config file
-    main.CONFIG_PATH = str(tmp_path / "config.json")
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    appdata.CONFIG_PATH = str(tmp_path / "config.json")
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
@@ -26,7 +27,7 @@ def test_year_spinbox_border_persists(tmp_path):
 
     # change workspace color and simulate settings save
     main.CONFIG["workspace_color"] = "#123456"
-    with open(main.CONFIG_PATH, "w", encoding="utf-8") as f:
+    with open(appdata.CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(main.CONFIG, f)
 
     window._on_settings_changed()